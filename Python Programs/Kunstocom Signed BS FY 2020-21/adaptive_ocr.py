@@ -0,0 +1,203 @@
+import re
+import subprocess
+
+import cv2
+import numpy as np
+
+from ocr_backends import OCRWord
+from text_layer import words_to_text
+
+
+# Words OCR'd with lower confidence than this at low DPI are re-read
+MIN_CONFIDENCE = 80
+
+# Padding around each re-OCR band, in low-resolution pixels
+BAND_PADDING = 6
+
+_DIGIT = re.compile(r"\d")
+
+
+def render_region(pdf_path, page_num, dpi, box):
+    """Render one rectangle of a PDF page in grayscale with ``pdftoppm``
+
+    ``box`` is ``(x0, y0, x1, y1)`` in pixels at ``dpi``. Only that region is
+    rasterized. Returns a uint8 array, or None if rendering fails.
+    """
+    x0, y0, x1, y1 = (int(round(v)) for v in box)
+    cmd = [
+        "pdftoppm",
+        "-gray",
+        "-r", str(dpi),
+        "-f", str(page_num),
+        "-l", str(page_num),
+        "-x", str(x0),
+        "-y", str(y0),
+        "-W", str(max(1, x1 - x0)),
+        "-H", str(max(1, y1 - y0)),
+        pdf_path,
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return cv2.imdecode(np.frombuffer(result.stdout, np.uint8), cv2.IMREAD_GRAYSCALE)
+
+
+def is_weak_word(word, min_confidence=MIN_CONFIDENCE):
+    """Return True if a low-DPI word should be re-read at high DPI"""
+    return word.conf < min_confidence or bool(_DIGIT.search(word.text))
+
+
+def find_weak_bands(words, image_shape, min_confidence=MIN_CONFIDENCE):
+    """Group weak words into a few rectangles worth re-OCR'ing
+
+    Weak words on each text line are spanned into one box; boxes on
+    neighbouring lines that overlap horizontally are merged into bands, so a
+    numeric column becomes one band instead of one crop per row. Each band
+    is widened to cover every word it cuts through, so no word is split
+    between the low- and high-resolution passes.
+    """
+    height, width = image_shape[:2]
+    spans = {}
+    for word in words:
+        if is_weak_word(word, min_confidence):
+            box = spans.get(word.line)
+            if box is None:
+                spans[word.line] = [word.x0, word.y0, word.x1, word.y1]
+            else:
+                box[0] = min(box[0], word.x0)
+                box[1] = min(box[1], word.y0)
+                box[2] = max(box[2], word.x1)
+                box[3] = max(box[3], word.y1)
+
+    bands = []
+    for box in sorted(spans.values(), key=lambda b: b[1]):
+        line_height = box[3] - box[1]
+        if bands:
+            last = bands[-1]
+            close = box[1] - last[3] <= 2 * line_height
+            overlaps = box[0] <= last[2] and box[2] >= last[0]
+            if close and overlaps:
+                last[0] = min(last[0], box[0])
+                last[2] = max(last[2], box[2])
+                last[3] = max(last[3], box[3])
+                continue
+        bands.append(list(box))
+
+    for band in bands:
+        for word in words:
+            cuts = (
+                word.x0 < band[2]
+                and word.x1 > band[0]
+                and word.y0 < band[3]
+                and word.y1 > band[1]
+            )
+            if cuts:
+                band[0] = min(band[0], word.x0)
+                band[1] = min(band[1], word.y0)
+                band[2] = max(band[2], word.x1)
+                band[3] = max(band[3], word.y1)
+        band[0] = max(0, band[0] - BAND_PADDING)
+        band[1] = max(0, band[1] - BAND_PADDING)
+        band[2] = min(width, band[2] + BAND_PADDING)
+        band[3] = min(height, band[3] + BAND_PADDING)
+
+    return [tuple(band) for band in bands]
+
+
+def _center_in(word, box):
+    cx = (word.x0 + word.x1) / 2
+    cy = (word.y0 + word.y1) / 2
+    return box[0] <= cx <= box[2] and box[1] <= cy <= box[3]
+
+
+class AdaptiveOCR:
+    """Two-pass OCR: whole page at low DPI, weak regions again at high DPI
+
+    The first pass reads the page rendered at ``low_dpi``. Words that came
+    back with low confidence or that contain digits are grouped into bands
+    (see ``find_weak_bands``). Only those bands are rendered again at
+    ``high_dpi`` and re-OCR'd, and their words replace the low-DPI ones.
+    Prose is read at low resolution and amounts at full resolution.
+
+    Bands are rendered straight from the PDF, so the preprocessing used
+    here must not move pixels around; deskew is always off in this mode.
+
+    ``get_engine`` returns the OCR backend to use. It is called for every
+    page, so each thread can get its own engine.
+    """
+
+    def __init__(
+        self,
+        get_engine,
+        preprocessor,
+        pdf_path,
+        low_dpi=150,
+        high_dpi=300,
+        min_confidence=MIN_CONFIDENCE,
+    ):
+        self.get_engine = get_engine
+        self.preprocessor = preprocessor
+        self.pdf_path = pdf_path
+        self.low_dpi = low_dpi
+        self.high_dpi = high_dpi
+        self.min_confidence = min_confidence
+        self.low_pixels = 0
+        self.high_pixels = 0
+
+    def params(self):
+        """Return the settings that affect the output, e.g. for cache keys"""
+        return {
+            "low_dpi": self.low_dpi,
+            "high_dpi": self.high_dpi,
+            "min_confidence": self.min_confidence,
+        }
+
+    def extract_words(self, img, page_num):
+        """OCR a low-DPI page image, re-reading weak regions at high DPI"""
+        engine = self.get_engine()
+        gray = self.preprocessor.run(img)
+        self.low_pixels += gray.size
+        words = engine.image_to_data(gray)
+
+        scale = self.high_dpi / self.low_dpi
+        for band in find_weak_bands(words, gray.shape, self.min_confidence):
+            crop = render_region(
+                self.pdf_path, page_num, self.high_dpi, [v * scale for v in band]
+            )
+            if crop is None or crop.size == 0:
+                continue
+            # A fresh render, so its buffer is reused
+            crop = self.preprocessor.run(crop, count_page=False, inplace=True)
+            self.high_pixels += crop.size
+
+            band_words = [
+                OCRWord(
+                    band[0] + w.x0 / scale,
+                    band[1] + w.y0 / scale,
+                    band[0] + w.x1 / scale,
+                    band[1] + w.y1 / scale,
+                    w.text,
+                    w.conf,
+                    ("band", band, w.line),
+                )
+                for w in engine.image_to_data(crop)
+            ]
+            words = [w for w in words if not _center_in(w, band)] + band_words
+
+        return words
+
+    def extract_text(self, img, page_num):
+        """Return the page as OCR-style text lines"""
+        return words_to_text(self.extract_words(img, page_num))
+
+    def format_stats(self):
+        """Summarize pixels processed against a single high-DPI pass"""
+        single_pass = self.low_pixels * (self.high_dpi / self.low_dpi) ** 2
+        processed = self.low_pixels + self.high_pixels
+        share = processed / single_pass * 100 if single_pass else 0.0
+        return (
+            f"Adaptive OCR: {self.low_pixels / 1e6:.1f} MP at {self.low_dpi} DPI + "
+            f"{self.high_pixels / 1e6:.1f} MP re-read at {self.high_dpi} DPI "
+            f"({share:.0f}% of a single {self.high_dpi} DPI pass)"
+        )
@@ -0,0 +1,294 @@
+"""Convert a directory (or glob) of financial statement PDFs to workbooks
+
+Usage:
+    python batch_convert.py [INPUT ...] [--output-dir DIR] [--jobs N]
+                            [--cache-dir DIR [--incremental]] [--force]
+                            [--save-tables]
+    python batch_convert.py [INPUT ...] [--output-dir DIR] --rerender
+
+INPUT may be a directory, a glob such as "PDFs/*FY22*.pdf" or a single PDF;
+it defaults to the repository's PDFs/ folder. Each PDF becomes
+"<name>.xlsx" in the output directory ("Batch Results/" by default, kept
+apart from the hand-checked workbooks in Results/), holding the tables
+OCR'd from it routed to one sheet per statement type.
+
+Documents are converted concurrently on a process pool of ``--jobs``
+workers. Every finished document is recorded in a manifest in the output
+directory, keyed by the SHA-256 of the PDF and the workbook written for
+it, so an interrupted batch picks up where it stopped while a copy of a
+done PDF under another name still gets its workbook; ``--force``
+converts everything again. With ``--incremental`` a re-issued PDF (e.g.
+a revised provisional statement) only has the pages whose rendering
+changed OCR'd again; the tables of the other pages come from the cache
+directory.
+
+``--save-tables`` also keeps the extracted tables as "<name>.tables" (see
+table_model), and ``--rerender`` rebuilds the workbooks from those files
+without rendering or OCR'ing anything, e.g. after a change to the sheet
+layout.
+"""
+import argparse
+import glob
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from ocr_cache import file_sha256
+from pdf_to_excel_converter import FinancialStatementConverter
+from table_model import read_tables, save_tables
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(HERE))
+DEFAULT_INPUT = os.path.join(REPO_ROOT, "PDFs")
+DEFAULT_OUTPUT_DIR = os.path.join(REPO_ROOT, "Batch Results")
+MANIFEST_NAME = ".batch_manifest.json"
+
+
+def find_pdfs(inputs):
+    """Expand directories, globs and file names into a sorted list of PDFs"""
+    found = set()
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "*.pdf")
+        for path in glob.glob(pattern):
+            if path.lower().endswith(".pdf") and os.path.isfile(path):
+                found.add(os.path.abspath(path))
+    return sorted(found)
+
+
+def output_path_for(pdf_path, output_dir):
+    name = os.path.splitext(os.path.basename(pdf_path))[0]
+    return os.path.join(output_dir, name + ".xlsx")
+
+
+def tables_path_for(output_path):
+    return os.path.splitext(output_path)[0] + ".tables"
+
+
+def manifest_key(digest, output_path):
+    """Key a finished document by its PDF's SHA-256 and its workbook's name
+
+    The manifest sits in the output directory, so the name is enough.
+    """
+    return f"{digest}:{os.path.basename(output_path)}"
+
+
+def load_manifest(path):
+    """Return {manifest_key: record} for documents finished in earlier runs"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(path, manifest):
+    """Write the manifest atomically so an interrupted run never corrupts it"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def convert_document(
+    pdf_path, output_path, cache_dir=None, keep_tables=False, incremental=False
+):
+    """Convert one PDF to a workbook of extracted tables (runs in a worker)
+
+    Returns the page and table counts and the time taken.
+    """
+    start = time.perf_counter()
+    converter = FinancialStatementConverter(
+        pdf_path, cache_dir=cache_dir, incremental=incremental
+    )
+    tables = converter.extract_tables_from_images()
+    if keep_tables:
+        save_tables(tables_path_for(output_path), tables)
+    converter.create_extracted_sheets(tables)
+    if not converter.save_excel(output_path):
+        raise RuntimeError(f"could not save {output_path}")
+    return {
+        "pages": converter.get_page_count(),
+        "tables": len(tables),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def rerender_document(pdf_path, output_path):
+    """Rebuild a workbook from the tables saved by an earlier conversion"""
+    converter = FinancialStatementConverter(pdf_path)
+    converter.create_extracted_sheets(read_tables(tables_path_for(output_path)))
+    if not converter.save_excel(output_path):
+        raise RuntimeError(f"could not save {output_path}")
+
+
+def rerender_batch(inputs, output_dir):
+    """Rebuild the workbook of every PDF in ``inputs`` that has saved tables
+
+    Returns the number of workbooks rebuilt.
+    """
+    rebuilt = 0
+    for pdf_path in find_pdfs(inputs):
+        output_path = output_path_for(pdf_path, output_dir)
+        if not os.path.exists(tables_path_for(output_path)):
+            print(f"No saved tables for {os.path.basename(pdf_path)}")
+            continue
+        rerender_document(pdf_path, output_path)
+        rebuilt += 1
+    print(f"Rebuilt {rebuilt} workbooks from saved tables")
+    return rebuilt
+
+
+def print_summary(results, skipped, failed, wall_seconds):
+    """Print per-file timings and overall throughput"""
+    if results:
+        width = max(len(os.path.basename(path)) for path in results)
+        print()
+        print(
+            f"{'file':<{width}}  {'pages':>5}  {'tables':>6}  "
+            f"{'seconds':>8}  {'pages/s':>7}"
+        )
+        for path, record in sorted(results.items()):
+            rate = record["pages"] / record["seconds"] if record["seconds"] else 0.0
+            print(
+                f"{os.path.basename(path):<{width}}  {record['pages']:>5}  "
+                f"{record['tables']:>6}  {record['seconds']:>8.1f}  {rate:>7.2f}"
+            )
+
+    pages = sum(record["pages"] for record in results.values())
+    rate = pages / wall_seconds if wall_seconds else 0.0
+    print(
+        f"\nConverted {len(results)} documents ({pages} pages) in "
+        f"{wall_seconds:.1f} s, {rate:.2f} pages/s; "
+        f"{skipped} already done, {len(failed)} failed"
+    )
+    for path, error in sorted(failed.items()):
+        print(f"  FAILED {os.path.basename(path)}: {error}")
+
+
+def run_batch(
+    inputs,
+    output_dir,
+    jobs=None,
+    cache_dir=None,
+    force=False,
+    keep_tables=False,
+    incremental=False,
+):
+    """Convert every PDF in ``inputs`` not already in the manifest
+
+    Returns ``(results, failed)``: per-file records of this run and the
+    error message of every document that failed.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    manifest = load_manifest(manifest_path)
+
+    pending = []
+    skipped = 0
+    for pdf_path in find_pdfs(inputs):
+        digest = file_sha256(pdf_path)
+        output_path = output_path_for(pdf_path, output_dir)
+        done = manifest.get(manifest_key(digest, output_path))
+        if not force and done and os.path.exists(done["output"]):
+            skipped += 1
+            continue
+        pending.append((pdf_path, output_path, digest))
+
+    print(f"{len(pending)} documents to convert, {skipped} already done")
+    results = {}
+    failed = {}
+    start = time.perf_counter()
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(
+                    convert_document,
+                    pdf_path,
+                    output_path,
+                    cache_dir,
+                    keep_tables,
+                    incremental,
+                ): (pdf_path, output_path, digest)
+                for pdf_path, output_path, digest in pending
+            }
+            for future in as_completed(futures):
+                pdf_path, output_path, digest = futures[future]
+                try:
+                    record = future.result()
+                except Exception as e:
+                    failed[pdf_path] = str(e)
+                    continue
+                results[pdf_path] = record
+                manifest[manifest_key(digest, output_path)] = dict(
+                    record,
+                    input=pdf_path,
+                    output=output_path,
+                    finished=datetime.now().isoformat(timespec="seconds"),
+                )
+                save_manifest(manifest_path, manifest)
+
+    print_summary(results, skipped, failed, time.perf_counter() - start)
+    return results, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "inputs", nargs="*", help="PDF files, directories or globs (default: PDFs/)"
+    )
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="documents converted at once (default: one per CPU)",
+    )
+    parser.add_argument("--cache-dir", default=None, help="persistent OCR cache")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="re-OCR only pages changed since an earlier issue (needs --cache-dir)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="ignore the manifest and redo everything"
+    )
+    parser.add_argument(
+        "--save-tables",
+        action="store_true",
+        help="keep the extracted tables next to each workbook",
+    )
+    parser.add_argument(
+        "--rerender",
+        action="store_true",
+        help="rebuild workbooks from saved tables without OCR",
+    )
+    args = parser.parse_args(argv)
+    if args.incremental and not args.cache_dir:
+        parser.error("--incremental needs --cache-dir")
+
+    if args.rerender:
+        rerender_batch(args.inputs or [DEFAULT_INPUT], args.output_dir)
+        return 0
+
+    _, failed = run_batch(
+        args.inputs or [DEFAULT_INPUT],
+        args.output_dir,
+        jobs=args.jobs,
+        cache_dir=args.cache_dir,
+        force=args.force,
+        keep_tables=args.save_tables,
+        incremental=args.incremental,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
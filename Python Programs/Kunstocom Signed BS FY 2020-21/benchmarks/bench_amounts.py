@@ -0,0 +1,73 @@
+"""Time amount parsing on a million Indian-grouped amount strings
+
+Usage:
+    python benchmarks/bench_amounts.py [--count N]
+
+Generates amounts such as "1,58,73,55,063.16", "(19,09,500.00)" and "-",
+then parses them one at a time with parse_amount and as one column with
+parse_amounts (float64 and Decimal).
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(HERE)), "shared"))
+
+from amounts import parse_amount, parse_amounts  # noqa: E402
+
+
+def indian_grouping(value):
+    whole, fraction = f"{value:.2f}".split(".")
+    head, tail = whole[:-3], whole[-3:]
+    groups = []
+    while len(head) > 2:
+        groups.insert(0, head[-2:])
+        head = head[:-2]
+    if head:
+        groups.insert(0, head)
+    return ",".join(groups + [tail]) + "." + fraction
+
+
+def make_amounts(count, seed=0):
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.05:
+            texts.append("-")
+        elif roll < 0.1:
+            texts.append("")
+        else:
+            text = indian_grouping(rng.uniform(0, 1e10))
+            texts.append(f"({text})" if roll < 0.2 else text)
+    return texts
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    texts = make_amounts(args.count)
+    results = {
+        "parse_amount loop": timed(lambda: [parse_amount(t) for t in texts]),
+        "parse_amounts float64": timed(lambda: parse_amounts(texts)),
+        "parse_amounts Decimal": timed(lambda: parse_amounts(texts, decimal=True)),
+    }
+    for name, seconds in results.items():
+        rate = args.count / seconds / 1e6
+        print(f"{name:<24} {seconds:8.2f} s  {rate:6.2f} M values/s")
+
+
+if __name__ == "__main__":
+    main()
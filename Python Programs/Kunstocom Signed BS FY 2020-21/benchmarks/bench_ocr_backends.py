@@ -0,0 +1,101 @@
+"""Compare the pytesseract and tesserocr OCR backends on the bundled PDFs
+
+Usage:
+    python benchmarks/bench_ocr_backends.py [--pages N] [--dpi DPI] [PDF ...]
+
+Each page is rendered and preprocessed once, then OCR'd by every available
+backend so only the OCR call is timed. The tesserocr column includes loading
+the language model on the first page.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from ocr_backends import OCR_BACKENDS, close_ocr_backends, get_ocr_backend  # noqa: E402
+from pdf_to_excel_converter import FinancialStatementConverter  # noqa: E402
+
+DEFAULT_PDF_DIR = os.path.join(HERE, "..", "..", "..", "PDFs")
+
+
+def available_backends():
+    names = []
+    for name in OCR_BACKENDS:
+        try:
+            get_ocr_backend(name)
+        except ImportError:
+            print(f"Skipping {name}: not installed")
+            continue
+        names.append(name)
+    close_ocr_backends()
+    return names
+
+
+def bench_pdf(pdf_path, backends, dpi, max_pages):
+    converter = FinancialStatementConverter(pdf_path, dpi=dpi)
+    timings = {name: 0.0 for name in backends}
+    pages = 0
+
+    for page_num, img in converter.iter_pdf_pages():
+        if max_pages and page_num > max_pages:
+            break
+        processed = converter.preprocess_image(img)
+        for name in backends:
+            engine = get_ocr_backend(name, converter.ocr_lang, converter.ocr_config)
+            start = time.perf_counter()
+            engine.image_to_string(processed)
+            timings[name] += time.perf_counter() - start
+        pages += 1
+
+    return pages, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdfs", nargs="*", help="PDFs to OCR (default: PDFs/*.pdf)")
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--pages", type=int, default=0, help="max pages per PDF")
+    args = parser.parse_args()
+
+    pdfs = args.pdfs or sorted(glob.glob(os.path.join(DEFAULT_PDF_DIR, "*.pdf")))
+    backends = available_backends()
+    if not backends:
+        sys.exit("No OCR backend is available")
+
+    header = f"{'PDF':<45} {'pages':>5}" + "".join(
+        f" {name + ' s/page':>18}" for name in backends
+    )
+    print(header)
+    print("-" * len(header))
+
+    totals = {name: 0.0 for name in backends}
+    total_pages = 0
+    for pdf_path in pdfs:
+        pages, timings = bench_pdf(pdf_path, backends, args.dpi, args.pages)
+        close_ocr_backends()
+        total_pages += pages
+        row = f"{os.path.basename(pdf_path)[:45]:<45} {pages:>5}"
+        for name in backends:
+            totals[name] += timings[name]
+            row += f" {timings[name] / max(pages, 1):>18.3f}"
+        print(row)
+
+    print("-" * len(header))
+    row = f"{'total':<45} {total_pages:>5}"
+    for name in backends:
+        row += f" {totals[name] / max(total_pages, 1):>18.3f}"
+    print(row)
+
+    if len(backends) > 1 and totals[backends[1]]:
+        print(
+            f"\n{backends[1]} is {totals[backends[0]] / totals[backends[1]]:.2f}x "
+            f"the speed of {backends[0]}"
+        )
+
+
+if __name__ == "__main__":
+    main()
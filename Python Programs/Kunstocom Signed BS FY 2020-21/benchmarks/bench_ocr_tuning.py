@@ -0,0 +1,366 @@
+"""Sweep OCR and preprocessing settings and weigh speed against accuracy
+
+Usage:
+    python benchmarks/bench_ocr_tuning.py [PDF ...] [--pages N]
+        [--dpi 200,300] [--psm 4,6] [--threshold 150,none]
+        [--grid on,off] [--crop on,off] [--target 0.95]
+        [--csv FILE] [--chart FILE]
+
+Every combination of the listed values is run over the bundled PDFs that
+have a hand-checked workbook in Results/ (see GOLDEN_WORKBOOKS). Each run
+happens in a fresh process with the OCR cache and text layer off, so
+every page is really rendered and OCR'd. Per page it records wall time
+and CPU time (tesseract subprocesses included); per run it records the
+peak resident memory of the largest process.
+
+Accuracy compares the amounts read from the PDF with the amounts in the
+golden workbook as multisets of absolute values rounded to paise, since
+their layouts differ. Zeros and integers below MIN_AMOUNT (note numbers,
+years) are left out. Precision is the share of extracted amounts found in
+the golden workbook, and recall the share of golden amounts extracted;
+accuracy is their F1. With --pages only part of each document is read,
+so recall (and F1) drops and precision is the number to watch.
+
+The results table is sorted by seconds per page. Configurations on the
+speed/accuracy Pareto front are starred, and the fastest one that reaches
+--target is recommended. --chart plots the front (needs matplotlib).
+"""
+import argparse
+import csv
+import glob
+import itertools
+import os
+import resource
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from openpyxl import load_workbook
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(HERE)), "shared"))
+
+from amounts import parse_amount  # noqa: E402
+from pdf_to_excel_converter import FinancialStatementConverter  # noqa: E402
+
+REPO_ROOT = os.path.join(HERE, "..", "..", "..")
+DEFAULT_PDF_DIR = os.path.join(REPO_ROOT, "PDFs")
+RESULTS_DIR = os.path.join(REPO_ROOT, "Results")
+
+# Hand-checked workbook in Results/ for each bundled PDF
+GOLDEN_WORKBOOKS = {
+    "MO Infra Provisional FY 23-24.pdf": "M_S_MO_Infra_Financial_Statements.xlsx",
+    "NECC SPV  Balance Sheet at 31.03.2022 FINAL.pdf": (
+        "NANDHRA_FINANCIALS_WITH_ANNEXURES.xlsx"
+    ),
+    "SA Infra FS 2023-24.pdf": (
+        "SA_Infrastructure_Financial_Statements_March_2024.xlsx"
+    ),
+    "SMO Provisional FY 23-24 (1)_compressed.pdf": (
+        "SMO_Ferro_Alloys_Financial_Statements.xlsx"
+    ),
+    "VNHPL FY22.pdf": "Vivekanand_Financial_Statements_FY2022.xlsx",
+}
+
+# Whole numbers below this are note numbers, serial numbers or years
+# rather than amounts, and are not scored
+MIN_AMOUNT = 100
+
+
+def split_values(text, convert=str):
+    return [None if value == "none" else convert(value) for value in text.split(",")]
+
+
+def on_off(text):
+    return [value == "on" for value in text.split(",")]
+
+
+def amount_key(value):
+    """Return the scoring key of an amount, or None if it is not scored"""
+    value = abs(round(float(value), 2))
+    if value == 0 or (value < MIN_AMOUNT and value == int(value)):
+        return None
+    return value
+
+
+def golden_amounts(workbook_path):
+    """Return a Counter of the scored amounts in every sheet of a workbook"""
+    amounts = Counter()
+    wb = load_workbook(workbook_path, read_only=True, data_only=True)
+    for ws in wb.worksheets:
+        for row in ws.iter_rows(values_only=True):
+            for value in row:
+                if isinstance(value, str):
+                    value = parse_amount(value)
+                elif isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                key = amount_key(value) if value is not None else None
+                if key is not None:
+                    amounts[key] += 1
+    wb.close()
+    return amounts
+
+
+def extracted_amounts(tables):
+    """Return a Counter of the scored amounts in extracted tables"""
+    amounts = Counter()
+    for table in tables:
+        for value in table.values[~np.isnan(table.values)]:
+            key = amount_key(value)
+            if key is not None:
+                amounts[key] += 1
+    return amounts
+
+
+def _cpu_seconds():
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def run_config(pdf_path, config, max_pages):
+    """OCR a document with one configuration (in a fresh worker process)
+
+    Returns per-page wall and CPU seconds, the peak memory in MB and the
+    Counter of extracted amounts.
+    """
+    converter = FinancialStatementConverter(
+        pdf_path,
+        dpi=config["dpi"],
+        use_text_layer=False,
+        classify_pages=False,
+        grid_tables=config["grid"],
+        crop_pages=config["crop"],
+        preprocess={"threshold": config["threshold"]},
+    )
+    converter.ocr_config = f"--psm {config['psm']}"
+
+    page_count = converter.get_page_count()
+    if max_pages:
+        page_count = min(page_count, max_pages)
+
+    wall, cpu, tables = [], [], []
+    pages = converter.iter_pdf_pages(page_numbers=range(1, page_count + 1))
+    while True:
+        start_wall, start_cpu = time.perf_counter(), _cpu_seconds()
+        try:
+            # Rendering counts towards the page: DPI changes its cost too
+            page_num, img = next(pages)
+        except StopIteration:
+            break
+        tables.extend(converter.process_page(img, page_num))
+        wall.append(time.perf_counter() - start_wall)
+        cpu.append(_cpu_seconds() - start_cpu)
+
+    # ru_maxrss is in kilobytes on Linux; RUSAGE_CHILDREN reports the
+    # largest tesseract subprocess
+    peak_kb = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return wall, cpu, peak_kb / 1024, extracted_amounts(tables)
+
+
+def score(extracted, golden):
+    """Return (precision, recall, f1) of extracted against golden amounts"""
+    matched = sum((extracted & golden).values())
+    precision = matched / max(sum(extracted.values()), 1)
+    recall = matched / max(sum(golden.values()), 1)
+    f1 = 2 * precision * recall / (precision + recall) if matched else 0.0
+    return precision, recall, f1
+
+
+def pareto_front(results):
+    """Mark results no other result beats on both speed and accuracy"""
+    for result in results:
+        result["pareto"] = not any(
+            other["s_per_page"] <= result["s_per_page"]
+            and other["accuracy"] >= result["accuracy"]
+            and (
+                other["s_per_page"] < result["s_per_page"]
+                or other["accuracy"] > result["accuracy"]
+            )
+            for other in results
+        )
+
+
+def describe(config):
+    threshold = config["threshold"] if config["threshold"] is not None else "off"
+    return (
+        f"dpi {config['dpi']} psm {config['psm']} threshold {threshold} "
+        f"grid {'on' if config['grid'] else 'off'} "
+        f"crop {'on' if config['crop'] else 'off'}"
+    )
+
+
+def sweep(documents, configs, max_pages):
+    results = []
+    for config in configs:
+        wall, cpu, peak_mb = [], [], 0.0
+        extracted, golden = Counter(), Counter()
+        for pdf_path, golden_counts in documents:
+            # A fresh process per run keeps peak memory and caches per run
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                run = pool.submit(run_config, pdf_path, config, max_pages)
+                page_wall, page_cpu, run_peak, amounts = run.result()
+            wall.extend(page_wall)
+            cpu.extend(page_cpu)
+            peak_mb = max(peak_mb, run_peak)
+            extracted += amounts
+            golden += golden_counts
+
+        precision, recall, f1 = score(extracted, golden)
+        pages = max(len(wall), 1)
+        result = dict(
+            config,
+            name=describe(config),
+            pages=len(wall),
+            s_per_page=sum(wall) / pages,
+            cpu_per_page=sum(cpu) / pages,
+            max_page_s=max(wall, default=0.0),
+            peak_mb=peak_mb,
+            precision=precision,
+            recall=recall,
+            accuracy=f1,
+        )
+        results.append(result)
+        print(
+            f"  {result['name']}: {result['s_per_page']:.2f} s/page, "
+            f"accuracy {f1:.3f}"
+        )
+    pareto_front(results)
+    return results
+
+
+def print_table(results, target):
+    header = (
+        f"{'':1} {'configuration':<50} {'s/page':>7} {'cpu/page':>8} "
+        f"{'max s':>6} {'peak MB':>8} {'prec':>6} {'recall':>6} {'F1':>6}"
+    )
+    print()
+    print(header)
+    print("-" * len(header))
+    for result in sorted(results, key=lambda r: r["s_per_page"]):
+        print(
+            f"{'*' if result['pareto'] else ' ':1} {result['name']:<50} "
+            f"{result['s_per_page']:>7.2f} {result['cpu_per_page']:>8.2f} "
+            f"{result['max_page_s']:>6.2f} {result['peak_mb']:>8.0f} "
+            f"{result['precision']:>6.3f} {result['recall']:>6.3f} "
+            f"{result['accuracy']:>6.3f}"
+        )
+    print("* on the speed/accuracy Pareto front")
+
+    passing = [r for r in results if r["accuracy"] >= target]
+    if passing:
+        best = min(passing, key=lambda r: r["s_per_page"])
+        print(
+            f"\nFastest configuration with accuracy >= {target}: {best['name']} "
+            f"({best['s_per_page']:.2f} s/page, accuracy {best['accuracy']:.3f})"
+        )
+    else:
+        print(f"\nNo configuration reaches accuracy {target}")
+
+
+def write_csv(results, path):
+    fields = list(results[0])
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"Results written to {path}")
+
+
+def plot_pareto(results, target, path):
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("Skipping --chart: matplotlib is not installed")
+        return
+
+    fig, ax = plt.subplots(figsize=(9, 6))
+    ax.scatter(
+        [r["s_per_page"] for r in results],
+        [r["accuracy"] for r in results],
+        color="lightgray",
+    )
+    front = sorted((r for r in results if r["pareto"]), key=lambda r: r["s_per_page"])
+    ax.plot(
+        [r["s_per_page"] for r in front],
+        [r["accuracy"] for r in front],
+        marker="o",
+        color="tab:blue",
+    )
+    for result in front:
+        ax.annotate(
+            result["name"],
+            (result["s_per_page"], result["accuracy"]),
+            fontsize=7,
+            xytext=(4, 4),
+            textcoords="offset points",
+        )
+    ax.axhline(target, color="tab:red", linestyle="--", linewidth=1)
+    ax.set_xlabel("seconds per page")
+    ax.set_ylabel("amount F1 against Results/ goldens")
+    ax.set_title("OCR speed vs accuracy")
+    fig.tight_layout()
+    fig.savefig(path, dpi=150)
+    print(f"Chart written to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "pdfs", nargs="*", help="PDFs with a golden workbook (default: all)"
+    )
+    parser.add_argument("--pages", type=int, default=0, help="max pages per PDF")
+    parser.add_argument("--dpi", default="200,300")
+    parser.add_argument("--psm", default="4,6")
+    parser.add_argument(
+        "--threshold", default="150,none", help="gray levels, or none to skip"
+    )
+    parser.add_argument(
+        "--grid", default="on,off", help="cell-by-cell OCR of ruled tables"
+    )
+    parser.add_argument("--crop", default="on,off", help="crop to the content region")
+    parser.add_argument("--target", type=float, default=0.95, help="F1 to reach")
+    parser.add_argument("--csv", help="write every result to this CSV file")
+    parser.add_argument("--chart", help="save a Pareto chart to this PNG file")
+    args = parser.parse_args()
+
+    pdfs = args.pdfs or sorted(glob.glob(os.path.join(DEFAULT_PDF_DIR, "*.pdf")))
+    documents = []
+    for pdf_path in pdfs:
+        golden = GOLDEN_WORKBOOKS.get(os.path.basename(pdf_path))
+        if golden is None:
+            print(f"Skipping {os.path.basename(pdf_path)}: no golden workbook")
+            continue
+        documents.append((pdf_path, golden_amounts(os.path.join(RESULTS_DIR, golden))))
+    if not documents:
+        sys.exit("No PDF with a golden workbook to score against")
+
+    grid = {
+        "dpi": split_values(args.dpi, int),
+        "psm": split_values(args.psm, int),
+        "threshold": split_values(args.threshold, int),
+        "grid": on_off(args.grid),
+        "crop": on_off(args.crop),
+    }
+    configs = [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+    print(f"{len(configs)} configurations x {len(documents)} documents")
+
+    results = sweep(documents, configs, args.pages)
+    print_table(results, args.target)
+    if args.csv:
+        write_csv(results, args.csv)
+    if args.chart:
+        plot_pareto(results, args.target, args.chart)
+
+
+if __name__ == "__main__":
+    main()
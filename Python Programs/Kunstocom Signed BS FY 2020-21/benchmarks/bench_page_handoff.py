@@ -0,0 +1,102 @@
+"""Time handing rendered pages to OCR worker processes: pickled vs shared memory
+
+Usage:
+    python benchmarks/bench_page_handoff.py [--pages N] [--workers N]
+                                            [--dpi DPI] [--rgb]
+
+Sends synthetic A4 page bitmaps through a process pool the way
+FinancialStatementConverter does with workers > 1, keeping two pages per
+worker in flight. Each worker only touches the page, so the timings are
+the hand-off overhead alone: pickling every bitmap through the pool's
+pipe, against copying it into a SharedPageArena slot and sending the
+descriptor.
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from page_buffers import PageBufferRef, SharedPageArena, open_page  # noqa: E402
+
+# A4 in inches
+PAGE_INCHES = (11.69, 8.27)
+
+
+def touch_page(page):
+    """Stand-in for OCR: read the page so it is really transferred"""
+    if isinstance(page, PageBufferRef):
+        page = open_page(page)
+    return int(page[::64, ::64].sum())
+
+
+def make_pages(count, dpi, rgb):
+    height, width = (int(inches * dpi) for inches in PAGE_INCHES)
+    shape = (height, width, 3) if rgb else (height, width)
+    rng = np.random.default_rng(0)
+    template = rng.integers(0, 256, size=shape, dtype=np.uint8)
+    return [np.roll(template, i, axis=0) for i in range(count)]
+
+
+def run(pool, pages, max_in_flight, arena=None):
+    in_flight = deque()
+    total = 0
+
+    def collect():
+        page, future = in_flight.popleft()
+        result = future.result()
+        if arena:
+            arena.release(page)
+        return result
+
+    start = time.perf_counter()
+    for img in pages:
+        page = arena.put(img) if arena else np.array(img)
+        in_flight.append((page, pool.submit(touch_page, page)))
+        if len(in_flight) >= max_in_flight:
+            total += collect()
+    while in_flight:
+        total += collect()
+    return time.perf_counter() - start, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--rgb", action="store_true", help="3 channels, not gray")
+    args = parser.parse_args()
+
+    pages = make_pages(args.pages, args.dpi, args.rgb)
+    page_mb = pages[0].nbytes / 1e6
+    max_in_flight = 2 * args.workers
+    print(
+        f"{args.pages} pages of {pages[0].shape} ({page_mb:.1f} MB), "
+        f"{args.workers} workers"
+    )
+
+    # The arena comes first so the workers share its resource tracker
+    with SharedPageArena(max_in_flight) as arena, ProcessPoolExecutor(
+        max_workers=args.workers
+    ) as pool:
+        # Start the workers before timing anything
+        list(pool.map(touch_page, pages[:args.workers]))
+        pickled, expected = run(pool, pages, max_in_flight)
+        shared, total = run(pool, pages, max_in_flight, arena)
+    assert total == expected
+
+    for name, seconds in (("pickled", pickled), ("shared memory", shared)):
+        per_page = seconds / args.pages * 1000
+        rate = args.pages * page_mb / seconds
+        print(f"{name:<14} {seconds:7.2f} s  {per_page:7.1f} ms/page  {rate:8.0f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Time each preprocessing stage on pages from the bundled PDFs
+
+Usage:
+    python benchmarks/bench_preprocessing.py [--pages N] [--dpi DPI] [PDF ...]
+
+Pages are rendered once in grayscale and in RGB, then pushed through the
+original RGB->BGR->GRAY->threshold->1x1-open sequence and through several
+PreprocessPipeline configurations. Reports milliseconds per page per stage,
+and how many of the page's pixels are left for OCR after cropping to the
+content region.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+from pdf2image import convert_from_path
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from preprocessing import PAGE_PROFILES, PreprocessPipeline  # noqa: E402
+
+DEFAULT_PDF_DIR = os.path.join(HERE, "..", "..", "..", "PDFs")
+
+CONFIGS = {
+    "threshold": {"threshold": 150, "denoise": 1},
+    "threshold+denoise3": {"threshold": 150, "denoise": 3},
+    "deskew+threshold": {"threshold": 150, "denoise": 1, "deskew": True},
+    "all stages": {"threshold": 150, "denoise": 3, "deskew": True},
+}
+
+
+def legacy_preprocess(img):
+    """The preprocessing the converter used before PreprocessPipeline"""
+    img_cv = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
+    gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
+    _, thresh = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY)
+    kernel = np.ones((1, 1), np.uint8)
+    return cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
+
+
+def render_pages(pdfs, dpi, max_pages, grayscale):
+    pages = []
+    for pdf_path in pdfs:
+        pages.extend(
+            convert_from_path(
+                pdf_path, dpi=dpi, last_page=max_pages, grayscale=grayscale
+            )
+        )
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdfs", nargs="*", help="PDFs to render (default: PDFs/*.pdf)")
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--pages", type=int, default=2, help="pages per PDF")
+    args = parser.parse_args()
+
+    pdfs = args.pdfs or sorted(glob.glob(os.path.join(DEFAULT_PDF_DIR, "*.pdf")))
+
+    rgb_pages = render_pages(pdfs, args.dpi, args.pages, grayscale=False)
+    start = time.perf_counter()
+    for img in rgb_pages:
+        legacy_preprocess(img)
+    legacy_ms = (time.perf_counter() - start) / len(rgb_pages) * 1000
+    print(f"{'legacy (RGB render)':<24} total {legacy_ms:8.1f} ms/page")
+    del rgb_pages
+
+    gray_pages = render_pages(pdfs, args.dpi, args.pages, grayscale=True)
+    for name, params in CONFIGS.items():
+        pipeline = PreprocessPipeline(**params)
+        start = time.perf_counter()
+        for img in gray_pages:
+            pipeline.run(img)
+        total_ms = (time.perf_counter() - start) / len(gray_pages) * 1000
+        stages = ", ".join(
+            f"{stage} {seconds / len(gray_pages) * 1000:.1f}"
+            for stage, seconds in pipeline.timings.items()
+            if seconds
+        )
+        print(f"{name:<24} total {total_ms:8.1f} ms/page  ({stages})")
+
+    for profile, zones in PAGE_PROFILES.items():
+        pipeline = PreprocessPipeline()
+        kept = 0
+        for img in gray_pages:
+            cropped = pipeline.crop(np.array(img), zones, inplace=True)
+            kept += cropped.size / (img.width * img.height)
+        crop_ms = pipeline.timings["crop"] / len(gray_pages) * 1000
+        print(
+            f"{'crop, ' + profile + ' profile':<24} total {crop_ms:8.1f} ms/page  "
+            f"({kept / len(gray_pages):.0%} of pixels kept)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Time table segmentation on multi-megabyte synthetic OCR text
+
+Usage:
+    python benchmarks/bench_segmenter.py [--sizes 1 2 4 8] [--repeat N]
+
+Builds statement-like text (headers, amount rows, prose and blank lines)
+of each size in MB and segments it with the keyword-by-keyword loop the
+converter used before and with segment_tables. Reports MB/s per size, which
+should stay flat if segmentation is linear.
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from table_segmenter import segment_tables, split_table_row  # noqa: E402
+
+HEADERS = [
+    "Balance Sheet as at 31st March 2021",
+    "Statement of Profit and Loss for the year ended 31st March 2021",
+    "Cash Flow Statement",
+    "Non-Current Assets",
+    "Current Liabilities",
+    "Other Income",
+    "Other Expenses",
+]
+DESCRIPTIONS = [
+    "Share Capital",
+    "Reserves and Surplus",
+    "Trade Payables",
+    "Short Term Borrowings",
+    "Cash and Cash Equivalents",
+    "Depreciation and Amortisation",
+    "Finance Costs",
+]
+PROSE = [
+    "In our opinion and to the best of our information and according to the",
+    "explanations given to us, the aforesaid financial statements give a true",
+    "and fair view in conformity with the accounting principles generally",
+]
+
+
+def legacy_identify_tables(text, page_num):
+    """The segmentation loop the converter used before segment_tables"""
+    lines = text.split("\n")
+    tables = []
+    current_table = []
+    table_name = None
+    in_table = False
+    financial_keywords = [
+        "Balance Sheet", "Profit", "Loss", "Cash Flow", "Income",
+        "Assets", "Liabilities", "Equity", "Revenue", "Expenses",
+    ]
+    for line in lines:
+        if not line.strip():
+            continue
+        if any(keyword in line for keyword in financial_keywords) and not in_table:
+            if current_table:
+                tables.append({"name": table_name, "data": current_table, "page": page_num})
+                current_table = []
+            table_name = line.strip()
+            in_table = True
+            continue
+        if re.search(r"\d", line) and in_table:
+            row_data = split_table_row(line)
+            if row_data:
+                current_table.append(row_data)
+        if in_table and (
+            not line.strip() or any(keyword in line for keyword in financial_keywords)
+        ):
+            if current_table:
+                tables.append({"name": table_name, "data": current_table, "page": page_num})
+                current_table = []
+                in_table = False
+                if any(keyword in line for keyword in financial_keywords):
+                    table_name = line.strip()
+                    in_table = True
+    if current_table:
+        tables.append({"name": table_name, "data": current_table, "page": page_num})
+    return tables
+
+
+def make_text(size_mb, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    total = 0
+    while total < size_mb * 1024 * 1024:
+        roll = rng.random()
+        if roll < 0.05:
+            line = rng.choice(HEADERS)
+        elif roll < 0.15:
+            line = rng.choice(PROSE)
+        elif roll < 0.2:
+            line = ""
+        else:
+            line = "{}  {}  {:,.2f}  {:,.2f}".format(
+                rng.choice(DESCRIPTIONS),
+                rng.randint(1, 30),
+                rng.uniform(0, 1e8),
+                rng.uniform(0, 1e8),
+            )
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)
+
+
+def best_of(func, text, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text, 1)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'size':>8} {'legacy':>12} {'segment_tables':>16}")
+    for size in args.sizes:
+        text = make_text(size)
+        mb = len(text) / (1024 * 1024)
+        legacy = best_of(legacy_identify_tables, text, args.repeat)
+        new = best_of(segment_tables, text, args.repeat)
+        print(f"{mb:6.1f}MB {mb / legacy:8.1f} MB/s {mb / new:12.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
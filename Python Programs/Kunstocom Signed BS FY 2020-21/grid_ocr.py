@@ -0,0 +1,258 @@
+import os
+import sys
+
+import cv2
+import numpy as np
+
+# amounts is shared with the other script folders (see ../shared)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+
+from amounts import parse_amounts  # noqa: E402
+from table_model import TableRow  # noqa: E402
+
+
+# A rule must span at least this share of the page width (horizontal rules)
+# or height (vertical rules) to be picked up by the morphological open
+MIN_RULE_FRACTION = 1 / 30
+
+# Rules closer than this many pixels are treated as one (thick or doubled)
+RULE_MERGE_DISTANCE = 8
+
+# Share of a cell edge that must be inked for the edge to count as a rule;
+# below this the neighbouring cells are merged
+EDGE_COVERAGE = 0.6
+
+# Pixels trimmed inside every cell so rule remnants are not OCR'd
+CELL_INSET = 4
+
+# Whitespace between cells stacked into one OCR batch image
+BATCH_GAP = 24
+
+NUMERIC_WHITELIST = "0123456789,.()-"
+
+
+def _rule_positions(mask, axis):
+    """Return the centers of the rules in a rule mask along one axis"""
+    profile = mask.sum(axis=axis)
+    rows = np.flatnonzero(profile > 0)
+    if len(rows) == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(rows) > RULE_MERGE_DISTANCE)
+    groups = np.split(rows, breaks + 1)
+    return [int(group.mean()) for group in groups]
+
+
+def detect_rules(gray):
+    """Find horizontal and vertical ruling lines on a grayscale page
+
+    Returns ``(h_mask, v_mask, ys, xs)``: binary masks of the horizontal and
+    vertical rules and the sorted positions of each.
+    """
+    height, width = gray.shape[:2]
+    _, ink = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
+
+    h_kernel = cv2.getStructuringElement(
+        cv2.MORPH_RECT, (max(10, int(width * MIN_RULE_FRACTION)), 1)
+    )
+    v_kernel = cv2.getStructuringElement(
+        cv2.MORPH_RECT, (1, max(10, int(height * MIN_RULE_FRACTION)))
+    )
+    h_mask = cv2.morphologyEx(ink, cv2.MORPH_OPEN, h_kernel)
+    v_mask = cv2.morphologyEx(ink, cv2.MORPH_OPEN, v_kernel)
+
+    ys = _rule_positions(h_mask > 0, axis=1)
+    xs = _rule_positions(v_mask > 0, axis=0)
+    return h_mask, v_mask, ys, xs
+
+
+class _UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a, b):
+        self.parent[self.find(a)] = self.find(b)
+
+
+def build_lattice(h_mask, v_mask, ys, xs):
+    """Build the cell lattice of a ruled table, merging unruled neighbours
+
+    Cells are the rectangles between consecutive rules. Two neighbouring
+    cells are merged when the rule between them is mostly missing, which is
+    how spanning headers such as GROSS BLOCK / DEPRECIATION / NET BLOCK are
+    drawn. Returns a list of ``(row0, col0, row1, col1)`` spans (inclusive,
+    0-based) in reading order, one per merged cell.
+    """
+    rows, cols = len(ys) - 1, len(xs) - 1
+    if rows < 1 or cols < 1:
+        return []
+
+    uf = _UnionFind(rows * cols)
+    for r in range(rows):
+        y0, y1 = ys[r], ys[r + 1]
+        for c in range(cols):
+            x0, x1 = xs[c], xs[c + 1]
+            if c + 1 < cols:
+                x = xs[c + 1]
+                band = v_mask[y0:y1, max(0, x - 2):x + 3].max(axis=1)
+                if band.size and (band > 0).mean() < EDGE_COVERAGE:
+                    uf.union(r * cols + c, r * cols + c + 1)
+            if r + 1 < rows:
+                y = ys[r + 1]
+                band = h_mask[max(0, y - 2):y + 3, x0:x1].max(axis=0)
+                if band.size and (band > 0).mean() < EDGE_COVERAGE:
+                    uf.union(r * cols + c, (r + 1) * cols + c)
+
+    spans = {}
+    for r in range(rows):
+        for c in range(cols):
+            root = uf.find(r * cols + c)
+            if root not in spans:
+                spans[root] = [r, c, r, c]
+            else:
+                span = spans[root]
+                span[2] = max(span[2], r)
+                span[3] = max(span[3], c)
+    return sorted((tuple(span) for span in spans.values()))
+
+
+def _cell_crop(gray, ys, xs, span):
+    r0, c0, r1, c1 = span
+    y0, y1 = ys[r0] + CELL_INSET, ys[r1 + 1] - CELL_INSET
+    x0, x1 = xs[c0] + CELL_INSET, xs[c1 + 1] - CELL_INSET
+    if y1 <= y0 or x1 <= x0:
+        return None
+    return gray[y0:y1, x0:x1]
+
+
+def ocr_cells_batched(engine, crops):
+    """OCR many cell images with a single engine call
+
+    The crops are stacked vertically on one white canvas with a gap between
+    them, the canvas is OCR'd once with ``image_to_data``, and each word is
+    assigned back to the crop its vertical center falls in. Returns one
+    string per crop.
+    """
+    if not crops:
+        return []
+
+    width = max(crop.shape[1] for crop in crops) + 2 * BATCH_GAP
+    height = sum(crop.shape[0] + BATCH_GAP for crop in crops) + BATCH_GAP
+    canvas = np.full((height, width), 255, dtype=np.uint8)
+
+    offsets = []
+    y = BATCH_GAP
+    for crop in crops:
+        h, w = crop.shape[:2]
+        canvas[y:y + h, BATCH_GAP:BATCH_GAP + w] = crop
+        offsets.append((y, y + h))
+        y += h + BATCH_GAP
+
+    tops = np.array([top for top, _ in offsets])
+    texts = [[] for _ in crops]
+    words = engine.image_to_data(canvas)
+    for word in sorted(words, key=lambda w: (w.y0, w.x0)):
+        center = (word.y0 + word.y1) / 2
+        index = int(np.searchsorted(tops, center, side="right")) - 1
+        if 0 <= index < len(crops) and center <= offsets[index][1] + BATCH_GAP / 2:
+            texts[index].append(word)
+
+    return [" ".join(w.text for w in cell) for cell in texts]
+
+
+def detect_grid(gray):
+    """Return ``(ys, xs, spans)`` for the ruled table on a page, or None"""
+    h_mask, v_mask, ys, xs = detect_rules(gray)
+    if len(ys) < 3 or len(xs) < 3:
+        return None
+    spans = build_lattice(h_mask, v_mask, ys, xs)
+    if not spans:
+        return None
+    return ys, xs, spans
+
+
+def count_header_rows(spans):
+    """Guess how many rows at the top of a grid are column headings
+
+    A spanning heading (e.g. GROSS BLOCK) is followed by one row of
+    sub-headings, so the header ends one row below the lowest top-of-table
+    spanning cell. Without spanning cells the first row is the header.
+    """
+    header_end = 0
+    for r0, c0, r1, c1 in spans:
+        if c1 > c0 and r0 <= header_end:
+            header_end = max(header_end, r1 + 1)
+    return header_end + 1
+
+
+def ocr_grid(gray, grid, text_engine, numeric_engine, header_rows=None):
+    """OCR every cell of a detected grid, column by column
+
+    Header cells and the first (particulars) column are read with
+    ``text_engine``. Body cells of the other columns are amounts and are
+    read with ``numeric_engine``, which should restrict tesseract to
+    ``NUMERIC_WHITELIST``. Every column goes to the engine as one batch.
+
+    Returns ``(cells, merges)``: ``cells`` is a rows x columns list of
+    strings, with the text of a merged cell stored in its top-left slot.
+    ``merges`` lists the spanning cells as ``merge_cells`` keyword
+    arguments (1-based ``start_row``/``start_column``/``end_row``/
+    ``end_column``), the form the workbook builders already write.
+    """
+    ys, xs, spans = grid
+    rows, cols = len(ys) - 1, len(xs) - 1
+    if header_rows is None:
+        header_rows = count_header_rows(spans)
+
+    batches = {}
+    for span in spans:
+        r0, c0 = span[0], span[1]
+        numeric = c0 > 0 and r0 >= header_rows
+        key = ("numeric" if numeric else "text", c0)
+        batches.setdefault(key, []).append(span)
+
+    cells = [["" for _ in range(cols)] for _ in range(rows)]
+    for (kind, _), batch_spans in sorted(batches.items()):
+        engine = numeric_engine if kind == "numeric" else text_engine
+        crops = []
+        kept = []
+        for span in batch_spans:
+            crop = _cell_crop(gray, ys, xs, span)
+            if crop is not None and (crop < 128).any():
+                crops.append(crop)
+                kept.append(span)
+        for span, text in zip(kept, ocr_cells_batched(engine, crops)):
+            cells[span[0]][span[1]] = text
+
+    merges = [
+        {
+            "start_row": r0 + 1,
+            "start_column": c0 + 1,
+            "end_row": r1 + 1,
+            "end_column": c1 + 1,
+        }
+        for r0, c0, r1, c1 in spans
+        if r1 > r0 or c1 > c0
+    ]
+    return cells, merges
+
+
+def grid_to_rows(cells, header_rows):
+    """Turn OCR'd grid cells into ``TableRow`` records"""
+    body = cells[header_rows:]
+    if not body:
+        return []
+    amounts = parse_amounts([line[1:] for line in body]).values
+
+    rows = []
+    for line, line_amounts in zip(body, amounts):
+        description = line[0].strip() if line else ""
+        values = [None if np.isnan(v) else float(v) for v in line_amounts]
+        if description and any(v is not None for v in values):
+            rows.append(TableRow(description, values))
+    return rows
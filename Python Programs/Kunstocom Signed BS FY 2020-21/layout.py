@@ -0,0 +1,231 @@
+import os
+import re
+import sys
+
+import numpy as np
+
+# amounts is shared with the other script folders (see ../shared)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+
+from amounts import parse_amount, parse_amounts  # noqa: E402
+from table_model import TableRow  # noqa: E402
+
+
+# Minimum blank run between two columns, in average character widths
+MIN_COLUMN_GAP_CHARS = 2.0
+
+# Share of table lines allowed to cross a column gap (wrapped headings etc.)
+GAP_NOISE_RATIO = 0.05
+
+_NOTE = re.compile(r"^\d{1,3}(\.\d{1,2})?$")
+_FORMATTED_AMOUNT = re.compile(r"[,.]\d")
+
+
+def _word_arrays(words):
+    """Return x0, y0, x1, y1 arrays and the texts of positioned words"""
+    boxes = np.array([w[:4] for w in words], dtype=np.float64).reshape(-1, 4)
+    return boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3], [w[4] for w in words]
+
+
+def assign_lines(y0, y1):
+    """Return a line index for every word, grouping by vertical center
+
+    Lines are numbered from the top of the page down.
+    """
+    if len(y0) == 0:
+        return np.zeros(0, dtype=np.int64)
+    centers = (y0 + y1) / 2
+    tolerance = np.median(y1 - y0) / 2
+    order = np.argsort(centers, kind="stable")
+    breaks = np.diff(centers[order]) > tolerance
+    line_ids = np.empty(len(centers), dtype=np.int64)
+    line_ids[order] = np.concatenate(([0], np.cumsum(breaks)))
+    return line_ids
+
+
+def find_column_bounds(words, line_ids=None):
+    """Find the x positions separating the columns of a statement page
+
+    Only table lines are considered (two or more numbers, or one formatted
+    amount such as "1,000" or "12.50"), so titles, dates and prose
+    spanning the page do not hide the gaps. Every x position is counted by
+    how many of those words cover it (one cumulative sum over a difference
+    array); long runs covered by almost no words are column gaps. Returns
+    the sorted midpoints of those gaps.
+    """
+    if not words:
+        return np.zeros(0)
+
+    x0, y0, x1, y1, texts = _word_arrays(words)
+    if line_ids is None:
+        line_ids = assign_lines(y0, y1)
+
+    is_number = parse_amounts(texts).valid
+    is_formatted = np.array([bool(_FORMATTED_AMOUNT.search(t)) for t in texts])
+    numbers_per_line = np.bincount(line_ids[is_number], minlength=line_ids.max() + 1)
+    formatted_lines = np.unique(line_ids[is_number & is_formatted])
+    table_lines = np.union1d(np.flatnonzero(numbers_per_line >= 2), formatted_lines)
+    in_table = np.isin(line_ids, table_lines)
+    if not in_table.any():
+        return np.zeros(0)
+
+    x0, x1 = x0[in_table], x1[in_table]
+    chars = np.array([len(t) for t, keep in zip(texts, in_table) if keep])
+    char_width = np.median((x1 - x0) / np.maximum(chars, 1))
+    min_gap = MIN_COLUMN_GAP_CHARS * char_width
+
+    origin = np.floor(x0.min())
+    start = np.floor(x0 - origin).astype(np.int64)
+    stop = np.ceil(x1 - origin).astype(np.int64)
+    diff = np.zeros(stop.max() + 2, dtype=np.int64)
+    np.add.at(diff, start, 1)
+    np.add.at(diff, stop, -1)
+    coverage = np.cumsum(diff)[:-1]
+
+    noise = int(GAP_NOISE_RATIO * len(table_lines))
+    blank = (coverage <= noise).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], blank, [0])))
+    run_starts = np.flatnonzero(edges == 1)
+    run_stops = np.flatnonzero(edges == -1)
+
+    bounds = [
+        origin + (a + b) / 2
+        for a, b in zip(run_starts, run_stops)
+        if b - a >= min_gap and a > 0 and b < len(coverage)
+    ]
+    return np.array(bounds)
+
+
+def bucket_words(words, bounds=None, line_ids=None):
+    """Place every word in a (line, column) cell in one vectorized pass
+
+    Returns ``(cells, column_count)`` where ``cells`` is a list of lines
+    from top to bottom, each a list of ``column_count`` strings.
+    """
+    if not words:
+        return [], 0
+
+    x0, y0, x1, y1, texts = _word_arrays(words)
+    if line_ids is None:
+        line_ids = assign_lines(y0, y1)
+    if bounds is None:
+        bounds = find_column_bounds(words, line_ids)
+
+    # Line ids already run top to bottom (assign_lines numbers them in
+    # order of vertical position)
+    columns = np.searchsorted(bounds, (x0 + x1) / 2)
+    column_count = len(bounds) + 1
+
+    order = np.lexsort((x0, columns, line_ids))
+    cells = [[[] for _ in range(column_count)] for _ in range(line_ids.max() + 1)]
+    for i in order:
+        cells[line_ids[i]][columns[i]].append(texts[i])
+
+    return [[" ".join(cell) for cell in line] for line in cells], column_count
+
+
+def find_note_column(cells, column_count):
+    """Return the index of the "Note" column, or None
+
+    Only rows holding a formatted amount are looked at, so headings and
+    titles that happen to fall in the column are ignored. The note column
+    is the first column after the particulars whose cells in those rows are
+    all short note references such as "3" or "2.1".
+    """
+    amount_rows = [
+        line
+        for line in cells
+        if any(_is_formatted_amount(cell) for cell in line[1:])
+    ]
+    for col in range(1, column_count):
+        values = [line[col] for line in amount_rows if line[col]]
+        if values and all(_NOTE.match(v) for v in values):
+            return col
+    return None
+
+
+def _is_formatted_amount(text):
+    return bool(_FORMATTED_AMOUNT.search(text)) and parse_amount(text) is not None
+
+
+def line_extents(words, line_ids):
+    """Return the bounding box and mean confidence of every line's words
+
+    ``boxes`` is a lines x 4 int array of x0, y0, x1, y1; ``confidences``
+    is None when the words carry no confidence (text-layer words).
+    """
+    x0, y0, x1, y1, _ = _word_arrays(words)
+    lines = line_ids.max() + 1
+    boxes = np.empty((lines, 4))
+    boxes[:, :2] = np.inf
+    boxes[:, 2:] = -np.inf
+    np.minimum.at(boxes[:, 0], line_ids, x0)
+    np.minimum.at(boxes[:, 1], line_ids, y0)
+    np.maximum.at(boxes[:, 2], line_ids, x1)
+    np.maximum.at(boxes[:, 3], line_ids, y1)
+
+    confidences = None
+    if all(len(w) > 5 and w[5] is not None for w in words):
+        conf = np.array([w[5] for w in words], dtype=np.float64)
+        counts = np.bincount(line_ids, minlength=lines)
+        confidences = np.bincount(line_ids, conf, minlength=lines) / counts
+    return boxes.astype(np.int64), confidences
+
+
+def build_layout_rows(words):
+    """Turn positioned words into text lines and row records
+
+    Returns ``(lines, rows)``. ``lines`` are the cells of each line joined
+    with two spaces, as ``identify_tables`` expects. ``rows`` has one entry
+    per line: None when the line holds no amounts, otherwise a ``TableRow``
+    like ``process_table_row`` produces. ``values`` has one entry per
+    amount column, with None for blank cells so current/previous year stay
+    aligned, ``note`` is set when the page has a note column, and ``box``
+    and ``conf`` come from the line's words.
+    """
+    if not words:
+        return [], []
+    _, y0, _, y1, _ = _word_arrays(words)
+    line_ids = assign_lines(y0, y1)
+    cells, column_count = bucket_words(words, line_ids=line_ids)
+    boxes, confidences = line_extents(words, line_ids)
+    note_col = find_note_column(cells, column_count)
+
+    # Parse every cell of the page in one call; the particulars column is
+    # never an amount
+    amounts = parse_amounts(cells).values
+    amounts[:, 0] = np.nan
+
+    lines = []
+    rows = []
+    for index, (line, line_amounts) in enumerate(zip(cells, amounts)):
+        lines.append("  ".join(cell for cell in line if cell))
+
+        text_parts = []
+        values = []
+        for col, cell in enumerate(line):
+            if col == note_col:
+                continue
+            amount = line_amounts[col]
+            if not np.isnan(amount):
+                values.append(float(amount))
+            elif col > 0 and not cell:
+                values.append(None)
+            elif cell:
+                text_parts.append(cell)
+
+        if text_parts and any(v is not None for v in values):
+            note = line[note_col] if note_col is not None else None
+            rows.append(
+                TableRow(
+                    " ".join(text_parts).strip(),
+                    values,
+                    note or None,
+                    tuple(boxes[index].tolist()),
+                    float(confidences[index]) if confidences is not None else None,
+                )
+            )
+        else:
+            rows.append(None)
+
+    return lines, rows
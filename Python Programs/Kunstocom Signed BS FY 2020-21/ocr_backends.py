@@ -0,0 +1,243 @@
+import re
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+
+import numpy as np
+import pytesseract
+
+try:
+    import tesserocr
+except ImportError:  # optional: falls back to pytesseract
+    tesserocr = None
+
+
+# One recognized word. The first five fields match the word tuples read from
+# PDF text layers, so both can be laid out into lines the same way. ``line``
+# identifies the text line tesseract assigned the word to.
+OCRWord = namedtuple("OCRWord", "x0 y0 x1 y1 text conf line")
+
+# Orientation guesses from tesseract's OSD below this confidence are ignored
+MIN_ORIENTATION_CONFIDENCE = 2.0
+
+
+class PytesseractBackend:
+    """OCR through the ``tesseract`` command line, one subprocess per call
+
+    Always available wherever the converter already works; used as the
+    fallback when no in-process engine is installed.
+    """
+
+    name = "pytesseract"
+
+    def __init__(self, lang="eng", config="--psm 6"):
+        self.lang = lang
+        self.config = config
+
+    def image_to_string(self, img):
+        return pytesseract.image_to_string(img, lang=self.lang, config=self.config)
+
+    def image_to_data(self, img):
+        """Return the recognized words with their boxes and confidences"""
+        data = pytesseract.image_to_data(
+            img,
+            lang=self.lang,
+            config=self.config,
+            output_type=pytesseract.Output.DICT,
+        )
+        words = []
+        for i, text in enumerate(data["text"]):
+            text = text.strip()
+            if not text:
+                continue
+            left, top = data["left"][i], data["top"][i]
+            words.append(
+                OCRWord(
+                    left,
+                    top,
+                    left + data["width"][i],
+                    top + data["height"][i],
+                    text,
+                    float(data["conf"][i]),
+                    (data["block_num"][i], data["par_num"][i], data["line_num"][i]),
+                )
+            )
+        return words
+
+    def detect_orientation(self, img):
+        """Return the clockwise rotation (0, 90, 180 or 270) that makes the
+        page upright, or 0 when OSD data is missing or unsure"""
+        try:
+            osd = pytesseract.image_to_osd(img, output_type=pytesseract.Output.DICT)
+        except pytesseract.TesseractError:
+            return 0
+        if float(osd.get("orientation_conf", 0)) < MIN_ORIENTATION_CONFIDENCE:
+            return 0
+        return int(osd["rotate"]) % 360
+
+    def close(self):
+        pass
+
+
+class TesserocrBackend:
+    """OCR through a long-lived in-process tesseract engine (``tesserocr``)
+
+    The language model is loaded once when the backend is created and reused
+    for every page. Images are handed over as raw pixel buffers, so there are
+    no temp files and no process forks per page.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self, lang="eng", config="--psm 6"):
+        if tesserocr is None:
+            raise ImportError("tesserocr is not installed")
+        self.lang = lang
+        self.config = config
+        self.api = tesserocr.PyTessBaseAPI(lang=lang, psm=_parse_psm(config))
+        for name, value in _parse_variables(config):
+            self.api.SetVariable(name, value)
+        # Orientation detection needs its own engine; created on first use
+        self._osd_api = None
+
+    def _set_image(self, img, api=None):
+        arr = np.ascontiguousarray(np.asarray(img))
+        if arr.dtype == np.bool_:
+            arr = arr.astype(np.uint8) * 255
+        height, width = arr.shape[:2]
+        channels = 1 if arr.ndim == 2 else arr.shape[2]
+        (api or self.api).SetImageBytes(
+            arr.tobytes(), width, height, channels, width * channels
+        )
+
+    def image_to_string(self, img):
+        self._set_image(img)
+        return self.api.GetUTF8Text()
+
+    def image_to_data(self, img):
+        """Return the recognized words with their boxes and confidences"""
+        self._set_image(img)
+        self.api.Recognize()
+        level = tesserocr.RIL.WORD
+        words = []
+        line_num = 0
+        for word in tesserocr.iterate_level(self.api.GetIterator(), level):
+            if word.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+                line_num += 1
+            text = (word.GetUTF8Text(level) or "").strip()
+            if not text:
+                continue
+            x0, y0, x1, y1 = word.BoundingBox(level)
+            words.append(OCRWord(x0, y0, x1, y1, text, word.Confidence(level), line_num))
+        return words
+
+    def detect_orientation(self, img):
+        """Return the clockwise rotation (0, 90, 180 or 270) that makes the
+        page upright, or 0 when OSD data is missing or unsure"""
+        if self._osd_api is None:
+            try:
+                self._osd_api = tesserocr.PyTessBaseAPI(
+                    lang="osd", psm=tesserocr.PSM.OSD_ONLY
+                )
+            except RuntimeError:
+                self._osd_api = False
+        if not self._osd_api:
+            return 0
+        self._set_image(img, self._osd_api)
+        result = self._osd_api.DetectOrientationScript()
+        if not result or result["orient_conf"] < MIN_ORIENTATION_CONFIDENCE:
+            return 0
+        return (360 - result["orient_deg"]) % 360
+
+    def close(self):
+        self.api.End()
+        if self._osd_api:
+            self._osd_api.End()
+
+
+OCR_BACKENDS = {
+    PytesseractBackend.name: PytesseractBackend,
+    TesserocrBackend.name: TesserocrBackend,
+}
+
+# Engines already created, one per (backend, lang, config) in every thread,
+# so each pool worker keeps its own engine alive across pages and documents.
+# Tesseract engines are not thread-safe, so threads never share one at the
+# same time; pipeline threads, which only live for one document, borrow
+# theirs from _idle_engines instead (see lend_engines).
+_local = threading.local()
+
+# Engine sets handed back by threads done with them, for the next borrower
+_idle_engines = []
+_idle_lock = threading.Lock()
+
+
+def _thread_engines():
+    engines = getattr(_local, "engines", None)
+    if engines is None:
+        engines = _local.engines = {}
+    return engines
+
+
+@contextmanager
+def lend_engines():
+    """Give the calling thread an engine set from a process-wide pool
+
+    Engines created inside the block stay in the set when it is handed
+    back, so short-lived threads, such as a pipeline's stage workers for one
+    document, reuse the engines (and the loaded tesseract models) of the
+    threads before them instead of starting their own.
+    """
+    with _idle_lock:
+        engines = _idle_engines.pop() if _idle_engines else {}
+    previous = getattr(_local, "engines", None)
+    _local.engines = engines
+    try:
+        yield engines
+    finally:
+        _local.engines = previous
+        with _idle_lock:
+            _idle_engines.append(engines)
+
+
+def _parse_psm(config):
+    """Pull the page segmentation mode out of a tesseract config string"""
+    match = re.search(r"--psm\s+(\d+)", config or "")
+    return int(match.group(1)) if match else 3
+
+
+def _parse_variables(config):
+    """Pull ``-c name=value`` settings out of a tesseract config string"""
+    return re.findall(r"-c\s+([\w]+)=(\S+)", config or "")
+
+
+def resolve_backend_name(name="auto"):
+    """Map "auto" to the fastest backend installed; validate other names"""
+    if name == "auto":
+        return TesserocrBackend.name if tesserocr is not None else PytesseractBackend.name
+    if name not in OCR_BACKENDS:
+        raise ValueError(
+            f"Unknown OCR backend {name!r}; expected one of {sorted(OCR_BACKENDS)}"
+        )
+    return name
+
+
+def get_ocr_backend(name="auto", lang="eng", config="--psm 6"):
+    """Return this thread's engine for the given backend and settings"""
+    name = resolve_backend_name(name)
+    key = (name, lang, config)
+    engines = _thread_engines()
+    if key not in engines:
+        engines[key] = OCR_BACKENDS[name](lang=lang, config=config)
+    return engines[key]
+
+
+def close_ocr_backends():
+    """Release every engine created in the calling thread or lent out idle"""
+    with _idle_lock:
+        idle = _idle_engines[:]
+        del _idle_engines[:]
+    for engines in [_thread_engines()] + idle:
+        while engines:
+            _, engine = engines.popitem()
+            engine.close()
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """Return the SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def raster_sha256(img):
+    """Return the SHA-256 of a rendered page's pixels and dimensions
+
+    Poppler renders unchanged page content to identical pixels, so this
+    fingerprints a page independently of the PDF it sits in.
+    """
+    arr = np.ascontiguousarray(np.asarray(img))
+    digest = hashlib.sha256(f"{arr.shape}{arr.dtype.str}".encode("ascii"))
+    digest.update(arr.data)
+    return digest.hexdigest()
+
+
+class OCRCache:
+    """Content-addressed on-disk cache for OCR text
+
+    Entries are keyed by everything that affects the OCR output (PDF content
+    hash, page, DPI, tesseract settings, preprocessing parameters), so editing
+    the Excel-building code never invalidates them. The directory is kept
+    under ``max_bytes`` by evicting the least recently used entries; reads
+    refresh an entry's modification time, which is what eviction goes by.
+    """
+
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Guards the counters: pipeline stage threads share one cache
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.total_bytes = sum(size for _, size, _ in self._entries())
+
+    @staticmethod
+    def make_key(
+        pdf_hash,
+        page_num,
+        dpi,
+        lang,
+        config,
+        preprocess_params,
+        backend=None,
+        adaptive=None,
+        output="text",
+    ):
+        """Build the cache key for one page's OCR result"""
+        payload = json.dumps(
+            {
+                "pdf": pdf_hash,
+                "page": page_num,
+                "dpi": dpi,
+                "lang": lang,
+                "config": config,
+                "preprocess": preprocess_params,
+                "backend": backend,
+                "adaptive": adaptive,
+                "output": output,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.txt")
+
+    def _entries(self):
+        """Yield (path, size, mtime) for every entry in the cache directory"""
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".txt"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, st.st_size, st.st_mtime
+
+    def __contains__(self, key):
+        """Whether ``key`` has an entry; unlike ``get`` not counted as a lookup"""
+        return os.path.exists(self._path(key))
+
+    def get(self, key):
+        """Return the cached text for ``key``, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return text
+
+    def put(self, key, text):
+        """Store ``text`` under ``key`` and evict old entries if over the cap"""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            previous_size = os.path.getsize(path)
+        except FileNotFoundError:
+            previous_size = 0
+
+        # Write to a temp file and rename so concurrent workers never see
+        # a partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.total_bytes += os.path.getsize(path) - previous_size
+            over_cap = self.total_bytes > self.max_bytes
+        if over_cap:
+            self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits its cap"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        self.total_bytes = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if self.total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self.total_bytes -= size
+
+    def clear(self):
+        """Remove every entry from the cache"""
+        for path, _, _ in list(self._entries()):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self.total_bytes = 0
+
+    def stats(self):
+        """Return hit/miss counters and the current size of the cache"""
+        # Re-read sizes from disk: other processes may share the directory
+        sizes = [size for _, size, _ in self._entries()]
+        self.total_bytes = sum(sizes)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(sizes),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def format_stats(self):
+        """Return a one-line, human-readable summary of ``stats()``"""
+        s = self.stats()
+        lookups = s["hits"] + s["misses"]
+        hit_rate = (s["hits"] / lookups * 100) if lookups else 0.0
+        return (
+            f"OCR cache: {s['hits']} hits, {s['misses']} misses "
+            f"({hit_rate:.1f}% hit rate), {s['entries']} entries, "
+            f"{s['bytes'] / 1024:.1f} KB of {s['max_bytes'] / (1024 * 1024):.0f} MB"
+        )
@@ -0,0 +1,132 @@
+import sys
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+
+# What a worker needs to find a page in shared memory: the block name and
+# the array layout. A few dozen bytes to pickle instead of the bitmap.
+PageBufferRef = namedtuple("PageBufferRef", "name shape dtype")
+
+# Blocks a worker process keeps attached between pages
+MAX_ATTACHED = 16
+
+# Python 3.13+ can attach without registering the block with the resource
+# tracker. Older versions always register it, which is harmless as long as
+# the worker shares the parent's tracker (see SharedPageArena)
+_ATTACH_KWARGS = {"track": False} if sys.version_info >= (3, 13) else {}
+
+
+def _unlink_all(blocks):
+    for block in blocks:
+        try:
+            block.close()
+            block.unlink()
+        except (BufferError, FileNotFoundError):
+            pass
+    blocks.clear()
+
+
+class SharedPageArena:
+    """A fixed number of shared-memory slots for page bitmaps
+
+    ``put`` copies a page into a free slot and returns a ``PageBufferRef``
+    to send to a worker in place of the array; ``release`` frees the slot
+    once the worker is done with it. A slot's block is reused for later
+    pages and only replaced when a page does not fit, so a whole document
+    is handed over through ``slots`` blocks.
+
+    Every block is unlinked by ``close``, when the arena is garbage
+    collected, or at interpreter exit, whichever comes first. If the
+    process dies outright, multiprocessing's resource tracker removes the
+    blocks it left behind.
+
+    Create the arena before the pool starts its workers: it starts the
+    resource tracker, and workers that inherit it cannot unlink the
+    parent's blocks through a tracker of their own when they exit.
+    """
+
+    def __init__(self, slots):
+        resource_tracker.ensure_running()
+        self.slots = max(1, slots)
+        self._blocks = [None] * self.slots
+        self._free = list(range(self.slots))
+        self._in_use = {}
+        self._lock = threading.Lock()
+        self._live = []
+        # Also runs at interpreter exit, and holds no reference to the arena
+        self._finalizer = weakref.finalize(self, _unlink_all, self._live)
+
+    def put(self, arr):
+        """Copy ``arr`` into a free slot and return its ``PageBufferRef``"""
+        arr = np.asarray(arr)
+        with self._lock:
+            if not self._free:
+                raise RuntimeError("no free page slot; release pages first")
+            slot = self._free.pop()
+
+        block = self._blocks[slot]
+        if block is None or block.size < arr.nbytes:
+            if block is not None:
+                self._discard(block)
+            block = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            self._blocks[slot] = block
+            self._live.append(block)
+
+        view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=block.buf)
+        view[...] = arr
+        del view
+        ref = PageBufferRef(block.name, arr.shape, arr.dtype.str)
+        with self._lock:
+            self._in_use[ref] = slot
+        return ref
+
+    def release(self, ref):
+        """Return the slot holding ``ref`` to the free list"""
+        with self._lock:
+            slot = self._in_use.pop(ref, None)
+            if slot is not None:
+                self._free.append(slot)
+
+    def _discard(self, block):
+        self._live.remove(block)
+        _unlink_all([block])
+
+    def close(self):
+        """Unlink every block; workers still attached keep their mapping"""
+        self._finalizer()
+        self._blocks = [None] * self.slots
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Blocks attached in this (worker) process, most recently used last
+_attached = OrderedDict()
+
+
+def open_page(ref):
+    """Return the page behind a ``PageBufferRef`` as an array, without copying
+
+    The block stays attached for later pages in the same slot. The array
+    is only valid until the parent releases the slot.
+    """
+    block = _attached.get(ref.name)
+    if block is None:
+        block = shared_memory.SharedMemory(name=ref.name, **_ATTACH_KWARGS)
+        _attached[ref.name] = block
+        while len(_attached) > MAX_ATTACHED:
+            _, old = _attached.popitem(last=False)
+            try:
+                old.close()
+            except BufferError:
+                pass
+    else:
+        _attached.move_to_end(ref.name)
+    return np.ndarray(ref.shape, dtype=np.dtype(ref.dtype), buffer=block.buf)
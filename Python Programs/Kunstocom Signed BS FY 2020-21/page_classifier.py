@@ -0,0 +1,63 @@
+import re
+
+from grid_ocr import detect_rules
+
+
+BALANCE_SHEET = "balance_sheet"
+PROFIT_LOSS = "profit_loss"
+CASH_FLOW = "cash_flow"
+NOTE_TABLE = "note_table"
+SCHEDULE = "schedule"
+PROSE = "prose"
+
+# Pages with this label have no tables worth extracting
+SKIP_LABELS = {PROSE}
+
+# Share of tokens containing a digit above which a page counts as tabular
+MIN_NUMERIC_DENSITY = 0.12
+
+# Only the first few lines are searched for a statement title, so prose
+# that mentions "the balance sheet" further down is not mistaken for one
+TITLE_LINES = 8
+
+_TITLE_PATTERNS = [
+    (NOTE_TABLE, re.compile(r"notes\s*(to|forming|on)\b")),
+    (BALANCE_SHEET, re.compile(r"balance\s*sheet")),
+    (PROFIT_LOSS, re.compile(r"profit\s*(&|and)?\s*loss|income\s*(&|and)\s*expenditure")),
+    (CASH_FLOW, re.compile(r"cash\s*flow")),
+    (SCHEDULE, re.compile(r"schedule|annexure|fixed\s*assets")),
+    (NOTE_TABLE, re.compile(r"^note\s*(no\.?)?\s*[-:]?\s*\d+", re.MULTILINE)),
+]
+_DIGIT = re.compile(r"\d")
+
+
+def numeric_density(text):
+    """Share of whitespace-separated tokens in ``text`` that contain a digit"""
+    tokens = text.split()
+    if not tokens:
+        return 0.0
+    return sum(1 for token in tokens if _DIGIT.search(token)) / len(tokens)
+
+
+def classify_text(text, ruled=False):
+    """Label a page from its (possibly rough) text and layout features
+
+    ``ruled`` says whether the page carries a ruling grid. Returns one of
+    the label constants in this module.
+    """
+    density = numeric_density(text)
+    if density < MIN_NUMERIC_DENSITY and not ruled:
+        return PROSE
+
+    lines = [line.strip().lower() for line in text.splitlines() if line.strip()]
+    title = "\n".join(lines[:TITLE_LINES])
+    for label, pattern in _TITLE_PATTERNS:
+        if pattern.search(title):
+            return label
+    return SCHEDULE if ruled else NOTE_TABLE
+
+
+def has_ruling(gray, min_rules=3):
+    """Return True if a (thumbnail) page shows a grid of ruling lines"""
+    _, _, ys, xs = detect_rules(gray)
+    return len(ys) >= min_rules and len(xs) >= min_rules
@@ -1,166 +1,1071 @@
 import pandas as pd
-import pytesseract
-from pdf2image import convert_from_path
-import cv2
+from pdf2image import convert_from_path, pdfinfo_from_path
 import numpy as np
-import re
 import os
+import json
+from collections import deque
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, wait
 from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.cell.cell import MergedCell
 from openpyxl.utils import get_column_letter
 
+from ocr_backends import OCRWord, get_ocr_backend, lend_engines, resolve_backend_name
+from adaptive_ocr import AdaptiveOCR, render_region
+from grid_ocr import (
+    NUMERIC_WHITELIST,
+    count_header_rows,
+    detect_grid,
+    grid_to_rows,
+    ocr_grid,
+)
+from layout import build_layout_rows
+from ocr_cache import OCRCache, file_sha256, raster_sha256
+from page_buffers import PageBufferRef, SharedPageArena, open_page
+from page_classifier import (
+    BALANCE_SHEET,
+    CASH_FLOW,
+    NOTE_TABLE,
+    PROFIT_LOSS,
+    SCHEDULE,
+    SKIP_LABELS,
+    classify_text,
+    has_ruling,
+)
+from preprocessing import PAGE_PROFILES, PageTransform, PreprocessPipeline, Region
+from stage_pipeline import Stage, StagedPipeline
+from table_model import ExtractedTable, tables_from_json, tables_to_json
+from table_segmenter import segment_tables, split_table_row
+from text_layer import extract_text_layer, is_usable_text_layer, words_to_text
+
+
+# Process pool shared by every converter in this process, so a batch of
+# documents reuses the same OCR workers instead of forking new ones per call
+_ocr_pool = None
+_ocr_pool_workers = None
+
+# Converter rebuilt inside each worker process, keyed by its OCR settings
+_worker_converter = None
+_worker_settings = None
+
+
+def get_ocr_pool(workers=None):
+    """Return the shared OCR process pool, creating it on first use"""
+    global _ocr_pool, _ocr_pool_workers
+    workers = workers or os.cpu_count() or 1
+    if _ocr_pool is None or _ocr_pool_workers != workers:
+        shutdown_ocr_pool()
+        _ocr_pool = ProcessPoolExecutor(max_workers=workers)
+        _ocr_pool_workers = workers
+    return _ocr_pool
+
+
+def shutdown_ocr_pool():
+    """Shut down the shared OCR process pool, if one is running"""
+    global _ocr_pool, _ocr_pool_workers
+    if _ocr_pool is not None:
+        _ocr_pool.shutdown()
+    _ocr_pool = None
+    _ocr_pool_workers = None
+
+
+def _process_page_worker(settings, img, page_num, fingerprint=None):
+    """Run the per-page OCR path inside a pool worker
+
+    ``img`` is either the page array itself or a ``PageBufferRef`` to a
+    page the parent placed in shared memory, which is used in place.
+    ``fingerprint`` is the page's raster hash in incremental mode, so the
+    worker keys its cached OCR results the way the parent does.
+    Returns the page's tables together with how much the worker's counters
+    (OCR cache hits/misses, preprocessing time per stage, ...) moved while
+    processing it, so the parent can report document-wide stats.
+    """
+    global _worker_converter, _worker_settings
+    if _worker_converter is None or _worker_settings != settings:
+        _worker_converter = FinancialStatementConverter(**settings)
+        _worker_settings = settings
+    if fingerprint is None:
+        # Left over from an earlier document otherwise
+        _worker_converter.page_fingerprints.pop(page_num, None)
+    else:
+        _worker_converter.page_fingerprints[page_num] = fingerprint
+    if isinstance(img, PageBufferRef):
+        img = open_page(img)
+
+    before = _worker_converter.get_page_stats()
+    tables = _worker_converter.process_page(img, page_num)
+    after = _worker_converter.get_page_stats()
+    return tables, {name: value - before[name] for name, value in after.items()}
+
+
+def _cached_word(record):
+    """Rebuild an ``OCRWord`` from its JSON list in the OCR cache"""
+    *fields, line = record
+    return OCRWord(*fields, tuple(line) if isinstance(line, list) else line)
+
+
+# Threads per stage of the single-process page pipeline (see
+# ``_process_pages_pipelined``); rendering always runs in one thread
+DEFAULT_STAGE_WORKERS = {"preprocess": 1, "ocr": 1, "parse": 1}
+
+# Worksheet that extracted tables of each page type are written to
+EXTRACTED_SHEET_NAMES = {
+    BALANCE_SHEET: "Balance Sheet",
+    PROFIT_LOSS: "Profit and Loss",
+    CASH_FLOW: "Cash Flow",
+    NOTE_TABLE: "Notes",
+    SCHEDULE: "Schedules",
+    None: "Tables",
+}
+
+HEADER_FILL = PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid")
+
+# Cell styles, registered once per workbook as named styles (see
+# ``register_styles``) and assigned to cells by name
+CELL_STYLES = {
+    "title": dict(font=Font(bold=True, size=14)),
+    "subtitle": dict(font=Font(bold=True, size=12)),
+    "header": dict(
+        font=Font(bold=True), fill=HEADER_FILL, alignment=Alignment(horizontal="center")
+    ),
+    "table_name": dict(font=Font(bold=True), fill=HEADER_FILL),
+    "bold": dict(font=Font(bold=True)),
+    "italic": dict(font=Font(italic=True)),
+}
+
+
+# Alignment of the particulars (label) and amount (value) columns of the
+# Notes sheet, and the thin box around its cells with content; layered over
+# a cell's own named style by ``notes_cell_style``
+NOTES_ALIGNMENT = {
+    "label": Alignment(horizontal="left", vertical="center"),
+    "value": Alignment(horizontal="right", vertical="center"),
+}
+THIN_SIDE = Side(style="thin")
+THIN_BOX = Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE)
+
+
+def register_styles(wb):
+    """Add ``CELL_STYLES`` to the workbook as named styles"""
+    existing = set(wb.named_styles)
+    for name, attributes in CELL_STYLES.items():
+        if name not in existing:
+            wb.add_named_style(NamedStyle(name=name, **attributes))
+
+
+def notes_cell_style(wb, base, column, boxed):
+    """Return the named style of a formatted Notes cell
+
+    It is the cell's ``base`` style ("Normal" or a ``CELL_STYLES`` name)
+    with the ``column`` ("label" or "value") alignment, and boxed when
+    ``boxed``. Each combination is registered the first time it is asked
+    for, so the workbook only carries the ones in use.
+    """
+    name = f"{base} {column} boxed" if boxed else f"{base} {column}"
+    if name not in wb.named_styles:
+        attributes = dict(CELL_STYLES.get(base, {"font": DEFAULT_FONT}))
+        attributes["alignment"] = NOTES_ALIGNMENT[column]
+        if boxed:
+            attributes["border"] = THIN_BOX
+        wb.add_named_style(NamedStyle(name=name, **attributes))
+    return name
+
 
 class FinancialStatementConverter:
-    def __init__(self, pdf_path):
+    def __init__(
+        self,
+        pdf_path,
+        dpi=300,
+        page_window=1,
+        workers=1,
+        pool=None,
+        cache_dir=None,
+        cache_max_bytes=512 * 1024 * 1024,
+        use_text_layer=True,
+        ocr_backend="auto",
+        preprocess=None,
+        adaptive_dpi=None,
+        column_layout=False,
+        grid_tables=False,
+        classify_pages=False,
+        skip_prose_pages=False,
+        thumbnail_dpi=100,
+        orient_pages=False,
+        crop_pages=False,
+        crop_profile=None,
+        pipeline=False,
+        stage_workers=None,
+        stage_queue_size=2,
+        shared_pages=False,
+        incremental=False,
+    ):
         self.pdf_path = pdf_path
+        self.dpi = dpi
+        # Read pages that carry an embedded text layer directly, and only
+        # rasterize and OCR the scanned ones
+        self.use_text_layer = use_text_layer
+        # With ``column_layout``, build table rows from word positions
+        # (columns found per page) rather than by splitting OCR text lines
+        # on runs of spaces
+        self.column_layout = column_layout
+        # Read pages with ruled tables cell by cell instead of as full text;
+        # opt-in, as it changes how those pages come out
+        self.grid_tables = grid_tables
+        # Label every page from its text layer or a thumbnail OCR first; the
+        # labels are kept on the tables. With ``skip_prose_pages`` (which
+        # classifies pages even without ``classify_pages``) pages labelled
+        # as having no tables (auditor's report, prose) are left out instead
+        # of being OCR'd in full. Both are opt-in, as labelling costs every
+        # scanned page a thumbnail render and OCR
+        self.classify_pages = classify_pages
+        self.skip_prose_pages = skip_prose_pages
+        self.thumbnail_dpi = thumbnail_dpi
+        self.page_labels = {}
+        # Tesseract and preprocessing settings; all of them feed the OCR
+        # cache key, so changing any one of them re-OCRs the affected pages
+        self.ocr_lang = "eng"
+        self.ocr_config = "--psm 6"
+        # "tesserocr" keeps one tesseract engine loaded per process,
+        # "pytesseract" forks the CLI per page; "auto" picks the former
+        # when it is installed
+        self.ocr_backend = resolve_backend_name(ocr_backend)
+        # Preprocessing stages, e.g. {"threshold": 150, "denoise": 3,
+        # "deskew": True}; see PreprocessPipeline for the defaults
+        self.preprocessor = PreprocessPipeline(**(preprocess or {}))
+        # With ``orient_pages``, turn scanned pages upright and level them
+        # before preprocessing. The transform is estimated once per page on
+        # a downscaled copy and cached per (PDF, page); it supersedes the
+        # pipeline's deskew stage
+        self.orient_pages = orient_pages
+        self.page_transforms = {}
+        if orient_pages:
+            self.preprocessor.deskew = False
+        # With ``crop_pages``, OCR only the body of each page: margins,
+        # letterheads, page numbers and signature blocks are cropped away.
+        # Off by default, as a table whose last rows sit apart from the rest
+        # low on the page is cut with them. ``crop_profile`` names a
+        # PAGE_PROFILES entry or lists Regions of its own to blank out
+        self.crop_pages = crop_pages
+        if isinstance(crop_profile, str):
+            crop_profile = PAGE_PROFILES[crop_profile]
+        self.exclude_zones = tuple(Region(*zone) for zone in crop_profile or ())
+        # Two-pass OCR: pages are rendered at adaptive_dpi and only the
+        # numeric or low-confidence regions are re-read at dpi
+        self.adaptive_dpi = adaptive_dpi
+        self.adaptive_ocr = None
+        if adaptive_dpi:
+            # High-DPI bands are cut straight from the PDF, so the low-DPI
+            # page must keep the PDF's geometry
+            self.preprocessor.deskew = False
+            self.orient_pages = False
+            self.crop_pages = False
+            self.adaptive_ocr = AdaptiveOCR(
+                partial(
+                    get_ocr_backend, self.ocr_backend, self.ocr_lang, self.ocr_config
+                ),
+                self.preprocessor,
+                pdf_path,
+                low_dpi=adaptive_dpi,
+                high_dpi=dpi,
+            )
+        # Persistent OCR results, reused across runs on the same PDF
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = cache_max_bytes
+        self.ocr_cache = OCRCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self._pdf_hash = None
+        # Key cached results of scanned pages by a hash of the page's
+        # thumbnail raster instead of (PDF, page number), and keep each
+        # page's tables, so a re-issued PDF only re-OCRs the pages whose
+        # rendering changed
+        if incremental and self.ocr_cache is None:
+            raise ValueError("incremental conversion needs a cache_dir")
+        self.incremental = incremental
+        self.page_fingerprints = {}
+        # Number of pages rasterized per poppler call when streaming
+        self.page_window = page_window
+        # Pages are OCR'd in a process pool when workers > 1; pass an
+        # executor as ``pool``, with its number of workers as ``workers``,
+        # to share one across a batch of documents
+        self.workers = workers
+        self.pool = pool
+        # With ``shared_pages``, hand pages to pool workers through shared
+        # memory rather than pickling each bitmap through the pool's pipe
+        self.shared_pages = shared_pages
+        # Otherwise, with ``pipeline``, rendering, preprocessing, OCR and
+        # parsing overlap in threads joined by bounded queues;
+        # ``stage_workers`` overrides DEFAULT_STAGE_WORKERS, e.g. {"ocr": 2}
+        self.pipeline = pipeline
+        self.stage_workers = dict(DEFAULT_STAGE_WORKERS, **(stage_workers or {}))
+        self.stage_queue_size = stage_queue_size
         self.images = None
         self.wb = Workbook()
-
-    def convert_pdf_to_images(self, dpi=300):
+        register_styles(self.wb)
+
+    def get_ocr_settings(self):
+        """Return the settings a pool worker needs to OCR pages like this one"""
+        return {
+            "pdf_path": self.pdf_path,
+            "dpi": self.dpi,
+            "cache_dir": self.cache_dir,
+            "cache_max_bytes": self.cache_max_bytes,
+            "ocr_backend": self.ocr_backend,
+            "preprocess": self.preprocessor.params(),
+            "adaptive_dpi": self.adaptive_dpi,
+            "column_layout": self.column_layout,
+            "grid_tables": self.grid_tables,
+            "orient_pages": self.orient_pages,
+            "crop_pages": self.crop_pages,
+            "crop_profile": [list(zone) for zone in self.exclude_zones],
+            "incremental": self.incremental,
+        }
+
+    @property
+    def render_dpi(self):
+        """Resolution pages are rasterized at before OCR"""
+        return self.adaptive_dpi or self.dpi
+
+    def get_page_stats(self):
+        """Return the running per-page counters as a flat dict of numbers"""
+        cache = self.ocr_cache
+        stats = {
+            "cache_hits": cache.hits if cache else 0,
+            "cache_misses": cache.misses if cache else 0,
+            "preprocess_pages": self.preprocessor.pages,
+        }
+        for stage, seconds in self.preprocessor.timings.items():
+            stats[f"preprocess_{stage}"] = seconds
+        if self.adaptive_ocr is not None:
+            stats["adaptive_low_pixels"] = self.adaptive_ocr.low_pixels
+            stats["adaptive_high_pixels"] = self.adaptive_ocr.high_pixels
+        return stats
+
+    def merge_page_stats(self, stats):
+        """Add counters reported by a pool worker to this converter's own"""
+        if self.ocr_cache is not None:
+            self.ocr_cache.hits += stats["cache_hits"]
+            self.ocr_cache.misses += stats["cache_misses"]
+        self.preprocessor.merge_timings(
+            {
+                stage: stats[f"preprocess_{stage}"]
+                for stage in self.preprocessor.timings
+            },
+            stats["preprocess_pages"],
+        )
+        if self.adaptive_ocr is not None:
+            self.adaptive_ocr.low_pixels += stats["adaptive_low_pixels"]
+            self.adaptive_ocr.high_pixels += stats["adaptive_high_pixels"]
+
+    @property
+    def pdf_hash(self):
+        """SHA-256 of the PDF contents, computed once per converter"""
+        if self._pdf_hash is None:
+            self._pdf_hash = file_sha256(self.pdf_path)
+        return self._pdf_hash
+
+    def convert_pdf_to_images(self, dpi=None):
         """Convert PDF to high-resolution images for OCR processing"""
+        dpi = dpi or self.render_dpi
         print(f"Converting PDF to images: {self.pdf_path}")
-        self.images = convert_from_path(self.pdf_path, dpi=dpi)
+        self.images = convert_from_path(self.pdf_path, dpi=dpi, grayscale=True)
         print(f"Converted {len(self.images)} pages to images")
         return self.images
 
-    def preprocess_image(self, img):
-        """Preprocess image for better OCR results"""
-        # Convert PIL Image to OpenCV format
-        img_cv = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
-
-        # Convert to grayscale
-        gray = cv2.cvtColor(img_cv, cv2.COLOR_BGR2GRAY)
-
-        # Apply threshold to get black and white image
-        _, thresh = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY)
-
-        # Remove noise
-        kernel = np.ones((1, 1), np.uint8)
-        opening = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
+    def get_page_count(self):
+        """Return the number of pages in the PDF without rendering it"""
+        return int(pdfinfo_from_path(self.pdf_path)["Pages"])
+
+    def iter_pdf_pages(self, dpi=None, window=None, page_numbers=None):
+        """Render the PDF a few pages at a time, yielding (page_num, image)
+
+        Only ``window`` pages are held in memory at once and each image is
+        closed as soon as the caller moves on, so peak memory does not grow
+        with the length of the document. ``page_numbers`` restricts rendering
+        to the given pages (1-based); by default every page is rendered.
+        """
+        dpi = dpi or self.render_dpi
+        window = max(1, window or self.page_window)
+        if page_numbers is None:
+            page_numbers = range(1, self.get_page_count() + 1)
+
+        for first_page, last_page in self._page_windows(page_numbers, window):
+            batch = convert_from_path(
+                self.pdf_path,
+                dpi=dpi,
+                first_page=first_page,
+                last_page=last_page,
+                grayscale=True,
+            )
+            page_num = first_page
+            while batch:
+                img = batch.pop(0)
+                try:
+                    yield page_num, img
+                finally:
+                    img.close()
+                page_num += 1
+
+    @staticmethod
+    def _page_windows(page_numbers, window):
+        """Split page numbers into runs of consecutive pages, at most ``window`` long"""
+        runs = []
+        for page_num in sorted(page_numbers):
+            if runs and page_num == runs[-1][1] + 1 and page_num - runs[-1][0] < window:
+                runs[-1][1] = page_num
+            else:
+                runs.append([page_num, page_num])
+        return [tuple(run) for run in runs]
+
+    def get_text_layer_pages(self):
+        """Return {page_num: words} for pages whose embedded text is usable"""
+        pages = extract_text_layer(self.pdf_path)
+        return {
+            page_num: words
+            for page_num, words in pages.items()
+            if is_usable_text_layer(words)
+        }
+
+    def preprocess_image(self, img, inplace=False):
+        """Preprocess image for better OCR results
+
+        ``img`` is left untouched unless ``inplace`` says the caller owns it
+        and its buffer may be reused.
+        """
+        return self.preprocessor.run(img, inplace=inplace)
+
+    def _page_source(self, page_num):
+        """Return the (document, page) pair cache keys for a page use
+
+        In incremental mode a fingerprinted page is identified by its
+        raster hash alone, wherever it sits in whichever PDF.
+        """
+        fingerprint = self.page_fingerprints.get(page_num)
+        if fingerprint is not None:
+            return fingerprint, None
+        return self.pdf_hash, page_num
+
+    def _ocr_cache_key(self, page_num, output):
+        """Return the OCR cache key for a page, or None if not caching"""
+        if self.ocr_cache is None or page_num is None:
+            return None
+        return OCRCache.make_key(
+            *self._page_source(page_num),
+            self.dpi,
+            self.ocr_lang,
+            self.ocr_config,
+            dict(
+                self.preprocessor.params(),
+                orient=self.orient_pages,
+                crop=self.crop_pages,
+                exclude=[list(zone) for zone in self.exclude_zones],
+            ),
+            backend=self.ocr_backend,
+            adaptive=self.adaptive_ocr.params() if self.adaptive_ocr else None,
+            output=output,
+        )
 
-        return opening
+    def _cached_output(self, page_num, output):
+        """Return a page's cached OCR output without rendering it, or None
+
+        In incremental mode pages are keyed by their raster fingerprint, so
+        a page not fingerprinted yet is reported as missing.
+        """
+        if self.incremental and page_num not in self.page_fingerprints:
+            return None
+        cache_key = self._ocr_cache_key(page_num, output)
+        if cache_key is None or cache_key not in self.ocr_cache:
+            return None
+        return self.ocr_cache.get(cache_key)
+
+    def cached_ocr_page(self, page_num):
+        """Return ``ocr_page``'s ``(kind, result)`` from the OCR cache, or None
+
+        Looked up by page number alone, so pages that hit are never
+        rendered; None means the page has to be rendered and OCR'd.
+        """
+        if self.grid_tables:
+            cached = self._cached_output(page_num, "grid_tables")
+            if cached is None:
+                return None
+            tables = tables_from_json(cached)
+            if tables is not None:
+                return "tables", tables
+        if self.column_layout:
+            cached = self._cached_output(page_num, "words+line")
+            if cached is None:
+                return None
+            return "words", [_cached_word(word) for word in json.loads(cached)]
+        text = self._cached_output(page_num, "text")
+        if text is None:
+            return None
+        return "text", text
+
+    def orient_page(self, img, page_num=None):
+        """Return the page as grayscale, turned upright and deskewed
+
+        The transform for a page is estimated once and kept in
+        ``page_transforms`` and in the OCR cache under the PDF hash and page
+        number only, so re-runs at other settings skip the estimate.
+        """
+        transform = self.page_transforms.get(page_num)
+        cache_key = None
+        if transform is None and self.ocr_cache is not None and page_num is not None:
+            cache_key = OCRCache.make_key(
+                *self._page_source(page_num),
+                None,
+                None,
+                None,
+                None,
+                output="transform",
+            )
+            cached = self.ocr_cache.get(cache_key)
+            if cached is not None:
+                transform = PageTransform(*json.loads(cached))
+
+        engine = None
+        if transform is None:
+            engine = get_ocr_backend(self.ocr_backend, self.ocr_lang, self.ocr_config)
+        gray, transform = self.preprocessor.orient(img, transform, engine)
+
+        if page_num is not None:
+            self.page_transforms[page_num] = transform
+        if cache_key is not None and engine is not None:
+            self.ocr_cache.put(cache_key, json.dumps(list(transform)))
+        return gray
+
+    def extract_text_from_image(self, img, page_num=None, processed=None):
+        """Extract text from image using OCR
+
+        When an OCR cache is configured and ``page_num`` is given, a cached
+        result for the same PDF, page and OCR settings is returned without
+        preprocessing or running tesseract. ``processed`` is ``img`` already
+        run through ``preprocess_image``, e.g. by the pipeline's preprocess
+        stage.
+        """
+        cache_key = self._ocr_cache_key(page_num, "text")
+        if cache_key is not None:
+            text = self.ocr_cache.get(cache_key)
+            if text is not None:
+                return text
+
+        if self.adaptive_ocr is not None and page_num is not None:
+            text = self.adaptive_ocr.extract_text(img, page_num)
+        else:
+            processed_img = processed if processed is not None else self.preprocess_image(img)
+            engine = get_ocr_backend(self.ocr_backend, self.ocr_lang, self.ocr_config)
+            text = engine.image_to_string(processed_img)
 
-    def extract_text_from_image(self, img):
-        """Extract text from image using OCR"""
-        processed_img = self.preprocess_image(img)
-        text = pytesseract.image_to_string(processed_img, lang="eng", config="--psm 6")
+        if cache_key is not None:
+            self.ocr_cache.put(cache_key, text)
         return text
 
-    def extract_tables_from_images(self):
-        """Extract table data from images"""
-        if not self.images:
+    def extract_words_from_image(self, img, page_num=None, processed=None):
+        """OCR an image into positioned words (see ``OCRWord``)
+
+        Cached like ``extract_text_from_image`` (and ``processed`` likewise
+        skips preprocessing), each word with its
+        ``line``, which pytesseract gives as a (block, paragraph, line)
+        tuple and JSON turns into a list.
+        """
+        cache_key = self._ocr_cache_key(page_num, "words+line")
+        if cache_key is not None:
+            cached = self.ocr_cache.get(cache_key)
+            if cached is not None:
+                return [_cached_word(word) for word in json.loads(cached)]
+
+        if self.adaptive_ocr is not None and page_num is not None:
+            words = self.adaptive_ocr.extract_words(img, page_num)
+        else:
+            processed_img = processed if processed is not None else self.preprocess_image(img)
+            engine = get_ocr_backend(self.ocr_backend, self.ocr_lang, self.ocr_config)
+            words = engine.image_to_data(processed_img)
+
+        if cache_key is not None:
+            self.ocr_cache.put(cache_key, json.dumps([list(w) for w in words]))
+        return words
+
+    def extract_tables_from_images(self, stream=True):
+        """Extract table data from images
+
+        With ``stream`` (the default) pages are rendered and OCR'd one window
+        at a time instead of rasterizing the whole document up front. Images
+        already loaded through ``convert_pdf_to_images`` are used as-is.
+        Pages with a usable embedded text layer skip rasterization and OCR.
+        """
+        text_pages = self.get_text_layer_pages() if self.use_text_layer else {}
+
+        if self.images:
+            page_count = len(self.images)
+        else:
+            page_count = self.get_page_count()
+
+        skipped = set()
+        if self.classify_pages or self.skip_prose_pages:
+            self.page_labels = self.classify_document_pages(page_count, text_pages)
+        if self.skip_prose_pages and self.page_labels:
+            skipped = {
+                n for n, label in self.page_labels.items() if label in SKIP_LABELS
+            }
+            if skipped:
+                print(
+                    f"Skipping {len(skipped)} pages without tables: "
+                    + ", ".join(str(n) for n in sorted(skipped))
+                )
+            text_pages = {n: w for n, w in text_pages.items() if n not in skipped}
+
+        ocr_page_numbers = [
+            n
+            for n in range(1, page_count + 1)
+            if n not in text_pages and n not in skipped
+        ]
+
+        page_tables = {}
+        if self.incremental:
+            page_tables = self.load_unchanged_pages(ocr_page_numbers)
+            ocr_page_numbers = [n for n in ocr_page_numbers if n not in page_tables]
+            print(
+                f"Incremental: {len(page_tables)} pages unchanged, "
+                f"{len(ocr_page_numbers)} to OCR"
+            )
+
+        # Pages whose OCR output is cached are parsed without a render
+        cached_pages = []
+        for page_num in ocr_page_numbers:
+            result = self.cached_ocr_page(page_num)
+            if result is not None:
+                page_tables[page_num] = self.parse_page(*result, page_num)
+                cached_pages.append(page_num)
+                if self.incremental:
+                    self.store_page_tables(page_num, page_tables[page_num])
+        if cached_pages:
+            ocr_page_numbers = [n for n in ocr_page_numbers if n not in page_tables]
+            print(
+                f"OCR cache: {len(cached_pages)} pages cached, "
+                f"{len(ocr_page_numbers)} to render"
+            )
+        wanted = set(ocr_page_numbers)
+
+        if text_pages:
+            print(
+                f"Using embedded text for {len(text_pages)} of {page_count} pages, "
+                f"OCR for {len(ocr_page_numbers)}"
+            )
+
+        if self.images:
+            pages = ((n, img) for n, img in enumerate(self.images, 1) if n in wanted)
+        elif stream:
+            pages = self.iter_pdf_pages(page_numbers=ocr_page_numbers)
+        else:
             self.convert_pdf_to_images()
+            pages = ((n, img) for n, img in enumerate(self.images, 1) if n in wanted)
+
+        for page_num, words in text_pages.items():
+            if self.column_layout:
+                page_tables[page_num] = self.identify_tables_from_words(words, page_num)
+            else:
+                page_tables[page_num] = self.identify_tables(
+                    words_to_text(words), page_num
+                )
+
+        if self.workers > 1 or self.pool is not None:
+            page_results = self._process_pages_parallel(pages, page_count)
+        elif self.pipeline:
+            page_results = self._process_pages_pipelined(pages, page_count)
+        else:
+            page_results = self._process_pages_serial(pages, page_count)
 
-        all_tables = []
+        for page_num, tables in page_results:
+            page_tables[page_num] = tables
+            if self.incremental:
+                self.store_page_tables(page_num, tables)
 
-        for i, img in enumerate(self.images):
-            print(f"Processing page {i+1}/{len(self.images)}")
+        if self.page_labels:
+            for page_num, tables in page_tables.items():
+                for table in tables:
+                    table.page_type = self.page_labels.get(page_num)
 
-            # Extract text from the image
-            text = self.extract_text_from_image(img)
+        all_tables = []
+        for page_num in sorted(page_tables):
+            all_tables.extend(page_tables[page_num])
 
-            # Process text to identify tables
-            tables = self.identify_tables(text, i + 1)
-            all_tables.extend(tables)
+        if self.ocr_cache is not None:
+            print(self.ocr_cache.format_stats())
+        if self.preprocessor.pages:
+            print(self.preprocessor.format_timings())
+        if self.adaptive_ocr is not None and self.adaptive_ocr.low_pixels:
+            print(self.adaptive_ocr.format_stats())
 
         return all_tables
 
-    def identify_tables(self, text, page_num):
-        """Identify tables from extracted text"""
-        lines = text.split("\n")
-        tables = []
-        current_table = []
-        table_name = None
-        in_table = False
-
-        # Keywords that indicate a financial table
-        financial_keywords = [
-            "Balance Sheet",
-            "Profit",
-            "Loss",
-            "Cash Flow",
-            "Income",
-            "Assets",
-            "Liabilities",
-            "Equity",
-            "Revenue",
-            "Expenses",
-        ]
-
-        for line in lines:
-            # Skip empty lines
-            if not line.strip():
-                continue
-
-            # Check if this line could be a table header
-            if any(keyword in line for keyword in financial_keywords) and not in_table:
-                if current_table:
-                    tables.append(
-                        {"name": table_name, "data": current_table, "page": page_num}
-                    )
-                    current_table = []
+    def extract_grid_tables(self, img, page_num=None):
+        """Read a page with a ruled table cell by cell
+
+        Returns the page's tables, or None when no ruling grid is found.
+        Cells are OCR'd in per-column batches, amount columns with a
+        digits-only whitelist, and the last line above the grid names the
+        table. The ``ExtractedTable`` keeps the raw ``cells`` and the
+        ``merges`` of spanning headers besides the rows. The page above and
+        below the grid is read as free text, so tables and totals set
+        outside the ruling are kept around the grid's table.
+        """
+        cache_key = self._ocr_cache_key(page_num, "grid_tables")
+        if cache_key is not None:
+            cached = self.ocr_cache.get(cache_key)
+            if cached is not None:
+                return tables_from_json(cached)
+
+        # Only read (regions are copied before preprocessing)
+        gray = self.preprocessor.to_grayscale(img, inplace=True)
+        grid = detect_grid(gray)
+        tables = None
+        if grid is not None:
+            ys, xs, spans = grid
+            page, top, bottom = gray, ys[0], ys[-1]
+            title_strip = gray[max(0, top - gray.shape[0] // 6):top]
+
+            if self.adaptive_ocr is not None and page_num is not None:
+                # The grid was found on the low-DPI render; read the cells
+                # from the table's own high-DPI render
+                scale = self.adaptive_ocr.high_dpi / self.adaptive_ocr.low_dpi
+                box = [xs[0] * scale, ys[0] * scale, xs[-1] * scale, ys[-1] * scale]
+                table_img = render_region(self.pdf_path, page_num, self.dpi, box)
+                if table_img is not None:
+                    gray = table_img
+                    ys = [round((y - ys[0]) * scale) for y in ys]
+                    xs = [round((x - xs[0]) * scale) for x in xs]
+                    grid = ys, xs, spans
+
+            text_engine = get_ocr_backend(
+                self.ocr_backend, self.ocr_lang, self.ocr_config
+            )
+            numeric_engine = get_ocr_backend(
+                self.ocr_backend,
+                self.ocr_lang,
+                f"{self.ocr_config} -c tessedit_char_whitelist={NUMERIC_WHITELIST}",
+            )
+            header_rows = count_header_rows(spans)
+            cells, merges = ocr_grid(
+                gray, grid, text_engine, numeric_engine, header_rows
+            )
+
+            title_lines = []
+            if title_strip.size:
+                title_lines = [
+                    line.strip()
+                    for line in text_engine.image_to_string(title_strip).split("\n")
+                    if line.strip()
+                ]
+            tables = [
+                ExtractedTable.from_rows(
+                    title_lines[-1] if title_lines else None,
+                    page_num,
+                    grid_to_rows(cells, header_rows),
+                    cells=cells,
+                    merges=merges,
+                )
+            ]
+            tables = (
+                self.read_region_tables(page[:top], page_num)
+                + tables
+                + self.read_region_tables(page[bottom:], page_num)
+            )
+
+        if cache_key is not None:
+            self.ocr_cache.put(cache_key, tables_to_json(tables))
+        return tables
 
-                table_name = line.strip()
-                in_table = True
+    def read_region_tables(self, region, page_num):
+        """OCR part of a page as free text and return the tables in it"""
+        if not region.size or not (region < 128).any():
+            return []
+        processed = self.preprocessor.run(region, count_page=False)
+        engine = get_ocr_backend(self.ocr_backend, self.ocr_lang, self.ocr_config)
+        if self.column_layout:
+            return self.identify_tables_from_words(
+                engine.image_to_data(processed), page_num
+            )
+        return self.identify_tables(engine.image_to_string(processed), page_num)
+
+    def classify_document_pages(self, page_count, text_pages):
+        """Label every page as a statement, note table, schedule or prose
+
+        Pages with a text layer are labelled from it for free; scanned pages
+        are rendered at ``thumbnail_dpi`` and OCR'd at that resolution, which
+        is enough to read titles and count numbers.
+        """
+        labels = {}
+        for page_num, words in text_pages.items():
+            labels[page_num] = classify_text(words_to_text(words))
+
+        scanned = [n for n in range(1, page_count + 1) if n not in text_pages]
+        for page_num in scanned:
+            label = self._cached_output(page_num, f"label@{self.thumbnail_dpi}")
+            if label is not None:
+                labels[page_num] = label
+        scanned = [n for n in scanned if n not in labels]
+        if self.images:
+            factor = max(1, self.render_dpi // self.thumbnail_dpi)
+            thumbnails = ((n, self.images[n - 1].reduce(factor)) for n in scanned)
+        else:
+            thumbnails = self.iter_pdf_pages(
+                dpi=self.thumbnail_dpi, window=8, page_numbers=scanned
+            )
+
+        for page_num, img in thumbnails:
+            if self.incremental:
+                self.page_fingerprints[page_num] = raster_sha256(img)
+            labels[page_num] = self.classify_thumbnail(img, page_num)
+        return labels
+
+    def fingerprint_pages(self, page_numbers):
+        """Hash the thumbnail raster of every page not fingerprinted yet
+
+        Uses the same renders as ``classify_document_pages``, which
+        fingerprints pages as it goes when it runs first.
+        """
+        missing = [n for n in page_numbers if n not in self.page_fingerprints]
+        if self.images:
+            factor = max(1, self.render_dpi // self.thumbnail_dpi)
+            thumbnails = ((n, self.images[n - 1].reduce(factor)) for n in missing)
+        else:
+            thumbnails = self.iter_pdf_pages(
+                dpi=self.thumbnail_dpi, window=8, page_numbers=missing
+            )
+        for page_num, img in thumbnails:
+            self.page_fingerprints[page_num] = raster_sha256(img)
+
+    def _page_tables_key(self, page_num):
+        # Parsing settings change the tables too, not just the OCR
+        output = f"page_tables:layout={self.column_layout}:grid={self.grid_tables}"
+        return self._ocr_cache_key(page_num, output)
+
+    def load_unchanged_pages(self, page_numbers):
+        """Return {page_num: tables} for pages whose tables are cached
+
+        A page counts as unchanged when a page with the same thumbnail
+        raster was converted before with the same settings, in this PDF or
+        an earlier issue of it.
+        """
+        self.fingerprint_pages(page_numbers)
+        found = {}
+        for page_num in page_numbers:
+            cached = self.ocr_cache.get(self._page_tables_key(page_num))
+            if cached is None:
                 continue
+            tables = tables_from_json(cached)
+            # The page may have moved since it was cached
+            for table in tables:
+                table.page = page_num
+            found[page_num] = tables
+        return found
+
+    def store_page_tables(self, page_num, tables):
+        """Cache a page's tables under its fingerprint for later issues"""
+        self.fingerprint_pages([page_num])
+        self.ocr_cache.put(self._page_tables_key(page_num), tables_to_json(tables))
+
+    def classify_thumbnail(self, img, page_num=None):
+        """Label one page from a low-resolution render"""
+        cache_key = self._ocr_cache_key(page_num, f"label@{self.thumbnail_dpi}")
+        if cache_key is not None:
+            label = self.ocr_cache.get(cache_key)
+            if label is not None:
+                return label
+
+        gray = self.preprocessor.to_grayscale(img, inplace=True)
+        engine = get_ocr_backend(self.ocr_backend, self.ocr_lang, self.ocr_config)
+        label = classify_text(engine.image_to_string(gray), ruled=has_ruling(gray))
+
+        if cache_key is not None:
+            self.ocr_cache.put(cache_key, label)
+        return label
+
+    @staticmethod
+    def group_tables_by_page_type(tables):
+        """Group extracted tables by the label of the page they came from"""
+        groups = {}
+        for table in tables:
+            groups.setdefault(table.page_type, []).append(table)
+        return groups
+
+    def process_page(self, img, page_num):
+        """OCR a single page and return the tables found on it"""
+        img = self.prepare_page(img, page_num)
+        kind, result = self.ocr_page(img, page_num)
+        return self.parse_page(kind, result, page_num)
+
+    def prepare_page(self, img, page_num):
+        """Image cleanup that precedes OCR (orientation, skew and cropping)"""
+        if self.orient_pages:
+            img = self.orient_page(img, page_num)
+        if self.crop_pages or self.exclude_zones:
+            img = self.preprocessor.crop(img, self.exclude_zones, self.crop_pages)
+        return img
+
+    def ocr_page(self, img, page_num, processed=None):
+        """Run the OCR for a prepared page
+
+        Returns ``(kind, result)``: ``("tables", tables)`` for a ruled grid
+        read cell by cell, otherwise ``("words", words)`` or ``("text",
+        text)`` for ``parse_page`` to segment. ``processed`` is the page
+        already preprocessed for full-page OCR; ``img`` is then only needed
+        for grid detection.
+        """
+        if self.grid_tables:
+            tables = self.extract_grid_tables(img, page_num)
+            if tables is not None:
+                return "tables", tables
+
+        if self.column_layout:
+            return "words", self.extract_words_from_image(img, page_num, processed)
+
+        # Extract text from the image
+        return "text", self.extract_text_from_image(img, page_num, processed)
+
+    def parse_page(self, kind, result, page_num):
+        """Turn the output of ``ocr_page`` into the page's tables"""
+        if kind == "tables":
+            return result
+        if kind == "words":
+            return self.identify_tables_from_words(result, page_num)
+
+        # Process text to identify tables
+        return self.identify_tables(result, page_num)
+
+    def _process_pages_serial(self, pages, page_count):
+        """Yield (page_num, tables) for each page, OCR'ing them one after another"""
+        for page_num, img in pages:
+            print(f"Processing page {page_num}/{page_count}")
+            yield page_num, self.process_page(img, page_num)
+
+    def _process_pages_pipelined(self, pages, page_count):
+        """Yield (page_num, tables) from a pipeline of per-stage threads
+
+        Rendering, preprocessing, OCR and parsing each run in their own
+        threads (see ``StagedPipeline``), so page N+1 is rendered while page
+        N is OCR'd, and at most ``stage_queue_size`` pages wait between two
+        stages. Results come out in completion order. The stage threads end
+        with the document, but the OCR engines they load (``lend_engines``)
+        are kept for the next one.
+        """
+
+        def preprocess(item):
+            page_num, img = item
+            with lend_engines():
+                img = self.prepare_page(img, page_num)
+            processed = None
+            if self.adaptive_ocr is None:
+                # Adaptive OCR picks its own preprocessing per region. The
+                # page is this pipeline's own copy, so unless grid detection
+                # still needs it unprocessed its buffer is reused
+                if self.grid_tables:
+                    processed = self.preprocess_image(img)
+                else:
+                    processed, img = self.preprocess_image(img, inplace=True), None
+            return page_num, img, processed
+
+        def ocr(item):
+            page_num, img, processed = item
+            print(f"Processing page {page_num}/{page_count}")
+            with lend_engines():
+                return page_num, self.ocr_page(img, page_num, processed)
+
+        def parse(item):
+            page_num, (kind, result) = item
+            return page_num, self.parse_page(kind, result, page_num)
+
+        pipeline = StagedPipeline(
+            [
+                Stage("preprocess", preprocess, self.stage_workers["preprocess"]),
+                Stage("ocr", ocr, self.stage_workers["ocr"]),
+                Stage("parse", parse, self.stage_workers["parse"]),
+            ],
+            self.stage_queue_size,
+        )
+        # Copy each image out of the renderer's buffer: streamed images are
+        # closed as soon as the next page is requested
+        source = ((page_num, np.array(img)) for page_num, img in pages)
+        yield from pipeline.run(source, "render")
+        print(pipeline.format_stats())
+
+    def _process_pages_parallel(self, pages, page_count):
+        """Yield (page_num, tables) in page order, OCR'ing pages in a pool
+
+        At most two pages per worker are in flight, so streaming keeps its
+        flat memory profile while every worker stays busy. With
+        ``shared_pages`` each in-flight page occupies one slot of a
+        ``SharedPageArena`` and only its descriptor crosses the pipe; the
+        slot is reused once the page's result is back.
+        """
+        if self.pool is not None:
+            pool, pool_workers = self.pool, self.workers
+        else:
+            pool = get_ocr_pool(self.workers)
+            pool_workers = _ocr_pool_workers
+        settings = self.get_ocr_settings()
+        max_in_flight = 2 * pool_workers
+        in_flight = deque()
+        # Workers are only started by the first submit, after this
+        arena = SharedPageArena(max_in_flight) if self.shared_pages else None
 
-            # Check if this could be a table row (contains numbers)
-            if re.search(r"\d", line) and in_table:
-                # Process the row to separate text and numbers
-                row_data = self.process_table_row(line)
-                if row_data:
-                    current_table.append(row_data)
-
-            # End of table indicator (consecutive empty lines or new header)
-            if in_table and (
-                not line.strip()
-                or any(keyword in line for keyword in financial_keywords)
-            ):
-                if current_table:
-                    tables.append(
-                        {"name": table_name, "data": current_table, "page": page_num}
-                    )
-                    current_table = []
-                    in_table = False
-                    if any(keyword in line for keyword in financial_keywords):
-                        table_name = line.strip()
-                        in_table = True
-
-        # Add the last table if any
-        if current_table:
-            tables.append({"name": table_name, "data": current_table, "page": page_num})
-
-        return tables
+        try:
+            for page_num, img in pages:
+                print(f"Processing page {page_num}/{page_count}")
+                # Hand the worker its own copy: streamed images are closed
+                # as soon as we move on, possibly before the pool has
+                # pickled them
+                page = arena.put(img) if arena else np.array(img)
+                future = pool.submit(
+                    _process_page_worker,
+                    settings,
+                    page,
+                    page_num,
+                    self.page_fingerprints.get(page_num),
+                )
+                in_flight.append((page_num, future, page))
+                if len(in_flight) >= max_in_flight:
+                    yield self._collect_worker_result(arena, *in_flight.popleft())
+
+            while in_flight:
+                yield self._collect_worker_result(arena, *in_flight.popleft())
+        finally:
+            # Let workers finish with pages still in flight before their
+            # blocks go away
+            for _, future, _ in in_flight:
+                future.cancel()
+            wait([future for _, future, _ in in_flight])
+            if arena:
+                arena.close()
+
+    def _collect_worker_result(self, arena, page_num, future, page):
+        """Return (page_num, tables), folding the worker's counters into ours"""
+        try:
+            tables, stats = future.result()
+        finally:
+            if arena:
+                arena.release(page)
+        self.merge_page_stats(stats)
+        return page_num, tables
+
+    def identify_tables_from_words(self, words, page_num):
+        """Identify tables from positioned words (OCR boxes or a text layer)"""
+        lines, rows = build_layout_rows(words)
+        return segment_tables(lines, page_num, rows)
+
+    def identify_tables(self, text, page_num, rows=None):
+        """Identify tables from extracted text
+
+        ``rows`` optionally holds a ready-made row record (or None) for each
+        line of ``text``, as built from word positions by
+        ``build_layout_rows``; otherwise rows are split with
+        ``process_table_row``.
+        """
+        return segment_tables(text, page_num, rows, self.process_table_row)
 
     def process_table_row(self, line):
         """Process a potential table row by separating text and numbers"""
-        # Match patterns like "Description    1234.56    7890.12"
-        parts = re.split(r"\s{2,}", line)
-
-        if len(parts) >= 2:
-            # Try to identify which parts are numeric
-            numeric_parts = []
-            text_parts = []
-
-            for part in parts:
-                # Check if the part looks like a number (possibly with commas and decimals)
-                if re.match(r"^-?[\d,]+(\.\d+)?$", part.replace(",", "")):
-                    # Convert string number to float
-                    try:
-                        numeric_parts.append(float(part.replace(",", "")))
-                    except ValueError:
-                        text_parts.append(part)
-                else:
-                    text_parts.append(part)
-
-            # If we found both text and numbers
-            if text_parts and numeric_parts:
-                return {
-                    "description": " ".join(text_parts).strip(),
-                    "values": numeric_parts,
-                }
-
-        return None
+        return split_table_row(line)
 
     def create_balance_sheet(self):
         """Create a worksheet for the Balance Sheet"""
@@ -177,8 +1082,8 @@ class FinancialStatementConverter:
         # Add headers
         ws["A1"] = "KUNSTOCOM INDIA LIMITED"
         ws["A2"] = "BALANCE SHEET AS AT 31ST MARCH 2021"
-        ws["A1"].font = Font(bold=True, size=14)
-        ws["A2"].font = Font(bold=True, size=12)
+        ws["A1"].style = "title"
+        ws["A2"].style = "subtitle"
 
         # Merge cells for the title
         ws.merge_cells("A1:C1")
@@ -190,28 +1095,20 @@ class FinancialStatementConverter:
         ws["C4"] = "As at March 31, 2020"
 
         for cell in [ws["A4"], ws["B4"], ws["C4"]]:
-            cell.font = Font(bold=True)
-            cell.alignment = Alignment(horizontal="center")
-
-        # Apply header style
-        header_fill = PatternFill(
-            start_color="DDEBF7", end_color="DDEBF7", fill_type="solid"
-        )
-        for cell in [ws["A4"], ws["B4"], ws["C4"]]:
-            cell.fill = header_fill
+            cell.style = "header"
 
         # Add data rows (example format)
         row_num = 5
 
         # EQUITY AND LIABILITIES
         ws[f"A{row_num}"] = "EQUITY AND LIABILITIES"
-        ws[f"A{row_num}"].font = Font(bold=True)
+        ws[f"A{row_num}"].style = "bold"
         ws.merge_cells(f"A{row_num}:C{row_num}")
         row_num += 1
 
         # Shareholders' funds
         ws[f"A{row_num}"] = "Shareholders' funds"
-        ws[f"A{row_num}"].font = Font(bold=True)
+        ws[f"A{row_num}"].style = "bold"
         row_num += 1
 
         # Add more rows as needed...
@@ -233,8 +1130,8 @@ class FinancialStatementConverter:
         # Add headers
         ws["A1"] = "KUNSTOCOM INDIA LIMITED"
         ws["A2"] = "STATEMENT OF PROFIT & LOSS FOR THE YEAR ENDED AS ON 31ST MARCH 2021"
-        ws["A1"].font = Font(bold=True, size=14)
-        ws["A2"].font = Font(bold=True, size=12)
+        ws["A1"].style = "title"
+        ws["A2"].style = "subtitle"
 
         # Merge cells for the title
         ws.merge_cells("A1:C1")
@@ -246,15 +1143,7 @@ class FinancialStatementConverter:
         ws["C4"] = "For the year ended March, 2020"
 
         for cell in [ws["A4"], ws["B4"], ws["C4"]]:
-            cell.font = Font(bold=True)
-            cell.alignment = Alignment(horizontal="center")
-
-        # Apply header style
-        header_fill = PatternFill(
-            start_color="DDEBF7", end_color="DDEBF7", fill_type="solid"
-        )
-        for cell in [ws["A4"], ws["B4"], ws["C4"]]:
-            cell.fill = header_fill
+            cell.style = "header"
 
         # Add data rows (example format)
         row_num = 5
@@ -276,8 +1165,8 @@ class FinancialStatementConverter:
         # Add headers
         ws["A1"] = "KUNSTOCOM INDIA LIMITED"
         ws["A2"] = "CASH FLOW STATEMENT FOR THE YEAR ENDED AS ON 31.03.2021"
-        ws["A1"].font = Font(bold=True, size=14)
-        ws["A2"].font = Font(bold=True, size=12)
+        ws["A1"].style = "title"
+        ws["A2"].style = "subtitle"
 
         # Merge cells for the title
         ws.merge_cells("A1:C1")
@@ -289,15 +1178,7 @@ class FinancialStatementConverter:
         ws["C4"] = "For the year ended March, 2020"
 
         for cell in [ws["A4"], ws["B4"], ws["C4"]]:
-            cell.font = Font(bold=True)
-            cell.alignment = Alignment(horizontal="center")
-
-        # Apply header style
-        header_fill = PatternFill(
-            start_color="DDEBF7", end_color="DDEBF7", fill_type="solid"
-        )
-        for cell in [ws["A4"], ws["B4"], ws["C4"]]:
-            cell.fill = header_fill
+            cell.style = "header"
 
         return ws
 
@@ -316,8 +1197,8 @@ class FinancialStatementConverter:
         # Add headers
         ws["A1"] = "KUNSTOCOM INDIA LIMITED"
         ws["A2"] = "NOTES TO FINANCIAL STATEMENT FOR THE YEAR ENDED 31ST MARCH, 2021"
-        ws["A1"].font = Font(bold=True, size=14)
-        ws["A2"].font = Font(bold=True, size=12)
+        ws["A1"].style = "title"
+        ws["A2"].style = "subtitle"
 
         # Merge cells for the title
         ws.merge_cells("A1:C1")
@@ -336,7 +1217,7 @@ class FinancialStatementConverter:
 
     # Shareholders' funds
         bs[f"A{row}"] = "Shareholders' funds"
-        bs[f"A{row}"].font = Font(bold=True)
+        bs[f"A{row}"].style = "bold"
         row += 1
 
         bs[f"A{row}"] = "(a) Share capital"
@@ -353,12 +1234,12 @@ class FinancialStatementConverter:
         bs[f"A{row}"] = "Total Shareholders' funds"
         bs[f"B{row}"] = 206017493.00  # Exact value instead of =SUM(B7:B8)
         bs[f"C{row}"] = 204874533.00  # Exact value instead of =SUM(C7:C8)
-        bs[f"A{row}"].font = Font(bold=True)
+        bs[f"A{row}"].style = "bold"
         row += 2
 
     # Non-current liabilities
         bs[f"A{row}"] = "Non-current liabilities"
-        bs[f"A{row}"].font = Font(bold=True)
+        bs[f"A{row}"].style = "bold"
         row += 1
 
         bs[f"A{row}"] = "(a) Long-term Borrowings"
@@ -385,12 +1266,12 @@ class FinancialStatementConverter:
         bs[f"A{row}"] = "Total Non-current liabilities"
         bs[f"B{row}"] = 191258141.00  # Exact value instead of =SUM(B12:B15)
         bs[f"C{row}"] = 192726061.00  # Exact value instead of =SUM(C12:C15)
-        bs[f"A{row}"].font = Font(bold=True)
+        bs[f"A{row}"].style = "bold"
         row += 2
 
     # Current liabilities
         bs[f"A{row}"] = "Current liabilities"
-        bs[f"A{row}"].font = Font(bold=True)
+        bs[f"A{row}"].style = "bold"
         row += 1
 
         bs[f"A{row}"] = "(a) Short-term borrowings"
@@ -419,24 +1300,24 @@ class FinancialStatementConverter:
         bs[f"A{row}"] = "Total Current liabilities"
         bs[f"B{row}"] = 191838576.00  # Exact value instead of =SUM(B19:B22)
         bs[f"C{row}"] = 178986487.00  # Exact value instead of =SUM(C19:C22)
-        bs[f"A{row}"].font = Font(bold=True)
+        bs[f"A{row}"].style = "bold"
         row += 2
 
     # Total
         bs[f"A{row}"] = "TOTAL - EQUITY AND LIABILITIES"
         bs[f"B{row}"] = 589114210.00  # Exact value instead of =B9+B16+B23
         bs[f"C{row}"] = 576587081.00  # Exact value instead of =C9+C16+C23
-        bs[f"A{row}"].font = Font(bold=True)
+        bs[f"A{row}"].style = "bold"
         row += 2
 
     # Assets
         bs[f"A{row}"] = "ASSETS"
-        bs[f"A{row}"].font = Font(bold=True)
+        bs[f"A{row}"].style = "bold"
         row += 1
 
     # Non-current assets
         bs[f"A{row}"] = "Non-current assets"
-        bs[f"A{row}"].font = Font(bold=True)
+        bs[f"A{row}"].style = "bold"
         row += 1
 
         bs[f"A{row}"] = "(a) Property, Plant & Equipment"
@@ -456,12 +1337,12 @@ class FinancialStatementConverter:
         bs[f"A{row}"] = "Total Non-current assets"
         bs[f"B{row}"] = 372947634.00  # Exact value instead of =SUM(B29:B30)
         bs[f"C{row}"] = 391636270.00  # Exact value instead of =SUM(C29:C30)
-        bs[f"A{row}"].font = Font(bold=True)
+        bs[f"A{row}"].style = "bold"
         row += 2
 
     # Current assets
         bs[f"A{row}"] = "Current assets"
-        bs[f"A{row}"].font = Font(bold=True)
+        bs[f"A{row}"].style = "bold"
         row += 1
 
         bs[f"A{row}"] = "(a) Current Investments"
@@ -498,14 +1379,14 @@ class FinancialStatementConverter:
         bs[f"A{row}"] = "Total Current assets"
         bs[f"B{row}"] = 457301523.00  # Exact value instead of =SUM(B34:B39)
         bs[f"C{row}"] = 343943058.00  # Exact value instead of =SUM(C34:C39)
-        bs[f"A{row}"].font = Font(bold=True)
+        bs[f"A{row}"].style = "bold"
         row += 2
 
     # Total Assets - This was mentioned to have an issue
         bs[f"A{row}"] = "TOTAL - ASSETS"
         bs[f"B{row}"] = 15939226.00  # Exact value from PDF instead of =B31+B40
         bs[f"C{row}"] = 16759086.00  # Exact value from PDF instead of =C31+C40
-        bs[f"A{row}"].font = Font(bold=True)
+        bs[f"A{row}"].style = "bold"
 
     # Format numbers as accounting with commas
         for r in range(7, row + 1):
@@ -535,12 +1416,12 @@ class FinancialStatementConverter:
         pl[f"A{row}"] = "Total Revenue (i)"
         pl[f"B{row}"] = 1640279676.00  # Exact value instead of =SUM(B5:B6)
         pl[f"C{row}"] = 1685374262.00  # Exact value instead of =SUM(C5:C6)
-        pl[f"A{row}"].font = Font(bold=True)
+        pl[f"A{row}"].style = "bold"
         row += 2
 
     # Expenses
         pl[f"A{row}"] = "Expenses:"
-        pl[f"A{row}"].font = Font(bold=True)
+        pl[f"A{row}"].style = "bold"
         row += 1
 
         pl[f"A{row}"] = "Cost of materials consumed"
@@ -577,7 +1458,7 @@ class FinancialStatementConverter:
         pl[f"A{row}"] = "Total Expenses (ii)"
         pl[f"B{row}"] = 1639555630.00  # Exact value instead of =SUM(B10:B15)
         pl[f"C{row}"] = 1666791886.00  # Exact value instead of =SUM(C10:C15)
-        pl[f"A{row}"].font = Font(bold=True)
+        pl[f"A{row}"].style = "bold"
         row += 1
 
         pl[f"A{row}"] = "Profit before exceptional and extraordinary items and tax"
@@ -593,11 +1474,11 @@ class FinancialStatementConverter:
         pl[f"A{row}"] = "Profit / (Loss) Before Tax"
         pl[f"B{row}"] = 724046.00  # Exact value instead of =B17
         pl[f"C{row}"] = 18582376.00  # Exact value instead of =C17
-        pl[f"A{row}"].font = Font(bold=True)
+        pl[f"A{row}"].style = "bold"
         row += 2
 
         pl[f"A{row}"] = "Tax expense:"
-        pl[f"A{row}"].font = Font(bold=True)
+        pl[f"A{row}"].style = "bold"
         row += 1
 
         pl[f"A{row}"] = "    Current tax Payable"
@@ -613,11 +1494,11 @@ class FinancialStatementConverter:
         pl[f"A{row}"] = "Profit (Loss) for the year"
         pl[f"B{row}"] = -1357038.00  # Exact value instead of =B20-B23-B24
         pl[f"C{row}"] = 12819624.00  # Exact value instead of =C20-C23-C24
-        pl[f"A{row}"].font = Font(bold=True)
+        pl[f"A{row}"].style = "bold"
         row += 2
 
         pl[f"A{row}"] = "Earnings per equity share [Nominal value of  Rs. 10/- each]"
-        pl[f"A{row}"].font = Font(bold=True)
+        pl[f"A{row}"].style = "bold"
         row += 1
 
         pl[f"A{row}"] = "(i) Basic"
@@ -644,7 +1525,7 @@ class FinancialStatementConverter:
 
     # Cash flow from operating activities
         cf[f"A{row}"] = "A. CASH FLOW FROM OPERATING ACTIVITIES"
-        cf[f"A{row}"].font = Font(bold=True)
+        cf[f"A{row}"].style = "bold"
         row += 1
 
         cf[f"A{row}"] = "Net Profit before tax and extraordinary item"
@@ -653,7 +1534,7 @@ class FinancialStatementConverter:
         row += 1
 
         cf[f"A{row}"] = "Adjustments For"
-        cf[f"A{row}"].font = Font(italic=True)
+        cf[f"A{row}"].style = "italic"
         row += 1
 
         cf[f"A{row}"] = "Depreciation Provision"
@@ -674,11 +1555,11 @@ class FinancialStatementConverter:
         cf[f"A{row}"] = "Operating Profit before Working Capital Changes"
         cf[f"B{row}"] = 60348468  # Exact value instead of =SUM(B6:B10)
         cf[f"C{row}"] = 80239331  # Exact value instead of =SUM(C6:C10)
-        cf[f"A{row}"].font = Font(bold=True)
+        cf[f"A{row}"].style = "bold"
         row += 2
 
         cf[f"A{row}"] = "Changes in Working Capital"
-        cf[f"A{row}"].font = Font(italic=True)
+        cf[f"A{row}"].style = "italic"
         row += 1
 
         cf[f"A{row}"] = "(Increase)/Decrease in Trade Receivables"
@@ -719,7 +1600,7 @@ class FinancialStatementConverter:
         cf[f"A{row}"] = "Cash Generated from Operations"
         cf[f"B{row}"] = -24765935  # Exact value instead of =B11+SUM(B13:B19)
         cf[f"C{row}"] = 64485835  # Exact value instead of =C11+SUM(C13:C19)
-        cf[f"A{row}"].font = Font(bold=True)
+        cf[f"A{row}"].style = "bold"
         row += 1
 
         cf[f"A{row}"] = "Direct Taxes Paid (Net)"
@@ -730,12 +1611,12 @@ class FinancialStatementConverter:
         cf[f"A{row}"] = "Net Cash Flow from Operating Activities (A)"
         cf[f"B{row}"] = -33003668  # Exact value instead of =B20+B21
         cf[f"C{row}"] = 68784600  # Exact value instead of =C20+C21
-        cf[f"A{row}"].font = Font(bold=True)
+        cf[f"A{row}"].style = "bold"
         row += 2
 
     # Cash flow from investing activities
         cf[f"A{row}"] = "B. CASH FLOW FROM INVESTING ACTIVITIES"
-        cf[f"A{row}"].font = Font(bold=True)
+        cf[f"A{row}"].style = "bold"
         row += 1
 
         cf[f"A{row}"] = "Purchase of Fixed Assets"
@@ -756,12 +1637,12 @@ class FinancialStatementConverter:
         cf[f"A{row}"] = "Net Cash Flow from Investing Activities (B)"
         cf[f"B{row}"] = -25316395  # Exact value instead of =SUM(B25:B27)
         cf[f"C{row}"] = -30613824  # Exact value instead of =SUM(C25:C27)
-        cf[f"A{row}"].font = Font(bold=True)
+        cf[f"A{row}"].style = "bold"
         row += 2
 
     # Cash flow from financing activities
         cf[f"A{row}"] = "C. CASH FLOW FROM FINANCING ACTIVITIES"
-        cf[f"A{row}"].font = Font(bold=True)
+        cf[f"A{row}"].style = "bold"
         row += 1
 
         cf[f"A{row}"] = "Proceeds from issuance of Share Capital"
@@ -797,13 +1678,13 @@ class FinancialStatementConverter:
         cf[f"A{row}"] = "Net Cash Flow from Financing Activities (C)"
         cf[f"B{row}"] = 2340116  # Exact value instead of =SUM(B31:B36)
         cf[f"C{row}"] = 27125742  # Exact value instead of =SUM(C31:C36)
-        cf[f"A{row}"].font = Font(bold=True)
+        cf[f"A{row}"].style = "bold"
         row += 2
 
         cf[f"A{row}"] = "Net Increase/(Decrease) in Cash & Cash Equivalents (A+B+C)"
         cf[f"B{row}"] = -17550947  # Exact value instead of =B22+B28+B37
         cf[f"C{row}"] = -24890737  # Exact value instead of =C22+C28+C37
-        cf[f"A{row}"].font = Font(bold=True)
+        cf[f"A{row}"].style = "bold"
         row += 2
 
         cf[f"A{row}"] = "Cash & Cash Equivalents at the beginning of the year"
@@ -819,7 +1700,7 @@ class FinancialStatementConverter:
         cf[f"A{row}"] = "Net Increase/(Decrease) in Cash & Cash Equivalents"
         cf[f"B{row}"] = 17550947  # Exact value instead of =B41-B40
         cf[f"C{row}"] = 24890737  # Exact value instead of =C41-C40
-        cf[f"A{row}"].font = Font(bold=True)
+        cf[f"A{row}"].style = "bold"
 
     # Format numbers as accounting with commas
         for r in range(6, row + 1):
@@ -836,15 +1717,15 @@ class FinancialStatementConverter:
 
         # Title and Header
         notes[f"A{row}"] = "KUNSTOCOM INDIA LIMITED"
-        notes[f"A{row}"].font = Font(bold=True, size=12)
+        notes[f"A{row}"].style = "subtitle"
         row += 1
         notes[f"A{row}"] = "CIN - U64201DL1979PLC009596"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
         notes[f"A{row}"] = (
             "Notes to Financial Statement for the year ended 31st March, 2021"
         )
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         notes.merge_cells(f"A{row-2}:C{row-2}")
         notes.merge_cells(f"A{row-1}:C{row-1}")
         notes.merge_cells(f"A{row}:C{row}")
@@ -852,7 +1733,7 @@ class FinancialStatementConverter:
 
         # Note 1: Company Information
         notes[f"A{row}"] = "1. Company Information"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -863,7 +1744,7 @@ class FinancialStatementConverter:
 
         # Note 2: Statement of Significant Accounting Policies
         notes[f"A{row}"] = "2. Statement of Significant Accounting Policies"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -874,7 +1755,7 @@ class FinancialStatementConverter:
 
         # Note 2a: Method of Accounting
         notes[f"A{row}"] = "a) Method of Accounting:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -897,7 +1778,7 @@ class FinancialStatementConverter:
 
         # Note 2b: Use of Estimates
         notes[f"A{row}"] = "b) Use of Estimates:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -908,7 +1789,7 @@ class FinancialStatementConverter:
 
         # Note 2c: Revenue Recognition
         notes[f"A{row}"] = "c) Revenue recognition:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -925,7 +1806,7 @@ class FinancialStatementConverter:
 
         # Note 2d: Inventories
         notes[f"A{row}"] = "d) Inventories:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -942,7 +1823,7 @@ class FinancialStatementConverter:
 
         # Note 2e: Fixed Assets and Depreciation
         notes[f"A{row}"] = "e) Fixed Assets and Depreciation:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -959,7 +1840,7 @@ class FinancialStatementConverter:
 
         # Note 2f: Investment
         notes[f"A{row}"] = "f) Investment"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -978,7 +1859,7 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = (
             "g) Accounting for effects of changes in Foreign Exchange Rates:"
         )
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -1007,7 +1888,7 @@ class FinancialStatementConverter:
 
         # Note 2h: Retirement and Employee Benefits
         notes[f"A{row}"] = "h) Retirement and Employee Benefits:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -1048,7 +1929,7 @@ class FinancialStatementConverter:
 
         # Note 2i: Taxation
         notes[f"A{row}"] = "i) Taxation:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -1065,7 +1946,7 @@ class FinancialStatementConverter:
 
         # Note 2j: Borrowing Cost
         notes[f"A{row}"] = "j) Borrowing Cost:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -1076,7 +1957,7 @@ class FinancialStatementConverter:
 
         # Note 2k: Earning Per Share
         notes[f"A{row}"] = "k) Earning Per Share:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -1087,7 +1968,7 @@ class FinancialStatementConverter:
 
         # Note 2l: Cash Flow Statement
         notes[f"A{row}"] = "l) Cash Flow Statement"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -1098,7 +1979,7 @@ class FinancialStatementConverter:
 
         # Note 2m: Contingent Liabilities and Commitments
         notes[f"A{row}"] = "m) Contingent Liabilities and Commitments:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -1109,7 +1990,7 @@ class FinancialStatementConverter:
 
         # Note 2n: Provisions
         notes[f"A{row}"] = "n) Provisions:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -1120,7 +2001,7 @@ class FinancialStatementConverter:
 
         # Note 3: Reserves and Surplus
         notes[f"A{row}"] = "Note 3  Reserves and Surplus"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         # Create table
@@ -1130,7 +2011,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "(a) Surplus"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Opening Balance"
@@ -1166,12 +2047,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 154962993
         notes[f"C{row}"] = 156320033
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 4: Long term Borrowing
         notes[f"A{row}"] = "Note 4  Long term Borrowing"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         # Create table
@@ -1181,11 +2062,11 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Secured"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "I. Term Loan form HDFC Bank"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "HDFC BANK LTD T L  A/C NO-003LN06190030002 (C 47)"
@@ -1255,7 +2136,7 @@ class FinancialStatementConverter:
         row += 2
 
         notes[f"A{row}"] = "II. Car Loan from Axis Bank"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "(Terms of Repayment - Monthly)"
@@ -1264,7 +2145,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "III. Loan from Kotak Mahindra Prime"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "(Terms of Repayment - Monthly)"
@@ -1273,7 +2154,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "IV. Loan from HDFC Bank"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "(Terms of Repayment - Monthly)"
@@ -1289,7 +2170,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Unsecured"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -1302,12 +2183,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 105230975
         notes[f"C{row}"] = 102404538
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 5: Deferred Tax Liability (net)
         notes[f"A{row}"] = "Note 5  Deffered Tax Liability (net)"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -1336,12 +2217,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Deferred tax Assets (Net) [i+ii]"
         notes[f"B{row}"] = 494614
         notes[f"C{row}"] = 277637
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 6: Other Long Term Liabilities
         notes[f"A{row}"] = "Note 6  Other Long Term Liabilities"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "( Amount in Rs.)"
@@ -1372,12 +2253,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 65472982
         notes[f"C{row}"] = 68174456
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 7: Long-Term Provisions
         notes[f"A{row}"] = "Note 7  Long-Term Provisions"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "( Amount in Rs.)"
@@ -1391,7 +2272,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Provision for employee benefit"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Provision for Gratuity"
@@ -1407,12 +2288,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 20059570
         notes[f"C{row}"] = 21869430
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 8: Short-Term borrowings
         notes[f"A{row}"] = "Note 8  Short-Term borrowings"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -1421,11 +2302,11 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Secured"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "I. Term Loan form HDFC Bank"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "HDFC BANK LTD T L  A/C NO-003LN06190030002 (C 47)"
@@ -1490,7 +2371,7 @@ class FinancialStatementConverter:
         row += 2
 
         notes[f"A{row}"] = "II. Car Loan from ICICI Bank Ltd."
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "(Terms of Repayment - Monthly)"
@@ -1499,7 +2380,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "III. Car Loan from Axis Bank."
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "(Terms of Repayment - Monthly)"
@@ -1508,7 +2389,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "IV. Loan from Kotak Mahindra Prime"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "(Terms of Repayment - Monthly)"
@@ -1517,7 +2398,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "V Loan from HDFC Bank"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "(Terms of Repayment - Monthly)"
@@ -1526,7 +2407,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "VI. Working Capital Limits"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "HDFC BANK LTD CC A/C NO 57500000314831"
@@ -1537,12 +2418,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 117733250
         notes[f"C{row}"] = 116208237
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 9: Trade Payables
         notes[f"A{row}"] = "Note 9  Trade Payables"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -1567,7 +2448,7 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 28563796
         notes[f"C{row}"] = 19527926
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -1578,7 +2459,7 @@ class FinancialStatementConverter:
 
         # Note 10: Other Current Liabilities
         notes[f"A{row}"] = "Note 10  Other Current Liabilities"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -1592,7 +2473,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "GST Payable"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "1. CGST Payable"
@@ -1633,12 +2514,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 34034764
         notes[f"C{row}"] = 23505825
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 11: Short- Term Provisions
         notes[f"A{row}"] = "Note 11  Short- Term Provisions"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -1647,7 +2528,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Provision for employee benefits"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Salary/Wages & Reimbursement"
@@ -1666,7 +2547,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Other Provisions"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Provision for income tax"
@@ -1677,18 +2558,18 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 11506766
         notes[f"C{row}"] = 19744499
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
         
         # Note 12: Property, Plant & Equipment (Tangible assets)
         notes[f'A{row}'] = "Note 12  Property, Plant & Equipment (Tangible assets)"
-        notes[f'A{row}'].font = Font(bold=True)
+        notes[f'A{row}'].style = "bold"
         row += 1
 
         notes[f'A{row}'] = "Particulars"
         notes[f'B{row}'] = "01.04.2020"
         notes[f'C{row}'] = "Gross Block"
-        notes[f'C{row}'].font = Font(bold=True)
+        notes[f'C{row}'].style = "bold"
         notes[f'D{row}'] = "Indexation/ Adjustment"
         notes[f'E{row}'] = "Depreciation during the year"
         notes[f'F{row}'] = "31.03.2021"
@@ -1708,7 +2589,7 @@ class FinancialStatementConverter:
 
 # Tangible Assets
         notes[f'A{row}'] = "Tangible Assets"
-        notes[f'A{row}'].font = Font(bold=True)
+        notes[f'A{row}'].style = "bold"
         row += 1
 
 # Land & Buildings
@@ -1779,7 +2660,7 @@ class FinancialStatementConverter:
 
 # Total
         notes[f'A{row}'] = "Total"
-        notes[f'A{row}'].font = Font(bold=True)
+        notes[f'A{row}'].style = "bold"
         notes[f'B{row}'] = 585374160.00
         notes[f'C{row}'] = 21940437.00
         notes[f'D{row}'] = 47100000.00
@@ -1787,7 +2668,7 @@ class FinancialStatementConverter:
         notes[f'F{row}'] = 452426401.00
         notes[f'G{row}'] = 372947634.00
         notes[f'H{row}'] = 391636270.00
-        notes[f'A{row}'].font = Font(bold=True)
+        notes[f'A{row}'].style = "bold"
         row += 1
 
 # Previous Year
@@ -1803,7 +2684,7 @@ class FinancialStatementConverter:
 
         # Note 13: Long-term loans and advances
         notes[f"A{row}"] = "Note 13  Long-term loans and advances"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -1812,7 +2693,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Unsecured, Considered Good"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Security Deposits"
@@ -1823,12 +2704,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 10898662
         notes[f"C{row}"] = 10831214
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 14: Current Investments
         notes[f"A{row}"] = "Note 14  Current Investments"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -1849,12 +2730,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 4000
         notes[f"C{row}"] = 4000
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 15: Inventories
         notes[f"A{row}"] = "Note 15  Inventories"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -1885,12 +2766,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 155817819
         notes[f"C{row}"] = 156465696
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 16: Trade Receivables
         notes[f"A{row}"] = "Note 16  Trade Receivables"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -1899,7 +2780,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Unsecured, Considered good"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -1919,12 +2800,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 279477700
         notes[f"C{row}"] = 160779078
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 17: Cash and cash equivalents
         notes[f"A{row}"] = "Note 17  Cash and cash equivalents"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -1933,7 +2814,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Balance with banks"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Fixed Deposit"
@@ -1954,12 +2835,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 12998379
         notes[f"C{row}"] = 5206434
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 18: Short term loan and advances
         notes[f"A{row}"] = "Note 18  Short term loan and advances"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -1968,11 +2849,11 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Others"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Unsecured, Considered good"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Advance Tax & TDS/TCS Receivable"
@@ -1998,12 +2879,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 9003625
         notes[f"C{row}"] = 21487850
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 19: Other Current Assets
         notes[f"A{row}"] = "Note 19  Other Current Assets"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -2012,7 +2893,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Other Current Assets"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Goods and Service Tax Receivable"
@@ -2061,12 +2942,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 5040564
         notes[f"C{row}"] = 5927872
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 20: Revenue From Operations
         notes[f"A{row}"] = "Note 20  Revenue From Operations"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -2087,12 +2968,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 1623246556
         notes[f"C{row}"] = 1676045738
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 21: Other Income
         notes[f"A{row}"] = "Note 21  Other Income"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -2101,7 +2982,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Interest Income"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Interest Income on FDR"
@@ -2162,12 +3043,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 17033120
         notes[f"C{row}"] = 9328524
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 22: Cost of Raw Material Consumed
         notes[f"A{row}"] = "Note 22  Cost of Raw Material Consumed"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -2176,7 +3057,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Raw Material Consumption"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Opening Balance of Raw Material"
@@ -2197,14 +3078,14 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 1244403393
         notes[f"C{row}"] = 1198023756
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 23: Changes in Inventories of finished goods work-in-progress
         notes[f"A{row}"] = (
             "Note 23  Changes in Inventories of finished goods work-in-progress"
         )
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -2213,7 +3094,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Changes in Inventories of finished goods"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Opening Stock"
@@ -2232,7 +3113,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Changes in Inventories of work-in-progress"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Opening Stock"
@@ -2253,12 +3134,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Net Total"
         notes[f"B{row}"] = 4410106
         notes[f"C{row}"] = -27237059
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 24: Employee Benefit Expenses
         notes[f"A{row}"] = "Note 24  Employee Benefit Expenses"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -2272,7 +3153,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Contribution to Provident and Other Funds"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "(a) EPF"
@@ -2313,12 +3194,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 152534208
         notes[f"C{row}"] = 183733151
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 25: Finance Cost
         notes[f"A{row}"] = "Note 25  Finance Cost"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -2327,7 +3208,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Interest to Bank"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Interest on Term Loan"
@@ -2346,7 +3227,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Interest to Others"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Interest to Directors"
@@ -2372,12 +3253,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 15619392
         notes[f"C{row}"] = 18605681
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 26: Other Expenses
         notes[f"A{row}"] = "Note 26  Other Expenses"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "Particulars"
@@ -2411,7 +3292,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Repair & Maintenance"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "- Vehicles"
@@ -2565,7 +3446,7 @@ class FinancialStatementConverter:
         row += 1
 
         notes[f"A{row}"] = "Travelling & Conveyance"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "- Others Travelling Expenses"
@@ -2586,12 +3467,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 176125679
         notes[f"C{row}"] = 248772118
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 27: Related Party Disclosures
         notes[f"A{row}"] = "27. Related Party Disclosures"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -2603,12 +3484,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = (
             "Related parties in transaction with the company during the period"
         )
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         notes.merge_cells(f"A{row}:C{row}")
         row += 2
 
         notes[f"A{row}"] = "(i) Key Management Personnel:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "    a) Mr. Anand Chauhan ( Managing Director)"
@@ -2632,7 +3513,7 @@ class FinancialStatementConverter:
         row += 2
 
         notes[f"A{row}"] = "(ii) Relatives of Directors:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "    a) Sandhya Chauhan (Daughter of Director)"
@@ -2644,7 +3525,7 @@ class FinancialStatementConverter:
         row += 2
 
         notes[f"A{row}"] = "(iii) Entities in which directors hold directorship:"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "    a) Bacfo Pharmaceuticals India Limited"
@@ -2750,7 +3631,7 @@ class FinancialStatementConverter:
         # Continue with notes 28-34
         # Note 28: Earning & Expenditure in Foreign Currency
         notes[f"A{row}"] = "28. Earning & Expenditure in Foreign Currency"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "(Rs. In Lakh)"
@@ -2788,7 +3669,7 @@ class FinancialStatementConverter:
 
         # Note 29: Amount paid to Auditors
         notes[f"A{row}"] = "29. Amount paid to Auditors"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "(Amount in Rs)"
@@ -2817,7 +3698,7 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 120000
         notes[f"C{row}"] = 120000
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 30
@@ -2829,7 +3710,7 @@ class FinancialStatementConverter:
 
         # Note 31: Particulars of Managerial Remuneration
         notes[f"A{row}"] = "31. Particulars of Managerial Remuneration"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "(Amount in Rs)"
@@ -2865,12 +3746,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 10766380
         notes[f"C{row}"] = 12632980
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 32: Contingent Liabilities and Commitments
         notes[f"A{row}"] = "32. Contingent Liabilities and Commitments: -"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "(Rs. In Lakh)"
@@ -2886,7 +3767,7 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Demands and Litigations"
         notes[f"B{row}"] = 0.00
         notes[f"C{row}"] = 13.71
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -2898,7 +3779,7 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Guarantees/Undertakings"
         notes[f"B{row}"] = 0.50
         notes[f"C{row}"] = 0.50
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = (
@@ -2910,12 +3791,12 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Total"
         notes[f"B{row}"] = 14.21
         notes[f"C{row}"] = 14.21
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 33: Earning Per Share
         notes[f"A{row}"] = "33. Earning Per Share"
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 1
 
         notes[f"A{row}"] = "(Amount in Rs.)"
@@ -2992,7 +3873,7 @@ class FinancialStatementConverter:
         notes[f"A{row}"] = "Weighted Average No. of Equity Shares"
         notes[f"B{row}"] = 5007779
         notes[f"C{row}"] = 4456546
-        notes[f"A{row}"].font = Font(bold=True)
+        notes[f"A{row}"].style = "bold"
         row += 2
 
         # Note 34
@@ -3049,31 +3930,81 @@ class FinancialStatementConverter:
         notes[f"C{row}"] = "DIN:00352845"
         row += 1
 
-        # Format all cells in the Notes section for better readability
-        # Format all cells in the Notes section for better readability
+        # Format all cells in the Notes section for better readability:
+        # particulars left and amounts right, with light borders around
+        # every cell that has content
+        styles = {}
         for r in range(1, row + 1):
             for c in ["A", "B", "C", "D", "E", "F", "G"]:
-                try:
-                    cell = notes[f"{c}{r}"]
-                    # Set alignment
-                    if c == "A":
-                        cell.alignment = Alignment(horizontal="left", vertical="center")
-                    else:
-                        cell.alignment = Alignment(
-                            horizontal="right", vertical="center"
-                        )
-
-                    # Add light borders to all cells that have content
-                    if cell.value is not None and cell.value != "":
-                        cell.border = Border(
-                            left=Side(style="thin"),
-                            right=Side(style="thin"),
-                            top=Side(style="thin"),
-                            bottom=Side(style="thin"),
+                cell = notes[f"{c}{r}"]
+                key = (
+                    cell.style,
+                    "label" if c == "A" else "value",
+                    cell.value is not None and cell.value != "",
+                )
+                if key not in styles:
+                    styles[key] = notes_cell_style(self.wb, *key)
+                cell.style = styles[key]
+
+    def create_extracted_sheets(self, tables):
+        """Write tables found by ``extract_tables_from_images`` to worksheets
+
+        Tables are routed to one sheet per page type (see
+        ``EXTRACTED_SHEET_NAMES``) and written one below the other: the
+        table name in bold, then particulars, note and amount columns.
+        Tables read from a ruling grid are written cell for cell with their
+        merged headings. Returns the created worksheets.
+        """
+        sheets = []
+        for page_type, group in self.group_tables_by_page_type(tables).items():
+            title = EXTRACTED_SHEET_NAMES.get(page_type, "Tables")
+            if title in self.wb.sheetnames:
+                ws = self.wb[title]
+                row_num = ws.max_row + 2
+            else:
+                ws = self.wb.create_sheet(title)
+                ws.column_dimensions["A"].width = 40
+                row_num = 1
+            sheets.append(ws)
+
+            for table in group:
+                name_cell = ws.cell(row=row_num, column=1, value=table.name or "")
+                name_cell.style = "table_name"
+                row_num += 1
+
+                if table.cells:
+                    merges = table.merges if table.merges is not None else ()
+                    for start_row, start_col, end_row, end_col in merges.tolist():
+                        ws.merge_cells(
+                            start_row=start_row + row_num - 1,
+                            start_column=start_col,
+                            end_row=end_row + row_num - 1,
+                            end_column=end_col,
                         )
-                except:
-                    # Skip if cell doesn't exist in that column
-                    pass
+                    for line in table.cells:
+                        for col, text in enumerate(line, 1):
+                            cell = ws.cell(row=row_num, column=col)
+                            if text and not isinstance(cell, MergedCell):
+                                cell.value = text
+                        row_num += 1
+                else:
+                    has_note = table.notes is not None
+                    first_value = 3 if has_note else 2
+                    for row in table.rows():
+                        ws.cell(row=row_num, column=1, value=row.description)
+                        if has_note:
+                            ws.cell(row=row_num, column=2, value=row.note)
+                        for col, value in enumerate(row.values, first_value):
+                            if value is not None:
+                                cell = ws.cell(row=row_num, column=col, value=value)
+                                cell.number_format = "#,##0.00"
+                        row_num += 1
+
+                row_num += 1
+
+        if sheets and "Sheet" in self.wb.sheetnames:
+            del self.wb["Sheet"]
+        return sheets
 
     def save_excel(self, output_path):
         """Save the workbook to Excel file"""
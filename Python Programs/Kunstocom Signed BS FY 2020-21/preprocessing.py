@@ -0,0 +1,358 @@
+import threading
+import time
+from collections import namedtuple
+
+import cv2
+import numpy as np
+
+
+# How a scanned page must be turned to read normally: ``rotation`` is a
+# clockwise quarter turn (0, 90, 180 or 270) and ``skew`` the small
+# rotation, in degrees, that then levels the text lines
+PageTransform = namedtuple("PageTransform", "rotation skew")
+
+# Orientation and skew are estimated on a copy no larger than this
+ESTIMATE_MAX_SIDE = 1600
+
+# A rectangle of the page in fractions of its width and height, so it holds
+# at any DPI: Region(0, 0, 1, 0.1) is the top tenth of the page
+Region = namedtuple("Region", "left top right bottom")
+
+# Blocks blanked out before OCR, by document profile, on the upright page
+PAGE_PROFILES = {
+    "none": (),
+    # Signed statements: the firm's letterhead across the top, and the
+    # "In terms of our report" / signatories / stamp block at the bottom
+    "signed": (Region(0.0, 0.0, 1.0, 0.06), Region(0.0, 0.86, 1.0, 1.0)),
+}
+
+# The content region is found on a copy no larger than this
+CONTENT_MAX_SIDE = 1000
+
+# Ink blocks separated from the rest of the page by at least this fraction
+# of its height are told apart; a block lying entirely within the top
+# HEADER_ZONE or starting within the bottom FOOTER_ZONE of the page is a
+# running header, page number or signature block and is cropped away
+BLOCK_GAP = 0.03
+HEADER_ZONE = 0.08
+FOOTER_ZONE = 0.25
+
+# Margin kept around the content, as a fraction of the page's longer side
+CONTENT_PADDING = 0.01
+
+# Rows or columns with fewer ink pixels than this (on the small copy) count
+# as blank, so dust and scanner specks do not widen the crop
+MIN_INK_PIXELS = 2
+
+_QUARTER_TURNS = {
+    90: cv2.ROTATE_90_CLOCKWISE,
+    180: cv2.ROTATE_180,
+    270: cv2.ROTATE_90_COUNTERCLOCKWISE,
+}
+
+
+class PreprocessPipeline:
+    """Configurable image cleanup applied to each page before OCR
+
+    The page is converted to a single grayscale buffer once (pages rendered
+    with ``grayscale=True`` need no conversion at all) and every enabled
+    stage then works on that buffer in place. Stages that would not change
+    the image, such as a 1x1 morphological open, are skipped. Time spent in
+    each stage is accumulated in ``timings`` so throughput can be weighed
+    against OCR accuracy.
+
+    Stages, in order:
+        orient     turn the page upright and level it; called separately
+                   through ``orient`` so the transform can be cached
+        crop       cut the page down to its content region and blank the
+                   profile's exclusion zones; called through ``crop``
+        deskew     rotate the page so text lines are horizontal
+        threshold  binarize at a fixed gray level (None to disable)
+        denoise    morphological open with a ``denoise`` x ``denoise`` kernel
+    """
+
+    STAGES = ("grayscale", "orient", "crop", "deskew", "threshold", "denoise")
+
+    def __init__(self, threshold=150, denoise=1, deskew=False):
+        self.threshold = threshold
+        self.denoise = denoise
+        self.deskew = deskew
+        self.timings = {stage: 0.0 for stage in self.STAGES}
+        self.pages = 0
+        # Guards timings and pages: pipeline stage threads share one pipeline
+        self._lock = threading.Lock()
+
+    def params(self):
+        """Return the settings that affect the output, e.g. for cache keys"""
+        return {
+            "threshold": self.threshold,
+            "denoise": self.denoise,
+            "deskew": self.deskew,
+        }
+
+    def run(self, img, count_page=True, inplace=False):
+        """Return a preprocessed uint8 grayscale copy of ``img``
+
+        ``count_page`` is turned off for partial images (e.g. re-OCR crops)
+        so per-page averages are not skewed by them. With ``inplace`` a
+        writable grayscale ``img`` the caller owns is processed in its own
+        buffer instead of a copy (see ``to_grayscale``).
+        """
+        start = time.perf_counter()
+        gray = self.to_grayscale(img, inplace)
+        now = self._tick("grayscale", start)
+
+        if self.deskew:
+            gray = deskew_image(gray)
+            now = self._tick("deskew", now)
+
+        if self.threshold is not None:
+            cv2.threshold(gray, self.threshold, 255, cv2.THRESH_BINARY, dst=gray)
+            now = self._tick("threshold", now)
+
+        if self.denoise and self.denoise > 1:
+            kernel = np.ones((self.denoise, self.denoise), np.uint8)
+            cv2.morphologyEx(gray, cv2.MORPH_OPEN, kernel, dst=gray)
+            now = self._tick("denoise", now)
+
+        if count_page:
+            with self._lock:
+                self.pages += 1
+        return gray
+
+    def orient(self, img, transform=None, engine=None):
+        """Return ``(gray, transform)`` with the page turned upright and level
+
+        ``transform`` is a ``PageTransform`` estimated earlier, e.g. read
+        from a cache; when None it is estimated from a downscaled copy, with
+        ``engine`` (an OCR backend) detecting the orientation. The rotation
+        is applied to the full-resolution buffer once.
+        """
+        start = time.perf_counter()
+        # Only read, and the rotations return new arrays
+        gray = self.to_grayscale(img, inplace=True)
+        now = self._tick("grayscale", start)
+        if transform is None:
+            transform = estimate_page_transform(gray, engine)
+        gray = apply_page_transform(gray, transform)
+        self._tick("orient", now)
+        return gray, transform
+
+    def crop(self, img, exclude=(), detect=True, inplace=False):
+        """Return the page's content region with ``exclude`` blanked out
+
+        ``exclude`` holds ``Region``s (e.g. a ``PAGE_PROFILES`` entry) that
+        are painted white; with ``detect`` the page is then cut down to the
+        box found by ``find_content_box``. Only the returned, usually much
+        smaller, array is OCR'd. ``inplace`` is as for ``run``.
+        """
+        start = time.perf_counter()
+        gray = self.to_grayscale(img, inplace)
+        blank_regions(gray, exclude)
+        if detect:
+            box = find_content_box(gray)
+            if box is not None:
+                x0, y0, x1, y1 = box
+                gray = np.ascontiguousarray(gray[y0:y1, x0:x1])
+        self._tick("crop", start)
+        return gray
+
+    @staticmethod
+    def to_grayscale(img, inplace=False):
+        """Return a writable uint8 grayscale array for a PIL image or array
+
+        This is the only buffer the pipeline allocates; later stages reuse
+        it. A grayscale array passed in (e.g. a page in a shared-memory
+        arena) is copied, so the caller's buffer is never modified, unless
+        ``inplace`` says the caller owns it and it is writable.
+        """
+        owned = not isinstance(img, np.ndarray)
+        if hasattr(img, "mode") and img.mode not in ("L", "RGB"):
+            img = img.convert("L")
+        arr = np.asarray(img)
+        if arr.ndim == 3:
+            return cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY)
+        if arr.dtype != np.uint8:
+            return arr.astype(np.uint8)
+        if arr.flags.writeable and (owned or inplace):
+            return arr
+        return arr.copy()
+
+    def _tick(self, stage, since):
+        now = time.perf_counter()
+        with self._lock:
+            self.timings[stage] += now - since
+        return now
+
+    def merge_timings(self, timings, pages):
+        """Fold in timings reported by another pipeline, e.g. a pool worker"""
+        with self._lock:
+            for stage, seconds in timings.items():
+                self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+            self.pages += pages
+
+    def format_timings(self):
+        """Return a one-line summary of the average time per page per stage"""
+        pages = max(self.pages, 1)
+        parts = [
+            f"{stage} {self.timings[stage] / pages * 1000:.1f} ms"
+            for stage in self.STAGES
+            if self.timings[stage]
+        ]
+        return f"Preprocessing ({self.pages} pages, per page): " + ", ".join(parts)
+
+
+def downscale(gray, max_side):
+    """Return ``gray`` shrunk so its longer side is at most ``max_side``"""
+    scale = max_side / max(gray.shape[:2])
+    if scale >= 1.0:
+        return gray
+    return cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+
+def estimate_skew_angle(gray, max_angle=10.0):
+    """Estimate the skew of dark text in a grayscale page, in degrees"""
+    # Work on a downscaled copy; the angle does not depend on resolution
+    small = downscale(gray, 1000)
+    _, ink = cv2.threshold(small, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
+    coords = cv2.findNonZero(ink)
+    if coords is None or len(coords) < 50:
+        return 0.0
+
+    angle = cv2.minAreaRect(coords)[-1]
+    # minAreaRect reports [-90, 0) or (0, 90] depending on the OpenCV
+    # version; map either to the rotation that levels the text
+    if angle < -45:
+        angle += 90
+    elif angle > 45:
+        angle -= 90
+    if abs(angle) > max_angle:
+        return 0.0
+    return angle
+
+
+def rotate_image(gray, angle):
+    """Rotate a grayscale page by ``angle`` degrees, filling with white"""
+    height, width = gray.shape[:2]
+    matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+    return cv2.warpAffine(
+        gray,
+        matrix,
+        (width, height),
+        flags=cv2.INTER_LINEAR,
+        borderMode=cv2.BORDER_CONSTANT,
+        borderValue=255,
+    )
+
+
+def deskew_image(gray, min_angle=0.1):
+    """Return ``gray`` rotated so its text lines are horizontal"""
+    angle = estimate_skew_angle(gray)
+    if abs(angle) < min_angle:
+        return gray
+    return rotate_image(gray, angle)
+
+
+def rotate_quarter(gray, rotation):
+    """Rotate a page clockwise by a multiple of 90 degrees"""
+    rotation %= 360
+    if not rotation:
+        return gray
+    return cv2.rotate(gray, _QUARTER_TURNS[rotation])
+
+
+def estimate_page_transform(gray, engine=None, min_skew=0.1):
+    """Estimate a page's ``PageTransform`` from a downscaled copy
+
+    ``engine`` is an OCR backend whose ``detect_orientation`` finds quarter
+    turns (tesseract OSD); without one only the skew is estimated.
+    """
+    small = downscale(gray, ESTIMATE_MAX_SIDE)
+    rotation = engine.detect_orientation(small) if engine is not None else 0
+    skew = estimate_skew_angle(rotate_quarter(small, rotation))
+    if abs(skew) < min_skew:
+        skew = 0.0
+    return PageTransform(rotation, skew)
+
+
+def apply_page_transform(gray, transform):
+    """Apply a ``PageTransform`` to a full-resolution page"""
+    gray = rotate_quarter(gray, transform.rotation)
+    if transform.skew:
+        gray = rotate_image(gray, transform.skew)
+    return gray
+
+
+def region_to_pixels(region, shape):
+    """Return a ``Region`` as ``(x0, y0, x1, y1)`` pixels of a page of ``shape``"""
+    height, width = shape[:2]
+    return (
+        max(0, round(region.left * width)),
+        max(0, round(region.top * height)),
+        min(width, round(region.right * width)),
+        min(height, round(region.bottom * height)),
+    )
+
+
+def blank_regions(gray, regions):
+    """Paint ``regions`` of a grayscale page white, in place"""
+    for region in regions:
+        x0, y0, x1, y1 = region_to_pixels(Region(*region), gray.shape)
+        gray[y0:y1, x0:x1] = 255
+
+
+def _ink_spans(counts):
+    """Return (starts, ends) of the runs where ``counts`` has ink"""
+    inked = np.flatnonzero(counts >= MIN_INK_PIXELS)
+    if not inked.size:
+        return inked, inked
+    breaks = np.flatnonzero(np.diff(inked) > 1)
+    starts = inked[np.r_[0, breaks + 1]]
+    ends = inked[np.r_[breaks, len(inked) - 1]] + 1
+    return starts, ends
+
+
+def find_content_box(gray):
+    """Return the ``(x0, y0, x1, y1)`` box of a page's body text, or None
+
+    Works on a downscaled, Otsu-binarized copy. Text rows are grouped into
+    blocks split by gaps of at least ``BLOCK_GAP`` of the page height; a
+    leading block inside ``HEADER_ZONE`` and trailing blocks starting in
+    ``FOOTER_ZONE`` (page numbers, signatures, stamps) are dropped, and the
+    box spans the ink of what is left plus ``CONTENT_PADDING``. Returns None
+    for a blank page.
+    """
+    small = downscale(gray, CONTENT_MAX_SIDE)
+    height, width = small.shape[:2]
+    _, ink = cv2.threshold(small, 0, 1, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
+
+    starts, ends = _ink_spans(ink.sum(axis=1))
+    if not starts.size:
+        return None
+    split = np.flatnonzero(starts[1:] - ends[:-1] >= BLOCK_GAP * height)
+    block_tops = starts[np.r_[0, split + 1]]
+    block_bottoms = ends[np.r_[split, len(ends) - 1]]
+
+    first, last = 0, len(block_tops) - 1
+    if first < last and block_bottoms[first] <= HEADER_ZONE * height:
+        first += 1
+    while last > first and block_tops[last] >= (1 - FOOTER_ZONE) * height:
+        last -= 1
+    top, bottom = block_tops[first], block_bottoms[last]
+
+    columns, column_ends = _ink_spans(ink[top:bottom].sum(axis=0))
+    if columns.size:
+        left, right = columns[0], column_ends[-1]
+    else:
+        # Ink spread too thinly to mark any column: keep the full width
+        left, right = 0, width
+
+    scale = gray.shape[0] / height
+    pad = CONTENT_PADDING * max(gray.shape[:2])
+    full_height, full_width = gray.shape[:2]
+    return (
+        max(0, int(left * scale - pad)),
+        max(0, int(top * scale - pad)),
+        min(full_width, int(np.ceil(right * scale + pad))),
+        min(full_height, int(np.ceil(bottom * scale + pad))),
+    )
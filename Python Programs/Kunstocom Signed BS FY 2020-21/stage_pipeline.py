@@ -0,0 +1,148 @@
+import queue
+import threading
+import time
+from collections import namedtuple
+
+
+# One step of a pipeline: ``func`` maps an item to the next stage's item and
+# runs in ``workers`` threads
+Stage = namedtuple("Stage", "name func workers")
+
+# Marks the end of the items flowing through a queue
+_DONE = object()
+
+# How often blocked threads check whether the pipeline was stopped
+_POLL_SECONDS = 0.1
+
+
+class StagedPipeline:
+    """Push items through a chain of stages running in their own threads
+
+    Consecutive stages are joined by queues holding at most ``queue_size``
+    items, so a fast stage blocks once it is that far ahead of the next one
+    (backpressure) and memory stays bounded however long the input is.
+    Each stage gets its own number of worker threads. The source iterator
+    is drained in a thread of its own too, so producing item N+1 overlaps
+    with the later stages working on item N.
+
+    Threads only help where the work releases the GIL: subprocesses
+    (poppler, the tesseract CLI), tesserocr and OpenCV all do.
+
+    Time spent in each stage is summed in ``busy`` (per worker, so a stage
+    with two busy workers counts double); with the stages overlapping,
+    ``wall`` approaches the busiest stage rather than the sum of all.
+    """
+
+    def __init__(self, stages, queue_size=2):
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.busy = {}
+        self.wall = 0.0
+
+    def run(self, source, source_name="source"):
+        """Yield the last stage's output for every item of ``source``
+
+        Items come out in completion order. An exception in any stage stops
+        the pipeline and is re-raised here.
+        """
+        self.busy = {source_name: 0.0}
+        self.busy.update((stage.name, 0.0) for stage in self.stages)
+        queues = [queue.Queue(self.queue_size) for _ in range(len(self.stages) + 1)]
+        stop = threading.Event()
+        errors = []
+        lock = threading.Lock()
+
+        def put(q, item):
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=_POLL_SECONDS)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def get(q):
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    pass
+            return _DONE
+
+        def fail(exc):
+            errors.append(exc)
+            stop.set()
+
+        def produce():
+            try:
+                iterator = iter(source)
+                while not stop.is_set():
+                    start = time.perf_counter()
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        break
+                    self.busy[source_name] += time.perf_counter() - start
+                    if not put(queues[0], item):
+                        return
+            except Exception as exc:
+                fail(exc)
+            put(queues[0], _DONE)
+
+        remaining = [stage.workers for stage in self.stages]
+
+        def work(index, stage):
+            inbox, outbox = queues[index], queues[index + 1]
+            while True:
+                item = get(inbox)
+                if item is _DONE:
+                    # Let sibling workers see the end too; the last one to
+                    # finish passes it downstream
+                    put(inbox, _DONE)
+                    with lock:
+                        remaining[index] -= 1
+                        last = remaining[index] == 0
+                    if last:
+                        put(outbox, _DONE)
+                    return
+                start = time.perf_counter()
+                try:
+                    result = stage.func(item)
+                except Exception as exc:
+                    fail(exc)
+                    return
+                with lock:
+                    self.busy[stage.name] += time.perf_counter() - start
+                if not put(outbox, result):
+                    return
+
+        threads = [threading.Thread(target=produce, daemon=True)]
+        for index, stage in enumerate(self.stages):
+            remaining[index] = max(1, stage.workers)
+            threads.extend(
+                threading.Thread(target=work, args=(index, stage), daemon=True)
+                for _ in range(remaining[index])
+            )
+
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                item = get(queues[-1])
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            self.wall = time.perf_counter() - started
+
+        if errors:
+            raise errors[0]
+
+    def format_stats(self):
+        """Return a one-line summary of busy time per stage against wall time"""
+        parts = [f"{name} {seconds:.1f} s" for name, seconds in self.busy.items()]
+        return f"Pipeline busy time: {', '.join(parts)}; wall {self.wall:.1f} s"
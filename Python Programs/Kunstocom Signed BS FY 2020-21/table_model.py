@@ -0,0 +1,319 @@
+import json
+import os
+import struct
+import tempfile
+from collections import namedtuple
+
+import numpy as np
+
+
+# One row as the parsers produce it: ``values`` has an entry per amount
+# column (None for a blank cell), ``note`` the note reference, ``box`` the
+# (x0, y0, x1, y1) of the row's words on the page image and ``conf`` their
+# mean OCR confidence; the last three are None where unknown
+TableRow = namedtuple(
+    "TableRow", "description values note box conf", defaults=(None, None, None)
+)
+
+# Binary format: magic, version, header length, JSON header, then the
+# arrays of every table back to back, each aligned to ARRAY_ALIGNMENT
+MAGIC = b"FSTB"
+FORMAT_VERSION = 1
+ARRAY_ALIGNMENT = 8
+_PREAMBLE = struct.Struct("<4sHI")
+
+# Array attributes of a table and their dtype in memory and on disk
+ARRAY_FIELDS = {
+    "values": np.dtype("<f8"),
+    "boxes": np.dtype("<i4"),
+    "confidences": np.dtype("<f4"),
+    "merges": np.dtype("<i4"),
+}
+
+
+class ExtractedTable:
+    """A table read from one page, stored column-wise
+
+    Text stays in two lists (``descriptions``, and ``notes`` when the page
+    has a note column); everything numeric is an array with one row per
+    table row: ``values`` (float64, NaN for a blank cell), ``boxes`` (int32
+    x0, y0, x1, y1) and ``confidences`` (float32). ``boxes`` and
+    ``confidences`` are None when the rows were not read from positioned
+    words. Tables read cell by cell from a ruling grid also keep the OCR'd
+    ``cells`` and their ``merges`` (int32 start_row, start_column, end_row,
+    end_column, 1-based like ``merge_cells``).
+
+    Slotted, so a table costs a handful of references plus its arrays
+    rather than a dict per row; see ``dump_tables`` and ``tables_to_json``
+    for persisting tables and ``rows`` for reading them back row by row.
+    """
+
+    __slots__ = (
+        "name",
+        "page",
+        "page_type",
+        "descriptions",
+        "notes",
+        "values",
+        "boxes",
+        "confidences",
+        "cells",
+        "merges",
+    )
+
+    def __init__(
+        self,
+        name,
+        page,
+        descriptions,
+        values,
+        notes=None,
+        boxes=None,
+        confidences=None,
+        cells=None,
+        merges=None,
+        page_type=None,
+    ):
+        self.name = name
+        self.page = page
+        self.page_type = page_type
+        self.descriptions = list(descriptions)
+        self.notes = list(notes) if notes is not None else None
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 2:
+            width = values.size // len(self.descriptions) if values.size else 0
+            values = values.reshape(len(self.descriptions), width)
+        self.values = values
+        self.boxes = _optional_array(boxes, "boxes", (-1, 4))
+        self.confidences = _optional_array(confidences, "confidences", (-1,))
+        self.cells = cells
+        self.merges = _optional_array(merges, "merges", (-1, 4))
+
+    @classmethod
+    def from_rows(cls, name, page, rows, cells=None, merges=None):
+        """Build a table from ``TableRow`` records
+
+        Rows with fewer values than the widest row are padded with blanks.
+        ``merges`` may be given as ``merge_cells`` keyword dicts.
+        """
+        width = max((len(row.values) for row in rows), default=0)
+        values = np.full((len(rows), width), np.nan)
+        for i, row in enumerate(rows):
+            values[i, :len(row.values)] = [
+                np.nan if value is None else value for value in row.values
+            ]
+
+        notes = None
+        if any(row.note is not None for row in rows):
+            notes = [row.note for row in rows]
+        boxes = None
+        if rows and all(row.box is not None for row in rows):
+            boxes = [row.box for row in rows]
+        confidences = None
+        if rows and all(row.conf is not None for row in rows):
+            confidences = [row.conf for row in rows]
+        if merges and isinstance(merges[0], dict):
+            merges = [
+                (m["start_row"], m["start_column"], m["end_row"], m["end_column"])
+                for m in merges
+            ]
+        return cls(
+            name,
+            page,
+            [row.description for row in rows],
+            values,
+            notes=notes,
+            boxes=boxes,
+            confidences=confidences,
+            cells=cells,
+            merges=merges,
+        )
+
+    def __len__(self):
+        return len(self.descriptions)
+
+    def __repr__(self):
+        return (
+            f"ExtractedTable(name={self.name!r}, page={self.page}, "
+            f"page_type={self.page_type!r}, rows={len(self)}, "
+            f"columns={self.values.shape[1]})"
+        )
+
+    def rows(self):
+        """Yield the table's rows as ``TableRow`` records"""
+        notes = self.notes or [None] * len(self)
+        boxes = self.boxes.tolist() if self.boxes is not None else [None] * len(self)
+        confidences = (
+            self.confidences.tolist()
+            if self.confidences is not None
+            else [None] * len(self)
+        )
+        for description, line, note, box, conf in zip(
+            self.descriptions, self.values.tolist(), notes, boxes, confidences
+        ):
+            values = [None if v != v else v for v in line]
+            yield TableRow(
+                description, values, note, tuple(box) if box else None, conf
+            )
+
+    def _meta(self):
+        """The table's attributes that are not arrays"""
+        return {
+            "name": self.name,
+            "page": self.page,
+            "page_type": self.page_type,
+            "descriptions": self.descriptions,
+            "notes": self.notes,
+            "cells": self.cells,
+        }
+
+    def to_dict(self):
+        """Return the table as JSON-compatible lists (None for blank values)"""
+        data = self._meta()
+        # NaN is the only value not equal to itself
+        data["values"] = [
+            [v if v == v else None for v in line] for line in self.values.tolist()
+        ]
+        for field in ("boxes", "confidences", "merges"):
+            array = getattr(self, field)
+            data[field] = array.tolist() if array is not None else None
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Inverse of ``to_dict``"""
+        # numpy reads None as NaN in a float array
+        return cls(
+            data["name"],
+            data["page"],
+            data["descriptions"],
+            np.array(data["values"], dtype=np.float64),
+            notes=data.get("notes"),
+            boxes=data.get("boxes"),
+            confidences=data.get("confidences"),
+            cells=data.get("cells"),
+            merges=data.get("merges"),
+            page_type=data.get("page_type"),
+        )
+
+
+def _optional_array(data, field, shape):
+    if data is None:
+        return None
+    dtype = ARRAY_FIELDS[field].newbyteorder("=")
+    return np.asarray(data, dtype=dtype).reshape(shape)
+
+
+def tables_to_json(tables):
+    """Serialize a list of tables (or None) to a JSON string"""
+    if tables is None:
+        return "null"
+    return json.dumps([table.to_dict() for table in tables], separators=(",", ":"))
+
+
+def tables_from_json(text):
+    """Inverse of ``tables_to_json``"""
+    data = json.loads(text)
+    if data is None:
+        return None
+    return [ExtractedTable.from_dict(item) for item in data]
+
+
+def dump_tables(tables):
+    """Serialize a list of tables to the compact binary format
+
+    Text and page metadata go into a JSON header; every array is written as
+    raw little-endian bytes, so loading needs no per-value parsing.
+    """
+    header = []
+    chunks = []
+    offset = 0
+    for table in tables:
+        meta = table._meta()
+        arrays = {}
+        for field, dtype in ARRAY_FIELDS.items():
+            array = getattr(table, field)
+            if array is None:
+                continue
+            raw = np.ascontiguousarray(array, dtype=dtype).tobytes()
+            arrays[field] = [offset, list(array.shape)]
+            chunks.append(raw)
+            padding = -len(raw) % ARRAY_ALIGNMENT
+            chunks.append(b"\0" * padding)
+            offset += len(raw) + padding
+        meta["arrays"] = arrays
+        header.append(meta)
+
+    encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    encoded += b" " * (-(len(encoded) + _PREAMBLE.size) % ARRAY_ALIGNMENT)
+    return b"".join(
+        [_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(encoded)), encoded] + chunks
+    )
+
+
+def load_tables(data):
+    """Inverse of ``dump_tables``
+
+    Arrays are read-only views into ``data`` rather than copies.
+    """
+    magic, version, header_length = _PREAMBLE.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a table file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported table file version {version}")
+    start = _PREAMBLE.size + header_length
+    header = json.loads(bytes(data[_PREAMBLE.size:start]).decode("utf-8"))
+
+    tables = []
+    for meta in header:
+        arrays = {}
+        for field, (offset, shape) in meta.pop("arrays").items():
+            dtype = ARRAY_FIELDS[field]
+            count = int(np.prod(shape))
+            arrays[field] = np.frombuffer(
+                data, dtype=dtype, count=count, offset=start + offset
+            ).reshape(shape)
+        table = ExtractedTable.__new__(ExtractedTable)
+        table.name = meta["name"]
+        table.page = meta["page"]
+        table.page_type = meta["page_type"]
+        table.descriptions = meta["descriptions"]
+        table.notes = meta["notes"]
+        table.cells = meta["cells"]
+        table.values = arrays.get(
+            "values", np.zeros((len(table.descriptions), 0))
+        )
+        table.boxes = arrays.get("boxes")
+        table.confidences = arrays.get("confidences")
+        table.merges = arrays.get("merges")
+        tables.append(table)
+    return tables
+
+
+def save_tables(path, tables):
+    """Write tables to ``path``: JSON for a .json file, binary otherwise
+
+    The file is replaced atomically.
+    """
+    if path.lower().endswith(".json"):
+        data = tables_to_json(tables).encode("utf-8")
+    else:
+        data = dump_tables(tables)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_tables(path):
+    """Read tables written by ``save_tables``"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.lower().endswith(".json"):
+        return tables_from_json(data.decode("utf-8"))
+    return load_tables(data)
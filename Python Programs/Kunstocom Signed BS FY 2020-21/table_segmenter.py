@@ -0,0 +1,145 @@
+import os
+import re
+import sys
+
+# amounts is shared with the other script folders (see ../shared)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+
+from amounts import parse_amount  # noqa: E402
+from table_model import ExtractedTable, TableRow  # noqa: E402
+
+
+# Keywords that indicate a financial table
+FINANCIAL_KEYWORDS = (
+    "Balance Sheet",
+    "Profit",
+    "Loss",
+    "Cash Flow",
+    "Income",
+    "Assets",
+    "Liabilities",
+    "Equity",
+    "Revenue",
+    "Expenses",
+)
+
+# Consecutive empty lines that close a table
+END_OF_TABLE_BLANKS = 2
+
+# Line kinds
+BLANK = "blank"
+HEADER = "header"
+HEADER_ROW = "header_row"
+ROW = "row"
+TEXT = "text"
+
+_KEYWORD = re.compile("|".join(re.escape(k) for k in FINANCIAL_KEYWORDS))
+_DIGIT = re.compile(r"\d")
+_CELL_SPLIT = re.compile(r"\s{2,}")
+
+
+def classify_line(line):
+    """Return the kind of a text line
+
+    A line holding a keyword is a ``HEADER`` (or a ``HEADER_ROW`` when it
+    also carries numbers, e.g. "Total Assets  1,000  2,000"), any other line
+    with a digit is a ``ROW`` and the rest are ``TEXT`` or ``BLANK``.
+    """
+    if not line or line.isspace():
+        return BLANK
+    if _KEYWORD.search(line):
+        return HEADER_ROW if _DIGIT.search(line) else HEADER
+    return ROW if _DIGIT.search(line) else TEXT
+
+
+def split_table_row(line):
+    """Split a line on runs of two or more spaces into text and numbers
+
+    Amounts may use Indian grouping, parentheses for negatives or "-" for
+    nil (see ``amounts.parse_amount``). Returns a ``TableRow``, or None
+    unless the line has both a text part and a numeric part.
+    """
+    parts = _CELL_SPLIT.split(line)
+    if len(parts) < 2:
+        return None
+
+    numeric_parts = []
+    text_parts = []
+    for part in parts:
+        amount = parse_amount(part)
+        if amount is not None:
+            numeric_parts.append(amount)
+        elif part:
+            text_parts.append(part)
+
+    if text_parts and numeric_parts:
+        return TableRow(" ".join(text_parts).strip(), numeric_parts)
+    return None
+
+
+def segment_tables(lines, page_num, rows=None, parse_row=split_table_row):
+    """Group the lines of a page into named tables
+
+    ``lines`` is either the page text (split on newlines) or a list of lines
+    already built from word boxes. ``rows`` optionally holds a ready-made
+    row record (or None) for each line, as ``build_layout_rows`` returns;
+    otherwise row lines are split with ``parse_row``.
+
+    Each line is classified once and drives a small state machine: a header
+    opens a table, rows are added to the open table, a header after some
+    rows closes it and opens the next one, and ``END_OF_TABLE_BLANKS``
+    empty lines in a row close it. Rows after such a gap go on in a new,
+    unnamed table; rows before the first header are dropped.
+    Returns a list of ``ExtractedTable``.
+    """
+    if isinstance(lines, str):
+        lines = lines.split("\n")
+
+    tables = []
+    table_name = None
+    current_table = []
+    in_table = False
+    after_gap = False
+    blanks = 0
+
+    for index, line in enumerate(lines):
+        kind = classify_line(line)
+
+        if kind is BLANK:
+            blanks += 1
+            if in_table and current_table and blanks >= END_OF_TABLE_BLANKS:
+                tables.append(
+                    ExtractedTable.from_rows(table_name, page_num, current_table)
+                )
+                current_table = []
+                in_table = False
+                after_gap = True
+            continue
+        blanks = 0
+
+        if not in_table:
+            if kind is HEADER or kind is HEADER_ROW:
+                table_name = line.strip()
+                in_table = True
+                continue
+            if kind is not ROW or not after_gap:
+                continue
+            table_name = None
+            in_table = True
+
+        if kind is ROW or kind is HEADER_ROW:
+            row = rows[index] if rows is not None else parse_row(line)
+            if row:
+                current_table.append(row)
+
+        # A keyword line after some rows starts the next table; a total
+        # such as "Total Assets" is kept as the last row of the one before
+        if (kind is HEADER or kind is HEADER_ROW) and current_table:
+            tables.append(ExtractedTable.from_rows(table_name, page_num, current_table))
+            current_table = []
+            table_name = line.strip()
+
+    if current_table:
+        tables.append(ExtractedTable.from_rows(table_name, page_num, current_table))
+
+    return tables
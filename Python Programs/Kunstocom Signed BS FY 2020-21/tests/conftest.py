@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The converter's modules, and the shared ones they import, by name as the
+# scripts themselves import them
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir, os.pardir, "shared"))
+sys.path.insert(0, os.path.dirname(HERE))
@@ -0,0 +1,108 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import batch_convert
+
+converted = []
+
+
+def fake_convert_document(pdf_path, output_path, cache_dir=None, keep_tables=False,
+                          incremental=False):
+    """Stand-in for OCR: fail on PDFs named bad*.pdf, else write a workbook"""
+    converted.append(os.path.basename(pdf_path))
+    if os.path.basename(pdf_path).startswith("bad"):
+        raise RuntimeError("unreadable")
+    with open(output_path, "w") as f:
+        f.write("xlsx")
+    return {"pages": 2, "tables": 1, "seconds": 0.01}
+
+
+@pytest.fixture
+def batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_convert, "convert_document", fake_convert_document)
+    monkeypatch.setattr(batch_convert, "ProcessPoolExecutor", ThreadPoolExecutor)
+    converted.clear()
+    inputs = tmp_path / "pdfs"
+    inputs.mkdir()
+    for name in ("a.pdf", "b.pdf"):
+        (inputs / name).write_bytes(name.encode())
+    output = tmp_path / "out"
+
+    def run(**options):
+        converted.clear()
+        return batch_convert.run_batch([str(inputs)], str(output), jobs=1, **options)
+
+    run.inputs = inputs
+    run.output = output
+    return run
+
+
+def manifest(batch):
+    with open(batch.output / batch_convert.MANIFEST_NAME) as f:
+        return json.load(f)
+
+
+def test_finished_documents_are_recorded(batch):
+    results, failed = batch()
+    assert sorted(converted) == ["a.pdf", "b.pdf"]
+    assert not failed
+    records = manifest(batch)
+    assert sorted(os.path.basename(r["input"]) for r in records.values()) == ["a.pdf", "b.pdf"]
+    assert (batch.output / "a.xlsx").exists()
+
+
+def test_second_run_resumes_where_the_first_stopped(batch):
+    batch()
+    (batch.inputs / "c.pdf").write_bytes(b"c")
+    results, _ = batch()
+    assert converted == ["c.pdf"]
+    assert list(results) == [str(batch.inputs / "c.pdf")]
+
+
+def test_changed_pdf_is_converted_again(batch):
+    batch()
+    (batch.inputs / "a.pdf").write_bytes(b"revised a")
+    batch()
+    assert converted == ["a.pdf"]
+
+
+def test_missing_workbook_is_converted_again(batch):
+    batch()
+    (batch.output / "b.xlsx").unlink()
+    batch()
+    assert converted == ["b.pdf"]
+
+
+def test_copy_of_a_done_pdf_gets_its_own_workbook(batch):
+    batch()
+    (batch.inputs / "a copy.pdf").write_bytes(b"a.pdf")
+    batch()
+    assert converted == ["a copy.pdf"]
+    assert (batch.output / "a copy.xlsx").exists()
+    assert len(manifest(batch)) == 3
+
+
+def test_force_converts_everything(batch):
+    batch()
+    batch(force=True)
+    assert sorted(converted) == ["a.pdf", "b.pdf"]
+
+
+def test_failed_document_is_retried_next_run(batch):
+    (batch.inputs / "bad.pdf").write_bytes(b"bad")
+    _, failed = batch()
+    assert list(failed) == [str(batch.inputs / "bad.pdf")]
+    assert len(manifest(batch)) == 2
+
+    batch()
+    assert converted == ["bad.pdf"]
+
+
+def test_unreadable_manifest_starts_afresh(batch):
+    batch.output.mkdir()
+    (batch.output / batch_convert.MANIFEST_NAME).write_text("{not json")
+    batch()
+    assert sorted(converted) == ["a.pdf", "b.pdf"]
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+import pdf_to_excel_converter
+from ocr_backends import OCRWord
+from pdf_to_excel_converter import FinancialStatementConverter
+
+WORDS = [
+    OCRWord(10, 10, 60, 22, "Cash", 91.0, (1, 1, 1)),
+    OCRWord(200, 10, 260, 22, "1,000", 88.0, (1, 1, 1)),
+    OCRWord(10, 40, 60, 52, "Bank", 75.0, (1, 1, 2)),
+]
+
+
+class FakeEngine:
+    calls = 0
+
+    def image_to_data(self, img):
+        FakeEngine.calls += 1
+        return list(WORDS)
+
+
+@pytest.fixture
+def converter(tmp_path, monkeypatch):
+    pdf = tmp_path / "statement.pdf"
+    pdf.write_bytes(b"%PDF-1.4 stand-in")
+    monkeypatch.setattr(pdf_to_excel_converter, "get_ocr_backend", lambda *a: FakeEngine())
+    FakeEngine.calls = 0
+    return FinancialStatementConverter(str(pdf), cache_dir=str(tmp_path / "cache"))
+
+
+def test_cached_words_keep_their_line(converter):
+    page = np.full((100, 300), 255, dtype=np.uint8)
+    assert converter.extract_words_from_image(page, 1) == WORDS
+    assert converter.extract_words_from_image(page, 1) == WORDS
+    assert FakeEngine.calls == 1
+
+
+def test_new_options_are_off_by_default(tmp_path):
+    converter = FinancialStatementConverter(str(tmp_path / "statement.pdf"))
+    assert not converter.column_layout
+    assert not converter.grid_tables
+    assert not converter.classify_pages
+    assert not converter.skip_prose_pages
+    assert not converter.orient_pages
+    assert not converter.crop_pages
+    assert not converter.pipeline
+    assert not converter.shared_pages
+
+
+def test_workers_are_set_up_like_the_parent(tmp_path):
+    parent = FinancialStatementConverter(
+        str(tmp_path / "statement.pdf"),
+        cache_dir=str(tmp_path / "cache"),
+        incremental=True,
+        grid_tables=True,
+    )
+    worker = FinancialStatementConverter(**parent.get_ocr_settings())
+    assert worker.incremental
+    assert worker.grid_tables
+    assert worker.get_ocr_settings() == parent.get_ocr_settings()
+
+
+def test_pages_with_cached_ocr_are_not_rendered(tmp_path, monkeypatch):
+    pdf = tmp_path / "statement.pdf"
+    pdf.write_bytes(b"%PDF-1.4 stand-in")
+    monkeypatch.setattr(pdf_to_excel_converter, "get_ocr_backend", lambda *a: FakeEngine())
+    FakeEngine.calls = 0
+    converter = FinancialStatementConverter(
+        str(pdf), cache_dir=str(tmp_path / "cache"), column_layout=True
+    )
+    page = np.full((100, 300), 255, dtype=np.uint8)
+    converter.extract_words_from_image(page, 1)
+
+    rendered = []
+
+    def render(dpi=None, window=None, page_numbers=None):
+        rendered.extend(page_numbers)
+        return ((n, page) for n in page_numbers)
+
+    monkeypatch.setattr(converter, "get_page_count", lambda: 2)
+    monkeypatch.setattr(converter, "iter_pdf_pages", render)
+    converter.extract_tables_from_images()
+    assert rendered == [2]
+    assert FakeEngine.calls == 2
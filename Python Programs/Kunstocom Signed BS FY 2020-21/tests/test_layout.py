@@ -0,0 +1,60 @@
+import pytest
+
+from layout import build_layout_rows
+
+
+def words_at(y, *cells, conf=None):
+    """Words of one line: ``cells`` are (x, text) pairs, 10 px a character"""
+    words = []
+    for x, text in cells:
+        for token in text.split():
+            box = (x, y, x + 10 * len(token), y + 12, token)
+            words.append(box if conf is None else box + (conf,))
+            x += 10 * (len(token) + 1)
+    return words
+
+
+STATEMENT = (
+    words_at(0, (0, "BALANCE SHEET AS AT 31.03.2021"))
+    + words_at(30, (0, "Particulars"), (300, "Note"), (400, "2021"), (550, "2020"))
+    + words_at(60, (0, "Share capital"), (300, "3"), (400, "1,00,000.00"), (550, "1,00,000.00"))
+    + words_at(90, (0, "Reserves and surplus"), (300, "4"), (400, "(5,000.00)"), (550, "2,500.00"))
+    + words_at(120, (0, "Trade payables"), (300, "5"), (400, "12,345.50"))
+)
+
+
+def test_lines_join_cells_with_two_spaces():
+    lines, rows = build_layout_rows(STATEMENT)
+    assert len(lines) == len(rows) == 5
+    assert lines[2] == "Share capital  3  1,00,000.00  1,00,000.00"
+
+
+def test_title_line_has_no_row():
+    _, rows = build_layout_rows(STATEMENT)
+    assert rows[0] is None
+
+
+def test_rows_split_particulars_note_and_amounts():
+    _, rows = build_layout_rows(STATEMENT)
+    assert rows[2].description == "Share capital"
+    assert rows[2].note == "3"
+    assert rows[2].values == [100000.0, 100000.0]
+    assert rows[3].description == "Reserves and surplus"
+    assert rows[3].values == [-5000.0, 2500.0]
+
+
+def test_blank_amount_cell_keeps_the_years_aligned():
+    _, rows = build_layout_rows(STATEMENT)
+    assert rows[4].values == [12345.5, None]
+
+
+def test_rows_carry_the_line_box_and_confidence():
+    words = words_at(0, (0, "Cash"), (200, "1,000.00"), (400, "900.00"), conf=90.0)
+    words += words_at(30, (0, "Bank"), (200, "2,000.00"), (400, "800.00"), conf=70.0)
+    _, rows = build_layout_rows(words)
+    assert rows[0].box == (0, 0, 460, 12)
+    assert rows[1].conf == pytest.approx(70.0)
+
+
+def test_no_words():
+    assert build_layout_rows([]) == ([], [])
@@ -0,0 +1,63 @@
+import os
+import time
+
+from ocr_cache import OCRCache
+
+
+def key(name):
+    return OCRCache.make_key("pdf", 1, 300, "eng", "--psm 6", {}, output=name)
+
+
+def age(cache, name, seconds):
+    """Make an entry look last used ``seconds`` ago"""
+    then = time.time() - seconds
+    os.utime(cache._path(key(name)), (then, then))
+
+
+def test_get_returns_what_put_stored(tmp_path):
+    cache = OCRCache(str(tmp_path))
+    cache.put(key("a"), "text of page")
+    assert cache.get(key("a")) == "text of page"
+    assert cache.get(key("b")) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_keys_differ_by_every_setting():
+    base = OCRCache.make_key("pdf", 1, 300, "eng", "--psm 6", {"threshold": 150})
+    assert base != OCRCache.make_key("pdf", 2, 300, "eng", "--psm 6", {"threshold": 150})
+    assert base != OCRCache.make_key("pdf", 1, 200, "eng", "--psm 6", {"threshold": 150})
+    assert base != OCRCache.make_key("pdf", 1, 300, "eng", "--psm 6", {"threshold": 140})
+    assert base != OCRCache.make_key(
+        "pdf", 1, 300, "eng", "--psm 6", {"threshold": 150}, output="words"
+    )
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = OCRCache(str(tmp_path), max_bytes=25)
+    cache.put(key("a"), "a" * 10)
+    cache.put(key("b"), "b" * 10)
+    age(cache, "a", 200)
+    age(cache, "b", 100)
+
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get(key("a")) is not None
+    cache.put(key("c"), "c" * 10)
+
+    assert cache.get(key("b")) is None
+    assert cache.get(key("a")) == "a" * 10
+    assert cache.get(key("c")) == "c" * 10
+    assert cache.stats()["bytes"] == 20
+
+
+def test_overwriting_an_entry_does_not_count_it_twice(tmp_path):
+    cache = OCRCache(str(tmp_path), max_bytes=25)
+    cache.put(key("a"), "a" * 10)
+    cache.put(key("a"), "a" * 12)
+    cache.put(key("b"), "b" * 10)
+    assert cache.total_bytes == 22
+    assert cache.get(key("a")) is not None
+
+
+def test_size_is_picked_up_from_an_existing_directory(tmp_path):
+    OCRCache(str(tmp_path)).put(key("a"), "a" * 10)
+    assert OCRCache(str(tmp_path)).total_bytes == 10
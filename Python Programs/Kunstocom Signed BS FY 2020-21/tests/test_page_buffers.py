@@ -0,0 +1,72 @@
+import gc
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from page_buffers import SharedPageArena, open_page
+
+
+def page(value, shape=(40, 30)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def test_page_is_read_back_from_shared_memory():
+    with SharedPageArena(2) as arena:
+        ref = arena.put(page(7))
+        np.testing.assert_array_equal(open_page(ref), page(7))
+
+
+def test_full_arena_refuses_pages_until_one_is_released():
+    with SharedPageArena(2) as arena:
+        first = arena.put(page(1))
+        arena.put(page(2))
+        with pytest.raises(RuntimeError):
+            arena.put(page(3))
+
+        arena.release(first)
+        ref = arena.put(page(3))
+        # The released slot's block is reused for the next page
+        assert ref.name == first.name
+        np.testing.assert_array_equal(open_page(ref), page(3))
+
+
+def test_releasing_twice_frees_the_slot_once():
+    with SharedPageArena(1) as arena:
+        ref = arena.put(page(1))
+        arena.release(ref)
+        arena.release(ref)
+        arena.put(page(2))
+        with pytest.raises(RuntimeError):
+            arena.put(page(3))
+
+
+def test_larger_page_replaces_the_slot_block():
+    with SharedPageArena(1) as arena:
+        small = arena.put(page(1))
+        arena.release(small)
+        large = arena.put(page(2, shape=(400, 300)))
+        assert large.name != small.name
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=small.name)
+
+
+def test_close_unlinks_every_block():
+    arena = SharedPageArena(2)
+    refs = [arena.put(page(1)), arena.put(page(2))]
+    arena.close()
+    for ref in refs:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=ref.name)
+
+
+def test_dropped_arena_is_collected_and_unlinks_its_blocks():
+    arena = SharedPageArena(1)
+    name = arena.put(page(5)).name
+    collected = weakref.ref(arena)
+    del arena
+    gc.collect()
+    assert collected() is None
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
@@ -0,0 +1,30 @@
+import numpy as np
+
+from page_buffers import SharedPageArena, open_page
+from preprocessing import PreprocessPipeline, Region
+
+
+def speckled_page():
+    page = np.full((60, 80), 200, dtype=np.uint8)
+    page[20:40, 10:70] = 90
+    return page
+
+
+def test_run_leaves_the_callers_buffer_alone():
+    page = speckled_page()
+    processed = PreprocessPipeline(threshold=150).run(page)
+    np.testing.assert_array_equal(page, speckled_page())
+    assert processed.max() == 255 and processed.min() == 0
+
+
+def test_run_reuses_an_owned_buffer_with_inplace():
+    page = speckled_page()
+    processed = PreprocessPipeline(threshold=150).run(page, inplace=True)
+    assert processed is page
+
+
+def test_crop_does_not_write_to_a_shared_page():
+    with SharedPageArena(1) as arena:
+        ref = arena.put(speckled_page())
+        PreprocessPipeline().crop(open_page(ref), [Region(0, 0, 1, 0.5)], detect=False)
+        np.testing.assert_array_equal(open_page(ref), speckled_page())
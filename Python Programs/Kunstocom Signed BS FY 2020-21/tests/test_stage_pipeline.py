@@ -0,0 +1,68 @@
+import threading
+import time
+
+import pytest
+
+from stage_pipeline import Stage, StagedPipeline
+
+
+def test_every_item_goes_through_every_stage():
+    pipeline = StagedPipeline(
+        [Stage("double", lambda x: 2 * x, 2), Stage("add", lambda x: x + 1, 3)]
+    )
+    assert sorted(pipeline.run(range(50))) == [2 * x + 1 for x in range(50)]
+    assert set(pipeline.busy) == {"source", "double", "add"}
+
+
+def test_stage_error_is_raised_to_the_consumer():
+    def fail_on_five(x):
+        if x == 5:
+            raise ValueError("bad page 5")
+        return x
+
+    pipeline = StagedPipeline([Stage("check", fail_on_five, 2), Stage("keep", str, 1)])
+    with pytest.raises(ValueError, match="bad page 5"):
+        list(pipeline.run(range(100)))
+
+
+def test_source_error_is_raised_to_the_consumer():
+    def pages():
+        yield 1
+        raise OSError("renderer died")
+
+    with pytest.raises(OSError, match="renderer died"):
+        list(StagedPipeline([Stage("keep", int, 1)]).run(pages()))
+
+
+def test_error_stops_the_other_threads():
+    before = threading.active_count()
+    pipeline = StagedPipeline([Stage("fail", lambda x: 1 / 0, 1)])
+    with pytest.raises(ZeroDivisionError):
+        list(pipeline.run(iter(range(10**6))))
+    assert threading.active_count() == before
+
+
+def test_a_slow_consumer_holds_the_source_back():
+    produced = []
+
+    def pages():
+        for n in range(1000):
+            produced.append(n)
+            yield n
+
+    pipeline = StagedPipeline([Stage("keep", int, 1), Stage("keep2", int, 1)], queue_size=1)
+    results = pipeline.run(pages())
+    assert next(results) == 0
+    time.sleep(0.3)
+    # One item taken, one in each of the three queues and one held by the
+    # source and by each worker
+    assert len(produced) <= 7
+    results.close()
+
+
+def test_closing_early_joins_the_threads():
+    before = threading.active_count()
+    results = StagedPipeline([Stage("keep", int, 2)]).run(iter(range(10**6)))
+    next(results)
+    results.close()
+    assert threading.active_count() == before
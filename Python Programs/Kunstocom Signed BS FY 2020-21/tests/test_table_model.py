@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from table_model import (
+    ExtractedTable,
+    TableRow,
+    dump_tables,
+    load_tables,
+    read_tables,
+    save_tables,
+    tables_from_json,
+    tables_to_json,
+)
+
+
+def sample_tables():
+    rows = [
+        TableRow("Share capital", [100000.0, 100000.0], "3", (0, 60, 660, 72), 91.5),
+        TableRow("Reserves", [-5000.0, None], "4", (0, 90, 630, 102), 88.0),
+        TableRow("Trade payables", [12345.5], "5", (0, 120, 490, 132), 75.25),
+    ]
+    laid_out = ExtractedTable.from_rows("Balance Sheet", 2, rows)
+    laid_out.page_type = "balance_sheet"
+
+    grid = ExtractedTable.from_rows(
+        "Fixed Assets",
+        7,
+        [TableRow("Plant", [10.0, 2.0, 8.0])],
+        cells=[["", "GROSS BLOCK", ""], ["Plant", "10", "2"]],
+        merges=[{"start_row": 1, "start_column": 2, "end_row": 1, "end_column": 3}],
+    )
+    plain = ExtractedTable.from_rows("Notes", 9, [TableRow("Cash", [1.0, 2.0])])
+    return [laid_out, grid, plain]
+
+
+def assert_same_tables(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert (a.name, a.page, a.page_type) == (e.name, e.page, e.page_type)
+        assert a.descriptions == e.descriptions
+        assert a.notes == e.notes
+        assert a.cells == e.cells
+        np.testing.assert_array_equal(a.values, e.values)
+        for field in ("boxes", "confidences", "merges"):
+            if getattr(e, field) is None:
+                assert getattr(a, field) is None, field
+            else:
+                np.testing.assert_array_equal(getattr(a, field), getattr(e, field))
+        assert list(a.rows()) == list(e.rows())
+
+
+def test_from_rows_pads_short_rows_with_blanks():
+    table = sample_tables()[0]
+    assert table.values.shape == (3, 2)
+    assert list(table.rows())[2].values == [12345.5, None]
+
+
+def test_binary_round_trip():
+    tables = sample_tables()
+    assert_same_tables(load_tables(dump_tables(tables)), tables)
+
+
+def test_binary_arrays_are_views_into_the_data():
+    loaded = load_tables(dump_tables(sample_tables()))
+    assert not loaded[0].values.flags.writeable
+
+
+def test_json_round_trip():
+    tables = sample_tables()
+    assert_same_tables(tables_from_json(tables_to_json(tables)), tables)
+
+
+def test_json_keeps_none_for_a_page_without_grid():
+    assert tables_from_json(tables_to_json(None)) is None
+
+
+@pytest.mark.parametrize("name", ["tables.json", "tables.tables"])
+def test_save_and_read_tables(tmp_path, name):
+    tables = sample_tables()
+    path = str(tmp_path / name)
+    save_tables(path, tables)
+    assert_same_tables(read_tables(path), tables)
+    assert [p.name for p in tmp_path.iterdir()] == [name]
+
+
+def test_load_rejects_other_files():
+    with pytest.raises(ValueError):
+        load_tables(b"PK\x03\x04" + bytes(16))
@@ -0,0 +1,122 @@
+from table_segmenter import (
+    BLANK,
+    HEADER,
+    HEADER_ROW,
+    ROW,
+    TEXT,
+    classify_line,
+    segment_tables,
+    split_table_row,
+)
+from table_model import TableRow
+
+
+def test_classify_line():
+    assert classify_line("   ") is BLANK
+    assert classify_line("Balance Sheet as at March") is HEADER
+    assert classify_line("Total Assets  1,000  2,000") is HEADER_ROW
+    assert classify_line("Share capital  1,000  2,000") is ROW
+    assert classify_line("See accompanying notes") is TEXT
+
+
+def test_split_table_row():
+    row = split_table_row("Share capital  1,00,000.00  (5,000)")
+    assert row.description == "Share capital"
+    assert row.values == [100000.0, -5000.0]
+    assert split_table_row("Share capital 1,000") is None
+    assert split_table_row("Share capital  and reserves") is None
+
+
+def test_header_opens_a_table_and_rows_join_it():
+    text = "\n".join([
+        "Balance Sheet",
+        "Share capital  1,000  900",
+        "Reserves  200  100",
+    ])
+    [table] = segment_tables(text, 3)
+    assert table.name == "Balance Sheet"
+    assert table.page == 3
+    assert [row.description for row in table.rows()] == ["Share capital", "Reserves"]
+
+
+def test_rows_before_any_header_are_dropped():
+    text = "Share capital  1,000  900\nBalance Sheet\nReserves  200  100"
+    [table] = segment_tables(text, 1)
+    assert [row.description for row in table.rows()] == ["Reserves"]
+
+
+def test_header_after_rows_starts_the_next_table():
+    text = "\n".join([
+        "Balance Sheet",
+        "Share capital  1,000  900",
+        "Profit and Loss",
+        "Revenue from operations  5,000  4,000",
+    ])
+    first, second = segment_tables(text, 1)
+    assert first.name == "Balance Sheet"
+    assert second.name == "Profit and Loss"
+    assert [row.description for row in second.rows()] == ["Revenue from operations"]
+
+
+def test_total_line_closes_its_table_as_the_last_row():
+    text = "\n".join([
+        "Assets",
+        "Cash  100  90",
+        "Total Assets  100  90",
+        "Bank  50  40",
+    ])
+    first, second = segment_tables(text, 1)
+    assert [row.description for row in first.rows()] == ["Cash", "Total Assets"]
+    assert second.name == "Total Assets  100  90"
+    assert [row.description for row in second.rows()] == ["Bank"]
+
+
+def test_two_blank_lines_close_a_table():
+    text = "\n".join([
+        "Balance Sheet",
+        "Share capital  1,000  900",
+        "",
+        "Reserves  200  100",
+        "",
+        "",
+        "Cash  100  90",
+    ])
+    first, second = segment_tables(text, 1)
+    assert [row.description for row in first.rows()] == ["Share capital", "Reserves"]
+    assert second.name is None
+    assert [row.description for row in second.rows()] == ["Cash"]
+
+
+def test_rows_after_a_gap_are_kept_until_the_next_header():
+    text = "\n".join([
+        "Balance Sheet",
+        "Share capital  1,000  900",
+        "",
+        "",
+        "Reserves  200  100",
+        "Trade payables  50  40",
+        "",
+        "",
+        "",
+        "Statement of Profit and Loss",
+        "Sales  500  400",
+    ])
+    tables = segment_tables(text, 1)
+    assert [table.name for table in tables] == [
+        "Balance Sheet",
+        None,
+        "Statement of Profit and Loss",
+    ]
+    assert [row.description for row in tables[1].rows()] == ["Reserves", "Trade payables"]
+    assert [row.description for row in tables[2].rows()] == ["Sales"]
+
+
+def test_header_without_rows_gives_no_table():
+    assert segment_tables("Balance Sheet\nAs at 31 March", 1) == []
+
+
+def test_ready_made_rows_replace_line_splitting():
+    lines = ["Balance Sheet", "Share capital 1,000", "Reserves 200"]
+    rows = [None, TableRow("Share capital", [1000.0]), None]
+    [table] = segment_tables(lines, 1, rows)
+    assert [row.description for row in table.rows()] == ["Share capital"]
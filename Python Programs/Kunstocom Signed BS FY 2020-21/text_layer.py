@@ -0,0 +1,116 @@
+import subprocess
+import xml.etree.ElementTree as ET
+from statistics import median
+
+
+# Pages with fewer words than this are treated as scanned and sent to OCR
+MIN_TEXT_LAYER_WORDS = 10
+
+# Share of word characters that must be letters, digits or common amount
+# punctuation for a text layer to be trusted (guards against broken fonts)
+MIN_READABLE_RATIO = 0.8
+
+# A gap wider than this many average character widths separates columns
+COLUMN_GAP_CHARS = 1.5
+
+_READABLE_PUNCTUATION = set(",.()-/&%':;")
+
+
+def extract_text_layer(pdf_path, first_page=None, last_page=None):
+    """Read the embedded text layer of a PDF with poppler's ``pdftotext``
+
+    Returns a dict mapping page number to a list of words, each a tuple
+    ``(x0, y0, x1, y1, text)`` in PDF points. Returns an empty dict when
+    ``pdftotext`` is not installed or fails, so callers fall back to OCR.
+    """
+    cmd = ["pdftotext", "-bbox"]
+    if first_page:
+        cmd += ["-f", str(first_page)]
+    if last_page:
+        cmd += ["-l", str(last_page)]
+    cmd += [pdf_path, "-"]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+
+    try:
+        root = ET.fromstring(result.stdout)
+    except ET.ParseError:
+        return {}
+
+    pages = {}
+    for page_num, page in enumerate(root.iter("{*}page"), first_page or 1):
+        words = []
+        for word in page.iter("{*}word"):
+            text = (word.text or "").strip()
+            if not text:
+                continue
+            words.append(
+                (
+                    float(word.get("xMin")),
+                    float(word.get("yMin")),
+                    float(word.get("xMax")),
+                    float(word.get("yMax")),
+                    text,
+                )
+            )
+        pages[page_num] = words
+    return pages
+
+
+def is_usable_text_layer(words, min_words=MIN_TEXT_LAYER_WORDS):
+    """Return True if a page's text layer can replace OCR"""
+    if len(words) < min_words:
+        return False
+
+    chars = "".join(word[4] for word in words)
+    readable = sum(1 for c in chars if c.isalnum() or c in _READABLE_PUNCTUATION)
+    return readable / len(chars) >= MIN_READABLE_RATIO
+
+
+def group_words_into_lines(words):
+    """Group positioned words into lines, each sorted left to right"""
+    if not words:
+        return []
+
+    line_tolerance = median(w[3] - w[1] for w in words) / 2
+    lines = []
+    current = []
+    current_center = None
+
+    for word in sorted(words, key=lambda w: ((w[1] + w[3]) / 2, w[0])):
+        center = (word[1] + word[3]) / 2
+        if current and abs(center - current_center) > line_tolerance:
+            lines.append(sorted(current, key=lambda w: w[0]))
+            current = []
+        if not current:
+            current_center = center
+        current.append(word)
+
+    if current:
+        lines.append(sorted(current, key=lambda w: w[0]))
+    return lines
+
+
+def words_to_text(words):
+    """Render positioned words as OCR-style text
+
+    Words on the same line are joined with one space, or with two when the
+    gap between them is wide enough to be a column break, which is what
+    ``process_table_row`` splits on. The result can be fed to
+    ``identify_tables`` exactly like tesseract output.
+    """
+    text_lines = []
+    for line in group_words_into_lines(words):
+        char_width = sum(w[2] - w[0] for w in line) / max(
+            1, sum(len(w[4]) for w in line)
+        )
+        parts = [line[0][4]]
+        for prev, word in zip(line, line[1:]):
+            gap = word[0] - prev[2]
+            parts.append("  " if gap > COLUMN_GAP_CHARS * char_width else " ")
+            parts.append(word[4])
+        text_lines.append("".join(parts))
+    return "\n".join(text_lines)
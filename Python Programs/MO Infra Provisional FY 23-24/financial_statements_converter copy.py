@@ -1,11 +1,62 @@
 import openpyxl
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
 from openpyxl.utils import get_column_letter
 
+# Fonts, border and fill shared by every sheet
+HEADER_FONT = Font(name='Arial', size=12, bold=True)
+SUBHEADER_FONT = Font(name='Arial', size=11, bold=True)
+NORMAL_FONT = Font(name='Arial', size=10)
+BOLD_FONT = Font(name='Arial', size=10, bold=True)
+
+THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+
+HEADER_FILL = PatternFill(start_color="D9D9D9",
+                          end_color="D9D9D9", fill_type="solid")
+
+# Cell styles, registered once per workbook as named styles (see
+# register_styles) and assigned to cells by name
+CELL_STYLES = {
+    'title': dict(font=HEADER_FONT),
+    'subtitle': dict(font=SUBHEADER_FONT),
+    'normal': dict(font=NORMAL_FONT),
+    'bold': dict(font=BOLD_FONT),
+    'header': dict(font=BOLD_FONT, border=THIN_BORDER,
+                   alignment=Alignment(horizontal='center')),
+    'shaded_header': dict(font=BOLD_FONT, border=THIN_BORDER, fill=HEADER_FILL,
+                          alignment=Alignment(horizontal='center')),
+    'cell': dict(font=NORMAL_FONT, border=THIN_BORDER),
+    'total': dict(font=BOLD_FONT, border=THIN_BORDER),
+    'amount': dict(font=NORMAL_FONT, border=THIN_BORDER,
+                   alignment=Alignment(horizontal='right')),
+    'total_amount': dict(font=BOLD_FONT, border=THIN_BORDER,
+                         alignment=Alignment(horizontal='right')),
+}
+
+
+def register_styles(wb):
+    """Add CELL_STYLES to the workbook as named styles"""
+    existing = set(wb.named_styles)
+    for name, attributes in CELL_STYLES.items():
+        if name not in existing:
+            wb.add_named_style(NamedStyle(name=name, **attributes))
+
+
+def table_cell_style(is_total, is_amount):
+    """Name of the style for a bordered table cell"""
+    if is_amount:
+        return 'total_amount' if is_total else 'amount'
+    return 'total' if is_total else 'cell'
+
 
 def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statements.xlsx"):
     # Create a new workbook
     wb = openpyxl.Workbook()
+    register_styles(wb)
 
     # Create worksheets for each financial statement
     balance_sheet = wb.active
@@ -16,22 +67,6 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     schedules = wb.create_sheet("Schedules")
     fixed_assets = wb.create_sheet("Fixed Assets")
 
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-
-    header_fill = PatternFill(start_color="D9D9D9",
-                             end_color="D9D9D9", fill_type="solid")
-
     # Create separate sheets for each schedule
     schedule_names = [
         "Schedule A - Capital Account",
@@ -57,15 +92,15 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
 
         # Add header to each sheet
         sheet['A1'] = "M/S MO Infra"
-        sheet['A1'].font = header_font
+        sheet['A1'].style = 'title'
 
         sheet['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-        sheet['A2'].font = subheader_font
+        sheet['A2'].style = 'subtitle'
 
         # Extract schedule letter from the name (e.g., 'A' from 'Schedule A')
         schedule_letter = schedule_name.split(' ')[1]
         sheet['A4'] = f"Schedule : {schedule_letter}"
-        sheet['A4'].font = bold_font
+        sheet['A4'].style = 'bold'
 
         # Set column widths for better readability
         sheet.column_dimensions['A'].width = 35
@@ -78,17 +113,17 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     def setup_header(sheet, title):
         sheet.merge_cells('A1:G1')
         sheet['A1'] = "M/S MO Infra"
-        sheet['A1'].font = header_font
+        sheet['A1'].style = 'title'
         sheet['A1'].alignment = Alignment(horizontal='center')
 
         sheet.merge_cells('A2:G2')
         sheet['A2'] = "1, Wahid Nagar, Ratlam, Madhya Pradesh -457001"
-        sheet['A2'].font = normal_font
+        sheet['A2'].style = 'normal'
         sheet['A2'].alignment = Alignment(horizontal='center')
 
         sheet.merge_cells('A3:G3')
         sheet['A3'] = title
-        sheet['A3'].font = subheader_font
+        sheet['A3'].style = 'subtitle'
         sheet['A3'].alignment = Alignment(horizontal='center')
 
         sheet.merge_cells('A4:G4')
@@ -109,11 +144,7 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     balance_sheet['H5'] = "Amount"
 
     for col in range(1, 9):
-        balance_sheet.cell(row=5, column=col).font = bold_font
-        balance_sheet.cell(row=5, column=col).fill = header_fill
-        balance_sheet.cell(row=5, column=col).border = thin_border
-        balance_sheet.cell(row=5, column=col).alignment = Alignment(
-            horizontal='center')
+        balance_sheet.cell(row=5, column=col).style = 'shaded_header'
 
     # Balance Sheet Data
     balance_sheet_data = [
@@ -149,14 +180,11 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     for row_idx, row_data in enumerate(balance_sheet_data, 6):
         for col_idx, cell_value in enumerate(row_data, 1):
             balance_sheet.cell(row=row_idx, column=col_idx).value = cell_value
-            balance_sheet.cell(row=row_idx, column=col_idx).font = normal_font
-            balance_sheet.cell(
-                row=row_idx, column=col_idx).border = thin_border
 
-            # Apply bold font and background to total row
-            if row_idx == len(balance_sheet_data) + 5:  # Last row (TOTAL)
-                balance_sheet.cell(
-                    row=row_idx, column=col_idx).font = bold_font
+            # Apply bold font to total row
+            is_total = row_idx == len(balance_sheet_data) + 5  # Last row (TOTAL)
+            balance_sheet.cell(row=row_idx, column=col_idx).style = table_cell_style(
+                is_total, is_amount=False)
 
     # Set column widths for balance sheet
     balance_sheet.column_dimensions['A'].width = 25
@@ -172,33 +200,33 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     footer_row = len(balance_sheet_data) + 6
     balance_sheet.merge_cells(f'A{footer_row}:H{footer_row}')
     balance_sheet[f'A{footer_row}'] = 'Schedules "A" to "O" forms Integral Part of Accounts'
-    balance_sheet[f'A{footer_row}'].font = normal_font
+    balance_sheet[f'A{footer_row}'].style = 'normal'
     balance_sheet[f'A{footer_row}'].alignment = Alignment(horizontal='center')
 
     footer_row += 2
     balance_sheet.merge_cells(f'A{footer_row}:D{footer_row}')
     balance_sheet[f'A{footer_row}'] = 'For: M/s MO Infra'
-    balance_sheet[f'A{footer_row}'].font = normal_font
+    balance_sheet[f'A{footer_row}'].style = 'normal'
 
     footer_row += 2
     balance_sheet.merge_cells(f'A{footer_row}:D{footer_row}')
     balance_sheet[f'A{footer_row}'] = 'Mr. Saiyyed Akhtar Ali'
-    balance_sheet[f'A{footer_row}'].font = normal_font
+    balance_sheet[f'A{footer_row}'].style = 'normal'
 
     footer_row += 1
     balance_sheet.merge_cells(f'A{footer_row}:D{footer_row}')
     balance_sheet[f'A{footer_row}'] = '(Proprietor)'
-    balance_sheet[f'A{footer_row}'].font = normal_font
+    balance_sheet[f'A{footer_row}'].style = 'normal'
 
     footer_row += 2
     balance_sheet.merge_cells(f'A{footer_row}:D{footer_row}')
     balance_sheet[f'A{footer_row}'] = 'Place : Ratlam'
-    balance_sheet[f'A{footer_row}'].font = normal_font
+    balance_sheet[f'A{footer_row}'].style = 'normal'
 
     footer_row += 1
     balance_sheet.merge_cells(f'A{footer_row}:D{footer_row}')
     balance_sheet[f'A{footer_row}'] = 'Date : 17-05-2024'
-    balance_sheet[f'A{footer_row}'].font = normal_font
+    balance_sheet[f'A{footer_row}'].style = 'normal'
 
     # Set up Manufacturing Account
     setup_header(manufacturing_account,
@@ -211,11 +239,7 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     manufacturing_account['G5'] = "Amount"
 
     for col_idx in [1, 3, 5, 7]:
-        manufacturing_account.cell(row=5, column=col_idx).font = bold_font
-        manufacturing_account.cell(row=5, column=col_idx).fill = header_fill
-        manufacturing_account.cell(row=5, column=col_idx).border = thin_border
-        manufacturing_account.cell(
-            row=5, column=col_idx).alignment = Alignment(horizontal='center')
+        manufacturing_account.cell(row=5, column=col_idx).style = 'shaded_header'
 
     # Manufacturing Account Data
     manufacturing_account_data = [
@@ -238,15 +262,12 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
                 actual_col = col_pos + 1
                 manufacturing_account.cell(
                     row=row_idx, column=actual_col).value = cell_value
-                manufacturing_account.cell(
-                    row=row_idx, column=actual_col).font = normal_font
-                manufacturing_account.cell(
-                    row=row_idx, column=actual_col).border = Side(style='thin')
 
-                # Apply bold font and background to total row
-                if row_idx == len(manufacturing_account_data) + 5:  # Last row (Total)
-                    manufacturing_account.cell(
-                        row=row_idx, column=actual_col).font = bold_font
+                # Apply bold font to total row
+                is_total = row_idx == len(manufacturing_account_data) + 5  # Last row (Total)
+                manufacturing_account.cell(
+                    row=row_idx, column=actual_col).style = table_cell_style(
+                        is_total, is_amount=False)
 
     # Set column widths for manufacturing account
     manufacturing_account.column_dimensions['A'].width = 25
@@ -261,14 +282,14 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     footer_row = len(manufacturing_account_data) + 7
     manufacturing_account.merge_cells(f'A{footer_row}:G{footer_row}')
     manufacturing_account[f'A{footer_row}'] = 'In Terms of Our Attached Report of Even Date'
-    manufacturing_account[f'A{footer_row}'].font = normal_font
+    manufacturing_account[f'A{footer_row}'].style = 'normal'
     manufacturing_account[f'A{footer_row}'].alignment = Alignment(
         horizontal='center')
 
     footer_row += 2
     manufacturing_account.merge_cells(f'A{footer_row}:D{footer_row}')
     manufacturing_account[f'A{footer_row}'] = 'For: M/s MO Infra'
-    manufacturing_account[f'A{footer_row}'].font = normal_font
+    manufacturing_account[f'A{footer_row}'].style = 'normal'
 
     # Set up Trading Account
     setup_header(trading_account,
@@ -287,7 +308,7 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     for row in range(5, 23):  # Extend to row 23 to cover all content
         for col in range(1, 8):
             cell = trading_account.cell(row=row, column=col)
-            cell.border = thin_border
+            cell.border = THIN_BORDER
 
     # Trading Account Headers
     trading_account['A5'] = "Particulars"
@@ -296,10 +317,7 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     trading_account['G5'] = "Amount"
 
     for col_idx in [1, 4, 5, 7]:
-        trading_account.cell(row=5, column=col_idx).font = bold_font
-        trading_account.cell(row=5, column=col_idx).fill = header_fill
-        trading_account.cell(row=5, column=col_idx).alignment = Alignment(
-            horizontal='center')
+        trading_account.cell(row=5, column=col_idx).style = 'shaded_header'
 
     # Trading Account Data - matching the exact structure in the image
     row = 6
@@ -380,39 +398,39 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
 
     # Apply bold font to the "Total" row
     for col in [1, 4, 5, 7]:
-        trading_account.cell(row=row, column=col).font = bold_font
+        trading_account.cell(row=row, column=col).style = 'total'
 
     # Add footer
     row += 2
     trading_account.merge_cells(f'A{row}:G{row}')
     trading_account[f'A{row}'] = 'In Terms of Our Attached Report of Even Date'
-    trading_account[f'A{row}'].font = normal_font
+    trading_account[f'A{row}'].style = 'normal'
     trading_account[f'A{row}'].alignment = Alignment(horizontal='left')
 
     row += 2
     trading_account.merge_cells(f'A{row}:D{row}')
     trading_account[f'A{row}'] = 'For: M/s MO Infra'
-    trading_account[f'A{row}'].font = normal_font
+    trading_account[f'A{row}'].style = 'normal'
 
     row += 4
     trading_account.merge_cells(f'A{row}:D{row}')
     trading_account[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    trading_account[f'A{row}'].font = normal_font
+    trading_account[f'A{row}'].style = 'normal'
 
     row += 1
     trading_account.merge_cells(f'A{row}:D{row}')
     trading_account[f'A{row}'] = '(Proprietor)'
-    trading_account[f'A{row}'].font = normal_font
+    trading_account[f'A{row}'].style = 'normal'
 
     row += 3
     trading_account.merge_cells(f'A{row}:D{row}')
     trading_account[f'A{row}'] = 'Place : Ratlam'
-    trading_account[f'A{row}'].font = normal_font
+    trading_account[f'A{row}'].style = 'normal'
 
     row += 1
     trading_account.merge_cells(f'A{row}:D{row}')
     trading_account[f'A{row}'] = 'Date : 17-05-2024'
-    trading_account[f'A{row}'].font = normal_font
+    trading_account[f'A{row}'].style = 'normal'
 
     # Set up Profit and Loss Account
     setup_header(
@@ -431,7 +449,7 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     for row in range(5, 38):  # Extend table to cover all content
         for col in range(1, 8):
             cell = profit_loss.cell(row=row, column=col)
-            cell.border = thin_border
+            cell.border = THIN_BORDER
 
     # Profit and Loss Headers
     profit_loss['A5'] = "Particulars"
@@ -440,10 +458,7 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     profit_loss['G5'] = "Amount"
 
     for col_idx in [1, 3, 5, 7]:
-        profit_loss.cell(row=5, column=col_idx).font = bold_font
-        profit_loss.cell(row=5, column=col_idx).fill = header_fill
-        profit_loss.cell(row=5, column=col_idx).alignment = Alignment(
-            horizontal='center')
+        profit_loss.cell(row=5, column=col_idx).style = 'shaded_header'
 
     # Profit and Loss Data - matching the exact structure in the image
     row = 6
@@ -601,7 +616,7 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
 
     # Apply bold font to the "Total" row
     for col in [1, 4, 5, 7]:
-        profit_loss.cell(row=row, column=col).font = bold_font
+        profit_loss.cell(row=row, column=col).style = 'total'
 
     # Draw a line under subtotals
     # Rows with subtotals (64,85,482 and 2,46,73,505)
@@ -619,33 +634,33 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     row += 2
     profit_loss.merge_cells(f'A{row}:G{row}')
     profit_loss[f'A{row}'] = 'In Terms of Our Attached Report of Even Date'
-    profit_loss[f'A{row}'].font = normal_font
+    profit_loss[f'A{row}'].style = 'normal'
     profit_loss[f'A{row}'].alignment = Alignment(horizontal='left')
 
     row += 2
     profit_loss.merge_cells(f'A{row}:D{row}')
     profit_loss[f'A{row}'] = 'For: M/s MO Infra'
-    profit_loss[f'A{row}'].font = normal_font
+    profit_loss[f'A{row}'].style = 'normal'
 
     row += 4
     profit_loss.merge_cells(f'A{row}:D{row}')
     profit_loss[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    profit_loss[f'A{row}'].font = normal_font
+    profit_loss[f'A{row}'].style = 'normal'
 
     row += 1
     profit_loss.merge_cells(f'A{row}:D{row}')
     profit_loss[f'A{row}'] = '(Proprietor)'
-    profit_loss[f'A{row}'].font = normal_font
+    profit_loss[f'A{row}'].style = 'normal'
 
     row += 3
     profit_loss.merge_cells(f'A{row}:D{row}')
     profit_loss[f'A{row}'] = 'Place : Ratlam'
-    profit_loss[f'A{row}'].font = normal_font
+    profit_loss[f'A{row}'].style = 'normal'
 
     row += 1
     profit_loss.merge_cells(f'A{row}:D{row}')
     profit_loss[f'A{row}'] = 'Date : 17-05-2024'
-    profit_loss[f'A{row}'].font = normal_font
+    profit_loss[f'A{row}'].style = 'normal'
 
     # Set up Fixed Assets sheet for Schedules
     setup_header(
@@ -655,27 +670,21 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     fixed_assets.merge_cells('A2:I2')
     # Create a line of underscores for visual separation
     fixed_assets['A2'] = "_" * 120
-    fixed_assets['A2'].font = Font(name='Arial', size=10, bold=True)
+    fixed_assets['A2'].style = 'bold'
     fixed_assets['A2'].alignment = Alignment(horizontal='center')
 
     # Add the FIXED ASSETS title
     fixed_assets['A4'] = "FIXED ASSETS :-"
-    fixed_assets['A4'].font = bold_font
+    fixed_assets['A4'].style = 'bold'
 
     # Fixed Assets Headers - Row 6 for GROSS BLOCK
     fixed_assets.merge_cells('B6:E6')
     fixed_assets['B6'] = "GROSS BLOCK"
-    fixed_assets['B6'].font = bold_font
-    fixed_assets['B6'].alignment = Alignment(horizontal='center')
-    fixed_assets['B6'].fill = header_fill
-    fixed_assets['B6'].border = thin_border
+    fixed_assets['B6'].style = 'shaded_header'
 
     # NET BLOCK header
     fixed_assets['I6'] = "NET BLOCK"
-    fixed_assets['I6'].font = bold_font
-    fixed_assets['I6'].alignment = Alignment(horizontal='center')
-    fixed_assets['I6'].fill = header_fill
-    fixed_assets['I6'].border = thin_border
+    fixed_assets['I6'].style = 'shaded_header'
 
     # Fixed Assets Headers - Row 7 for column labels
     col_headers = [
@@ -693,11 +702,9 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
     for idx, header in enumerate(col_headers, 1):
         cell = fixed_assets.cell(row=7, column=idx)
         cell.value = header
-        cell.font = bold_font
+        cell.style = 'shaded_header'
         cell.alignment = Alignment(
             horizontal='center', vertical='center', wrap_text=True)
-        cell.fill = header_fill
-        cell.border = thin_border
 
     # Set the column widths
     column_widths = [30, 15, 15, 15, 15, 15, 15, 15, 15]
@@ -735,24 +742,14 @@ def create_financial_statements_excel(output_file="M_S_MO_Infra_Financial_Statem
 
     # Add data and apply formatting
     for row_idx, row_data in enumerate(fixed_assets_data, start_row):
-        # Special formatting for the "Tangible Assets" row
-        if row_idx == start_row:  # First row
-            fixed_assets.cell(row=row_idx, column=1).font = bold_font
-
         for col_idx, cell_value in enumerate(row_data, 1):
             cell = fixed_assets.cell(row=row_idx, column=col_idx)
             cell.value = cell_value
-            cell.border = thin_border
 
-            # Bold for the first column and totals row
-            if col_idx == 1 or row_idx == len(fixed_assets_data) + start_row - 1:
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-
-            # Align numbers to the right
-            if col_idx > 1:  # Columns with numbers
-                cell.alignment = Alignment(horizontal='right')
+            # Bold for the first column and totals row, numbers to the right
+            cell.style = table_cell_style(
+                is_total=col_idx == 1 or row_idx == len(fixed_assets_data) + start_row - 1,
+                is_amount=col_idx > 1)
 
     # Set column widths
     schedules.column_dimensions['A'].width = 35
@@ -802,19 +799,8 @@ def create_schedule_a(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_a = wb["Schedule A - Capital Account"]
         else:
             schedule_a = wb.create_sheet("Schedule A - Capital Account")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_a.column_dimensions['A'].width = 35
@@ -824,18 +810,18 @@ def create_schedule_a(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_a['A1'] = "M/S MO Infra"
-    schedule_a['A1'].font = header_font
+    schedule_a['A1'].style = 'title'
     
     schedule_a['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_a['A2'].font = subheader_font
+    schedule_a['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_a['A4'] = "Schedule : A"
-    schedule_a['A4'].font = bold_font
+    schedule_a['A4'].style = 'bold'
     
     # Add Capital Account header
     schedule_a['A5'] = "Capital Account (Saiyyed Akhtar Ali)"
-    schedule_a['A5'].font = bold_font
+    schedule_a['A5'].style = 'bold'
     schedule_a.merge_cells('A5:D5')
     schedule_a['A5'].alignment = Alignment(horizontal='center')
     
@@ -844,9 +830,7 @@ def create_schedule_a(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     for col, header in enumerate(headers, start=1):
         cell = schedule_a.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -871,33 +855,25 @@ def create_schedule_a(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_a.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount columns
-            if col_idx == 2 or col_idx == 4:  # Amount columns
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2 or col_idx == 4)
     
     # Add footer
     row = len(data) + 8
     schedule_a.merge_cells(f'A{row}:D{row}')
     schedule_a[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_a[f'A{row}'].font = normal_font
+    schedule_a[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_a.merge_cells(f'A{row}:D{row}')
     schedule_a[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_a[f'A{row}'].font = normal_font
+    schedule_a[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_a.merge_cells(f'A{row}:D{row}')
     schedule_a[f'A{row}'] = '(Proprietor)'
-    schedule_a[f'A{row}'].font = normal_font
+    schedule_a[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -918,19 +894,8 @@ def create_schedule_b(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_b = wb["Schedule B - Secured Loan"]
         else:
             schedule_b = wb.create_sheet("Schedule B - Secured Loan")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_b.column_dimensions['A'].width = 50
@@ -938,27 +903,25 @@ def create_schedule_b(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_b['A1'] = "M/S MO Infra"
-    schedule_b['A1'].font = header_font
+    schedule_b['A1'].style = 'title'
     
     schedule_b['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_b['A2'].font = subheader_font
+    schedule_b['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_b['A4'] = "Schedule : B"
-    schedule_b['A4'].font = bold_font
+    schedule_b['A4'].style = 'bold'
     
     # Add Secured Loan header
     schedule_b['A5'] = "2.Secured Loan"
-    schedule_b['A5'].font = bold_font
+    schedule_b['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_b.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -987,33 +950,25 @@ def create_schedule_b(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_b.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_b.merge_cells(f'A{row}:B{row}')
     schedule_b[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_b[f'A{row}'].font = normal_font
+    schedule_b[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_b.merge_cells(f'A{row}:B{row}')
     schedule_b[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_b[f'A{row}'].font = normal_font
+    schedule_b[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_b.merge_cells(f'A{row}:B{row}')
     schedule_b[f'A{row}'] = '(Proprietor)'
-    schedule_b[f'A{row}'].font = normal_font
+    schedule_b[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -1034,19 +989,8 @@ def create_schedule_c(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_c = wb["Schedule C - Unsecured Loan"]
         else:
             schedule_c = wb.create_sheet("Schedule C - Unsecured Loan")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_c.column_dimensions['A'].width = 50
@@ -1054,27 +998,25 @@ def create_schedule_c(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_c['A1'] = "M/S MO Infra"
-    schedule_c['A1'].font = header_font
+    schedule_c['A1'].style = 'title'
     
     schedule_c['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_c['A2'].font = subheader_font
+    schedule_c['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_c['A4'] = "Schedule : C"
-    schedule_c['A4'].font = bold_font
+    schedule_c['A4'].style = 'bold'
     
     # Add Unsecured Loan header
     schedule_c['A5'] = "3. Unsecured Loan"
-    schedule_c['A5'].font = bold_font
+    schedule_c['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_c.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -1114,33 +1056,25 @@ def create_schedule_c(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_c.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_c.merge_cells(f'A{row}:B{row}')
     schedule_c[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_c[f'A{row}'].font = normal_font
+    schedule_c[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_c.merge_cells(f'A{row}:B{row}')
     schedule_c[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_c[f'A{row}'].font = normal_font
+    schedule_c[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_c.merge_cells(f'A{row}:B{row}')
     schedule_c[f'A{row}'] = '(Proprietor)'
-    schedule_c[f'A{row}'].font = normal_font
+    schedule_c[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -1161,19 +1095,8 @@ def create_schedule_ca(workbook=None, output_file="M_S_MO_Infra_Financial_Statem
             schedule_ca = wb["Schedule CA - HDFC KCC"]
         else:
             schedule_ca = wb.create_sheet("Schedule CA - HDFC KCC")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_ca.column_dimensions['A'].width = 50
@@ -1181,27 +1104,25 @@ def create_schedule_ca(workbook=None, output_file="M_S_MO_Infra_Financial_Statem
     
     # Add header
     schedule_ca['A1'] = "M/S MO Infra"
-    schedule_ca['A1'].font = header_font
+    schedule_ca['A1'].style = 'title'
     
     schedule_ca['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_ca['A2'].font = subheader_font
+    schedule_ca['A2'].style = 'subtitle'
     
     # Add Schedule title for HDFC KCC
     schedule_ca['A4'] = "Schedule : CA"
-    schedule_ca['A4'].font = bold_font
+    schedule_ca['A4'].style = 'bold'
     
     # Add HDFC KCC header
     schedule_ca['A5'] = "4.HDFC KCC"
-    schedule_ca['A5'].font = bold_font
+    schedule_ca['A5'].style = 'bold'
     
     # Create table headers for HDFC KCC
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_ca.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the HDFC KCC data
     hdfc_data = [
@@ -1216,37 +1137,27 @@ def create_schedule_ca(workbook=None, output_file="M_S_MO_Infra_Financial_Statem
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_ca.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(hdfc_data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(hdfc_data) + 6, is_amount=col_idx == 2)
     
     # Add a gap between tables
     row = len(hdfc_data) + 8
     
     # Add Payable for Fixed Assets section
     schedule_ca.cell(row=row, column=1).value = "Schedule : CA"
-    schedule_ca.cell(row=row, column=1).font = bold_font
+    schedule_ca.cell(row=row, column=1).style = 'bold'
     
     row += 1
     schedule_ca.cell(row=row, column=1).value = "Payble for Fixed Assets"
-    schedule_ca.cell(row=row, column=1).font = bold_font
+    schedule_ca.cell(row=row, column=1).style = 'bold'
     
     # Create table headers for Payable for Fixed Assets
     row += 1
     for col, header in enumerate(headers, start=1):
         cell = schedule_ca.cell(row=row, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the Payable for Fixed Assets data
     fixed_assets_data = [
@@ -1259,33 +1170,25 @@ def create_schedule_ca(workbook=None, output_file="M_S_MO_Infra_Financial_Statem
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_ca.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == row + len(fixed_assets_data):  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == row + len(fixed_assets_data), is_amount=col_idx == 2)
     
     # Add footer
     row = row + len(fixed_assets_data) + 2
     schedule_ca.merge_cells(f'A{row}:B{row}')
     schedule_ca[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_ca[f'A{row}'].font = normal_font
+    schedule_ca[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_ca.merge_cells(f'A{row}:B{row}')
     schedule_ca[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_ca[f'A{row}'].font = normal_font
+    schedule_ca[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_ca.merge_cells(f'A{row}:B{row}')
     schedule_ca[f'A{row}'] = '(Proprietor)'
-    schedule_ca[f'A{row}'].font = normal_font
+    schedule_ca[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -1306,19 +1209,8 @@ def create_schedule_d(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_d = wb["Schedule D - Trade Payables"]
         else:
             schedule_d = wb.create_sheet("Schedule D - Trade Payables")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_d.column_dimensions['A'].width = 50
@@ -1326,27 +1218,25 @@ def create_schedule_d(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_d['A1'] = "M/S MO Infra"
-    schedule_d['A1'].font = header_font
+    schedule_d['A1'].style = 'title'
     
     schedule_d['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_d['A2'].font = subheader_font
+    schedule_d['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_d['A4'] = "Schedule : D"
-    schedule_d['A4'].font = bold_font
+    schedule_d['A4'].style = 'bold'
     
     # Add Trade Payables header
     schedule_d['A5'] = "4.Trade Payables"
-    schedule_d['A5'].font = bold_font
+    schedule_d['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_d.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -1378,33 +1268,25 @@ def create_schedule_d(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_d.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_d.merge_cells(f'A{row}:B{row}')
     schedule_d[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_d[f'A{row}'].font = normal_font
+    schedule_d[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_d.merge_cells(f'A{row}:B{row}')
     schedule_d[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_d[f'A{row}'].font = normal_font
+    schedule_d[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_d.merge_cells(f'A{row}:B{row}')
     schedule_d[f'A{row}'] = '(Proprietor)'
-    schedule_d[f'A{row}'].font = normal_font
+    schedule_d[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -1425,19 +1307,8 @@ def create_schedule_e(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_e = wb["Schedule E - Provisions"]
         else:
             schedule_e = wb.create_sheet("Schedule E - Provisions")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_e.column_dimensions['A'].width = 50
@@ -1445,27 +1316,25 @@ def create_schedule_e(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_e['A1'] = "M/S MO Infra"
-    schedule_e['A1'].font = header_font
+    schedule_e['A1'].style = 'title'
     
     schedule_e['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_e['A2'].font = subheader_font
+    schedule_e['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_e['A4'] = "Schedule : E"
-    schedule_e['A4'].font = bold_font
+    schedule_e['A4'].style = 'bold'
     
     # Add Provisions header
     schedule_e['A5'] = "5.Provisions"
-    schedule_e['A5'].font = bold_font
+    schedule_e['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_e.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -1480,33 +1349,25 @@ def create_schedule_e(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_e.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_e.merge_cells(f'A{row}:B{row}')
     schedule_e[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_e[f'A{row}'].font = normal_font
+    schedule_e[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_e.merge_cells(f'A{row}:B{row}')
     schedule_e[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_e[f'A{row}'].font = normal_font
+    schedule_e[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_e.merge_cells(f'A{row}:B{row}')
     schedule_e[f'A{row}'] = '(Proprietor)'
-    schedule_e[f'A{row}'].font = normal_font
+    schedule_e[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -1527,19 +1388,8 @@ def create_schedule_f(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_f = wb["Schedule F - Advance against Sale of Land"]
         else:
             schedule_f = wb.create_sheet("Schedule F - Advance against Sale of Land")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_f.column_dimensions['A'].width = 50
@@ -1547,27 +1397,25 @@ def create_schedule_f(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_f['A1'] = "M/S MO Infra"
-    schedule_f['A1'].font = header_font
+    schedule_f['A1'].style = 'title'
     
     schedule_f['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_f['A2'].font = subheader_font
+    schedule_f['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_f['A4'] = "Schedule : F"
-    schedule_f['A4'].font = bold_font
+    schedule_f['A4'].style = 'bold'
     
     # Add Advance against Sale of Land header
     schedule_f['A5'] = "6.Advance against Sale of Land"
-    schedule_f['A5'].font = bold_font
+    schedule_f['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_f.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -1580,33 +1428,25 @@ def create_schedule_f(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_f.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_f.merge_cells(f'A{row}:B{row}')
     schedule_f[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_f[f'A{row}'].font = normal_font
+    schedule_f[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_f.merge_cells(f'A{row}:B{row}')
     schedule_f[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_f[f'A{row}'].font = normal_font
+    schedule_f[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_f.merge_cells(f'A{row}:B{row}')
     schedule_f[f'A{row}'] = '(Proprietor)'
-    schedule_f[f'A{row}'].font = normal_font
+    schedule_f[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -1627,19 +1467,8 @@ def create_schedule_g(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_g = wb["Schedule G - Advance against Sale"]
         else:
             schedule_g = wb.create_sheet("Schedule G - Advance against Sale")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_g.column_dimensions['A'].width = 50
@@ -1647,27 +1476,25 @@ def create_schedule_g(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_g['A1'] = "M/S MO Infra"
-    schedule_g['A1'].font = header_font
+    schedule_g['A1'].style = 'title'
     
     schedule_g['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_g['A2'].font = subheader_font
+    schedule_g['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_g['A4'] = "Schedule : G"
-    schedule_g['A4'].font = bold_font
+    schedule_g['A4'].style = 'bold'
     
     # Add Advance against Sale header
     schedule_g['A5'] = "7.Advance against Sale"
-    schedule_g['A5'].font = bold_font
+    schedule_g['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_g.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -1683,33 +1510,25 @@ def create_schedule_g(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_g.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_g.merge_cells(f'A{row}:B{row}')
     schedule_g[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_g[f'A{row}'].font = normal_font
+    schedule_g[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_g.merge_cells(f'A{row}:B{row}')
     schedule_g[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_g[f'A{row}'].font = normal_font
+    schedule_g[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_g.merge_cells(f'A{row}:B{row}')
     schedule_g[f'A{row}'] = '(Proprietor)'
-    schedule_g[f'A{row}'].font = normal_font
+    schedule_g[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -1730,19 +1549,8 @@ def create_schedule_h(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_h = wb["Schedule H - Investment"]
         else:
             schedule_h = wb.create_sheet("Schedule H - Investment")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_h.column_dimensions['A'].width = 50
@@ -1750,27 +1558,25 @@ def create_schedule_h(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_h['A1'] = "M/S MO Infra"
-    schedule_h['A1'].font = header_font
+    schedule_h['A1'].style = 'title'
     
     schedule_h['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_h['A2'].font = subheader_font
+    schedule_h['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_h['A4'] = "Schedule : H"
-    schedule_h['A4'].font = bold_font
+    schedule_h['A4'].style = 'bold'
     
     # Add Investment header
     schedule_h['A5'] = "8.Investment"
-    schedule_h['A5'].font = bold_font
+    schedule_h['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_h.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -1790,33 +1596,25 @@ def create_schedule_h(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_h.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_h.merge_cells(f'A{row}:B{row}')
     schedule_h[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_h[f'A{row}'].font = normal_font
+    schedule_h[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_h.merge_cells(f'A{row}:B{row}')
     schedule_h[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_h[f'A{row}'].font = normal_font
+    schedule_h[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_h.merge_cells(f'A{row}:B{row}')
     schedule_h[f'A{row}'] = '(Proprietor)'
-    schedule_h[f'A{row}'].font = normal_font
+    schedule_h[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -1837,19 +1635,8 @@ def create_schedule_i(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_i = wb["Schedule I - Closing Stock"]
         else:
             schedule_i = wb.create_sheet("Schedule I - Closing Stock")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_i.column_dimensions['A'].width = 50
@@ -1857,27 +1644,25 @@ def create_schedule_i(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_i['A1'] = "M/S MO Infra"
-    schedule_i['A1'].font = header_font
+    schedule_i['A1'].style = 'title'
     
     schedule_i['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_i['A2'].font = subheader_font
+    schedule_i['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_i['A4'] = "Schedule : I"
-    schedule_i['A4'].font = bold_font
+    schedule_i['A4'].style = 'bold'
     
     # Add Closing Stock header
     schedule_i['A5'] = "9.Closing Stock"
-    schedule_i['A5'].font = bold_font
+    schedule_i['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_i.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -1899,33 +1684,25 @@ def create_schedule_i(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_i.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_i.merge_cells(f'A{row}:B{row}')
     schedule_i[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_i[f'A{row}'].font = normal_font
+    schedule_i[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_i.merge_cells(f'A{row}:B{row}')
     schedule_i[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_i[f'A{row}'].font = normal_font
+    schedule_i[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_i.merge_cells(f'A{row}:B{row}')
     schedule_i[f'A{row}'] = '(Proprietor)'
-    schedule_i[f'A{row}'].font = normal_font
+    schedule_i[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -1946,19 +1723,8 @@ def create_schedule_j(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_j = wb["Schedule J - Trade Receivable"]
         else:
             schedule_j = wb.create_sheet("Schedule J - Trade Receivable")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_j.column_dimensions['A'].width = 50
@@ -1966,27 +1732,25 @@ def create_schedule_j(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_j['A1'] = "M/S MO Infra"
-    schedule_j['A1'].font = header_font
+    schedule_j['A1'].style = 'title'
     
     schedule_j['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_j['A2'].font = subheader_font
+    schedule_j['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_j['A4'] = "Schedule : J"
-    schedule_j['A4'].font = bold_font
+    schedule_j['A4'].style = 'bold'
     
     # Add Trade Receivable header
     schedule_j['A5'] = "10.Trade Receivable"
-    schedule_j['A5'].font = bold_font
+    schedule_j['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_j.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -2009,33 +1773,25 @@ def create_schedule_j(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_j.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_j.merge_cells(f'A{row}:B{row}')
     schedule_j[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_j[f'A{row}'].font = normal_font
+    schedule_j[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_j.merge_cells(f'A{row}:B{row}')
     schedule_j[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_j[f'A{row}'].font = normal_font
+    schedule_j[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_j.merge_cells(f'A{row}:B{row}')
     schedule_j[f'A{row}'] = '(Proprietor)'
-    schedule_j[f'A{row}'].font = normal_font
+    schedule_j[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -2056,19 +1812,8 @@ def create_schedule_k(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_k = wb["Schedule K - Loans and Advances"]
         else:
             schedule_k = wb.create_sheet("Schedule K - Loans and Advances")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_k.column_dimensions['A'].width = 50
@@ -2076,27 +1821,25 @@ def create_schedule_k(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_k['A1'] = "M/S MO Infra"
-    schedule_k['A1'].font = header_font
+    schedule_k['A1'].style = 'title'
     
     schedule_k['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_k['A2'].font = subheader_font
+    schedule_k['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_k['A4'] = "Schedule : K"
-    schedule_k['A4'].font = bold_font
+    schedule_k['A4'].style = 'bold'
     
     # Add Loans and Advances header
     schedule_k['A5'] = "11. Loans and Advances (Assets)"
-    schedule_k['A5'].font = bold_font
+    schedule_k['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_k.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -2130,33 +1873,25 @@ def create_schedule_k(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_k.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_k.merge_cells(f'A{row}:B{row}')
     schedule_k[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_k[f'A{row}'].font = normal_font
+    schedule_k[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_k.merge_cells(f'A{row}:B{row}')
     schedule_k[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_k[f'A{row}'].font = normal_font
+    schedule_k[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_k.merge_cells(f'A{row}:B{row}')
     schedule_k[f'A{row}'] = '(Proprietor)'
-    schedule_k[f'A{row}'].font = normal_font
+    schedule_k[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -2177,19 +1912,8 @@ def create_schedule_l(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_l = wb["Schedule L - Advances for Material Purchase"]
         else:
             schedule_l = wb.create_sheet("Schedule L - Advances for Material Purchase")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_l.column_dimensions['A'].width = 50
@@ -2197,27 +1921,25 @@ def create_schedule_l(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_l['A1'] = "M/S MO Infra"
-    schedule_l['A1'].font = header_font
+    schedule_l['A1'].style = 'title'
     
     schedule_l['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_l['A2'].font = subheader_font
+    schedule_l['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_l['A4'] = "Schedule : L"
-    schedule_l['A4'].font = bold_font
+    schedule_l['A4'].style = 'bold'
     
     # Add Advances for Material Purchase header
     schedule_l['A5'] = "12.Advances for Material Purchase"
-    schedule_l['A5'].font = bold_font
+    schedule_l['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_l.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -2232,33 +1954,25 @@ def create_schedule_l(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_l.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_l.merge_cells(f'A{row}:B{row}')
     schedule_l[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_l[f'A{row}'].font = normal_font
+    schedule_l[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_l.merge_cells(f'A{row}:B{row}')
     schedule_l[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_l[f'A{row}'].font = normal_font
+    schedule_l[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_l.merge_cells(f'A{row}:B{row}')
     schedule_l[f'A{row}'] = '(Proprietor)'
-    schedule_l[f'A{row}'].font = normal_font
+    schedule_l[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -2279,19 +1993,8 @@ def create_schedule_m(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_m = wb["Schedule M - Deposits"]
         else:
             schedule_m = wb.create_sheet("Schedule M - Deposits")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_m.column_dimensions['A'].width = 50
@@ -2299,27 +2002,25 @@ def create_schedule_m(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_m['A1'] = "M/S MO Infra"
-    schedule_m['A1'].font = header_font
+    schedule_m['A1'].style = 'title'
     
     schedule_m['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_m['A2'].font = subheader_font
+    schedule_m['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_m['A4'] = "Schedule : M"
-    schedule_m['A4'].font = bold_font
+    schedule_m['A4'].style = 'bold'
     
     # Add Deposits header
     schedule_m['A5'] = "13.Deposits"
-    schedule_m['A5'].font = bold_font
+    schedule_m['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_m.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -2336,33 +2037,25 @@ def create_schedule_m(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_m.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_m.merge_cells(f'A{row}:B{row}')
     schedule_m[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_m[f'A{row}'].font = normal_font
+    schedule_m[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_m.merge_cells(f'A{row}:B{row}')
     schedule_m[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_m[f'A{row}'].font = normal_font
+    schedule_m[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_m.merge_cells(f'A{row}:B{row}')
     schedule_m[f'A{row}'] = '(Proprietor)'
-    schedule_m[f'A{row}'].font = normal_font
+    schedule_m[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -2383,19 +2076,8 @@ def create_schedule_n(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_n = wb["Schedule N - Other Current Assets"]
         else:
             schedule_n = wb.create_sheet("Schedule N - Other Current Assets")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_n.column_dimensions['A'].width = 50
@@ -2403,27 +2085,25 @@ def create_schedule_n(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_n['A1'] = "M/S MO Infra"
-    schedule_n['A1'].font = header_font
+    schedule_n['A1'].style = 'title'
     
     schedule_n['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_n['A2'].font = subheader_font
+    schedule_n['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_n['A4'] = "Schedule : N"
-    schedule_n['A4'].font = bold_font
+    schedule_n['A4'].style = 'bold'
     
     # Add Other Current Assets header
     schedule_n['A5'] = "14.Other Current Assets"
-    schedule_n['A5'].font = bold_font
+    schedule_n['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_n.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -2438,33 +2118,25 @@ def create_schedule_n(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_n.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_n.merge_cells(f'A{row}:B{row}')
     schedule_n[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_n[f'A{row}'].font = normal_font
+    schedule_n[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_n.merge_cells(f'A{row}:B{row}')
     schedule_n[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_n[f'A{row}'].font = normal_font
+    schedule_n[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_n.merge_cells(f'A{row}:B{row}')
     schedule_n[f'A{row}'] = '(Proprietor)'
-    schedule_n[f'A{row}'].font = normal_font
+    schedule_n[f'A{row}'].style = 'normal'
     
     return wb
 
@@ -2485,19 +2157,8 @@ def create_schedule_o(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
             schedule_o = wb["Schedule O - Cash and Bank"]
         else:
             schedule_o = wb.create_sheet("Schedule O - Cash and Bank")
-    
-    # Define styles
-    header_font = Font(name='Arial', size=12, bold=True)
-    subheader_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    bold_font = Font(name='Arial', size=10, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+
+    register_styles(wb)
     
     # Set column widths for better readability
     schedule_o.column_dimensions['A'].width = 50
@@ -2505,27 +2166,25 @@ def create_schedule_o(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
     
     # Add header
     schedule_o['A1'] = "M/S MO Infra"
-    schedule_o['A1'].font = header_font
+    schedule_o['A1'].style = 'title'
     
     schedule_o['A2'] = "SCHEDULES FORMING PART OF BALANCE SHEET AS AT 31.03.2024"
-    schedule_o['A2'].font = subheader_font
+    schedule_o['A2'].style = 'subtitle'
     
     # Add Schedule title
     schedule_o['A4'] = "15.Schedule : O"
-    schedule_o['A4'].font = bold_font
+    schedule_o['A4'].style = 'bold'
     
     # Add Cash and Bank header
     schedule_o['A5'] = "Cash and Bank"
-    schedule_o['A5'].font = bold_font
+    schedule_o['A5'].style = 'bold'
     
     # Create table headers
     headers = ['Particulars', 'Amount']
     for col, header in enumerate(headers, start=1):
         cell = schedule_o.cell(row=6, column=col)
         cell.value = header
-        cell.font = bold_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'header'
     
     # Add the data
     data = [
@@ -2542,33 +2201,25 @@ def create_schedule_o(workbook=None, output_file="M_S_MO_Infra_Financial_Stateme
         for col_idx, value in enumerate(row_data, start=1):
             cell = schedule_o.cell(row=row_idx, column=col_idx)
             cell.value = value
-            cell.border = thin_border
-            
-            # Format the Total row with bold
-            if row_idx == len(data) + 6:  # Last row (Total)
-                cell.font = bold_font
-            else:
-                cell.font = normal_font
-            
-            # Right-align amount column
-            if col_idx == 2:  # Amount column
-                cell.alignment = Alignment(horizontal='right')
+            # Bold the Total row, right-align the amounts
+            cell.style = table_cell_style(
+                is_total=row_idx == len(data) + 6, is_amount=col_idx == 2)
     
     # Add footer
     row = len(data) + 8
     schedule_o.merge_cells(f'A{row}:B{row}')
     schedule_o[f'A{row}'] = 'For: M/s MO Infra'
-    schedule_o[f'A{row}'].font = normal_font
+    schedule_o[f'A{row}'].style = 'normal'
     
     row += 3
     schedule_o.merge_cells(f'A{row}:B{row}')
     schedule_o[f'A{row}'] = 'Mr. Saiyyed Akhtar Ali'
-    schedule_o[f'A{row}'].font = normal_font
+    schedule_o[f'A{row}'].style = 'normal'
     
     row += 1
     schedule_o.merge_cells(f'A{row}:B{row}')
     schedule_o[f'A{row}'] = '(Proprietor)'
-    schedule_o[f'A{row}'].font = normal_font
+    schedule_o[f'A{row}'].style = 'normal'
     
     return wb
 
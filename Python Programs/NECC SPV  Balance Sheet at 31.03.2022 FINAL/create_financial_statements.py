@@ -1,8 +1,19 @@
+import os
+import sys
+
 import pandas as pd
 import openpyxl
-from openpyxl.styles import Font, Border, Side, Alignment, PatternFill
+from openpyxl.styles import Font, Border, Side, Alignment, PatternFill, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils import get_column_letter
 
+# amounts is shared with the other script folders (see ../shared)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+
+from amounts import (  # noqa: E402
+    INDIAN_NUMBER_FORMAT, NIL_MARKERS, indian_number_format, parse_amounts,
+)
+
 # Create a new workbook
 wb = openpyxl.Workbook()
 
@@ -33,6 +44,37 @@ header_fill = PatternFill(start_color="B8CCE4", end_color="B8CCE4", fill_type="s
 subheader_fill = PatternFill(start_color="DCE6F1", end_color="DCE6F1", fill_type="solid")
 total_fill = PatternFill(start_color="EBF1DE", end_color="EBF1DE", fill_type="solid")
 
+# Cell styles, registered once per workbook as named styles (see
+# register_styles) and assigned to cells by name
+CELL_STYLES = {
+    'title': dict(font=header_font, alignment=Alignment(horizontal='center')),
+    'column_header': dict(font=subheader_font, fill=header_fill, border=border,
+                          alignment=Alignment(horizontal='center')),
+    # Plain cells name the workbook's default font
+    'right': dict(font=DEFAULT_FONT, alignment=Alignment(horizontal='right')),
+    'boxed': dict(font=DEFAULT_FONT, border=border),
+    'boxed_amount': dict(font=DEFAULT_FONT, border=border,
+                         alignment=Alignment(horizontal='right')),
+    # Statements (see statement_cell_style)
+    'title_boxed': dict(font=header_font, border=border,
+                        alignment=Alignment(horizontal='center')),
+    'note_title_boxed': dict(font=subheader_font, fill=subheader_fill, border=border),
+    'total_label': dict(font=Font(bold=True), fill=total_fill, border=border),
+    'boxed_number': dict(font=DEFAULT_FONT, border=border, number_format=INDIAN_NUMBER_FORMAT,
+                         alignment=Alignment(horizontal='right')),
+}
+
+
+def register_styles(wb):
+    """Add CELL_STYLES to the workbook as named styles"""
+    existing = set(wb.named_styles)
+    for name, attributes in CELL_STYLES.items():
+        if name not in existing:
+            wb.add_named_style(NamedStyle(name=name, **attributes))
+
+
+register_styles(wb)
+
 # Balance Sheet data
 balance_sheet_data = [
     ["", "", "", ""],
@@ -549,78 +591,85 @@ def populate_notes_sheet(sheet, data):
     sheet.column_dimensions['A'].width = 25
     sheet.column_dimensions['B'].width = 75
 
-# Function to safely populate a sheet with data and apply formatting
+# Function to parse the amount columns of a data table into numbers
+# (one vectorized call for the whole block); returns {(row, column): value}
+# with 1-based positions for every cell holding an amount
+def parse_amount_cells(data, first_row, first_column):
+    width = max(len(row) for row in data)
+    block = [
+        [
+            value if isinstance(value, str) and value.strip() not in NIL_MARKERS else ""
+            for value in list(row[first_column - 1:]) + [""] * (width - len(row))
+        ]
+        for row in data[first_row - 1:]
+    ]
+    parsed = parse_amounts(block)
+    amounts = {}
+    for row_offset, col_offset in zip(*parsed.valid.nonzero()):
+        amounts[(first_row + row_offset, first_column + col_offset)] = float(
+            parsed.values[row_offset, col_offset]
+        )
+    return amounts
+
+# Section headings of the statements, styled like note titles
+STATEMENT_SECTIONS = frozenset([
+    "EQUITY AND LIABILITIES", "ASSETS", "INCOME", "EXPENSES",
+    "I) Cash Flows from Operating Activities",
+    "II) Cash Flows from Investing Activities",
+    "III) Cash Flows From Financing Activities",
+    "TANGIBLE ASSETS", "INTANGIBLE ASSETS",
+])
+
+# Named style of a statement cell, from its position and value: company
+# name and report title in rows 2-3, column headers in rows 5-6, then
+# line items with their amounts from ``amount_column`` on
+def statement_cell_style(row_idx, col_idx, value, amount_column, is_amount):
+    text = value if isinstance(value, str) else ""
+    if row_idx in (2, 3):
+        return 'title_boxed' if value else 'title'
+    if row_idx in (5, 6):
+        return 'column_header'
+    if row_idx > 6:
+        if col_idx >= amount_column:
+            if is_amount:
+                return 'boxed_number'
+            return 'boxed_amount' if value else 'right'
+        if col_idx == 1 and text in STATEMENT_SECTIONS:
+            return 'note_title_boxed'
+        if "total" in text.lower():
+            return 'total_label'
+    elif text == "TOTAL":
+        return 'total_label'
+    return 'boxed' if value else None
+
+# Function to write a statement (Balance Sheet, Profit and Loss) in one
+# pass: each cell's value and style are written together, and column
+# widths are measured on the data as entered while it goes (amounts are
+# stored as numbers and display with their grouping)
 def populate_sheet(sheet, data, has_note_column=False):
-    # Set the column offset based on note column presence
-    column_offset = 1 if has_note_column else 0
-    
-    # First pass: Set all cell values
-    for row_idx, row in enumerate(data, 1):
-        for col_idx, value in enumerate(row, 1):
-            cell = sheet.cell(row=row_idx, column=col_idx)
-            cell.value = value
-    
-    # Second pass: Apply merges
-    for row_idx, row in enumerate(data, 1):
-        if row_idx in [2, 3]:  # Company name and report title rows
-            if len(row) > 1:
-                sheet.merge_cells(start_row=row_idx, start_column=1, end_row=row_idx, end_column=len(row))
-    
-    # Third pass: Apply formatting
-    for row_idx, row in enumerate(data, 1):
-        for col_idx, value in enumerate(row, 1):
-            try:
-                cell = sheet.cell(row=row_idx, column=col_idx)
-                
-                # Apply styles
-                if row_idx in [2, 3]:  # Company name and report title
-                    if col_idx == 1:  # Only format the first cell of merged cells
-                        cell.font = header_font
-                        cell.alignment = Alignment(horizontal='center')
-                elif row_idx in [5, 6]:  # Column headers
-                    cell.font = subheader_font
-                    cell.fill = header_fill
-                    cell.border = border
-                    cell.alignment = Alignment(horizontal='center')
-                elif row_idx > 6 and col_idx > (1 + column_offset):  # Numeric values
-                    # Right-align numeric values
-                    cell.alignment = Alignment(horizontal='right')
-                
-                # Special formatting for section headers
-                if col_idx == 1 and row_idx > 6 and isinstance(value, str) and value and not value.startswith(" "):
-                    if value in ["EQUITY AND LIABILITIES", "ASSETS", "INCOME", "EXPENSES", 
-                               "I) Cash Flows from Operating Activities", 
-                               "II) Cash Flows from Investing Activities",
-                               "III) Cash Flows From Financing Activities",
-                               "TANGIBLE ASSETS", "INTANGIBLE ASSETS"]:
-                        cell.font = subheader_font
-                        cell.fill = subheader_fill
-                
-                # Special formatting for totals
-                if isinstance(value, str) and value == "TOTAL" or (row_idx > 6 and isinstance(value, str) and "total" in value.lower()):
-                    cell.font = Font(bold=True)
-                    cell.fill = total_fill
-            except:
-                # Skip cells that can't be formatted (like merged cells)
-                pass
-                
-    # Add borders to all non-empty cells
+    amount_column = 3 if has_note_column else 2
+
+    # Amounts below the column headers are written as numbers
+    amounts = parse_amount_cells(data, 7, amount_column)
+
+    widths = [0] * max(len(row) for row in data)
     for row_idx, row in enumerate(data, 1):
+        if row_idx in (2, 3) and len(row) > 1:
+            # Company name and report title span the table
+            sheet.merge_cells(start_row=row_idx, start_column=1, end_row=row_idx, end_column=len(row))
+            row = row[:1]
         for col_idx, value in enumerate(row, 1):
-            if value:
-                cell = sheet.cell(row=row_idx, column=col_idx)
-                cell.border = border
-    
-    # Adjust column widths
-    for column in sheet.columns:
-        max_length = 0
-        column_letter = get_column_letter(column[0].column)
-        for cell in column:
-            if cell.value:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-        adjusted_width = min(max(max_length + 2, 12), 50)  # Min width 12, max 50
-        sheet.column_dimensions[column_letter].width = adjusted_width
\ No newline at end of file
+            amount = amounts.get((row_idx, col_idx))
+            cell = sheet.cell(row=row_idx, column=col_idx, value=value if amount is None else amount)
+            style = statement_cell_style(row_idx, col_idx, value, amount_column, amount is not None)
+            if style:
+                cell.style = style
+            if style == 'boxed_number':
+                # Lakh/crore grouping depends on the amount's size
+                cell.number_format = indian_number_format(amount)
+            if value and len(str(value)) > widths[col_idx - 1]:
+                widths[col_idx - 1] = len(str(value))
+
+    for col_idx, width in enumerate(widths, 1):
+        # Min width 12, max 50
+        sheet.column_dimensions[get_column_letter(col_idx)].width = min(max(width + 2, 12), 50)
@@ -1,37 +1,27 @@
 import os
-import openpyxl
-from openpyxl.styles import Font, Border, Side, Alignment, PatternFill
+import sys
+from openpyxl.styles import Font, Border, Side, Alignment, PatternFill, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils import get_column_letter
 
-# Create a new workbook
-wb = openpyxl.Workbook()
+# amounts, parallel_workbooks and workbook_writer are shared with the
+# other script folders (see ../shared)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
 
-# Create main sheets
-balance_sheet = wb.active
-balance_sheet.title = "Balance Sheet"
+from amounts import (  # noqa: E402
+    INDIAN_NUMBER_FORMAT, NIL_MARKERS, indian_number_format, parse_amounts,
+)
+from parallel_workbooks import build_in_parallel, resolve_workers  # noqa: E402
+from streaming_sheets import StreamingSheet, save_workbook  # noqa: E402
+from workbook_writer import MERGED_CELL_TYPES, new_workbook  # noqa: E402
 
-profit_loss = wb.create_sheet("Profit and Loss")
-cash_flow = wb.create_sheet("Cash Flow Statement")
-fixed_assets = wb.create_sheet("Fixed Assets")
-share_capital = wb.create_sheet("Share Capital")
-
-# Create Notes sheets
-for i in range(2, 25):
-    wb.create_sheet(f"Note {i}")
-
-# Create Annexure sheets
-annexure_b = wb.create_sheet("Annexure B")
-annexure_note4 = wb.create_sheet("Annexure to Note 4")
-annexure_note8 = wb.create_sheet("Annexure to Note 8")
-annexure_note11 = wb.create_sheet("Annexure to Note 11")
-annexure_note12 = wb.create_sheet("Annexure to Note 12")
-annexure_note15 = wb.create_sheet("Annexure to Note 15")
-annexure_note16 = wb.create_sheet("Annexure to Note 16")
 
 # Define styles
 header_font = Font(bold=True, size=12)
 subheader_font = Font(bold=True, size=11)
 normal_font = Font(size=10)
+bold_font = Font(bold=True)
+italic_font = Font(italic=True)
 
 thin_border = Side(border_style="thin")
 border = Border(left=thin_border, right=thin_border, top=thin_border, bottom=thin_border)
@@ -42,6 +32,69 @@ subheader_fill = PatternFill(start_color="DCE6F1", end_color="DCE6F1", fill_type
 total_fill = PatternFill(start_color="EBF1DE", end_color="EBF1DE", fill_type="solid")
 light_blue_fill = PatternFill(start_color="D8E4BC", end_color="D8E4BC", fill_type="solid")
 
+# Cell styles, registered once per workbook as named styles (see
+# register_styles) and assigned to cells by name
+CELL_STYLES = {
+    'title': dict(font=header_font, alignment=Alignment(horizontal='center')),
+    'title_left': dict(font=header_font, alignment=Alignment(horizontal='left')),
+    'subtitle': dict(font=subheader_font, alignment=Alignment(horizontal='center')),
+    'note_title': dict(font=subheader_font, fill=subheader_fill),
+    'column_header': dict(font=subheader_font, fill=header_fill, border=border,
+                          alignment=Alignment(horizontal='center')),
+    'column_header_middle': dict(font=subheader_font, fill=header_fill, border=border,
+                                 alignment=Alignment(horizontal='center', vertical='center')),
+    'unit_caption': dict(font=italic_font, alignment=Alignment(horizontal='right')),
+    'signature': dict(font=Font(italic=True, color="808080"),
+                      alignment=Alignment(horizontal='center')),
+    'total_amount': dict(font=bold_font, fill=total_fill,
+                         alignment=Alignment(horizontal='right'),
+                         border=Border(bottom=Side(border_style="double"),
+                                       top=Side(border_style="double"))),
+    'bold': dict(font=bold_font),
+    # Plain cells name the workbook's default font
+    'right': dict(font=DEFAULT_FONT, alignment=Alignment(horizontal='right')),
+    'rule': dict(font=DEFAULT_FONT, border=Border(bottom=Side(border_style="thin"))),
+    'rule_amount': dict(font=DEFAULT_FONT, border=Border(bottom=Side(border_style="thin")),
+                        alignment=Alignment(horizontal='right')),
+    # Party-wise listings (Sundry Creditors)
+    'listing_title': dict(font=header_font),
+    'listing_address': dict(font=normal_font),
+    'listing_heading': dict(font=Font(bold=True, size=10)),
+    'listing_header': dict(font=Font(bold=True, size=10), border=border,
+                           alignment=Alignment(horizontal='center')),
+    'listing_header_rule': dict(font=Font(bold=True, size=10),
+                                border=Border(bottom=Side(border_style="thin")),
+                                alignment=Alignment(horizontal='center')),
+    'listing_section': dict(font=Font(bold=True, italic=True, size=10),
+                            border=Border(bottom=Side(border_style="thin"))),
+    'listing_total': dict(font=bold_font,
+                          border=Border(top=Side(border_style="thin"),
+                                        bottom=Side(border_style="double"))),
+    'listing_total_amount': dict(font=bold_font,
+                                 border=Border(top=Side(border_style="thin"),
+                                               bottom=Side(border_style="double")),
+                                 alignment=Alignment(horizontal='right')),
+    'boxed': dict(font=DEFAULT_FONT, border=border),
+    'boxed_amount': dict(font=DEFAULT_FONT, border=border,
+                         alignment=Alignment(horizontal='right')),
+    # Statements (see statement_cell_style)
+    'title_boxed': dict(font=header_font, border=border,
+                        alignment=Alignment(horizontal='center')),
+    'note_title_boxed': dict(font=subheader_font, fill=subheader_fill, border=border),
+    'total_label': dict(font=bold_font, fill=total_fill, border=border),
+    'boxed_number': dict(font=DEFAULT_FONT, border=border, number_format=INDIAN_NUMBER_FORMAT,
+                         alignment=Alignment(horizontal='right')),
+}
+
+
+def register_styles(wb):
+    """Add CELL_STYLES to the workbook as named styles"""
+    existing = set(wb.named_styles)
+    for name, attributes in CELL_STYLES.items():
+        if name not in existing:
+            wb.add_named_style(NamedStyle(name=name, **attributes))
+
+
 # Balance Sheet data
 balance_sheet_data = [
     ["", "", "", ""],
@@ -200,16 +253,11 @@ def populate_cash_flow_sheet(sheet, data):
         for col_idx, value in enumerate(row, 1):
             cell = sheet.cell(row=row_idx, column=col_idx)
             
-            # Apply borders to all cells
-            cell.border = border
-            
             # Title cell formatting
             if row_idx == 1:
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal='center')
+                cell.style = 'title'
             elif row_idx == 2:
-                cell.font = subheader_font
-                cell.alignment = Alignment(horizontal='center')
+                cell.style = 'subtitle'
             
             # Header row formatting
             elif row_idx == 4:
@@ -219,8 +267,7 @@ def populate_cash_flow_sheet(sheet, data):
             
             # Format section headers
             elif col_idx == 1 and (row_idx == 6 or row_idx == 33 or row_idx == 40):
-                cell.font = subheader_font
-                cell.fill = subheader_fill
+                cell.style = 'note_title'
             
             # Format the "Operating Profit Before Working Capital Changes" header
             elif col_idx == 1 and row_idx == 17:
@@ -233,9 +280,12 @@ def populate_cash_flow_sheet(sheet, data):
             # Format total rows
             elif row_idx in [15, 16, 27, 28, 29, 30, 31, 36, 38, 39, 43, 44, 45]:
                 if col_idx in [3, 5] and value:
-                    cell.font = Font(bold=True)
+                    cell.font = bold_font
                     cell.fill = total_fill
                     cell.alignment = Alignment(horizontal='right')
+            
+            # Apply borders to all cells, after any named style
+            cell.border = border
     
     # Set column widths
     sheet.column_dimensions['A'].width = 45  # For descriptions
@@ -250,8 +300,6 @@ def populate_cash_flow_sheet(sheet, data):
             cell = sheet.cell(row=row_idx, column=col_idx)
             cell.fill = light_blue_fill
 
-# Populate the sheet
-populate_cash_flow_sheet(cash_flow, cash_flow_data)
 
 # Note 2 - Share Capital data based on the image
 note2_data = [
@@ -295,7 +343,6 @@ note2_data = [
 ]
 
 # Function to populate Note 2 - Share Capital sheet
-note2_sheet = wb['Note 2']
 def populate_note2_sheet(sheet, data):
     # First pass: Set all cell values
     for row_idx, row in enumerate(data, 1):
@@ -318,29 +365,23 @@ def populate_note2_sheet(sheet, data):
             
             # Company title formatting
             if row_idx == 1:
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal='center')
+                cell.style = 'title'
             
             # Balance sheet title formatting
             elif row_idx == 2:
-                cell.font = subheader_font
-                cell.alignment = Alignment(horizontal='center')
+                cell.style = 'subtitle'
             
             # Header rows formatting
             elif row_idx == 5:
-                cell.font = subheader_font
-                cell.fill = header_fill
-                cell.border = all_border
-                cell.alignment = Alignment(horizontal='center')
+                cell.style = 'column_header'
             
             # Note title formatting
             elif row_idx == 7:
-                cell.font = subheader_font
-                cell.fill = subheader_fill
+                cell.style = 'note_title'
             
             # Subheader formatting
             elif row_idx in [8, 11]:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
             
             # Format numeric cells with right alignment
             elif col_idx in [2, 3] and value and isinstance(value, str) and (value[0].isdigit() or value == "-"):
@@ -348,9 +389,9 @@ def populate_note2_sheet(sheet, data):
             
             # Format total row
             elif row_idx == 14 and col_idx == 1:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
             elif row_idx == 14 and col_idx in [2, 3]:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 cell.fill = total_fill
                 cell.alignment = Alignment(horizontal='right')
             
@@ -360,7 +401,7 @@ def populate_note2_sheet(sheet, data):
             
             # Table headers
             elif row_idx in [22, 23, 30, 31]:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 cell.fill = header_fill
                 cell.border = all_border
                 cell.alignment = Alignment(horizontal='center')
@@ -389,8 +430,6 @@ def populate_note2_sheet(sheet, data):
     cell = sheet.cell(row=14, column=3)
     cell.border = Border(bottom=Side(border_style="double"), top=Side(border_style="double"))
 
-# Populate the sheet
-populate_note2_sheet(note2_sheet, note2_data)
 
 # Note 3 data - Reserves and Surplus
 note3_data = [
@@ -418,12 +457,11 @@ def populate_note3_sheet(sheet, data):
             
             # Note title formatting
             if row_idx == 1 and col_idx == 1:
-                cell.font = subheader_font
-                cell.fill = subheader_fill
+                cell.style = 'note_title'
             
             # Subheader formatting
             elif row_idx == 2 and col_idx == 1:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
             
             # Format numeric values with right alignment
             elif col_idx in [2, 3] and value and isinstance(value, str) and (value[0].isdigit() or value == "-"):
@@ -431,9 +469,9 @@ def populate_note3_sheet(sheet, data):
             
             # Format total row
             elif row_idx == 7 and col_idx == 1:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
             elif row_idx == 7 and col_idx in [2, 3]:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 cell.fill = total_fill
                 cell.alignment = Alignment(horizontal='right')
                 # Add double border
@@ -454,12 +492,8 @@ def populate_note3_sheet(sheet, data):
     signature_row = 12
     signature_cell = sheet.cell(row=signature_row, column=2)
     signature_cell.value = "(Signature placeholder)"
-    signature_cell.font = Font(italic=True, color="808080")
-    signature_cell.alignment = Alignment(horizontal='center')
+    signature_cell.style = 'signature'
 
-# Get the Note 3 sheet and populate it
-note3_sheet = wb['Note 3']
-populate_note3_sheet(note3_sheet, note3_data)
 
 # Note 4 data - Long Term Borrowings (updated to match image)
 note4_data = [
@@ -493,12 +527,11 @@ def populate_note4_sheet(sheet, data):
             
             # Note title formatting
             if row_idx == 1 and col_idx == 1:
-                cell.font = subheader_font
-                cell.fill = subheader_fill
+                cell.style = 'note_title'
             
             # Section headers formatting
             elif (row_idx == 2 or row_idx == 9) and col_idx == 1:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
             
             # Format numeric values with right alignment
             elif col_idx in [2, 3] and value and isinstance(value, str) and (value[0].isdigit() or value == "-"):
@@ -506,9 +539,9 @@ def populate_note4_sheet(sheet, data):
             
             # Format total row
             elif row_idx == 13 and col_idx == 1:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
             elif row_idx == 13 and col_idx in [2, 3]:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 cell.fill = total_fill
                 cell.alignment = Alignment(horizontal='right')
                 # Add double border
@@ -524,9 +557,6 @@ def populate_note4_sheet(sheet, data):
     sheet.column_dimensions['B'].width = 20
     sheet.column_dimensions['C'].width = 20
 
-# Replace the existing Note 4 population code with this updated function
-note4_sheet = wb['Note 4']
-populate_note4_sheet(note4_sheet, note4_data)
 
 # Note 5 data - Other Long Term Liabilities
 note5_data = [
@@ -593,12 +623,11 @@ def populate_note_sheet_generic(sheet, data, title_in_caps=False):
             
             # Note title formatting
             if row_idx == 1 and col_idx == 1:
-                cell.font = subheader_font
-                cell.fill = subheader_fill
+                cell.style = 'note_title'
             
             # Subheader formatting
             elif row_idx > 1 and col_idx == 1 and not value.startswith(" ") and value not in ["", "TOTAL", "Total"]:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
             
             # Format numeric values with right alignment
             elif col_idx in [2, 3] and value and isinstance(value, str):
@@ -606,16 +635,13 @@ def populate_note_sheet_generic(sheet, data, title_in_caps=False):
             
             # Format total row - find the row with TOTAL or Total
             if isinstance(value, str) and (value == "TOTAL" or value == "Total"):
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 
                 # Format total amount cells
                 total_row = row_idx
                 for total_col in [2, 3]:
                     total_cell = sheet.cell(row=total_row, column=total_col)
-                    total_cell.font = Font(bold=True)
-                    total_cell.fill = total_fill
-                    total_cell.alignment = Alignment(horizontal='right')
-                    total_cell.border = Border(bottom=Side(border_style="double"), top=Side(border_style="double"))
+                    total_cell.style = 'total_amount'
                 
                 # Add underline before total row
                 for underline_col in [2, 3]:
@@ -627,18 +653,6 @@ def populate_note_sheet_generic(sheet, data, title_in_caps=False):
     sheet.column_dimensions['B'].width = 20
     sheet.column_dimensions['C'].width = 20
 
-# Populate Notes 5-9
-note5_sheet = wb['Note 5']
-note6_sheet = wb['Note 6']
-note7_sheet = wb['Note 7']
-note8_sheet = wb['Note 8']
-note9_sheet = wb['Note 9']
-
-populate_note_sheet_generic(note5_sheet, note5_data)
-populate_note_sheet_generic(note6_sheet, note6_data)
-populate_note_sheet_generic(note7_sheet, note7_data)
-populate_note_sheet_generic(note8_sheet, note8_data)
-populate_note_sheet_generic(note9_sheet, note9_data)
 
 # Note 11 data - Long Term Loans and Advances
 note11_data = [
@@ -703,12 +717,11 @@ def populate_note_sheet_enhanced(sheet, data):
             
             # Note title formatting
             if row_idx == 1 and col_idx == 1:
-                cell.font = subheader_font
-                cell.fill = subheader_fill
+                cell.style = 'note_title'
             
             # Special formatting for italic text like "UnSecured Considered Good"
             elif row_idx == 2 and col_idx == 1 and "UnSecured Considered Good" in value:
-                cell.font = Font(italic=True)
+                cell.font = italic_font
             
             # Section headers like "Balances with Banks :"
             elif col_idx == 1 and (":") in value and row_idx > 1:
@@ -717,7 +730,7 @@ def populate_note_sheet_enhanced(sheet, data):
             # Bold but not section headers
             elif row_idx > 1 and col_idx == 1 and not value.startswith("-") and value and value != "TOTAL":
                 if "UnSecured" not in value:  # Skip items that should be in italic
-                    cell.font = Font(bold=True)
+                    cell.font = bold_font
             
             # Format numeric values with right alignment
             elif col_idx in [2, 3] and value and isinstance(value, str):
@@ -725,16 +738,13 @@ def populate_note_sheet_enhanced(sheet, data):
             
             # Format total row
             if isinstance(value, str) and value == "TOTAL":
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 
                 # Get the total row
                 total_row = row_idx
                 for total_col in [2, 3]:
                     total_cell = sheet.cell(row=total_row, column=total_col)
-                    total_cell.font = Font(bold=True)
-                    total_cell.fill = total_fill
-                    total_cell.alignment = Alignment(horizontal='right')
-                    total_cell.border = Border(bottom=Side(border_style="double"), top=Side(border_style="double"))
+                    total_cell.style = 'total_amount'
                 
                 # Add underline before total row
                 for underline_col in [2, 3]:
@@ -746,18 +756,6 @@ def populate_note_sheet_enhanced(sheet, data):
     sheet.column_dimensions['B'].width = 20
     sheet.column_dimensions['C'].width = 20
 
-# Populate Notes 11-15
-note11_sheet = wb['Note 11']
-note12_sheet = wb['Note 12']
-note13_sheet = wb['Note 13']
-note14_sheet = wb['Note 14']
-note15_sheet = wb['Note 15']
-
-populate_note_sheet_enhanced(note11_sheet, note11_data)
-populate_note_sheet_enhanced(note12_sheet, note12_data)
-populate_note_sheet_enhanced(note13_sheet, note13_data)
-populate_note_sheet_enhanced(note14_sheet, note14_data)
-populate_note_sheet_enhanced(note15_sheet, note15_data)
 
 # Note 16 data - Short Term Loans & Advances
 note16_data = [
@@ -798,16 +796,15 @@ def populate_notes_16_17(sheet, data):
             
             # Note title formatting
             if row_idx == 1 and col_idx == 1:
-                cell.font = subheader_font
-                cell.fill = subheader_fill
+                cell.style = 'note_title'
             
             # Section headers - "Others"
             elif row_idx == 2 and col_idx == 1:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
             
             # Italicized "Unsecured Considered Good"
             elif row_idx == 3 and col_idx == 1 and "Unsecured Considered Good" in value:
-                cell.font = Font(italic=True)
+                cell.font = italic_font
             
             # Format indented items
             elif col_idx == 1 and value.startswith("  - "):
@@ -820,16 +817,13 @@ def populate_notes_16_17(sheet, data):
             
             # Format total row
             if isinstance(value, str) and value == "TOTAL":
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 
                 # Get the total row
                 total_row = row_idx
                 for total_col in [2, 3]:
                     total_cell = sheet.cell(row=total_row, column=total_col)
-                    total_cell.font = Font(bold=True)
-                    total_cell.fill = total_fill
-                    total_cell.alignment = Alignment(horizontal='right')
-                    total_cell.border = Border(bottom=Side(border_style="double"), top=Side(border_style="double"))
+                    total_cell.style = 'total_amount'
                 
                 # Add underline before total row
                 for underline_col in [2, 3]:
@@ -841,12 +835,6 @@ def populate_notes_16_17(sheet, data):
     sheet.column_dimensions['B'].width = 20
     sheet.column_dimensions['C'].width = 20
 
-# Populate Notes 16-17
-note16_sheet = wb['Note 16']
-note17_sheet = wb['Note 17']
-
-populate_notes_16_17(note16_sheet, note16_data)
-populate_notes_16_17(note17_sheet, note17_data)
 
 # Note 18 data - Revenue from Operations
 note18_data = [
@@ -907,27 +895,21 @@ def populate_notes_18_to_20(sheet, data, is_header_note=True):
         # Merge company name across columns
         sheet.merge_cells(start_row=1, start_column=1, end_row=1, end_column=3)
         cell = sheet.cell(row=1, column=1)
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'title'
         
         # Merge statement title across columns
         sheet.merge_cells(start_row=2, start_column=1, end_row=2, end_column=3)
         cell = sheet.cell(row=2, column=1)
-        cell.font = subheader_font
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'subtitle'
         
         # Format column headers (row 4)
         for col_idx in range(1, 4):
             cell = sheet.cell(row=4, column=col_idx)
-            cell.font = subheader_font
-            cell.fill = header_fill
-            cell.border = border
-            cell.alignment = Alignment(horizontal='center')
+            cell.style = 'column_header'
         
         # Set special formatting for amt in INR text
         cell = sheet.cell(row=3, column=2)
-        cell.font = Font(italic=True)
-        cell.alignment = Alignment(horizontal='right')
+        cell.style = 'unit_caption'
         
         # Starting row for the note title depends on whether we have a header
         note_title_row = 6
@@ -946,8 +928,7 @@ def populate_notes_18_to_20(sheet, data, is_header_note=True):
             
             # Note title formatting
             if row_idx == note_title_row and col_idx == 1:
-                cell.font = subheader_font
-                cell.fill = subheader_fill
+                cell.style = 'note_title'
             
             # Format numeric values with right alignment
             elif col_idx in [2, 3] and value and isinstance(value, str) and (value[0].isdigit() or value == "-"):
@@ -955,16 +936,13 @@ def populate_notes_18_to_20(sheet, data, is_header_note=True):
             
             # Format total row
             if isinstance(value, str) and value == "Total":
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 
                 # Format total amount cells
                 total_row = row_idx
                 for total_col in [2, 3]:
                     total_cell = sheet.cell(row=total_row, column=total_col)
-                    total_cell.font = Font(bold=True)
-                    total_cell.fill = total_fill
-                    total_cell.alignment = Alignment(horizontal='right')
-                    total_cell.border = Border(bottom=Side(border_style="double"), top=Side(border_style="double"))
+                    total_cell.style = 'total_amount'
                 
                 # Add underline before total row
                 for underline_col in [2, 3]:
@@ -983,7 +961,7 @@ def populate_notes_18_to_20(sheet, data, is_header_note=True):
         if subtotal_row > 0:
             for col_idx in [2, 3]:
                 subtotal_cell = sheet.cell(row=subtotal_row, column=col_idx)
-                subtotal_cell.font = Font(bold=True)
+                subtotal_cell.font = bold_font
                 subtotal_cell.border = Border(bottom=Side(border_style="thin"))
                 subtotal_cell.alignment = Alignment(horizontal='right')
     
@@ -992,20 +970,6 @@ def populate_notes_18_to_20(sheet, data, is_header_note=True):
     sheet.column_dimensions['B'].width = 25
     sheet.column_dimensions['C'].width = 25
 
-# Populate Notes 18-20
-note18_sheet = wb['Note 18']
-note19_sheet = wb['Note 19']
-note20_sheet = wb['Note 20']
-
-# Apply formatting with headers only for Note 18
-populate_notes_18_to_20(note18_sheet, note18_data, True)
-
-# For Note 19 and 20, we don't repeat the header
-note19_data_adjusted = note19_data  # No header needed
-note20_data_adjusted = note20_data  # No header needed
-
-populate_notes_18_to_20(note19_sheet, note19_data_adjusted, False)
-populate_notes_18_to_20(note20_sheet, note20_data_adjusted, False)
 
 # Note 21 data - Change in Inventories
 note21_data = [
@@ -1072,17 +1036,16 @@ def populate_notes_21_to_23(sheet, data):
             
             # Note title formatting
             if row_idx == 1 and col_idx == 1:
-                cell.font = subheader_font
-                cell.fill = subheader_fill
+                cell.style = 'note_title'
             
             # Subheader formatting (all caps items like "CLOSING STOCK OF")
             elif col_idx == 1 and value and value.isupper() and row_idx > 1:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
             
             # Second level headers (like "Interest Expenses", "Interest to Banks")
             elif col_idx == 1 and value and not value.startswith("-") and not "Total" in value and not "Change" in value and row_idx > 1:
                 if not value.isupper():  # Skip if already handled as uppercase header
-                    cell.font = Font(bold=True)
+                    cell.font = bold_font
             
             # Format numeric values with right alignment
             elif col_idx in [2, 3] and value and isinstance(value, str):
@@ -1090,16 +1053,13 @@ def populate_notes_21_to_23(sheet, data):
             
             # Format "Total" rows
             if isinstance(value, str) and value == "Total":
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 
                 # Format total amount cells
                 total_row = row_idx
                 for total_col in [2, 3]:
                     total_cell = sheet.cell(row=total_row, column=total_col)
-                    total_cell.font = Font(bold=True)
-                    total_cell.fill = total_fill
-                    total_cell.alignment = Alignment(horizontal='right')
-                    total_cell.border = Border(bottom=Side(border_style="double"), top=Side(border_style="double"))
+                    total_cell.style = 'total_amount'
                 
                 # Add underline before total row
                 for underline_col in [2, 3]:
@@ -1108,10 +1068,10 @@ def populate_notes_21_to_23(sheet, data):
             
             # Special formatting for "Change in Inventories" lines in Note 21
             if "Change in Inventories" in str(value):
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 
                 if col_idx in [2, 3]:
-                    cell.font = Font(bold=True)
+                    cell.font = bold_font
                     cell.alignment = Alignment(horizontal='right')
                     if row_idx == 21:  # The final Change in Inventories row
                         cell.border = Border(bottom=Side(border_style="double"), top=Side(border_style="double"))
@@ -1127,14 +1087,6 @@ def populate_notes_21_to_23(sheet, data):
     sheet.column_dimensions['B'].width = 25
     sheet.column_dimensions['C'].width = 25
 
-# Populate Notes 21-23
-note21_sheet = wb['Note 21']
-note22_sheet = wb['Note 22']
-note23_sheet = wb['Note 23']
-
-populate_notes_21_to_23(note21_sheet, note21_data)
-populate_notes_21_to_23(note22_sheet, note22_data)
-populate_notes_21_to_23(note23_sheet, note23_data)
 
 # Note 24 data - Other Expenses (combines all three images)
 note24_data = [
@@ -1247,12 +1199,11 @@ def populate_note24(sheet, data):
             
             # Note title formatting
             if row_idx == 1 and col_idx == 1:
-                cell.font = subheader_font
-                cell.fill = subheader_fill
+                cell.style = 'note_title'
             
             # Section headers formatting
             elif col_idx == 1 and any(header in str(value) for header in ["INDIRECT EXPENDITURE", "(A) ADMINISTRATIVE EXPENSES", "(B) SELLING & DISTRIBUTION EXPENSES"]):
-                cell.font = Font(bold=True)
+                cell.font = bold_font
             
             # Format numeric values with right alignment
             elif col_idx in [2, 3] and value and isinstance(value, str) and (value[0].isdigit() or value.startswith("-") or value.startswith("(")):
@@ -1260,10 +1211,7 @@ def populate_note24(sheet, data):
             
             # Format total rows
             if row_idx in [64, 66] and col_idx in [2, 3]:
-                cell.font = Font(bold=True)
-                cell.fill = total_fill
-                cell.alignment = Alignment(horizontal='right')
-                cell.border = Border(bottom=Side(border_style="double"), top=Side(border_style="double"))
+                cell.style = 'total_amount'
             
             # Add underline before total rows
             if row_idx == 63 and col_idx in [2, 3]:
@@ -1297,7 +1245,7 @@ def populate_employee_benefit_details(sheet, data):
             
             # Format total rows
             if row_idx in [10, 18] and col_idx in [2, 3]:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 cell.alignment = Alignment(horizontal='right')
                 cell.border = Border(bottom=Side(border_style="double"), top=Side(border_style="double"))
             
@@ -1310,13 +1258,6 @@ def populate_employee_benefit_details(sheet, data):
     sheet.column_dimensions['B'].width = 25
     sheet.column_dimensions['C'].width = 25
 
-# Populate Note 24
-note24_sheet = wb['Note 24']
-populate_note24(note24_sheet, note24_data)
-
-# Create a new sheet for Employee Benefit Details
-employee_details_sheet = wb.create_sheet("Employee Benefit Details")
-populate_employee_benefit_details(employee_details_sheet, employee_benefit_details_data)
 
 # Annexure to Note 4 data - Long Term Borrowings
 annexure_to_note4_data = [
@@ -1454,26 +1395,20 @@ def populate_annexure_sheet_with_header(sheet, data, has_header=True):
         # Merge company name across columns
         sheet.merge_cells(start_row=1, start_column=1, end_row=1, end_column=3)
         cell = sheet.cell(row=1, column=1)
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'title'
         
         # Merge statement title across columns
         sheet.merge_cells(start_row=2, start_column=1, end_row=2, end_column=3)
         cell = sheet.cell(row=2, column=1)
-        cell.font = subheader_font
-        cell.alignment = Alignment(horizontal='center')
+        cell.style = 'subtitle'
         
         # Format column headers (row 4)
         for col_idx in [2, 3]:
-            sheet.cell(row=4, column=col_idx).font = subheader_font
-            sheet.cell(row=4, column=col_idx).fill = header_fill
-            sheet.cell(row=4, column=col_idx).border = border
-            sheet.cell(row=4, column=col_idx).alignment = Alignment(horizontal='center')
+            sheet.cell(row=4, column=col_idx).style = 'column_header'
         
         # Set special formatting for amt in INR text
         cell = sheet.cell(row=3, column=2)
-        cell.font = Font(italic=True)
-        cell.alignment = Alignment(horizontal='right')
+        cell.style = 'unit_caption'
         
         # Set the start row for formatting after the header
         format_start_row = 6
@@ -1498,7 +1433,7 @@ def populate_annexure_sheet_with_header(sheet, data, has_header=True):
             # Format sub-headers (like "SECURED", "VEHICLES LOANS", etc.)
             elif col_idx == 1 and value and not value.startswith(" ") and not "Total" in str(value) and row_idx > format_start_row:
                 if not any(char.islower() for char in str(value)):
-                    cell.font = Font(bold=True)
+                    cell.font = bold_font
             
             # Format numeric values with right alignment
             elif col_idx in [2, 3] and value and isinstance(value, str) and (value[0].isdigit() or value == "-" or value.startswith("(")):
@@ -1506,14 +1441,14 @@ def populate_annexure_sheet_with_header(sheet, data, has_header=True):
             
             # Format total rows
             if isinstance(value, str) and ("Total" in value or "Grand Total" in value):
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 
                 # Find total row
                 total_row = row_idx
                 for total_col in [2, 3]:
                     try:
                         total_cell = sheet.cell(row=total_row, column=total_col)
-                        total_cell.font = Font(bold=True)
+                        total_cell.font = bold_font
                         # Only apply fill to the final totals, not subtotals
                         if "Grand Total" in value:
                             total_cell.fill = total_fill
@@ -1546,12 +1481,6 @@ def populate_annexure_sheet_with_header(sheet, data, has_header=True):
             cell = sheet.cell(row=4, column=col_idx)
             cell.fill = PatternFill(start_color="B8CCE4", end_color="B8CCE4", fill_type="solid")
 
-# Populate annexure sheets
-annexure_note4_sheet = wb['Annexure to Note 4']
-annexure_note8_sheet = wb['Annexure to Note 8']
-
-populate_annexure_sheet_with_header(annexure_note4_sheet, annexure_to_note4_data, True)
-populate_annexure_sheet_with_header(annexure_note8_sheet, annexure_to_note8_data, False)
 
 # Annexure to Note 11 data - Long Term Loans and Advances
 annexure_to_note11_data = [
@@ -1601,16 +1530,15 @@ def populate_annexure_to_note_sheet(sheet, data):
             
             # Annexure title formatting
             if row_idx == 1 and col_idx == 1:
-                cell.font = subheader_font
-                cell.fill = subheader_fill
+                cell.style = 'note_title'
             
             # Section header formatting (LONG TERM LOANS AND ADVANCES, CASH & CASH EQUIVALENTS)
             elif row_idx == 2 and col_idx == 1:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
             
             # Subsection header formatting (Security Deposits, Balances with Banks)
             elif col_idx == 1 and row_idx > 2 and not value.startswith(" ") and value and value != "Total":
-                cell.font = Font(bold=True)
+                cell.font = bold_font
             
             # Format numeric values with right alignment
             elif col_idx in [2, 3] and value and isinstance(value, str) and (value[0].isdigit() or value == "-"):
@@ -1619,16 +1547,13 @@ def populate_annexure_to_note_sheet(sheet, data):
             # Format total row
             if isinstance(value, str) and "Total" in value:
                 # Format total label
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 
                 # Format total amount cells
                 total_row = row_idx
                 for total_col in [2, 3]:
                     total_cell = sheet.cell(row=total_row, column=total_col)
-                    total_cell.font = Font(bold=True)
-                    total_cell.fill = total_fill
-                    total_cell.alignment = Alignment(horizontal='right')
-                    total_cell.border = Border(bottom=Side(border_style="double"), top=Side(border_style="double"))
+                    total_cell.style = 'total_amount'
                 
                 # Add underline before total row
                 for underline_col in [2, 3]:
@@ -1788,7 +1713,7 @@ def populate_annexure_to_note12_sheet(sheet, data):
         for col_idx in range(1, 8):
             cell = sheet.cell(row=row_idx, column=col_idx)
             if cell.value:
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 if "TOTAL" in str(cell.value) or col_idx in [2, 5]:  # Total label or amount columns
                     cell.fill = total_fill
     
@@ -1810,12 +1735,8 @@ def populate_annexure_to_note12_sheet(sheet, data):
     signature_row = 45
     signature_cell = sheet.cell(row=signature_row, column=2)
     signature_cell.value = "(Signature placeholder)"
-    signature_cell.font = Font(italic=True, color="808080")
-    signature_cell.alignment = Alignment(horizontal='center')
+    signature_cell.style = 'signature'
 
-# Populate Annexure to Note 12 sheet
-annexure_note12_sheet = wb['Annexure to Note 12']
-populate_annexure_to_note12_sheet(annexure_note12_sheet, annexure_to_note12_data)
 
 # Format subtotal in Note 15 (the bank balance subtotal)
 def format_note15_subtotal(sheet):
@@ -1831,19 +1752,10 @@ def format_note15_subtotal(sheet):
     if subtotal_row > 0:
         for col_idx in [2, 3]:
             subtotal_cell = sheet.cell(row=subtotal_row, column=col_idx)
-            subtotal_cell.font = Font(bold=True)
+            subtotal_cell.font = bold_font
             subtotal_cell.alignment = Alignment(horizontal='right')
             subtotal_cell.border = Border(bottom=Side(border_style="thin"))
 
-# Populate annexure sheets
-annexure_note11_sheet = wb['Annexure to Note 11']
-annexure_note15_sheet = wb['Annexure to Note 15']
-
-populate_annexure_to_note_sheet(annexure_note11_sheet, annexure_to_note11_data)
-populate_annexure_to_note_sheet(annexure_note15_sheet, annexure_to_note15_data)
-
-# Apply special formatting for Note 15 subtotal
-format_note15_subtotal(annexure_note15_sheet)
 
 # Annexure to Note 16 data - Short Term Loans & Advances
 annexure_to_note16_data = [
@@ -2001,61 +1913,40 @@ annexure_to_note16_data = [
 
 # Function to populate the Annexure to Note 16 sheet
 def populate_annexure_to_note16_sheet(sheet, data):
-    # First pass: Set all cell values
-    for row_idx, row in enumerate(data, 1):
-        for col_idx, value in enumerate(row, 1):
-            cell = sheet.cell(row=row_idx, column=col_idx)
-            cell.value = value
+    # Rows are streamed in order, each styled as it is written; the row
+    # above a total is underlined, so each row looks one row ahead
+    subsection_headers = ["ADVANCES TO VENDORS", "ADVANCES TO EMPLOYESS", "OTHERS"]
     
-    # Apply formatting
-    for row_idx, row in enumerate(data, 1):
-        for col_idx, value in enumerate(row, 1):
-            cell = sheet.cell(row=row_idx, column=col_idx)
-            
-            # Annexure title formatting
-            if row_idx == 1 and col_idx == 1:
-                cell.font = subheader_font
-                cell.fill = subheader_fill
-            
-            # Section header formatting (SHORT TERM LOANS & ADVANCES)
-            elif row_idx == 2 and col_idx == 1:
-                cell.font = Font(bold=True)
-            
-            # Subsection header formatting (ADVANCES TO VENDORS, ADVANCES TO EMPLOYESS, OTHERS)
-            elif col_idx == 1 and any(header in str(value) for header in ["ADVANCES TO VENDORS", "ADVANCES TO EMPLOYESS", "OTHERS"]):
-                cell.font = Font(bold=True)
-            
-            # Format numeric values with right alignment
-            elif col_idx in [2, 3] and value and isinstance(value, str) and (value[0].isdigit() or value == "-" or value.startswith("(")):
-                cell.alignment = Alignment(horizontal='right')
-            
-            # Format total rows
-            if isinstance(value, str) and value == "Total" and row_idx in [121, 134, 152]:
-                # Format total label
-                cell.font = Font(bold=True)
-                
-                # Format total amount cells
-                total_row = row_idx
-                for total_col in [2, 3]:
-                    total_cell = sheet.cell(row=total_row, column=total_col)
-                    total_cell.font = Font(bold=True)
-                    total_cell.fill = total_fill
-                    total_cell.alignment = Alignment(horizontal='right')
-                    total_cell.border = Border(bottom=Side(border_style="double"), top=Side(border_style="double"))
-                
-                # Add underline before total row
-                for underline_col in [2, 3]:
-                    underline_cell = sheet.cell(row=total_row-1, column=underline_col)
-                    underline_cell.border = Border(bottom=Side(border_style="thin"))
+    def is_total_row(row_idx, row):
+        return row[0] == "Total" and row_idx in [121, 134, 152]
     
-    # Set column widths
-    sheet.column_dimensions['A'].width = 50
-    sheet.column_dimensions['B'].width = 25
-    sheet.column_dimensions['C'].width = 25
+    def is_amount(value):
+        return value and isinstance(value, str) and (value[0].isdigit() or value == "-" or value.startswith("("))
+    
+    def row_styles(row_idx, row, underline):
+        # Annexure title, section header (SHORT TERM LOANS & ADVANCES),
+        # subsection headers and total labels
+        if row_idx == 1:
+            styles = ['note_title']
+        elif row_idx == 2 or is_total_row(row_idx, row) or any(header in str(row[0]) for header in subsection_headers):
+            styles = ['bold']
+        else:
+            styles = [None]
+        
+        # Amounts right-aligned, with double rules on total rows
+        for value in row[1:]:
+            if is_total_row(row_idx, row):
+                styles.append('total_amount')
+            elif underline:
+                styles.append('rule_amount' if is_amount(value) else 'rule')
+            else:
+                styles.append('right' if is_amount(value) else None)
+        return styles
+    
+    for row_idx, row in enumerate(data, 1):
+        underline = row_idx < len(data) and is_total_row(row_idx + 1, data[row_idx])
+        sheet.append(row, row_styles(row_idx, row, underline))
 
-# Populate Annexure to Note 16 sheet
-annexure_note16_sheet = wb['Annexure to Note 16']
-populate_annexure_to_note16_sheet(annexure_note16_sheet, annexure_to_note16_data)
 
 # Fixed Assets sheet data - Note 10 (both FY 2021 and FY 2022)
 fixed_assets_data_2022 = [
@@ -2157,18 +2048,14 @@ def populate_fixed_assets_sheet(sheet, data):
     # Format title and subtitle
     for row_idx in [1, 2]:
         cell = sheet.cell(row=row_idx, column=1)
-        cell.font = header_font
-        cell.alignment = Alignment(horizontal='left')
+        cell.style = 'title_left'
     
     # Format section headers
     header_rows = [4, 5]
     for row_idx in header_rows:
         for col_idx in range(1, 12):
             cell = sheet.cell(row=row_idx, column=col_idx)
-            cell.font = subheader_font
-            cell.fill = header_fill
-            cell.border = border
-            cell.alignment = Alignment(horizontal='center', vertical='center')
+            cell.style = 'column_header_middle'
     
     # Format GROSS BLOCK, DEPRECIATION, NET BLOCK merged cells
     gb_start, gb_end = 2, 5
@@ -2183,7 +2070,7 @@ def populate_fixed_assets_sheet(sheet, data):
     section_headers = [8, 10, 13, 21, 27, 30, 32]
     for row_idx in section_headers:
         cell = sheet.cell(row=row_idx, column=1)
-        cell.font = Font(bold=True)
+        cell.font = bold_font
         if "TANGIBLE ASSETS" in str(cell.value) or "INTANGIBLE ASSETS" in str(cell.value):
             cell.fill = subheader_fill
     
@@ -2199,7 +2086,7 @@ def populate_fixed_assets_sheet(sheet, data):
     total_row = 34
     for col_idx in range(1, 12):
         cell = sheet.cell(row=total_row, column=col_idx)
-        cell.font = Font(bold=True)
+        cell.font = bold_font
         if col_idx > 1:
             cell.fill = total_fill
     
@@ -2215,9 +2102,6 @@ def populate_fixed_assets_sheet(sheet, data):
             cell = sheet.cell(row=row_idx, column=col_idx)
             cell.fill = light_blue_fill
 
-# Populate Fixed Assets sheet
-fixed_assets_sheet = wb['Fixed Assets']
-populate_fixed_assets_sheet(fixed_assets_sheet, fixed_assets_data_2022)
 
 # Annexure B data - Fixed Assets As Per Income Tax Act for both years
 annexure_b_data = [
@@ -2332,14 +2216,14 @@ def populate_annexure_b_sheet_combined(sheet, data):
     
     # Format "ANNEXURE B" text
     cell = sheet.cell(row=4, column=1)
-    cell.font = Font(bold=True)
+    cell.font = bold_font
     
     # Format table headers
     for col_idx in range(1, 10):
         # Headers in row 5-6
         for row_idx in [5, 6]:
             cell = sheet.cell(row=row_idx, column=col_idx)
-            cell.font = Font(bold=True)
+            cell.font = bold_font
             cell.fill = light_blue_fill
             cell.border = border
             cell.alignment = Alignment(horizontal='center', wrap_text=True)
@@ -2350,22 +2234,22 @@ def populate_annexure_b_sheet_combined(sheet, data):
     
     for row_idx in block_rows:
         cell = sheet.cell(row=row_idx, column=1)
-        cell.font = Font(bold=True)
+        cell.font = bold_font
         cell.fill = light_blue_fill
     
     for row_idx in asset_rows:
         cell = sheet.cell(row=row_idx, column=1)
-        cell.font = Font(bold=True)
+        cell.font = bold_font
     
     # Format total rows
     total_rows = [11, 15, 19, 23, 27, 31, 35, 37]
     for row_idx in total_rows:
         cell = sheet.cell(row=row_idx, column=1)
-        cell.font = Font(bold=True)
+        cell.font = bold_font
         if row_idx == 37:  # GRAND TOTAL
             for col_idx in range(1, 10):
                 cell = sheet.cell(row=row_idx, column=col_idx)
-                cell.font = Font(bold=True)
+                cell.font = bold_font
                 cell.fill = light_blue_fill
                 cell.border = Border(top=Side(style='thin'), bottom=Side(style='thin'))
                 if col_idx > 1:
@@ -2391,82 +2275,89 @@ def populate_annexure_b_sheet_combined(sheet, data):
         column_letter = get_column_letter(i)
         sheet.column_dimensions[column_letter].width = width
 
-# Populate Annexure B sheet
-annexure_b_sheet = wb['Annexure B']
-populate_annexure_b_sheet_combined(annexure_b_sheet, annexure_b_data)
 
-# Function to safely populate a sheet with data and apply formatting
+# Function to parse the amount columns of a data table into numbers
+# (one vectorized call for the whole block); returns {(row, column): value}
+# with 1-based positions for every cell holding an amount
+def parse_amount_cells(data, first_row, first_column):
+    width = max(len(row) for row in data)
+    block = [
+        [
+            value if isinstance(value, str) and value.strip() not in NIL_MARKERS else ""
+            for value in list(row[first_column - 1:]) + [""] * (width - len(row))
+        ]
+        for row in data[first_row - 1:]
+    ]
+    parsed = parse_amounts(block)
+    amounts = {}
+    for row_offset, col_offset in zip(*parsed.valid.nonzero()):
+        amounts[(first_row + row_offset, first_column + col_offset)] = float(
+            parsed.values[row_offset, col_offset]
+        )
+    return amounts
+
+# Section headings of the statements, styled like note titles
+STATEMENT_SECTIONS = frozenset([
+    "EQUITY AND LIABILITIES", "ASSETS", "INCOME", "EXPENSES",
+    "I) Cash Flows from Operating Activities",
+    "II) Cash Flows from Investing Activities",
+    "III) Cash Flows From Financing Activities",
+    "TANGIBLE ASSETS", "INTANGIBLE ASSETS",
+])
+
+# Named style of a statement cell, from its position and value: company
+# name and report title in rows 2-3, column headers in rows 5-6, then
+# line items with their amounts from ``amount_column`` on
+def statement_cell_style(row_idx, col_idx, value, amount_column, is_amount):
+    text = value if isinstance(value, str) else ""
+    if row_idx in (2, 3):
+        return 'title_boxed' if value else 'title'
+    if row_idx in (5, 6):
+        return 'column_header'
+    if row_idx > 6:
+        if col_idx >= amount_column:
+            if is_amount:
+                return 'boxed_number'
+            return 'boxed_amount' if value else 'right'
+        if col_idx == 1 and text in STATEMENT_SECTIONS:
+            return 'note_title_boxed'
+        if "total" in text.lower():
+            return 'total_label'
+    elif text == "TOTAL":
+        return 'total_label'
+    return 'boxed' if value else None
+
+# Function to write a statement (Balance Sheet, Profit and Loss) in one
+# pass: each cell's value and style are written together, and column
+# widths are measured on the data as entered while it goes (amounts are
+# stored as numbers and display with their grouping)
 def populate_sheet(sheet, data, has_note_column=False):
-    # Set the column offset based on note column presence
-    column_offset = 1 if has_note_column else 0
-    
-    # First pass: Set all cell values
-    for row_idx, row in enumerate(data, 1):
-        for col_idx, value in enumerate(row, 1):
-            cell = sheet.cell(row=row_idx, column=col_idx)
-            cell.value = value
-    
-    # Second pass: Apply merges
-    for row_idx, row in enumerate(data, 1):
-        if row_idx in [2, 3]:  # Company name and report title rows
-            if len(row) > 1:
-                sheet.merge_cells(start_row=row_idx, start_column=1, end_row=row_idx, end_column=len(row))
-    
-    # Third pass: Apply formatting
+    amount_column = 3 if has_note_column else 2
+
+    # Amounts below the column headers are written as numbers
+    amounts = parse_amount_cells(data, 7, amount_column)
+
+    widths = [0] * max(len(row) for row in data)
     for row_idx, row in enumerate(data, 1):
+        if row_idx in (2, 3) and len(row) > 1:
+            # Company name and report title span the table
+            sheet.merge_cells(start_row=row_idx, start_column=1, end_row=row_idx, end_column=len(row))
+            row = row[:1]
         for col_idx, value in enumerate(row, 1):
-            try:
-                cell = sheet.cell(row=row_idx, column=col_idx)
-                
-                # Apply styles
-                if row_idx in [2, 3]:  # Company name and report title
-                    if col_idx == 1:  # Only format the first cell of merged cells
-                        cell.font = header_font
-                        cell.alignment = Alignment(horizontal='center')
-                elif row_idx in [5, 6]:  # Column headers
-                    cell.font = subheader_font
-                    cell.fill = header_fill
-                    cell.border = border
-                    cell.alignment = Alignment(horizontal='center')
-                elif row_idx > 6 and col_idx > (1 + column_offset):  # Numeric values
-                    # Right-align numeric values
-                    cell.alignment = Alignment(horizontal='right')
-                
-                # Special formatting for section headers
-                if col_idx == 1 and row_idx > 6 and isinstance(value, str) and value and not value.startswith(" "):
-                    if value in ["EQUITY AND LIABILITIES", "ASSETS", "INCOME", "EXPENSES", 
-                               "I) Cash Flows from Operating Activities", 
-                               "II) Cash Flows from Investing Activities",
-                               "III) Cash Flows From Financing Activities",
-                               "TANGIBLE ASSETS", "INTANGIBLE ASSETS"]:
-                        cell.font = subheader_font
-                        cell.fill = subheader_fill
-                
-                # Special formatting for totals
-                if isinstance(value, str) and value == "TOTAL" or (row_idx > 6 and isinstance(value, str) and "total" in value.lower()):
-                    cell.font = Font(bold=True)
-                    cell.fill = total_fill
-                
-                # Add borders to all non-empty cells
-                if value:
-                    cell.border = border
-            except:
-                # Skip cells that can't be formatted (like merged cells)
-                pass
-    
-    # Adjust column widths
-    for column in sheet.columns:
-        max_length = 0
-        column_letter = get_column_letter(column[0].column)
-        for cell in column:
-            if cell.value:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-        adjusted_width = min(max(max_length + 2, 12), 50)  # Min width 12, max 50
-        sheet.column_dimensions[column_letter].width = adjusted_width
+            amount = amounts.get((row_idx, col_idx))
+            cell = sheet.cell(row=row_idx, column=col_idx, value=value if amount is None else amount)
+            style = statement_cell_style(row_idx, col_idx, value, amount_column, amount is not None)
+            if style:
+                cell.style = style
+            if style == 'boxed_number':
+                # Lakh/crore grouping depends on the amount's size
+                cell.number_format = indian_number_format(amount)
+            if value and len(str(value)) > widths[col_idx - 1]:
+                widths[col_idx - 1] = len(str(value))
+
+    for col_idx, width in enumerate(widths, 1):
+        # Min width 12, max 50
+        sheet.column_dimensions[get_column_letter(col_idx)].width = min(max(width + 2, 12), 50)
 
 # Function to populate a note sheet
 def populate_note_sheet(sheet, data):
@@ -2484,8 +2375,7 @@ def populate_note_sheet(sheet, data):
                 
                 # Header formatting for note title
                 if row_idx == 1 and col_idx == 1:
-                    cell.font = subheader_font
-                    cell.fill = subheader_fill
+                    cell.style = 'note_title'
                 
                 # Format numeric values (columns 2 and 3)
                 if col_idx in [2, 3] and isinstance(value, str) and value:
@@ -2493,7 +2383,7 @@ def populate_note_sheet(sheet, data):
                 
                 # Format total row
                 if isinstance(value, str) and "TOTAL" in value:
-                    cell.font = Font(bold=True)
+                    cell.font = bold_font
                     cell.fill = total_fill
                 
                 # Add borders to cells with content
@@ -2517,7 +2407,7 @@ def populate_annexure_sheet(sheet, data):
     for row_idx, row in enumerate(data, 1):
         for col_idx, value in enumerate(row, 1):
             # Check if this is a regular cell (not a MergedCell)
-            if not isinstance(sheet.cell(row=row_idx, column=col_idx), openpyxl.cell.cell.MergedCell):
+            if not isinstance(sheet.cell(row=row_idx, column=col_idx), MERGED_CELL_TYPES):
                 cell = sheet.cell(row=row_idx, column=col_idx)
                 cell.value = value
     
@@ -2535,15 +2425,11 @@ def populate_annexure_sheet(sheet, data):
                 
                 # Column headers
                 if row_idx == 3:
-                    cell.font = subheader_font
-                    cell.fill = header_fill
-                    cell.border = border
-                    cell.alignment = Alignment(horizontal='center')
+                    cell.style = 'column_header'
                 
                 # Format section headers
                 if col_idx == 1 and row_idx > 3 and isinstance(value, str) and "BLOCK" in value:
-                    cell.font = subheader_font
-                    cell.fill = subheader_fill
+                    cell.style = 'note_title'
                 
                 # Format numeric values
                 if col_idx > 1 and isinstance(value, str) and value:
@@ -2551,7 +2437,7 @@ def populate_annexure_sheet(sheet, data):
                 
                 # Format total rows
                 if isinstance(value, str) and "TOTAL" in value:
-                    cell.font = Font(bold=True)
+                    cell.font = bold_font
                     if "GRAND TOTAL" in value:
                         cell.fill = total_fill
                     
@@ -2877,119 +2763,137 @@ sundry_creditors_data = sundry_creditors_header + sundry_creditors_expenses + su
 
 # Function to populate the Sundry Creditors sheet
 def populate_sundry_creditors_sheet(sheet, data):
-    # First pass: Set all cell values
-    row_index = 1
-    for row in data:
-        for col_idx, value in enumerate(row, 1):
-            cell = sheet.cell(row=row_index, column=col_idx)
-            cell.value = value
-        row_index += 1
+    # Rows are streamed in order, each styled as it is written: the
+    # letterhead (rows 1-8), the boxed column headers (rows 9-13), then
+    # the party-wise listing with its section and total rows
+    section_headers = ["Sundry Creditors - Expenses", "Sundry Creditors - Purchase", "Sundry Creditors ( Salary)"]
     
-    # Define formatting
-    title_font = Font(bold=True, size=12)
-    address_font = Font(size=10)
-    header_font = Font(bold=True, size=10)
-    section_font = Font(bold=True, italic=True, size=10)
+    def is_amount(value):
+        return isinstance(value, str) and (value.replace('.', '').isdigit() or value == "0.00")
     
-    # Format the header section
-    for row_idx in range(1, 6):
-        cell = sheet.cell(row=row_idx, column=1)
+    for row_idx, row in enumerate(data, 1):
         if row_idx == 1:
-            cell.font = title_font
+            styles = ['listing_title']
+        elif row_idx <= 5:
+            styles = ['listing_address']
+        elif row_idx <= 8:
+            styles = ['listing_heading']
+        elif row_idx <= 13:
+            styles = ['listing_header' if col_idx > 1 or row_idx == 11 else 'boxed' for col_idx in range(1, len(row) + 1)]
+            if row_idx == 13:
+                styles[1:] = ['listing_header_rule'] * (len(row) - 1)
+        elif row[0] in section_headers:
+            styles = ['listing_section'] + ['rule'] * (len(row) - 1)
+        elif row[0] == "TOTAL":
+            styles = ['listing_total'] + ['listing_total_amount' if is_amount(value) else 'listing_total' for value in row[1:]]
         else:
-            cell.font = address_font
-    
-    # Format the Sundry Creditors title and Group Summary
-    for row_idx in range(6, 9):
-        cell = sheet.cell(row=row_idx, column=1)
-        cell.font = header_font
-    
-    # Format the column headers
-    for row_idx in range(9, 14):
-        for col_idx in range(1, 4):
-            cell = sheet.cell(row=row_idx, column=col_idx)
-            if col_idx > 1 or row_idx == 11:
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal='center')
-            if row_idx == 13 and col_idx > 1:
-                cell.border = Border(bottom=Side(style='thin'))
-    
-    # Find and format section headers
-    section_headers = ["Sundry Creditors - Expenses", "Sundry Creditors - Purchase", "Sundry Creditors ( Salary)"]
-    row_idx = 14
-    while row_idx <= row_index:
-        cell = sheet.cell(row=row_idx, column=1)
-        if cell.value in section_headers:
-            cell.font = section_font
-            
-            # Add underline to section headers
-            for col_idx in range(1, 4):
-                section_cell = sheet.cell(row=row_idx, column=col_idx)
-                section_cell.border = Border(bottom=Side(style='thin'))
-        row_idx += 1
-    
-    # Find and format total rows
-    total_rows = []
-    row_idx = 14
-    while row_idx <= row_index:
-        cell = sheet.cell(row=row_idx, column=1)
-        if cell.value == "TOTAL":
-            total_rows.append(row_idx)
-            
-            # Format total row
-            for col_idx in range(1, 4):
-                total_cell = sheet.cell(row=row_idx, column=col_idx)
-                total_cell.font = Font(bold=True)
-                total_cell.border = Border(top=Side(style='thin'), bottom=Side(style='double'))
-        row_idx += 1
-    
-    # Format amount values with right alignment
-    row_idx = 14
-    while row_idx <= row_index:
-        for col_idx in [2, 3]:
-            cell = sheet.cell(row=row_idx, column=col_idx)
-            value = cell.value
-            if isinstance(value, str) and (value.replace('.', '').isdigit() or value == "0.00"):
-                cell.alignment = Alignment(horizontal='right')
-        row_idx += 1
-    
-    # Set column widths
-    sheet.column_dimensions['A'].width = 55
-    sheet.column_dimensions['B'].width = 15
-    sheet.column_dimensions['C'].width = 15
-    
-    # Add borders to the main table
-    for row_idx in range(9, row_index):
-        for col_idx in range(1, 4):
-            cell = sheet.cell(row=row_idx, column=col_idx)
-            existing_border = cell.border
-            
-            # Skip cells that already have special borders
-            if existing_border and (existing_border.bottom.style == 'double' or existing_border.bottom.style == 'thin'):
-                continue
-                
-            cell.border = Border(top=Side(style='thin'), bottom=Side(style='thin'), 
-                                left=Side(style='thin'), right=Side(style='thin'))
-
-# Create and populate the Sundry Creditors sheet
-sundry_creditors_sheet = wb.create_sheet("Sundry Creditors")
-populate_sundry_creditors_sheet(sundry_creditors_sheet, sundry_creditors_data)
-
-# Populate main sheets
-populate_sheet(balance_sheet, balance_sheet_data, True)
-populate_sheet(profit_loss, profit_loss_data, True)
-
-# Populate annexure sheets
-populate_annexure_sheet(annexure_b, annexure_b_data)
-
-# Get current directory
-current_dir = os.getcwd()
-file_path = os.path.join(current_dir, 'NANDHRA_FINANCIALS_WITH_ANNEXURES.xlsx')
-
-# Save the workbook with the full path
-try:
-    wb.save(file_path)
-    print(f"Excel file with annexures created successfully at: {file_path}")
-except Exception as e:
-    print(f"Error saving Excel file: {e}")
-    print("Current directory:", current_dir)
\ No newline at end of file
+            styles = ['boxed'] + ['boxed_amount' if is_amount(value) else 'boxed' for value in row[1:]]
+        sheet.append(row, styles)
+
+
+# Annexure B is filled twice: the combined layout, then the annexure
+# table written over it
+def populate_annexure_b_sheet(sheet):
+    populate_annexure_b_sheet_combined(sheet, annexure_b_data)
+    populate_annexure_sheet(sheet, annexure_b_data)
+
+# Note 15's annexure gets its bank balance subtotal formatted
+def populate_annexure_note15_sheet(sheet):
+    populate_annexure_to_note_sheet(sheet, annexure_to_note15_data)
+    format_note15_subtotal(sheet)
+
+# The workbook's sheets in order, each with the function filling it
+# (Share Capital and Note 10 are left empty). Sheets do not depend on
+# one another, so any of them can be built on their own (see
+# build_workbook)
+SHEETS = {
+    "Balance Sheet": lambda sheet: populate_sheet(sheet, balance_sheet_data, True),
+    "Profit and Loss": lambda sheet: populate_sheet(sheet, profit_loss_data, True),
+    "Cash Flow Statement": lambda sheet: populate_cash_flow_sheet(sheet, cash_flow_data),
+    "Fixed Assets": lambda sheet: populate_fixed_assets_sheet(sheet, fixed_assets_data_2022),
+    "Share Capital": None,
+    "Note 2": lambda sheet: populate_note2_sheet(sheet, note2_data),
+    "Note 3": lambda sheet: populate_note3_sheet(sheet, note3_data),
+    "Note 4": lambda sheet: populate_note4_sheet(sheet, note4_data),
+    "Note 5": lambda sheet: populate_note_sheet_generic(sheet, note5_data),
+    "Note 6": lambda sheet: populate_note_sheet_generic(sheet, note6_data),
+    "Note 7": lambda sheet: populate_note_sheet_generic(sheet, note7_data),
+    "Note 8": lambda sheet: populate_note_sheet_generic(sheet, note8_data),
+    "Note 9": lambda sheet: populate_note_sheet_generic(sheet, note9_data),
+    "Note 10": None,
+    "Note 11": lambda sheet: populate_note_sheet_enhanced(sheet, note11_data),
+    "Note 12": lambda sheet: populate_note_sheet_enhanced(sheet, note12_data),
+    "Note 13": lambda sheet: populate_note_sheet_enhanced(sheet, note13_data),
+    "Note 14": lambda sheet: populate_note_sheet_enhanced(sheet, note14_data),
+    "Note 15": lambda sheet: populate_note_sheet_enhanced(sheet, note15_data),
+    "Note 16": lambda sheet: populate_notes_16_17(sheet, note16_data),
+    "Note 17": lambda sheet: populate_notes_16_17(sheet, note17_data),
+    # Only Note 18 repeats the header
+    "Note 18": lambda sheet: populate_notes_18_to_20(sheet, note18_data, True),
+    "Note 19": lambda sheet: populate_notes_18_to_20(sheet, note19_data, False),
+    "Note 20": lambda sheet: populate_notes_18_to_20(sheet, note20_data, False),
+    "Note 21": lambda sheet: populate_notes_21_to_23(sheet, note21_data),
+    "Note 22": lambda sheet: populate_notes_21_to_23(sheet, note22_data),
+    "Note 23": lambda sheet: populate_notes_21_to_23(sheet, note23_data),
+    "Note 24": lambda sheet: populate_note24(sheet, note24_data),
+    "Annexure B": populate_annexure_b_sheet,
+    "Annexure to Note 4": lambda sheet: populate_annexure_sheet_with_header(sheet, annexure_to_note4_data, True),
+    "Annexure to Note 8": lambda sheet: populate_annexure_sheet_with_header(sheet, annexure_to_note8_data, False),
+    "Annexure to Note 11": lambda sheet: populate_annexure_to_note_sheet(sheet, annexure_to_note11_data),
+    "Annexure to Note 12": lambda sheet: populate_annexure_to_note12_sheet(sheet, annexure_to_note12_data),
+    "Annexure to Note 15": populate_annexure_note15_sheet,
+    "Annexure to Note 16": lambda sheet: populate_annexure_to_note16_sheet(sheet, annexure_to_note16_data),
+    "Employee Benefit Details": lambda sheet: populate_employee_benefit_details(sheet, employee_benefit_details_data),
+    "Sundry Creditors": lambda sheet: populate_sundry_creditors_sheet(sheet, sundry_creditors_data),
+}
+
+# Sheets streamed row by row (see StreamingSheet), with their column widths
+STREAMED_SHEETS = {
+    "Annexure to Note 16": {'A': 50, 'B': 25, 'C': 25},
+    "Sundry Creditors": {'A': 55, 'B': 15, 'C': 15},
+}
+
+# Function to build the workbook, or just the sheets named in ``titles``
+# (in workbook order), through the given writer backend (see
+# workbook_writer; WORKBOOK_BACKEND, else openpyxl, by default)
+def build_workbook(titles=None, backend=None):
+    wb = new_workbook(backend)
+    register_styles(wb)
+    wb.remove(wb.active)
+    for title, populate in SHEETS.items():
+        if titles is not None and title not in titles:
+            continue
+        if title in STREAMED_SHEETS:
+            sheet = StreamingSheet(wb, title, widths=STREAMED_SHEETS[title])
+        else:
+            sheet = wb.create_sheet(title)
+        if populate is not None:
+            populate(sheet)
+    return wb
+
+# Function run by the worker processes of a parallel build: save a
+# workbook of some of the sheets (see parallel_workbooks)
+def build_part(titles, filename, backend=None):
+    save_workbook(build_workbook(titles, backend), filename)
+
+
+if __name__ == "__main__":
+    # Get current directory
+    current_dir = os.getcwd()
+    file_path = os.path.join(current_dir, 'NANDHRA_FINANCIALS_WITH_ANNEXURES.xlsx')
+
+    # With WORKBOOK_WORKERS above 1 the sheets are built in that many
+    # worker processes and merged into the one file; experimental, the
+    # serial build is the default (see parallel_workbooks)
+    workers = resolve_workers()
+
+    # Save the workbook with the full path
+    try:
+        if workers > 1:
+            build_in_parallel(build_part, list(SHEETS), file_path, workers)
+        else:
+            save_workbook(build_workbook(), file_path)
+        print(f"Excel file with annexures created successfully at: {file_path}")
+    except Exception as e:
+        print(f"Error saving Excel file: {e}")
+        print("Current directory:", current_dir)
@@ -0,0 +1,112 @@
+import datetime
+import os
+import sys
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+from openpyxl.writer.excel import ExcelWriter
+
+# workbook_writer is shared with the other script folders (see ../shared)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+
+from workbook_writer import XlsxWriterWorkbook, XlsxWriterWorksheet, sheet_title  # noqa: E402
+
+
+class StreamingSheet:
+    """A worksheet written row by row, in order, straight to disk
+
+    Meant for long party-wise listings (creditors, annexures) in an
+    otherwise ordinary workbook. Each ``append`` serializes the row to the
+    sheet's temporary file at once, so memory stays the same however many
+    rows are written; nothing can be read back or restyled afterwards.
+
+    Column widths and merged ranges go in the sheet header and tail, so
+    they are given up front. Cells are styled by named style (see the
+    workbook's ``register_styles``). Save the workbook with
+    ``save_workbook`` from this module, not ``Workbook.save``.
+
+    In an ``XlsxWriterWorkbook`` (see workbook_writer) the sheet is one of
+    its streaming sheets, whose rows go straight to XlsxWriter.
+    """
+
+    def __init__(self, wb, title, widths=None, merges=()):
+        if isinstance(wb, XlsxWriterWorkbook):
+            self.ws = wb.create_streaming_sheet(title)
+            for ref in merges:
+                self.ws.merge_cells(ref)
+        else:
+            self.ws = WriteOnlyWorksheet(wb, sheet_title(title))
+            wb._add_sheet(self.ws)
+            for ref in merges:
+                self.ws.merged_cells.add(ref)
+        for column, width in (widths or {}).items():
+            self.ws.column_dimensions[column].width = width
+        self.rows_written = 0
+
+    @property
+    def title(self):
+        return self.ws.title
+
+    def append(self, values, styles=None):
+        """Write the next row
+
+        ``styles`` is a named style for the whole row, or one per value
+        (None leaves that cell unstyled).
+        """
+        if isinstance(self.ws, XlsxWriterWorksheet):
+            self.ws.append(values, styles)
+        elif styles is None:
+            self.ws.append(values)
+        else:
+            if isinstance(styles, str):
+                styles = [styles] * len(values)
+            row = []
+            for value, style in zip(values, styles):
+                if style is None:
+                    row.append(value)
+                else:
+                    cell = WriteOnlyCell(self.ws, value)
+                    cell.style = style
+                    row.append(cell)
+            self.ws.append(row)
+        self.rows_written += 1
+
+
+class _ExcelWriter(ExcelWriter):
+    """ExcelWriter for a workbook mixing ordinary and write-only sheets
+
+    openpyxl only writes write-only sheets in an all write-only workbook,
+    so this reaches into its internals as that code path does; the version
+    is capped in ../shared/requirements.txt and tests/ round-trip a
+    workbook through ``load_workbook``.
+    """
+
+    def write_worksheet(self, ws):
+        if not isinstance(ws, WriteOnlyWorksheet):
+            return super().write_worksheet(ws)
+
+        # As ExcelWriter does for a write-only workbook
+        ws._drawing = SpreadsheetDrawing()
+        ws._drawing.charts = ws._charts
+        ws._drawing.images = ws._images
+        if not ws.closed:
+            ws.close()
+        writer = ws._writer
+        ws._rels = writer._rels
+        self._archive.write(writer.out, ws.path[1:])
+        self.manifest.append(ws)
+        writer.cleanup()
+
+
+def save_workbook(wb, filename):
+    """Save a workbook that may hold ``StreamingSheet`` sheets"""
+    if isinstance(wb, XlsxWriterWorkbook):
+        wb.save(filename)
+        return
+    archive = ZipFile(filename, "w", ZIP_DEFLATED, allowZip64=True)
+    wb.properties.modified = datetime.datetime.now(
+        tz=datetime.timezone.utc
+    ).replace(tzinfo=None)
+    _ExcelWriter(wb, archive).save()
@@ -0,0 +1,47 @@
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font, NamedStyle
+
+from streaming_sheets import StreamingSheet, save_workbook
+
+ROWS = [
+    ("Creditor", "Amount"),
+    ("Acme Traders", 1250.5),
+    ("Bharat Steel", -300),
+    ("Nil balance", None),
+]
+
+
+def build(path):
+    wb = Workbook()
+    wb.active.title = "Balance Sheet"
+    wb.active["A1"] = "Ordinary sheet"
+    wb.add_named_style(NamedStyle(name="heading", font=Font(bold=True)))
+
+    sheet = StreamingSheet(
+        wb, "Creditors", widths={"A": 40, "B": 15}, merges=["A10:B10"]
+    )
+    sheet.append(ROWS[0], "heading")
+    for row in ROWS[1:]:
+        sheet.append(row, [None, None])
+    save_workbook(wb, path)
+    return sheet
+
+
+def test_streamed_sheet_round_trips_through_load_workbook(tmp_path):
+    path = tmp_path / "streamed.xlsx"
+    sheet = build(path)
+    assert sheet.rows_written == len(ROWS)
+
+    wb = load_workbook(path)
+    assert wb.sheetnames == ["Balance Sheet", "Creditors"]
+    assert wb["Balance Sheet"]["A1"].value == "Ordinary sheet"
+
+    ws = wb["Creditors"]
+    rows = ws.iter_rows(max_row=len(ROWS), values_only=True)
+    assert [tuple(row) for row in rows] == ROWS
+    assert ws["A1"].style == "heading"
+    assert ws["A1"].font.bold
+    assert ws["A2"].style == "Normal"
+    assert ws.column_dimensions["A"].width == 40
+    assert ws.column_dimensions["B"].width == 15
+    assert [str(r) for r in ws.merged_cells.ranges] == ["A10:B10"]
@@ -1,62 +1,85 @@
-import openpyxl
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+import os
+import sys
+
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils import get_column_letter
 
-def create_financial_statements_excel():
+# parallel_workbooks and workbook_writer are shared with the other script
+# folders (see ../shared)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+
+from parallel_workbooks import build_in_parallel, resolve_workers  # noqa: E402
+from workbook_writer import new_workbook  # noqa: E402
+
+# Cell styles, registered once per workbook as named styles (see
+# register_styles) and assigned to cells by name
+CELL_STYLES = {
+    'title': dict(font=Font(bold=True, size=14), alignment=Alignment(horizontal='center')),
+    'subtitle': dict(font=Font(bold=True, size=12), alignment=Alignment(horizontal='center')),
+    'centered': dict(font=DEFAULT_FONT, alignment=Alignment(horizontal='center')),
+    'heading': dict(font=Font(bold=True), alignment=Alignment(horizontal='center')),
+    'column_header': dict(
+        font=Font(bold=True),
+        alignment=Alignment(wrap_text=True, vertical="center", horizontal="center"),
+    ),
+    'bold': dict(font=Font(bold=True)),
+}
+
+
+def register_styles(wb):
+    """Add CELL_STYLES to the workbook as named styles"""
+    existing = set(wb.named_styles)
+    for name, attributes in CELL_STYLES.items():
+        if name not in existing:
+            wb.add_named_style(NamedStyle(name=name, **attributes))
+
+
+def create_financial_statements_excel(backend=None, workers=None):
     """
     Creates a complete Excel workbook with all financial statements
     from the SA Infrastructure PDF.
+
+    ``backend`` is the workbook writer to save it with, "openpyxl" or
+    "xlsxwriter" (see workbook_writer); by default WORKBOOK_BACKEND, else
+    openpyxl. With ``workers`` (by default WORKBOOK_WORKERS, else 1) above
+    1 the sheets are built in that many worker processes and merged into
+    the one file (see parallel_workbooks). The parallel build is
+    experimental; serial is the default. Returns the saved file's path
+    either way.
     """
+    filename = 'SA_Infrastructure_Financial_Statements_March_2024.xlsx'
+    workers = resolve_workers(workers)
+    if workers > 1:
+        build_in_parallel(build_part, range(len(SHEET_BUILDERS)), filename,
+                          workers, backend=backend)
+    else:
+        wb = build_workbook(SHEET_BUILDERS, backend)
+        # Save the workbook
+        wb.save(filename)
+    return filename
+
+def build_workbook(builders, backend=None):
+    """A workbook of the sheets the given ``SHEET_BUILDERS`` create, in order"""
     # Create a new Excel workbook
-    wb = openpyxl.Workbook()
+    wb = new_workbook(backend)
+    register_styles(wb)
     
     # Remove the default sheet
     default_sheet = wb.active
     wb.remove(default_sheet)
-    
-    # Create main financial statement sheets
-    create_balance_sheet(wb)
-    create_manufacturing_account(wb)
-    create_trading_account(wb)
-    create_profit_loss_account(wb)
-    
-    # Create schedules
-    create_capital_account(wb)  # Schedule 1
-    create_secured_loans(wb)    # Schedule 2
-    create_unsecured_loans(wb)  # Schedule 3
-    create_working_capital(wb)  # Schedule 4
-    create_agriculture_credit(wb)  # Schedule 4A
-    create_trade_payables(wb)   # Schedule 5
-    create_provisions(wb)       # Schedule 6
-    create_advance_against_land(wb)  # Schedule 6A
-    create_advance_against_sales(wb)  # Schedule 6B
-    create_fixed_assets(wb)     # Schedule 7
-    create_fixed_assets_mfg(wb) # Schedule 7A
-    create_investments(wb)      # Schedule 8
-    create_long_term_loans(wb)  # Schedule 9
-    create_deposits(wb)         # Schedule 10
-    create_trade_receivables(wb)  # Schedule 11
-    create_trade_receivables_assets(wb)  # Schedule 12
-    create_duties_and_taxes(wb)  # Schedule 13
-    create_short_term_loans(wb)  # Schedule 14
-    create_advances_against_purchase(wb)  # Schedule 14A
-    create_cash_and_bank(wb)    # Schedule 15
-    create_direct_expenses(wb)  # Schedule 16
-    create_gross_receipt(wb)    # Schedule 17
-    create_purchase(wb)         # Schedule 18
-    create_indirect_income(wb)  # Schedule 19
-    create_indirect_expenses(wb)  # Schedule 20
-    create_finance_expenses(wb)  # Schedule 21
-    
-    # Create annexures
-    create_agriculture_account(wb)  # Annexure 1
-    create_land_account(wb)     # Annexure 2
-    
-    # Save the workbook
-    wb.save('SA_Infrastructure_Financial_Statements_March_2024.xlsx')
-    print("Excel file created successfully!")
+
+    for create_sheet in builders:
+        create_sheet(wb)
     return wb
 
+def build_part(indexes, filename, backend=None):
+    """Save the sheets of ``SHEET_BUILDERS`` at ``indexes`` to ``filename``
+
+    Run in the worker processes of a parallel build.
+    """
+    build_workbook([SHEET_BUILDERS[i] for i in indexes], backend).save(filename)
+
 def apply_header_style(ws, title):
     """Apply standard header styling to a worksheet."""
     # Set column widths
@@ -70,17 +93,15 @@ def apply_header_style(ws, title):
     # Add title
     ws.merge_cells('A1:F1')
     ws['A1'] = "M/s SA Infrastructure Prop. Saiyyed Afsar Ali (PAN No. AZGPS7572J)"
-    ws['A1'].font = Font(bold=True, size=14)
-    ws['A1'].alignment = Alignment(horizontal='center')
+    ws['A1'].style = 'title'
     
     ws.merge_cells('A2:F2')
     ws['A2'] = "16/10, Rehmat Nagar, Ratlam (M.P.)-457001"
-    ws['A2'].alignment = Alignment(horizontal='center')
+    ws['A2'].style = 'centered'
     
     ws.merge_cells('A3:F3')
     ws['A3'] = title
-    ws['A3'].font = Font(bold=True, size=12)
-    ws['A3'].alignment = Alignment(horizontal='center')
+    ws['A3'].style = 'subtitle'
 
 def apply_footer(ws, start_row):
     """Apply standard footer to a worksheet."""
@@ -134,7 +155,7 @@ def create_balance_sheet(wb):
     ws['E5'] = "Sch. No."
     ws['F5'] = "Amount (Rs.)"
     for cell in ['A5', 'B5', 'C5', 'D5', 'E5', 'F5']:
-        ws[cell].font = Font(bold=True)
+        ws[cell].style = 'bold'
     
     # Add Liabilities data
     liabilities_data = [
@@ -184,9 +205,9 @@ def create_balance_sheet(wb):
         ws[f'B{i}'] = sch_no
         ws[f'C{i}'] = amount
         if "Total" in name or name in ["Proprietor's Fund", "Non Current Liabilities", "Current Liabilites"]:
-            ws[f'A{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
         if "Total" in name:
-            ws[f'C{i}'].font = Font(bold=True)
+            ws[f'C{i}'].style = 'bold'
     
     # Write Assets data
     for i, (name, sch_no, amount) in enumerate(assets_data, start=6):
@@ -194,9 +215,9 @@ def create_balance_sheet(wb):
         ws[f'E{i}'] = sch_no
         ws[f'F{i}'] = amount
         if "Total" in name or name in ["Non Current Assets", "Current Assets"]:
-            ws[f'D{i}'].font = Font(bold=True)
+            ws[f'D{i}'].style = 'bold'
         if "Total" in name:
-            ws[f'F{i}'].font = Font(bold=True)
+            ws[f'F{i}'].style = 'bold'
     
     # Add footer
     apply_footer(ws, 23)
@@ -209,10 +230,8 @@ def create_manufacturing_account(wb):
     # Add headers
     ws['A5'] = "Dr"
     ws['D5'] = "Cr"
-    ws['A5'].alignment = Alignment(horizontal='center')
-    ws['D5'].alignment = Alignment(horizontal='center')
-    ws['A5'].font = Font(bold=True)
-    ws['D5'].font = Font(bold=True)
+    ws['A5'].style = 'heading'
+    ws['D5'].style = 'heading'
     
     ws['A6'] = "Particulars"
     ws['B6'] = "Sch. No."
@@ -221,7 +240,7 @@ def create_manufacturing_account(wb):
     ws['E6'] = "Sch. No."
     ws['F6'] = "Amount (Rs.)"
     for cell in ['A6', 'B6', 'C6', 'D6', 'E6', 'F6']:
-        ws[cell].font = Font(bold=True)
+        ws[cell].style = 'bold'
     
     # Add data
     dr_data = [
@@ -246,8 +265,8 @@ def create_manufacturing_account(wb):
         ws[f'B{i}'] = sch_no
         ws[f'C{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'C{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'C{i}'].style = 'bold'
     
     # Write Cr data
     for i, (name, sch_no, amount) in enumerate(cr_data, start=7):
@@ -255,8 +274,8 @@ def create_manufacturing_account(wb):
         ws[f'E{i}'] = sch_no
         ws[f'F{i}'] = amount
         if "Total" in name:
-            ws[f'D{i}'].font = Font(bold=True)
-            ws[f'F{i}'].font = Font(bold=True)
+            ws[f'D{i}'].style = 'bold'
+            ws[f'F{i}'].style = 'bold'
     
     # Add footer
     apply_footer(ws, 13)
@@ -269,10 +288,8 @@ def create_trading_account(wb):
     # Add headers
     ws['A5'] = "Dr"
     ws['D5'] = "Cr"
-    ws['A5'].alignment = Alignment(horizontal='center')
-    ws['D5'].alignment = Alignment(horizontal='center')
-    ws['A5'].font = Font(bold=True)
-    ws['D5'].font = Font(bold=True)
+    ws['A5'].style = 'heading'
+    ws['D5'].style = 'heading'
     
     ws['A6'] = "Particulars"
     ws['B6'] = "Sch. No."
@@ -281,7 +298,7 @@ def create_trading_account(wb):
     ws['E6'] = "Sch. No."
     ws['F6'] = "Amount (Rs.)"
     for cell in ['A6', 'B6', 'C6', 'D6', 'E6', 'F6']:
-        ws[cell].font = Font(bold=True)
+        ws[cell].style = 'bold'
     
     # Add data
     dr_data = [
@@ -308,8 +325,8 @@ def create_trading_account(wb):
         ws[f'B{i}'] = sch_no
         ws[f'C{i}'] = amount
         if "Total" in name or "Gross Profit" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'C{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'C{i}'].style = 'bold'
     
     # Write Cr data
     for i, (name, sch_no, amount) in enumerate(cr_data, start=7):
@@ -317,8 +334,8 @@ def create_trading_account(wb):
         ws[f'E{i}'] = sch_no
         ws[f'F{i}'] = amount
         if "Total" in name:
-            ws[f'D{i}'].font = Font(bold=True)
-            ws[f'F{i}'].font = Font(bold=True)
+            ws[f'D{i}'].style = 'bold'
+            ws[f'F{i}'].style = 'bold'
     
     # Add footer
     apply_footer(ws, 14)
@@ -331,10 +348,8 @@ def create_profit_loss_account(wb):
     # Add headers
     ws['A5'] = "Dr"
     ws['D5'] = "Cr"
-    ws['A5'].alignment = Alignment(horizontal='center')
-    ws['D5'].alignment = Alignment(horizontal='center')
-    ws['A5'].font = Font(bold=True)
-    ws['D5'].font = Font(bold=True)
+    ws['A5'].style = 'heading'
+    ws['D5'].style = 'heading'
     
     ws['A6'] = "Particulars"
     ws['B6'] = "Sch. No."
@@ -343,7 +358,7 @@ def create_profit_loss_account(wb):
     ws['E6'] = "Sch. No."
     ws['F6'] = "Amount (Rs.)"
     for cell in ['A6', 'B6', 'C6', 'D6', 'E6', 'F6']:
-        ws[cell].font = Font(bold=True)
+        ws[cell].style = 'bold'
     
     # Add data
     dr_data = [
@@ -372,12 +387,12 @@ def create_profit_loss_account(wb):
         ws[f'B{i}'] = sch_no
         ws[f'C{i}'] = amount
         if "To Indirect Expenses" in name:
-            ws[f'A{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
         if "Net Profit" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'C{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'C{i}'].style = 'bold'
         if i == 13:  # Total row
-            ws[f'C{i}'].font = Font(bold=True)
+            ws[f'C{i}'].style = 'bold'
     
     # Write Cr data
     for i, (name, sch_no, amount) in enumerate(cr_data, start=7):
@@ -385,10 +400,10 @@ def create_profit_loss_account(wb):
         ws[f'E{i}'] = sch_no
         ws[f'F{i}'] = amount
         if "Gross Profit" in name:
-            ws[f'D{i}'].font = Font(bold=True)
-            ws[f'F{i}'].font = Font(bold=True)
+            ws[f'D{i}'].style = 'bold'
+            ws[f'F{i}'].style = 'bold'
         if i == 13:  # Total row
-            ws[f'F{i}'].font = Font(bold=True)
+            ws[f'F{i}'].style = 'bold'
     
     # Add footer
     apply_footer(ws, 15)
@@ -402,24 +417,22 @@ def create_schedule_header(ws, schedule_num, title):
     # Add title
     ws.merge_cells('A1:B1')
     ws['A1'] = "M/s SA Infrastructure Prop. Saiyyed Afsar Ali (PAN No. AZGPS7572J)"
-    ws['A1'].font = Font(bold=True, size=14)
-    ws['A1'].alignment = Alignment(horizontal='center')
+    ws['A1'].style = 'title'
     
     ws.merge_cells('A2:B2')
     ws['A2'] = "16/10, Rehmat Nagar, Ratlam (M.P.)-457001"
-    ws['A2'].alignment = Alignment(horizontal='center')
+    ws['A2'].style = 'centered'
     
     ws.merge_cells('A3:B3')
     ws['A3'] = "Schedule Forming Part of Balance Sheet as at 31st March 2024"
-    ws['A3'].font = Font(bold=True, size=12)
-    ws['A3'].alignment = Alignment(horizontal='center')
+    ws['A3'].style = 'subtitle'
     
     # Add schedule number and title
     ws['A5'] = f"Schedule No. {schedule_num}"
-    ws['A5'].font = Font(bold=True)
+    ws['A5'].style = 'bold'
     
     ws['A6'] = title
-    ws['A6'].font = Font(bold=True)
+    ws['A6'].style = 'bold'
 
 def create_capital_account(wb):
     """Create Schedule 1 - Capital Account."""
@@ -434,26 +447,24 @@ def create_capital_account(wb):
     # Add title
     ws.merge_cells('A1:D1')
     ws['A1'] = "M/s SA Infrastructure Prop. Saiyyed Afsar Ali (PAN No. AZGPS7572J)"
-    ws['A1'].font = Font(bold=True, size=14)
-    ws['A1'].alignment = Alignment(horizontal='center')
+    ws['A1'].style = 'title'
     
     ws.merge_cells('A2:D2')
     ws['A2'] = "16/10, Rehmat Nagar, Ratlam (M.P.)-457001"
-    ws['A2'].alignment = Alignment(horizontal='center')
+    ws['A2'].style = 'centered'
     
     ws.merge_cells('A3:D3')
     ws['A3'] = "Schedule Forming Part of Balance Sheet as at 31st March 2024"
-    ws['A3'].font = Font(bold=True, size=12)
-    ws['A3'].alignment = Alignment(horizontal='center')
+    ws['A3'].style = 'subtitle'
     
     # Add schedule number and title
     ws.merge_cells('A5:D5')
     ws['A5'] = "Schedule No. 1"
-    ws['A5'].font = Font(bold=True)
+    ws['A5'].style = 'bold'
     
     ws.merge_cells('A6:D6')
     ws['A6'] = "Capital Account of Proprietor Saiyyed Afsar Ali"
-    ws['A6'].font = Font(bold=True)
+    ws['A6'].style = 'bold'
     
     # Add column headers
     ws['A8'] = "Particulars"
@@ -462,7 +473,7 @@ def create_capital_account(wb):
     ws['D8'] = "Amount (Rs.)"
     
     for cell in ['A8', 'B8', 'C8', 'D8']:
-        ws[cell].font = Font(bold=True)
+        ws[cell].style = 'bold'
     
     # Add data
     dr_data = [
@@ -500,8 +511,8 @@ def create_capital_account(wb):
     # Add total row
     ws['B17'] = "172,583,795"
     ws['D17'] = "172,583,795"
-    ws['B17'].font = Font(bold=True)
-    ws['D17'].font = Font(bold=True)
+    ws['B17'].style = 'bold'
+    ws['D17'].style = 'bold'
 
 def create_secured_loans(wb):
     """Create Schedule 2 - Secured Loans."""
@@ -511,8 +522,8 @@ def create_secured_loans(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add secured loans data
     loans_data = [
@@ -541,8 +552,8 @@ def create_secured_loans(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_unsecured_loans(wb):
     """Create Schedule 3 - Unsecured Loans."""
@@ -552,8 +563,8 @@ def create_unsecured_loans(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add unsecured loans data
     loans_data = [
@@ -583,8 +594,8 @@ def create_unsecured_loans(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "TOTAL" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_working_capital(wb):
     """Create Schedule 4 - Working Capital Loan."""
@@ -594,8 +605,8 @@ def create_working_capital(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     loans_data = [
@@ -609,8 +620,8 @@ def create_working_capital(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "TOTAL" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_agriculture_credit(wb):
     """Create Schedule 4A - Agriculture Credit Overdraft."""
@@ -620,8 +631,8 @@ def create_agriculture_credit(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     loans_data = [
@@ -636,8 +647,8 @@ def create_agriculture_credit(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_trade_payables(wb):
     """Create Schedule 5 - Trade Payables."""
@@ -647,8 +658,8 @@ def create_trade_payables(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     payables_data = [
@@ -689,8 +700,8 @@ def create_trade_payables(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_provisions(wb):
     """Create Schedule 6 - Provisions."""
@@ -700,8 +711,8 @@ def create_provisions(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     provisions_data = [
@@ -719,8 +730,8 @@ def create_provisions(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_advance_against_land(wb):
     """Create Schedule 6A - Advance against land."""
@@ -730,8 +741,8 @@ def create_advance_against_land(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -744,8 +755,8 @@ def create_advance_against_land(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_advance_against_sales(wb):
     """Create Schedule 6B - Advance against Sales."""
@@ -755,8 +766,8 @@ def create_advance_against_sales(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -773,8 +784,8 @@ def create_advance_against_sales(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_fixed_assets(wb):
     """Create Schedule 7 - Fixed Assets."""
@@ -791,24 +802,22 @@ def create_fixed_assets(wb):
     # Add title
     ws.merge_cells('A1:I1')
     ws['A1'] = "M/s SA Infrastructure Prop. Saiyyed Afsar Ali (PAN No. AZGPS7572J)"
-    ws['A1'].font = Font(bold=True, size=14)
-    ws['A1'].alignment = Alignment(horizontal='center')
+    ws['A1'].style = 'title'
     
     ws.merge_cells('A2:I2')
     ws['A2'] = "16/10, Rehmat Nagar, Ratlam (M.P.)-457001"
-    ws['A2'].alignment = Alignment(horizontal='center')
+    ws['A2'].style = 'centered'
     
     ws.merge_cells('A3:I3')
     ws['A3'] = "Schedule Forming Part of Balance Sheet as at 31st March 2024"
-    ws['A3'].font = Font(bold=True, size=12)
-    ws['A3'].alignment = Alignment(horizontal='center')
+    ws['A3'].style = 'subtitle'
     
     # Add schedule title
     ws['A4'] = "Schedule No. 7"
-    ws['A4'].font = Font(bold=True)
+    ws['A4'].style = 'bold'
     
     ws['A5'] = "Fixed Assets"
-    ws['A5'].font = Font(bold=True)
+    ws['A5'].style = 'bold'
     
     # Add complex headers for fixed assets table
     headers = [
@@ -826,8 +835,7 @@ def create_fixed_assets(wb):
     for i, header in enumerate(headers, start=1):
         col_letter = get_column_letter(i)
         ws[f'{col_letter}7'] = header
-        ws[f'{col_letter}7'].font = Font(bold=True)
-        ws[f'{col_letter}7'].alignment = Alignment(wrap_text=True, vertical="center", horizontal="center")
+        ws[f'{col_letter}7'].style = 'column_header'
     
     # Set row height for header row
     ws.row_dimensions[7].height = 40
@@ -878,12 +886,12 @@ def create_fixed_assets(wb):
         # Apply bold formatting to category headers and total row
         if row_data[0] in ["Land and Property", "Plant and Machinery @ 15 %", "Vehical- Depreciation @ 15%", 
                            "Furniture and Fixtures @ 10%", "Computer @ 40%", "Total"]:
-            ws[f'A{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
             if row_data[0] == "Total":
                 for j in range(2, 10):
                     col_letter = get_column_letter(j)
                     if i < len(asset_data) + 8 and j-2 < len(row_data):
-                        ws[f'{col_letter}{i}'].font = Font(bold=True)
+                        ws[f'{col_letter}{i}'].style = 'bold'
     
     # Add footer
     row_num = len(asset_data) + 10
@@ -938,24 +946,22 @@ def create_fixed_assets_mfg(wb):
     # Add title
     ws.merge_cells('A1:I1')
     ws['A1'] = "M/s SA Infrastructure Prop. Saiyyed Afsar Ali (PAN No. AZGPS7572J)"
-    ws['A1'].font = Font(bold=True, size=14)
-    ws['A1'].alignment = Alignment(horizontal='center')
+    ws['A1'].style = 'title'
     
     ws.merge_cells('A2:I2')
     ws['A2'] = "16/10, Rehmat Nagar, Ratlam (M.P.)-457001"
-    ws['A2'].alignment = Alignment(horizontal='center')
+    ws['A2'].style = 'centered'
     
     ws.merge_cells('A3:I3')
     ws['A3'] = "Schedule Forming Part of Balance Sheet as at 31st March 2024"
-    ws['A3'].font = Font(bold=True, size=12)
-    ws['A3'].alignment = Alignment(horizontal='center')
+    ws['A3'].style = 'subtitle'
     
     # Add schedule title
     ws['A4'] = "Schedule No. 7(A)"
-    ws['A4'].font = Font(bold=True)
+    ws['A4'].style = 'bold'
     
     ws['A5'] = "Fixed Assets (Manufacturing)"
-    ws['A5'].font = Font(bold=True)
+    ws['A5'].style = 'bold'
     
     # Add complex headers for fixed assets table
     headers = [
@@ -973,8 +979,7 @@ def create_fixed_assets_mfg(wb):
     for i, header in enumerate(headers, start=1):
         col_letter = get_column_letter(i)
         ws[f'{col_letter}7'] = header
-        ws[f'{col_letter}7'].font = Font(bold=True)
-        ws[f'{col_letter}7'].alignment = Alignment(wrap_text=True, vertical="center", horizontal="center")
+        ws[f'{col_letter}7'].style = 'column_header'
     
     # Set row height for header row
     ws.row_dimensions[7].height = 40
@@ -1003,12 +1008,12 @@ def create_fixed_assets_mfg(wb):
         
         # Apply bold formatting to category headers and total row
         if row_data[0] in ["Plant and Machinery @ 15 %", "Total"]:
-            ws[f'A{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
             if row_data[0] == "Total":
                 for j in range(2, 10):
                     col_letter = get_column_letter(j)
                     if j-2 < len(row_data):
-                        ws[f'{col_letter}{i}'].font = Font(bold=True)
+                        ws[f'{col_letter}{i}'].style = 'bold'
     
     # Add footer
     row_num = len(asset_data) + 10
@@ -1056,8 +1061,8 @@ def create_investments(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1074,8 +1079,8 @@ def create_investments(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_long_term_loans(wb):
     """Create Schedule 9 - Long Term Loan and Advances."""
@@ -1085,8 +1090,8 @@ def create_long_term_loans(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1101,8 +1106,8 @@ def create_long_term_loans(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_deposits(wb):
     """Create Schedule 10 - Deposits."""
@@ -1112,8 +1117,8 @@ def create_deposits(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1128,9 +1133,9 @@ def create_deposits(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name or "Security Deposits (Long Term)" in name:
-            ws[f'A{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
         if "Total" in name:
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'B{i}'].style = 'bold'
 
 def create_trade_receivables(wb):
     """Create Schedule 11 - Trade Receivables."""
@@ -1140,8 +1145,8 @@ def create_trade_receivables(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1167,8 +1172,8 @@ def create_trade_receivables(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_trade_receivables_assets(wb):
     """Create Schedule 12 - Trade Receivables for Assets."""
@@ -1178,8 +1183,8 @@ def create_trade_receivables_assets(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1193,8 +1198,8 @@ def create_trade_receivables_assets(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_duties_and_taxes(wb):
     """Create Schedule 13 - Duties and Taxes."""
@@ -1204,8 +1209,8 @@ def create_duties_and_taxes(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1220,8 +1225,8 @@ def create_duties_and_taxes(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_short_term_loans(wb):
     """Create Schedule 14 - Short Term Loan and Advances."""
@@ -1231,8 +1236,8 @@ def create_short_term_loans(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1245,8 +1250,8 @@ def create_short_term_loans(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_advances_against_purchase(wb):
     """Create Schedule 14A - Advances against purchase."""
@@ -1256,8 +1261,8 @@ def create_advances_against_purchase(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1277,8 +1282,8 @@ def create_advances_against_purchase(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_cash_and_bank(wb):
     """Create Schedule 15 - Cash and Bank Balance."""
@@ -1288,8 +1293,8 @@ def create_cash_and_bank(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1306,9 +1311,9 @@ def create_cash_and_bank(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name or "Bank Accounts" in name:
-            ws[f'A{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
         if "Total" in name:
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'B{i}'].style = 'bold'
 
 def create_direct_expenses(wb):
     """Create Schedule 16 - Direct Expenses."""
@@ -1318,8 +1323,8 @@ def create_direct_expenses(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1343,8 +1348,8 @@ def create_direct_expenses(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_gross_receipt(wb):
     """Create Schedule 17 - Gross Receipt."""
@@ -1354,8 +1359,8 @@ def create_gross_receipt(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1372,8 +1377,8 @@ def create_gross_receipt(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_purchase(wb):
     """Create Schedule 18 - Purchase."""
@@ -1383,8 +1388,8 @@ def create_purchase(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1400,8 +1405,8 @@ def create_purchase(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_indirect_income(wb):
     """Create Schedule 19 - Indirect Income."""
@@ -1411,8 +1416,8 @@ def create_indirect_income(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1431,8 +1436,8 @@ def create_indirect_income(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_indirect_expenses(wb):
     """Create Schedule 20 - Indirect Expenses."""
@@ -1442,8 +1447,8 @@ def create_indirect_expenses(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1479,8 +1484,8 @@ def create_indirect_expenses(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
 
 def create_finance_expenses(wb):
     """Create Schedule 21 - Finance and Bank expenses."""
@@ -1490,8 +1495,8 @@ def create_finance_expenses(wb):
     # Add column headers
     ws['A8'] = "Particulars"
     ws['B8'] = "Amount (Rs.)"
-    ws['A8'].font = Font(bold=True)
-    ws['B8'].font = Font(bold=True)
+    ws['A8'].style = 'bold'
+    ws['B8'].style = 'bold'
     
     # Add data
     data = [
@@ -1514,8 +1519,8 @@ def create_finance_expenses(wb):
         ws[f'A{i}'] = name
         ws[f'B{i}'] = amount
         if "Total" in name:
-            ws[f'A{i}'].font = Font(bold=True)
-            ws[f'B{i}'].font = Font(bold=True)
+            ws[f'A{i}'].style = 'bold'
+            ws[f'B{i}'].style = 'bold'
     
     # Add standard footer
     ws.merge_cells('A22:B22')
@@ -1567,26 +1572,24 @@ def create_agriculture_account(wb):
     # Add title
     ws.merge_cells('A1:D1')
     ws['A1'] = "M/s SA Infrastructure Prop. Saiyyed Afsar Ali (PAN No. AZGPS7572J)"
-    ws['A1'].font = Font(bold=True, size=14)
-    ws['A1'].alignment = Alignment(horizontal='center')
+    ws['A1'].style = 'title'
     
     ws.merge_cells('A2:D2')
     ws['A2'] = "16/10, Rehmat Nagar, Ratlam (M.P.)-457001"
-    ws['A2'].alignment = Alignment(horizontal='center')
+    ws['A2'].style = 'centered'
     
     ws.merge_cells('A3:D3')
     ws['A3'] = "Annexures Forming Part of Balance Sheet as at 31st March 2024"
-    ws['A3'].font = Font(bold=True, size=12)
-    ws['A3'].alignment = Alignment(horizontal='center')
+    ws['A3'].style = 'subtitle'
     
     # Add annexure title
     ws.merge_cells('A5:D5')
     ws['A5'] = "Annexure-1"
-    ws['A5'].font = Font(bold=True)
+    ws['A5'].style = 'bold'
     
     ws.merge_cells('A6:D6')
     ws['A6'] = "Agriculture A/c"
-    ws['A6'].font = Font(bold=True)
+    ws['A6'].style = 'bold'
     
     # Add column headers
     ws['A8'] = "Particulars"
@@ -1595,7 +1598,7 @@ def create_agriculture_account(wb):
     ws['D8'] = "Amount (Rs.)"
     
     for cell in ['A8', 'B8', 'C8', 'D8']:
-        ws[cell].font = Font(bold=True)
+        ws[cell].style = 'bold'
     
     # Add data
     dr_data = [
@@ -1627,8 +1630,8 @@ def create_agriculture_account(wb):
     # Add total row
     ws['B14'] = "1,580,960"
     ws['D14'] = "1,580,960"
-    ws['B14'].font = Font(bold=True)
-    ws['D14'].font = Font(bold=True)
+    ws['B14'].style = 'bold'
+    ws['D14'].style = 'bold'
     
     # Add standard footer
     ws.merge_cells('A16:B16')
@@ -1680,26 +1683,24 @@ def create_land_account(wb):
     # Add title
     ws.merge_cells('A1:D1')
     ws['A1'] = "M/s SA Infrastructure Prop. Saiyyed Afsar Ali (PAN No. AZGPS7572J)"
-    ws['A1'].font = Font(bold=True, size=14)
-    ws['A1'].alignment = Alignment(horizontal='center')
+    ws['A1'].style = 'title'
     
     ws.merge_cells('A2:D2')
     ws['A2'] = "16/10, Rehmat Nagar, Ratlam (M.P.)-457001"
-    ws['A2'].alignment = Alignment(horizontal='center')
+    ws['A2'].style = 'centered'
     
     ws.merge_cells('A3:D3')
     ws['A3'] = "Annexures Forming Part of Balance Sheet as at 31st March 2024"
-    ws['A3'].font = Font(bold=True, size=12)
-    ws['A3'].alignment = Alignment(horizontal='center')
+    ws['A3'].style = 'subtitle'
     
     # Add annexure title
     ws.merge_cells('A5:D5')
     ws['A5'] = "Annexure-2"
-    ws['A5'].font = Font(bold=True)
+    ws['A5'].style = 'bold'
     
     ws.merge_cells('A6:D6')
     ws['A6'] = "Land (168/31) Account A/c"
-    ws['A6'].font = Font(bold=True)
+    ws['A6'].style = 'bold'
     
     # Add column headers
     ws['A8'] = "Particulars"
@@ -1708,7 +1709,7 @@ def create_land_account(wb):
     ws['D8'] = "Amount (Rs.)"
     
     for cell in ['A8', 'B8', 'C8', 'D8']:
-        ws[cell].font = Font(bold=True)
+        ws[cell].style = 'bold'
     
     # Add data
     dr_data = [
@@ -1744,8 +1745,8 @@ def create_land_account(wb):
     
     ws['B16'] = "2,736,198"
     ws['D16'] = "2,736,198"
-    ws['B16'].font = Font(bold=True)
-    ws['D16'].font = Font(bold=True)
+    ws['B16'].style = 'bold'
+    ws['D16'].style = 'bold'
     
     # Add standard footer
     ws.merge_cells('A18:B18')
@@ -1784,6 +1785,47 @@ def create_land_account(wb):
     ws.merge_cells('A29:B29')
     ws['A29'] = "Place- Ratlam"
 
+# The functions creating the workbook's sheets, in order. Each creates
+# one sheet on its own, so any of them can be built apart from the rest
+SHEET_BUILDERS = [
+    # Main financial statements
+    create_balance_sheet,
+    create_manufacturing_account,
+    create_trading_account,
+    create_profit_loss_account,
+    # Schedules
+    create_capital_account,  # Schedule 1
+    create_secured_loans,  # Schedule 2
+    create_unsecured_loans,  # Schedule 3
+    create_working_capital,  # Schedule 4
+    create_agriculture_credit,  # Schedule 4A
+    create_trade_payables,  # Schedule 5
+    create_provisions,  # Schedule 6
+    create_advance_against_land,  # Schedule 6A
+    create_advance_against_sales,  # Schedule 6B
+    create_fixed_assets,  # Schedule 7
+    create_fixed_assets_mfg,  # Schedule 7A
+    create_investments,  # Schedule 8
+    create_long_term_loans,  # Schedule 9
+    create_deposits,  # Schedule 10
+    create_trade_receivables,  # Schedule 11
+    create_trade_receivables_assets,  # Schedule 12
+    create_duties_and_taxes,  # Schedule 13
+    create_short_term_loans,  # Schedule 14
+    create_advances_against_purchase,  # Schedule 14A
+    create_cash_and_bank,  # Schedule 15
+    create_direct_expenses,  # Schedule 16
+    create_gross_receipt,  # Schedule 17
+    create_purchase,  # Schedule 18
+    create_indirect_income,  # Schedule 19
+    create_indirect_expenses,  # Schedule 20
+    create_finance_expenses,  # Schedule 21
+    # Annexures
+    create_agriculture_account,  # Annexure 1
+    create_land_account,  # Annexure 2
+]
+
 # Main function to run the code
 if __name__ == "__main__":
-    create_financial_statements_excel()
\ No newline at end of file
+    filename = create_financial_statements_excel()
+    print(f"Excel file created successfully: {filename}")
\ No newline at end of file
@@ -1,54 +1,109 @@
 import pandas as pd
 import numpy as np
 import os
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+import sys
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
 from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 
-def create_smo_ferro_excel():
-    # Create a workbook
-    wb = Workbook()
+# workbook_writer is shared with the other script folders (see ../shared)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "shared"))
+
+from workbook_writer import new_workbook  # noqa: E402
+
+# Fonts, border and fill shared by every sheet
+HEADER_FONT = Font(name='Arial', size=11, bold=True)
+NORMAL_FONT = Font(name='Arial', size=10)
+BOLD_FONT = Font(name='Arial', size=10, bold=True)
+TITLE_FONT = Font(name='Arial', size=12, bold=True)
+
+THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+
+HEADER_FILL = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
+
+# Cell styles, registered once per workbook as named styles (see
+# register_styles) and assigned to cells by name
+CELL_STYLES = {
+    'centered_title': dict(font=TITLE_FONT, alignment=Alignment(horizontal='center')),
+    'underlined_title': dict(font=Font(name='Arial', size=12, bold=True, underline="single")),
+    'subtitle': dict(font=Font(name='Arial', size=11, bold=True, italic=True)),
+    'normal': dict(font=NORMAL_FONT),
+    'bold': dict(font=Font(bold=True)),
+    'header': dict(font=HEADER_FONT, border=THIN_BORDER, fill=HEADER_FILL,
+                   alignment=Alignment(wrap_text=True, horizontal='center')),
+    'table_header': dict(font=HEADER_FONT, border=THIN_BORDER,
+                         alignment=Alignment(wrap_text=True, horizontal='center')),
+    'table_header_middle': dict(font=HEADER_FONT, border=THIN_BORDER,
+                                alignment=Alignment(wrap_text=True, horizontal='center',
+                                                    vertical='center')),
+    'annexure_header': dict(font=HEADER_FONT, border=THIN_BORDER,
+                            alignment=Alignment(horizontal='center', vertical='center')),
+    'cell': dict(font=NORMAL_FONT, border=THIN_BORDER),
+    'heading_cell': dict(font=Font(bold=True), border=THIN_BORDER),
+    'amount': dict(font=NORMAL_FONT, border=THIN_BORDER, number_format='#,##0',
+                   alignment=Alignment(horizontal='right')),
+    'decimal_amount': dict(font=NORMAL_FONT, border=THIN_BORDER, number_format='#,##0.00',
+                           alignment=Alignment(horizontal='right')),
+    'total_cell': dict(font=BOLD_FONT, border=THIN_BORDER),
+    'total_amount': dict(font=BOLD_FONT, border=THIN_BORDER, number_format='#,##0',
+                         alignment=Alignment(horizontal='right')),
+    'total_decimal_amount': dict(font=BOLD_FONT, border=THIN_BORDER,
+                                 number_format='#,##0.00',
+                                 alignment=Alignment(horizontal='right')),
+}
+
+# Style for each amount format used in the tables
+AMOUNT_STYLES = {'#,##0': 'amount', '#,##0.00': 'decimal_amount'}
+
+def register_styles(wb):
+    """Add CELL_STYLES to the workbook as named styles"""
+    existing = set(wb.named_styles)
+    for name, attributes in CELL_STYLES.items():
+        if name not in existing:
+            wb.add_named_style(NamedStyle(name=name, **attributes))
+
+def table_cell_style(is_total, number_format=None):
+    """Name of the style for a bordered table cell, right-aligned in
+    ``number_format`` when given"""
+    name = AMOUNT_STYLES[number_format] if number_format else 'cell'
+    return 'total_' + name if is_total else name
+
+def create_smo_ferro_excel(backend=None):
+    # Create a workbook, saved through ``backend`` ("openpyxl" or
+    # "xlsxwriter", see workbook_writer; by default WORKBOOK_BACKEND)
+    wb = new_workbook(backend)
+    register_styles(wb)
     
     # Remove the default sheet
     default_sheet = wb.active
     wb.remove(default_sheet)
     
-    # Define styles
-    header_font = Font(name='Arial', size=11, bold=True)
-    normal_font = Font(name='Arial', size=10)
-    title_font = Font(name='Arial', size=12, bold=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    header_fill = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
-    
     # Create Balance Sheet
-    create_balance_sheet(wb, header_font, normal_font, title_font, thin_border, header_fill)
+    create_balance_sheet(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
     
     # Create Profit and Loss Statement
-    create_profit_loss(wb, header_font, normal_font, title_font, thin_border, header_fill)
+    create_profit_loss(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
     
     # Create Notes to Accounts
-    create_notes(wb, header_font, normal_font, title_font, thin_border, header_fill)
+    create_notes(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
     
     # Create annexures
-    create_annexure_1(wb, header_font, normal_font, title_font, thin_border, header_fill)
-    create_annexure_2(wb, header_font, normal_font, title_font, thin_border, header_fill)
-    create_annexure_3a(wb, header_font, normal_font, title_font, thin_border, header_fill)
-    create_annexure_3b(wb, header_font, normal_font, title_font, thin_border, header_fill)
-    create_annexure_3c(wb, header_font, normal_font, title_font, thin_border, header_fill)
-    create_annexure_3d(wb, header_font, normal_font, title_font, thin_border, header_fill)
-    create_annexure_3e(wb, header_font, normal_font, title_font, thin_border, header_fill)
-    create_annexure_3f(wb, header_font, normal_font, title_font, thin_border, header_fill)
-    create_annexure_4(wb, header_font, normal_font, title_font, thin_border, header_fill)
-    create_annexure_5(wb, header_font, normal_font, title_font, thin_border, header_fill)
-    create_annexure_6(wb, header_font, normal_font, title_font, thin_border, header_fill)
+    create_annexure_1(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
+    create_annexure_2(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
+    create_annexure_3a(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
+    create_annexure_3b(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
+    create_annexure_3c(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
+    create_annexure_3d(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
+    create_annexure_3e(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
+    create_annexure_3f(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
+    create_annexure_4(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
+    create_annexure_5(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
+    create_annexure_6(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
     
     # Save the workbook
     wb.save('SMO_Ferro_Alloys_Financial_Statements.xlsx')
@@ -62,13 +117,11 @@ def create_balance_sheet(wb, header_font, normal_font, title_font, thin_border,
     # Add title
     ws['A1'] = "SMO FERRO ALLOYS PRIVATE LIMITED"
     ws.merge_cells('A1:D1')
-    ws['A1'].font = title_font
-    ws['A1'].alignment = Alignment(horizontal='center')
+    ws['A1'].style = 'centered_title'
     
     ws['A2'] = "Balance Sheet as at 31st March, 2024"
     ws.merge_cells('A2:D2')
-    ws['A2'].font = title_font
-    ws['A2'].alignment = Alignment(horizontal='center')
+    ws['A2'].style = 'centered_title'
     
     # Add headers
     headers = ["Particulars", "Note No.", "Figures as at the end of current reporting period (in Rs.)", "Figures as at the end of previous reporting period (in Rs.)"]
@@ -76,10 +129,7 @@ def create_balance_sheet(wb, header_font, normal_font, title_font, thin_border,
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=4, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.fill = header_fill
-        cell.alignment = Alignment(wrap_text=True, horizontal='center')
+        cell.style = 'header'
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 40
@@ -92,12 +142,12 @@ def create_balance_sheet(wb, header_font, normal_font, title_font, thin_border,
     
     # Main section heading
     ws.cell(row=row, column=1).value = "I. EQUITY AND LIABILITIES"
-    ws.cell(row=row, column=1).font = Font(bold=True)
+    ws.cell(row=row, column=1).style = 'bold'
     row += 1
     
     # Shareholder's Funds
     ws.cell(row=row, column=1).value = "(1) Shareholder's Funds"
-    ws.cell(row=row, column=1).font = Font(bold=True)
+    ws.cell(row=row, column=1).style = 'bold'
     row += 1
     
     # Add data
@@ -122,21 +172,20 @@ def create_balance_sheet(wb, header_font, normal_font, title_font, thin_border,
         for col, value in enumerate(data_row, start=1):
             cell = ws.cell(row=row, column=col)
             cell.value = value
-            cell.font = normal_font
-            cell.border = thin_border
             if col >= 3 and isinstance(value, (int, float)):
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
+                cell.style = 'amount'
+            else:
+                cell.style = 'cell'
                 
         # Bold for headings and total
         if data_row[0].startswith("(") or data_row[0] == "TOTAL":
-            ws.cell(row=row, column=1).font = Font(bold=True)
+            ws.cell(row=row, column=1).style = 'heading_cell'
             
         row += 1
     
     # II. ASSETS
     ws.cell(row=row, column=1).value = "II. ASSETS"
-    ws.cell(row=row, column=1).font = Font(bold=True)
+    ws.cell(row=row, column=1).style = 'bold'
     row += 1
     
     assets_data = [
@@ -164,15 +213,14 @@ def create_balance_sheet(wb, header_font, normal_font, title_font, thin_border,
         for col, value in enumerate(data_row, start=1):
             cell = ws.cell(row=row, column=col)
             cell.value = value
-            cell.font = normal_font
-            cell.border = thin_border
             if col >= 3 and isinstance(value, (int, float)):
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
+                cell.style = 'amount'
+            else:
+                cell.style = 'cell'
                 
         # Bold for headings and total
         if data_row[0].startswith("(") or data_row[0] == "TOTAL":
-            ws.cell(row=row, column=1).font = Font(bold=True)
+            ws.cell(row=row, column=1).style = 'heading_cell'
             
         row += 1
     
@@ -198,13 +246,11 @@ def create_profit_loss(wb, header_font, normal_font, title_font, thin_border, he
     # Add title
     ws['A1'] = "SMO FERRO ALLOYS PRIVATE LIMITED"
     ws.merge_cells('A1:D1')
-    ws['A1'].font = title_font
-    ws['A1'].alignment = Alignment(horizontal='center')
+    ws['A1'].style = 'centered_title'
     
     ws['A2'] = "Statement of Profit and Loss for the year ended 31st March, 2024"
     ws.merge_cells('A2:D2')
-    ws['A2'].font = title_font
-    ws['A2'].alignment = Alignment(horizontal='center')
+    ws['A2'].style = 'centered_title'
     
     # Add headers
     headers = ["Particulars", "Note No.", "Figures as at the end of current reporting period (in Rs.)", "Figures as at the end of previous reporting period (in Rs.)"]
@@ -212,10 +258,7 @@ def create_profit_loss(wb, header_font, normal_font, title_font, thin_border, he
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=4, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.fill = header_fill
-        cell.alignment = Alignment(wrap_text=True, horizontal='center')
+        cell.style = 'header'
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 40
@@ -260,19 +303,18 @@ def create_profit_loss(wb, header_font, normal_font, title_font, thin_border, he
         for col, value in enumerate(data_row, start=1):
             cell = ws.cell(row=row, column=col)
             cell.value = value
-            cell.font = normal_font
             
             # Add borders except for blank rows
-            if any(str(x).strip() for x in data_row):
-                cell.border = thin_border
-                
-            if col >= 3 and isinstance(value, (int, float)):
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
+            if not any(str(x).strip() for x in data_row):
+                cell.style = 'normal'
+            elif col >= 3 and isinstance(value, (int, float)):
+                cell.style = 'amount'
+            else:
+                cell.style = 'cell'
                 
         # Bold for totals and section headings
         if data_row[0] in ["Total Revenue", "Total expenses", "Profit before Tax", "Profit from Continuing operation (after tax)"]:
-            ws.cell(row=row, column=1).font = Font(bold=True)
+            ws.cell(row=row, column=1).style = 'heading_cell'
             
         row += 1
     
@@ -313,10 +355,7 @@ def create_notes(wb, header_font, normal_font, title_font, thin_border, header_f
         for col, header in enumerate(headers, start=1):
             cell = ws.cell(row=row, column=col)
             cell.value = header
-            cell.font = header_font
-            cell.border = thin_border
-            cell.fill = header_fill
-            cell.alignment = Alignment(wrap_text=True, horizontal='center')
+            cell.style = 'header'
         
         # Adjust column widths
         ws.column_dimensions['A'].width = 40
@@ -329,19 +368,18 @@ def create_notes(wb, header_font, normal_font, title_font, thin_border, header_f
             for col, value in enumerate(data_row, start=1):
                 cell = ws.cell(row=row, column=col)
                 cell.value = value
-                cell.font = normal_font
                 
                 # Add borders except for blank rows
-                if any(str(x).strip() for x in data_row):
-                    cell.border = thin_border
-                    
-                if col >= 2 and isinstance(value, (int, float)):
-                    cell.number_format = '#,##0'
-                    cell.alignment = Alignment(horizontal='right')
+                if not any(str(x).strip() for x in data_row):
+                    cell.style = 'normal'
+                elif col >= 2 and isinstance(value, (int, float)):
+                    cell.style = 'amount'
+                else:
+                    cell.style = 'cell'
                     
             # Bold for heading and total
             if data_row[0] and (data_row[0].startswith('(') or data_row[0].endswith(':') or "Total" in data_row[0]):
-                ws.cell(row=row, column=1).font = Font(bold=True)
+                ws.cell(row=row, column=1).style = 'heading_cell'
                 
             row += 1
         
@@ -351,7 +389,7 @@ def create_notes(wb, header_font, normal_font, title_font, thin_border, header_f
     std_headers = ["Particulars", "Figures as at the end of the current reporting period", "Figures as at the end of previous reporting period"]
     
     # Create Note 2.1 - Share Capital
-    create_note_2_1(wb, header_font, normal_font, title_font, thin_border, header_fill)
+    create_note_2_1(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
     
     # Note 2.1(a) - Reconciliation of Shares
     reconciliation_data = [
@@ -373,8 +411,8 @@ def create_notes(wb, header_font, normal_font, title_font, thin_border, header_f
     create_note_sheet(wb, "2.1(b)", "Right, Preferences and Restriction attached to Shares", std_headers, rights_data)
     
     # Create more notes
-    create_note_2_1c(wb, header_font, normal_font, title_font, thin_border, header_fill)
-    create_note_2_1d(wb, header_font, normal_font, title_font, thin_border, header_fill)
+    create_note_2_1c(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
+    create_note_2_1d(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
     
     # Note 2.2 - Reserves and Surplus
     reserve_data = [
@@ -390,8 +428,8 @@ def create_notes(wb, header_font, normal_font, title_font, thin_border, header_f
     create_note_sheet(wb, "2.2", "Reserves and Surplus", std_headers, reserve_data)
     
     # Create note 2.3
-    create_note_2_3(wb, header_font, normal_font, title_font, thin_border, header_fill)
-    create_note_2_3a(wb, header_font, normal_font, title_font, thin_border, header_fill)
+    create_note_2_3(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
+    create_note_2_3a(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
     
     # Note 2.4 - Deferred Tax Assets
     deferred_tax_data = [
@@ -711,7 +749,7 @@ def create_notes(wb, header_font, normal_font, title_font, thin_border, header_f
     ]
     create_note_sheet(wb, "2.13a", "Trade Receivables aging schedule", std_headers[:1] + ["", "", "", "", "", ""], receivables_aging_data)
     
-    create_note_2_14(wb, header_font, normal_font, title_font, thin_border, header_fill)
+    create_note_2_14(wb, HEADER_FONT, NORMAL_FONT, TITLE_FONT, THIN_BORDER, HEADER_FILL)
     
     # Note 2.15 - Short-Term Loans and Advances
     short_term_loans_data = [
@@ -1059,9 +1097,7 @@ def create_note_2_1(wb, header_font, normal_font, title_font, thin_border, heade
     # Format header row
     for col in [1, 2, 4]:
         cell = ws.cell(row=start_row, column=col)
-        cell.font = header_font
-        cell.border = thin_border
-        cell.alignment = Alignment(wrap_text=True, horizontal='center', vertical='center')
+        cell.style = 'table_header_middle'
     
     # Merge cells for headers
     ws.merge_cells(start_row=start_row, start_column=2, end_row=start_row, end_column=3)
@@ -1121,9 +1157,7 @@ def create_note_2_1c(wb, header_font, normal_font, title_font, thin_border, head
         for j, header_text in enumerate(header_row, start=1):
             cell = ws.cell(row=i, column=j)
             cell.value = header_text
-            cell.font = header_font
-            cell.border = thin_border
-            cell.alignment = Alignment(wrap_text=True, horizontal='center')
+            cell.style = 'table_header'
     
     # Merge cells for the headers
     ws.merge_cells(start_row=2, start_column=2, end_row=2, end_column=3)
@@ -1184,9 +1218,7 @@ def create_note_2_1d(wb, header_font, normal_font, title_font, thin_border, head
         for j, header_text in enumerate(header_row, start=1):
             cell = ws.cell(row=i, column=j)
             cell.value = header_text
-            cell.font = header_font
-            cell.border = thin_border
-            cell.alignment = Alignment(wrap_text=True, horizontal='center')
+            cell.style = 'table_header'
     
     # Merge cells for the headers
     ws.merge_cells(start_row=2, start_column=2, end_row=2, end_column=4)
@@ -1246,9 +1278,7 @@ def create_note_2_3(wb, header_font, normal_font, title_font, thin_border, heade
         for j, header_text in enumerate(header_row, start=1):
             cell = ws.cell(row=i, column=j)
             cell.value = header_text
-            cell.font = header_font
-            cell.border = thin_border
-            cell.alignment = Alignment(wrap_text=True, horizontal='center')
+            cell.style = 'table_header'
     
     # Merge header cells
     ws.merge_cells(start_row=start_row, start_column=2, end_row=start_row, end_column=3)
@@ -1448,9 +1478,7 @@ def create_note_2_14(wb, header_font, normal_font, title_font, thin_border, head
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=row, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.alignment = Alignment(wrap_text=True, horizontal='center', vertical='center')
+        cell.style = 'table_header_middle'
     
     # Add data rows
     cash_data = [
@@ -1471,26 +1499,20 @@ def create_note_2_14(wb, header_font, normal_font, title_font, thin_border, head
             cell = ws.cell(row=i, column=j)
             
             # Format numeric values
+            number_format = None
             if j > 1 and value not in ["", "-"]:
                 try:
                     # Remove commas and convert to integer
                     numeric_value = int(value.replace(",", ""))
                     cell.value = numeric_value
-                    cell.number_format = '#,##0'
-                    cell.alignment = Alignment(horizontal='right')
+                    number_format = '#,##0'
                 except (ValueError, AttributeError):
                     cell.value = value
             else:
                 cell.value = value
             
-            # Apply borders
-            cell.border = thin_border
-            
-            # Bold the total row
-            if data_row[0] == "Total":
-                cell.font = Font(name='Arial', size=10, bold=True)
-            else:
-                cell.font = normal_font
+            # Bordered, bold on the total row
+            cell.style = table_cell_style(data_row[0] == "Total", number_format)
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 35
@@ -1505,8 +1527,7 @@ def create_annexure_1(wb, header_font, normal_font, title_font, thin_border, hea
     
     # Add title with underline
     ws['A1'] = "1. Unsecured Loan"
-    ws['A1'].font = title_font
-    ws['A1'].font = Font(name='Arial', size=12, bold=True, underline="single")
+    ws['A1'].style = 'underlined_title'
     
     # Create headers with borders
     headers = ["Particulars", "Amount"]
@@ -1515,9 +1536,7 @@ def create_annexure_1(wb, header_font, normal_font, title_font, thin_border, hea
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=row, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+        cell.style = 'annexure_header'
     
     # Add data rows
     loan_data = [
@@ -1537,23 +1556,12 @@ def create_annexure_1(wb, header_font, normal_font, title_font, thin_border, hea
     for i, data_row in enumerate(loan_data, start=start_row):
         for j, value in enumerate(data_row, start=1):
             cell = ws.cell(row=i, column=j)
+            cell.value = value
             
-            # Format numeric values
-            if j == 2 and isinstance(value, (int, float)):
-                cell.value = value
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
-            else:
-                cell.value = value
-            
-            # Apply borders to all cells
-            cell.border = thin_border
-            
-            # Bold for headings and total
-            if data_row[0] in ["For Silico Manganese", "For Oxygen", "Total"]:
-                cell.font = Font(name='Arial', size=10, bold=True)
-            else:
-                cell.font = normal_font
+            # Format numeric values, bold for headings and total
+            cell.style = table_cell_style(
+                is_total=data_row[0] in ["For Silico Manganese", "For Oxygen", "Total"],
+                number_format='#,##0' if j == 2 and isinstance(value, (int, float)) else None)
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 30
@@ -1567,7 +1575,7 @@ def create_annexure_2(wb, header_font, normal_font, title_font, thin_border, hea
     
     # Add title with underline
     ws['A1'] = "2. Sundry Creditors for Capital Assets"
-    ws['A1'].font = Font(name='Arial', size=12, bold=True, underline="single")
+    ws['A1'].style = 'underlined_title'
     
     # Create headers with borders
     headers = ["Particulars", "Amount"]
@@ -1576,9 +1584,7 @@ def create_annexure_2(wb, header_font, normal_font, title_font, thin_border, hea
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=row, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+        cell.style = 'annexure_header'
     
     # Add data rows
     creditors_data = [
@@ -1590,23 +1596,12 @@ def create_annexure_2(wb, header_font, normal_font, title_font, thin_border, hea
     for i, data_row in enumerate(creditors_data, start=start_row):
         for j, value in enumerate(data_row, start=1):
             cell = ws.cell(row=i, column=j)
+            cell.value = value
             
-            # Format numeric values
-            if j == 2 and isinstance(value, (int, float)):
-                cell.value = value
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
-            else:
-                cell.value = value
-            
-            # Apply borders to all cells
-            cell.border = thin_border
-            
-            # Bold for total
-            if data_row[0] == "Total":
-                cell.font = Font(name='Arial', size=10, bold=True)
-            else:
-                cell.font = normal_font
+            # Format numeric values, bold for total
+            cell.style = table_cell_style(
+                is_total=data_row[0] == "Total",
+                number_format='#,##0' if j == 2 and isinstance(value, (int, float)) else None)
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 40
@@ -1620,10 +1615,10 @@ def create_annexure_3a(wb, header_font, normal_font,title_font, thin_border, hea
     
     # Add title with underline
     ws['A1'] = "3. Sundry Creditors"
-    ws['A1'].font = Font(name='Arial', size=12, bold=True, underline="single")
+    ws['A1'].style = 'underlined_title'
     
     ws['A2'] = "a) Silico Manganese"
-    ws['A2'].font = Font(name='Arial', size=11, bold=True, italic=True)
+    ws['A2'].style = 'subtitle'
     
     # Create headers with borders
     headers = ["Particulars", "Amount"]
@@ -1632,9 +1627,7 @@ def create_annexure_3a(wb, header_font, normal_font,title_font, thin_border, hea
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=row, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+        cell.style = 'annexure_header'
     
     # Add data rows - first image
     creditors_data_1 = [
@@ -1744,23 +1737,12 @@ def create_annexure_3a(wb, header_font, normal_font,title_font, thin_border, hea
     for i, data_row in enumerate(creditors_data, start=start_row):
         for j, value in enumerate(data_row, start=1):
             cell = ws.cell(row=i, column=j)
+            cell.value = value
             
-            # Format numeric values
-            if j == 2 and isinstance(value, (int, float)):
-                cell.value = value
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
-            else:
-                cell.value = value
-            
-            # Apply borders to all cells
-            cell.border = thin_border
-            
-            # Bold for headings and total
-            if data_row[0] == "Creditors for Goods" or data_row[0] == "Total":
-                cell.font = Font(name='Arial', size=10, bold=True)
-            else:
-                cell.font = normal_font
+            # Format numeric values, bold for headings and total
+            cell.style = table_cell_style(
+                is_total=data_row[0] == "Creditors for Goods" or data_row[0] == "Total",
+                number_format='#,##0' if j == 2 and isinstance(value, (int, float)) else None)
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 40
@@ -1774,10 +1756,10 @@ def create_annexure_3b(wb, header_font, normal_font, title_font, thin_border, he
     
     # Add title with underline
     ws['A1'] = "3. Sundry Creditors"
-    ws['A1'].font = Font(name='Arial', size=12, bold=True, underline="single")
+    ws['A1'].style = 'underlined_title'
     
     ws['A2'] = "b) Sundry Creditors Oxygen"
-    ws['A2'].font = Font(name='Arial', size=11, bold=True, italic=True)
+    ws['A2'].style = 'subtitle'
     
     # Create headers with borders
     headers = ["Particulars", "Amount"]
@@ -1786,9 +1768,7 @@ def create_annexure_3b(wb, header_font, normal_font, title_font, thin_border, he
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=row, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+        cell.style = 'annexure_header'
     
     # Add data rows - based on the image
     creditors_data = [
@@ -1814,23 +1794,12 @@ def create_annexure_3b(wb, header_font, normal_font, title_font, thin_border, he
     for i, data_row in enumerate(creditors_data, start=start_row):
         for j, value in enumerate(data_row, start=1):
             cell = ws.cell(row=i, column=j)
+            cell.value = value
             
-            # Format numeric values
-            if j == 2 and isinstance(value, (int, float)):
-                cell.value = value
-                cell.number_format = '#,##0.00'
-                cell.alignment = Alignment(horizontal='right')
-            else:
-                cell.value = value
-            
-            # Apply borders to all cells
-            cell.border = thin_border
-            
-            # Bold the total row
-            if data_row[0] == "Total":
-                cell.font = Font(name='Arial', size=10, bold=True)
-            else:
-                cell.font = normal_font
+            # Format numeric values, bold the total row
+            cell.style = table_cell_style(
+                is_total=data_row[0] == "Total",
+                number_format='#,##0.00' if j == 2 and isinstance(value, (int, float)) else None)
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 40
@@ -1844,10 +1813,10 @@ def create_annexure_3c(wb, header_font, normal_font, title_font, thin_border, he
     
     # Add title with underline
     ws['A1'] = "3. Sundry Creditors"
-    ws['A1'].font = Font(name='Arial', size=12, bold=True, underline="single")
+    ws['A1'].style = 'underlined_title'
     
     ws['A2'] = "c) Sundry Creditors Aluminium"
-    ws['A2'].font = Font(name='Arial', size=11, bold=True, italic=True)
+    ws['A2'].style = 'subtitle'
     
     # Create headers with borders
     headers = ["Particulars", "Amount"]
@@ -1856,9 +1825,7 @@ def create_annexure_3c(wb, header_font, normal_font, title_font, thin_border, he
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=row, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+        cell.style = 'annexure_header'
     
     # Add data rows - based on the image
     creditors_data = [
@@ -1885,23 +1852,12 @@ def create_annexure_3c(wb, header_font, normal_font, title_font, thin_border, he
     for i, data_row in enumerate(creditors_data, start=start_row):
         for j, value in enumerate(data_row, start=1):
             cell = ws.cell(row=i, column=j)
+            cell.value = value
             
-            # Format numeric values
-            if j == 2 and isinstance(value, (int, float)):
-                cell.value = value
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
-            else:
-                cell.value = value
-            
-            # Apply borders to all cells
-            cell.border = thin_border
-            
-            # Bold the category headers and total row
-            if data_row[0] in ["Creditor for Power & Fuels", "Creditor for Raw Material", "Creditor for Rent", "Creditor for Store", "Total"]:
-                cell.font = Font(name='Arial', size=10, bold=True)
-            else:
-                cell.font = normal_font
+            # Format numeric values, bold the category headers and total row
+            cell.style = table_cell_style(
+                is_total=data_row[0] in ["Creditor for Power & Fuels", "Creditor for Raw Material", "Creditor for Rent", "Creditor for Store", "Total"],
+                number_format='#,##0' if j == 2 and isinstance(value, (int, float)) else None)
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 40
@@ -1915,10 +1871,10 @@ def create_annexure_3d(wb, header_font, normal_font, title_font, thin_border, he
     
     # Add title with underline
     ws['A1'] = "3. Sundry Creditors"
-    ws['A1'].font = Font(name='Arial', size=12, bold=True, underline="single")
+    ws['A1'].style = 'underlined_title'
     
     ws['A2'] = "d) Sundry Creditors Rajasthan"
-    ws['A2'].font = Font(name='Arial', size=11, bold=True, italic=True)
+    ws['A2'].style = 'subtitle'
     
     # Create headers with borders
     headers = ["Particulars", "Amount"]
@@ -1927,9 +1883,7 @@ def create_annexure_3d(wb, header_font, normal_font, title_font, thin_border, he
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=row, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+        cell.style = 'annexure_header'
     
     # Add data rows - based on the image
     creditors_data = [
@@ -1946,23 +1900,12 @@ def create_annexure_3d(wb, header_font, normal_font, title_font, thin_border, he
     for i, data_row in enumerate(creditors_data, start=start_row):
         for j, value in enumerate(data_row, start=1):
             cell = ws.cell(row=i, column=j)
+            cell.value = value
             
-            # Format numeric values
-            if j == 2 and isinstance(value, (int, float)):
-                cell.value = value
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
-            else:
-                cell.value = value
-            
-            # Apply borders to all cells
-            cell.border = thin_border
-            
-            # Bold the total row
-            if data_row[0] == "Total":
-                cell.font = Font(name='Arial', size=10, bold=True)
-            else:
-                cell.font = normal_font
+            # Format numeric values, bold the total row
+            cell.style = table_cell_style(
+                is_total=data_row[0] == "Total",
+                number_format='#,##0' if j == 2 and isinstance(value, (int, float)) else None)
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 40
@@ -1976,10 +1919,10 @@ def create_annexure_3e(wb, header_font, normal_font, title_font, thin_border, he
     
     # Add title with underline
     ws['A1'] = "3. Sundry Creditors"
-    ws['A1'].font = Font(name='Arial', size=12, bold=True, underline="single")
+    ws['A1'].style = 'underlined_title'
     
     ws['A2'] = "e) Sundry Creditors Chandrapur"
-    ws['A2'].font = Font(name='Arial', size=11, bold=True, italic=True)
+    ws['A2'].style = 'subtitle'
     
     # Create headers with borders
     headers = ["Particulars", "Amount"]
@@ -1988,9 +1931,7 @@ def create_annexure_3e(wb, header_font, normal_font, title_font, thin_border, he
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=row, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+        cell.style = 'annexure_header'
     
     # Add data rows - based on the image
     creditors_data = [
@@ -2005,23 +1946,12 @@ def create_annexure_3e(wb, header_font, normal_font, title_font, thin_border, he
     for i, data_row in enumerate(creditors_data, start=start_row):
         for j, value in enumerate(data_row, start=1):
             cell = ws.cell(row=i, column=j)
+            cell.value = value
             
-            # Format numeric values
-            if j == 2 and isinstance(value, (int, float)):
-                cell.value = value
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
-            else:
-                cell.value = value
-            
-            # Apply borders to all cells
-            cell.border = thin_border
-            
-            # Bold the total row
-            if data_row[0] == "Total":
-                cell.font = Font(name='Arial', size=10, bold=True)
-            else:
-                cell.font = normal_font
+            # Format numeric values, bold the total row
+            cell.style = table_cell_style(
+                is_total=data_row[0] == "Total",
+                number_format='#,##0' if j == 2 and isinstance(value, (int, float)) else None)
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 40
@@ -2035,10 +1965,10 @@ def create_annexure_3f(wb, header_font, normal_font, title_font, thin_border, he
     
     # Add title with underline
     ws['A1'] = "3. Sundry Creditors"
-    ws['A1'].font = Font(name='Arial', size=12, bold=True, underline="single")
+    ws['A1'].style = 'underlined_title'
     
     ws['A2'] = "f) Sundry Creditors Durgapur"
-    ws['A2'].font = Font(name='Arial', size=11, bold=True, italic=True)
+    ws['A2'].style = 'subtitle'
     
     # Create headers with borders
     headers = ["Particulars", "Amount"]
@@ -2047,9 +1977,7 @@ def create_annexure_3f(wb, header_font, normal_font, title_font, thin_border, he
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=row, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+        cell.style = 'annexure_header'
     
     # Add data rows - based on the image
     creditors_data = [
@@ -2064,23 +1992,12 @@ def create_annexure_3f(wb, header_font, normal_font, title_font, thin_border, he
     for i, data_row in enumerate(creditors_data, start=start_row):
         for j, value in enumerate(data_row, start=1):
             cell = ws.cell(row=i, column=j)
+            cell.value = value
             
-            # Format numeric values
-            if j == 2 and isinstance(value, (int, float)):
-                cell.value = value
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
-            else:
-                cell.value = value
-            
-            # Apply borders to all cells
-            cell.border = thin_border
-            
-            # Bold the total row
-            if data_row[0] == "Total":
-                cell.font = Font(name='Arial', size=10, bold=True)
-            else:
-                cell.font = normal_font
+            # Format numeric values, bold the total row
+            cell.style = table_cell_style(
+                is_total=data_row[0] == "Total",
+                number_format='#,##0' if j == 2 and isinstance(value, (int, float)) else None)
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 40
@@ -2094,7 +2011,7 @@ def create_annexure_4(wb, header_font, normal_font, title_font, thin_border, hea
     
     # Add title with underline
     ws['A1'] = "4. Advance Received from Parties"
-    ws['A1'].font = Font(name='Arial', size=12, bold=True, underline="single")
+    ws['A1'].style = 'underlined_title'
     
     # Create headers with borders
     headers = ["Particulars", "Amount"]
@@ -2103,9 +2020,7 @@ def create_annexure_4(wb, header_font, normal_font, title_font, thin_border, hea
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=row, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+        cell.style = 'annexure_header'
     
     # Add data rows based on the image
     advances_data = [
@@ -2132,23 +2047,12 @@ def create_annexure_4(wb, header_font, normal_font, title_font, thin_border, hea
     for i, data_row in enumerate(advances_data, start=start_row):
         for j, value in enumerate(data_row, start=1):
             cell = ws.cell(row=i, column=j)
+            cell.value = value
             
-            # Format numeric values
-            if j == 2 and isinstance(value, (int, float)):
-                cell.value = value
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
-            else:
-                cell.value = value
-            
-            # Apply borders to all cells
-            cell.border = thin_border
-            
-            # Bold for headings and total
-            if data_row[0] in ["For Silico Manganese", "For Oxygen", "Total"]:
-                cell.font = Font(name='Arial', size=10, bold=True)
-            else:
-                cell.font = normal_font
+            # Format numeric values, bold for headings and total
+            cell.style = table_cell_style(
+                is_total=data_row[0] in ["For Silico Manganese", "For Oxygen", "Total"],
+                number_format='#,##0' if j == 2 and isinstance(value, (int, float)) else None)
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 40
@@ -2162,7 +2066,7 @@ def create_annexure_5(wb, header_font, normal_font, title_font, thin_border, hea
     
     # Add title with underline
     ws['A1'] = "5. Sundry Debtors"
-    ws['A1'].font = Font(name='Arial', size=12, bold=True, underline="single")
+    ws['A1'].style = 'underlined_title'
     
     # Create headers with borders
     headers = ["Particulars", "Amount"]
@@ -2171,9 +2075,7 @@ def create_annexure_5(wb, header_font, normal_font, title_font, thin_border, hea
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=row, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+        cell.style = 'annexure_header'
     
     # Add data rows based on the image
     debtors_data = [
@@ -2240,23 +2142,12 @@ def create_annexure_5(wb, header_font, normal_font, title_font, thin_border, hea
     for i, data_row in enumerate(debtors_data, start=start_row):
         for j, value in enumerate(data_row, start=1):
             cell = ws.cell(row=i, column=j)
+            cell.value = value
             
-            # Format numeric values
-            if j == 2 and isinstance(value, (int, float)):
-                cell.value = value
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
-            else:
-                cell.value = value
-            
-            # Apply borders to all cells
-            cell.border = thin_border
-            
-            # Bold for headings and total
-            if data_row[0] in ["For Silico Manganese", "For Aluminium", "For Oxygen", "For Chandrapur", "RAJ", "Total"]:
-                cell.font = Font(name='Arial', size=10, bold=True)
-            else:
-                cell.font = normal_font
+            # Format numeric values, bold for headings and total
+            cell.style = table_cell_style(
+                is_total=data_row[0] in ["For Silico Manganese", "For Aluminium", "For Oxygen", "For Chandrapur", "RAJ", "Total"],
+                number_format='#,##0' if j == 2 and isinstance(value, (int, float)) else None)
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 45
@@ -2270,7 +2161,7 @@ def create_annexure_6(wb, header_font, normal_font, title_font, thin_border, hea
     
     # Add title with underline
     ws['A1'] = "6. Advance Paid to Parties"
-    ws['A1'].font = Font(name='Arial', size=12, bold=True, underline="single")
+    ws['A1'].style = 'underlined_title'
     
     # Create headers with borders
     headers = ["Particulars", "Amount"]
@@ -2279,9 +2170,7 @@ def create_annexure_6(wb, header_font, normal_font, title_font, thin_border, hea
     for col, header in enumerate(headers, start=1):
         cell = ws.cell(row=row, column=col)
         cell.value = header
-        cell.font = header_font
-        cell.border = thin_border
-        cell.alignment = Alignment(horizontal='center', vertical='center')
+        cell.style = 'annexure_header'
     
     # Add data rows based on the images - Image 1
     advances_data_1 = [
@@ -2446,23 +2335,12 @@ def create_annexure_6(wb, header_font, normal_font, title_font, thin_border, hea
     for i, data_row in enumerate(advances_data, start=start_row):
         for j, value in enumerate(data_row, start=1):
             cell = ws.cell(row=i, column=j)
+            cell.value = value
             
-            # Format numeric values
-            if j == 2 and isinstance(value, (int, float)):
-                cell.value = value
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
-            else:
-                cell.value = value
-            
-            # Apply borders to all cells
-            cell.border = thin_border
-            
-            # Bold for headings and total
-            if data_row[0] in ["For Silico Manganese", "For Oxygen", "For Durgapur", "For Rajasthan", "For Chandrapur", "For Aluminium", "Total"]:
-                cell.font = Font(name='Arial', size=10, bold=True)
-            else:
-                cell.font = normal_font
+            # Format numeric values, bold for headings and total
+            cell.style = table_cell_style(
+                is_total=data_row[0] in ["For Silico Manganese", "For Oxygen", "For Durgapur", "For Rajasthan", "For Chandrapur", "For Aluminium", "Total"],
+                number_format='#,##0' if j == 2 and isinstance(value, (int, float)) else None)
     
     # Adjust column widths
     ws.column_dimensions['A'].width = 45
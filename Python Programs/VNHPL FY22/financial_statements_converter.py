@@ -1,7 +1,8 @@
 import pandas as pd
 import os
 from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils import get_column_letter
 import pytesseract
 from pdf2image import convert_from_path
@@ -21,6 +22,7 @@ def convert_financial_pdf_to_excel(pdf_path, output_excel_path):
     """
     # Create a new Excel workbook
     wb = Workbook()
+    register_styles(wb)
 
     # Create sheets for each financial statement
     create_balance_sheet(wb)
@@ -35,45 +37,84 @@ def convert_financial_pdf_to_excel(pdf_path, output_excel_path):
     return output_excel_path
 
 
+_THIN = Side(style='thin')
+THIN_BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+
+# Cell styles of the statement tables, registered once per workbook as
+# named styles (see register_styles) and assigned to cells by name. A
+# named style replaces the whole format, so plain cells name the
+# workbook's default font
+CELL_STYLES = {
+    'header': dict(
+        font=Font(bold=True),
+        alignment=Alignment(horizontal='center', vertical='center', wrap_text=True),
+        border=THIN_BORDER,
+        fill=PatternFill(start_color="D9D9D9", end_color="D9D9D9", fill_type="solid"),
+    ),
+    'text': dict(
+        font=DEFAULT_FONT,
+        alignment=Alignment(horizontal='left', vertical='center', wrap_text=True),
+        border=THIN_BORDER,
+    ),
+    'amount': dict(
+        font=DEFAULT_FONT,
+        number_format='#,##0.00',
+        alignment=Alignment(horizontal='right', vertical='center'),
+        border=THIN_BORDER,
+    ),
+    'section': dict(
+        font=Font(bold=True),
+        alignment=Alignment(horizontal='left', vertical='center', wrap_text=True),
+        border=THIN_BORDER,
+    ),
+    'section_amount': dict(
+        font=Font(bold=True),
+        number_format='#,##0.00',
+        alignment=Alignment(horizontal='right', vertical='center'),
+        border=THIN_BORDER,
+    ),
+    'total': dict(
+        font=Font(bold=True),
+        alignment=Alignment(horizontal='left', vertical='center', wrap_text=True),
+        border=THIN_BORDER,
+    ),
+    'total_amount': dict(
+        font=Font(bold=True),
+        number_format='#,##0.00',
+        alignment=Alignment(horizontal='right', vertical='center'),
+        border=THIN_BORDER,
+        fill=PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid"),
+    ),
+}
+
+
+def register_styles(wb):
+    """Add CELL_STYLES to the workbook as named styles"""
+    existing = set(wb.named_styles)
+    for name, attributes in CELL_STYLES.items():
+        if name not in existing:
+            wb.add_named_style(NamedStyle(name=name, **attributes))
+
+
 def apply_header_style(cell):
     """Apply styling to header cells"""
-    cell.font = Font(bold=True)
-    cell.alignment = Alignment(
-        horizontal='center', vertical='center', wrap_text=True)
-    cell.border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    cell.fill = PatternFill(start_color="D9D9D9",
-                            end_color="D9D9D9", fill_type="solid")
-
-
-def apply_data_cell_style(cell, is_numeric=False, is_total=False, indent_level=0):
-    """Apply styling to data cells"""
-    cell.border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-
-    if is_numeric:
-        cell.number_format = '#,##0.00'
-        cell.alignment = Alignment(horizontal='right', vertical='center')
-    else:
+    cell.style = 'header'
+
+
+def apply_data_cell_style(cell, is_numeric=False, is_total=False, indent_level=0,
+                          is_section=False):
+    """Apply styling to data cells; section rows are bold"""
+    if not is_numeric:
         indent = ' ' * (indent_level * 2)
         if cell.value and isinstance(cell.value, str):
             cell.value = indent + cell.value
-        cell.alignment = Alignment(
-            horizontal='left', vertical='center', wrap_text=True)
 
     if is_total:
-        cell.font = Font(bold=True)
-        if is_numeric:
-            cell.fill = PatternFill(
-                start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
+        cell.style = 'total_amount' if is_numeric else 'total'
+    elif is_section:
+        cell.style = 'section_amount' if is_numeric else 'section'
+    else:
+        cell.style = 'amount' if is_numeric else 'text'
 
 
 def add_company_header(ws, statement_title):
@@ -192,10 +233,8 @@ def create_balance_sheet(wb):
             is_section_header = row_data[0] in ["I. EQUITY AND LIABILITIES", "II. ASSETS", "Non-current assets",
                 "1 Shareholders' funds", "3 Non-current liabilities", "4 Current liabilities", "2 Current assets"]
 
-            if is_section_header:
-                cell.font = Font(bold=True)
-
-            apply_data_cell_style(cell, is_numeric, is_total, indent_level)
+            apply_data_cell_style(
+                cell, is_numeric, is_total, indent_level, is_section=is_section_header)
 
     # Add note to the bottom of the sheet
     note_row = len(balance_sheet_data) + 8
@@ -284,10 +323,8 @@ def create_profit_loss(wb):
             is_section_header = row_data[0].startswith("I.") or row_data[0].startswith("II.") or row_data[0].startswith("III.") or row_data[0].startswith("IV.") or row_data[0].startswith("V.") or row_data[0].startswith("VI") or row_data[0].startswith("VII.") or row_data[0].startswith(
                 "VIII") or row_data[0].startswith("IX.") or row_data[0].startswith("X ") or row_data[0].startswith("XI ") or row_data[0].startswith("XII ") or row_data[0].startswith("XIII ") or row_data[0].startswith("XIV ") or row_data[0].startswith("XV ") or row_data[0].startswith("XVI ")
 
-            if is_section_header:
-                cell.font = Font(bold=True)
-
-            apply_data_cell_style(cell, is_numeric, is_total, indent_level)
+            apply_data_cell_style(
+                cell, is_numeric, is_total, indent_level, is_section=is_section_header)
 
     # Add note to the bottom of the sheet
     note_row = len(pl_data) + 8
@@ -371,10 +408,8 @@ def create_cash_flow(wb):
             is_section_header = row_data[0] in ["A CASH FLOW FROM OPERATING ACTIVITIES", "B CASH FLOW FROM INVESTING ACTIVITIES", "C CASH FLOW FROM FINANCING ACTIVITIES", "Cash & Cash Equivalents as stated",
                 "Net increase in cash & Cash Equivalents (A+B+C)", "Opening Cash and Cash equivalents as at 31.03.2021", "Closing Cash and Cash equivalents as at 31.03.2022"]
 
-            if is_section_header:
-                cell.font = Font(bold=True)
-
-            apply_data_cell_style(cell, is_numeric, is_total, indent_level)
+            apply_data_cell_style(
+                cell, is_numeric, is_total, indent_level, is_section=is_section_header)
 
     # Add note to the bottom of the sheet
     note_row = len(cf_data) + 8
@@ -479,10 +514,8 @@ def create_note_2(wb):
             if not is_header and not is_total and row_data[0] != "":
                 indent_level = 1
 
-            if is_header:
-                cell.font = Font(bold=True)
-
-            apply_data_cell_style(cell, is_numeric, is_total, indent_level)
+            apply_data_cell_style(
+                cell, is_numeric, is_total, indent_level, is_section=is_header)
 
 
 def create_note_3(wb):
@@ -555,9 +588,6 @@ def create_note_3(wb):
             elif row_data[0].startswith("        "):
                 indent_level = 2
 
-            if is_total:
-                cell.font = Font(bold=True)
-
             apply_data_cell_style(cell, is_numeric, is_total, indent_level)
 
 
@@ -610,9 +640,6 @@ def create_note_4(wb):
             is_numeric = col_idx in [2, 3] and value != ""
             is_total = row_data[0] == "Total"
 
-            if is_total:
-                cell.font = Font(bold=True)
-
             apply_data_cell_style(cell, is_numeric, is_total)
 
 
@@ -675,10 +702,8 @@ def create_note_5(wb):
             if not is_header and not is_total and row_data[0] != "":
                 indent_level = 1
 
-            if is_header:
-                cell.font = Font(bold=True)
-
-            apply_data_cell_style(cell, is_numeric, is_total, indent_level)
+            apply_data_cell_style(
+                cell, is_numeric, is_total, indent_level, is_section=is_header)
 
 
 def create_note_6(wb):
@@ -751,10 +776,8 @@ def create_note_6(wb):
                 elif row_data[0] in ["Loans Repayable on Demand", "From Bank"]:
                     indent_level = 1
 
-            if is_header:
-                cell.font = Font(bold=True)
-
-            apply_data_cell_style(cell, is_numeric, is_total, indent_level)
+            apply_data_cell_style(
+                cell, is_numeric, is_total, indent_level, is_section=is_header)
 
 
 def create_note_7(wb):
@@ -812,10 +835,8 @@ def create_note_7(wb):
             if not is_header and not is_total and row_data[0] != "":
                 indent_level = 1
 
-            if is_header:
-                cell.font = Font(bold=True)
-
-            apply_data_cell_style(cell, is_numeric, is_total, indent_level)
+            apply_data_cell_style(
+                cell, is_numeric, is_total, indent_level, is_section=is_header)
 
     # Add aging schedule
     aging_row = row_idx + 2
@@ -893,10 +914,9 @@ def create_note_8(wb):
             elif row_data[0].startswith("    "):
                 indent_level = 2
 
-            if row_data[0] == "a) Other Payables":
-                cell.font = Font(bold=True)
-
-            apply_data_cell_style(cell, is_numeric, is_total, indent_level)
+            is_header = row_data[0] == "a) Other Payables"
+            apply_data_cell_style(
+                cell, is_numeric, is_total, indent_level, is_section=is_header)
 
 
 def create_note_9(wb):
@@ -1075,9 +1095,6 @@ def create_note_9(wb):
             is_numeric = col_idx > 2 and value != "" and value != "0.00"
             is_total = row_data[1] == "TOTAL ( Rupees )"
             
-            if is_total:
-                cell.font = Font(bold=True)
-                
             apply_data_cell_style(cell, is_numeric, is_total)
     
     current_row = row_idx + 2
@@ -1108,9 +1125,6 @@ def create_note_9(wb):
                 is_numeric = col_idx > 2 and value != "" and value != "0.00"
                 is_total = row_data[1] == "TOTAL ( Rupees )"
                 
-                if is_total:
-                    cell.font = Font(bold=True)
-                    
                 apply_data_cell_style(cell, is_numeric, is_total)
     
     current_row = row_idx + 2
@@ -1138,9 +1152,6 @@ def create_note_9(wb):
                 is_numeric = col_idx > 2 and value != "" and value != "0.00"
                 is_total = row_data[1] == "TOTAL ( Rupees )"
                 
-                if is_total:
-                    cell.font = Font(bold=True)
-                    
                 apply_data_cell_style(cell, is_numeric, is_total)
     
     current_row = row_idx + 2
@@ -1160,7 +1171,6 @@ def create_note_9(wb):
                 is_numeric = col_idx > 2 and value != "" and value != "0.00"
                 is_total = True  # Both rows are totals
                 
-                cell.font = Font(bold=True)
                 apply_data_cell_style(cell, is_numeric, is_total)
     
     current_row = row_idx + 2
@@ -1181,9 +1191,6 @@ def create_note_9(wb):
                 is_numeric = col_idx == 2  # Second column has numeric values
                 is_total = row_data[0] == "Balance remaining"
                 
-                if is_total:
-                    cell.font = Font(bold=True)
-                    
                 apply_data_cell_style(cell, is_numeric, is_total)
 
 
@@ -1237,9 +1244,6 @@ def create_note_10(wb):
             is_numeric = col_idx in [2, 3] and value != ""
             is_total = row_data[0] == "Total"
 
-            if is_total:
-                cell.font = Font(bold=True)
-
             apply_data_cell_style(cell, is_numeric, is_total)
 
 
@@ -1309,13 +1313,10 @@ def create_note_11(wb):
             is_header = row_data[0] in ["Stores", "Material", "Others"]
             is_subtotal = row_data[0] == "" and col_idx == 1
 
-            if is_header:
-                cell.font = Font(bold=True)
-
             if is_subtotal:
                 is_numeric = True
 
-            apply_data_cell_style(cell, is_numeric, is_total)
+            apply_data_cell_style(cell, is_numeric, is_total, is_section=is_header)
 
 
 def create_note_12(wb):
@@ -1526,10 +1527,8 @@ def create_note_13(wb):
             if not is_header and not is_total and row_data[0] != "" and not row_data[0].startswith("b)"):
                 indent_level = 1
 
-            if is_header:
-                cell.font = Font(bold=True)
-
-            apply_data_cell_style(cell, is_numeric, is_total, indent_level)
+            apply_data_cell_style(
+                cell, is_numeric, is_total, indent_level, is_section=is_header)
 
 
 def create_note_14(wb):
@@ -1678,9 +1677,6 @@ def create_note_15(wb):
             is_numeric = col_idx in [2, 3] and value != ""
             is_total = row_data[0] == "Total"
 
-            if is_total:
-                cell.font = Font(bold=True)
-
             apply_data_cell_style(cell, is_numeric, is_total)
 
 
@@ -1743,13 +1739,8 @@ def create_note_16(wb):
             if not is_header and not is_total and row_data[0] in ["on FDR", "on Income Tax Refund"]:
                 indent_level = 1
 
-            if is_total:
-                cell.font = Font(bold=True)
-
-            if is_header:
-                cell.font = Font(bold=True)
-
-            apply_data_cell_style(cell, is_numeric, is_total, indent_level)
+            apply_data_cell_style(
+                cell, is_numeric, is_total, indent_level, is_section=is_header)
 
 
 def create_note_17(wb):
@@ -1914,10 +1905,8 @@ def create_note_19(wb):
             elif row_data[0].startswith("    "):
                 indent_level = 2
                 
-            if is_header:
-                cell.font = Font(bold=True)
-                
-            apply_data_cell_style(cell, is_numeric, is_total, indent_level)
+            apply_data_cell_style(
+                cell, is_numeric, is_total, indent_level, is_section=is_header)
 
 def create_note_20(wb):
     """Create Note 20 - Other Expenses"""
@@ -2140,10 +2129,7 @@ def create_note_1(wb):
             is_total = row_data[0] == "Total"
             is_header = row_data[0] in ["Authorised", "Issued, Subscribed and Fully Paid up"]
             
-            if is_header:
-                cell.font = Font(bold=True)
-                
-            apply_data_cell_style(cell, is_numeric, is_total)
+            apply_data_cell_style(cell, is_numeric, is_total, is_section=is_header)
     
     # Add reconciliation table
     recon_row = len(share_capital_data) + 8
@@ -2184,9 +2170,6 @@ def create_note_1(wb):
             is_numeric = (col_idx in [2, 3, 4, 5]) and value not in ["-", ""]
             is_total = row_data[0] == "Balance at the end of the year"
             
-            if is_total:
-                cell.font = Font(bold=True)
-                
             apply_data_cell_style(cell, is_numeric, is_total)
     
     # Company rights note
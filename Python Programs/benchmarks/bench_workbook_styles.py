@@ -0,0 +1,264 @@
+"""Time building each generator's workbook and measure its styles.xml
+
+Usage:
+    python benchmarks/bench_workbook_styles.py [--repeat N] [--baseline REV]
+                                               [--only NAME ...] [--keep DIR]
+
+Runs the six workbook generators, each in a fresh process started in a
+scratch directory (several of them write to the working directory), and
+reports the best build time over --repeat runs together with the size of
+the saved workbook's xl/styles.xml and the number of cell formats (cellXfs),
+fonts and named styles it declares. With --baseline the generators are also
+run from that git revision of this tree, for a before/after comparison.
+
+Each named style costs a cellStyleXfs and a cellStyles entry on top of the
+cellXfs of the cells using it, so moving a workbook to named styles grows
+styles.xml by about that much per style even when every style is used.
+Named styles no cell format refers to are counted as unused; those are
+pure overhead.
+
+--keep copies the workbooks to DIR (under baseline/ and current/ when
+comparing) so their formatting can be checked side by side.
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import re
+import runpy
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import zipfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROGRAMS = os.path.dirname(HERE)
+
+
+def load_module(script):
+    name = os.path.splitext(os.path.basename(script))[0].replace(" ", "_")
+    spec = importlib.util.spec_from_file_location(name, script)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so that its functions can be pickled to worker processes
+    # (see parallel_workbooks)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_mo_infra(module):
+    module.create_financial_statements_excel("mo_infra.xlsx")
+    return "mo_infra.xlsx"
+
+
+def build_sa_infra(module):
+    return module.create_financial_statements_excel()
+
+
+def build_smo(module):
+    module.create_smo_ferro_excel()
+    return "SMO_Ferro_Alloys_Financial_Statements.xlsx"
+
+
+def build_vnhpl(module):
+    # The statements are transcribed in the script; the PDF is not read
+    module.convert_financial_pdf_to_excel("unused.pdf", "vnhpl.xlsx")
+    return "vnhpl.xlsx"
+
+
+def build_kunstocom(module):
+    from table_model import ExtractedTable, TableRow
+
+    converter = module.FinancialStatementConverter("kunstocom.pdf")
+    converter.create_balance_sheet()
+    converter.create_profit_loss()
+    converter.create_cash_flow()
+    converter.create_notes()
+    converter.populate_manual_data()
+    # Stand-in for OCR output: 40 pages of 30-row, two-year tables
+    tables = []
+    for page in range(40):
+        rows = [
+            TableRow(f"Item {page}.{i}", [1000.0 * i + page, 990.0 * i], str(i % 9))
+            for i in range(30)
+        ]
+        table = ExtractedTable.from_rows(f"Table {page}", page, rows)
+        table.page_type = ("balance_sheet", "profit_loss", "note_table")[page % 3]
+        tables.append(table)
+    converter.create_extracted_sheets(tables)
+    converter.save_excel("kunstocom.xlsx")
+    return "kunstocom.xlsx"
+
+
+# name: (folder, script, build). ``build`` takes the loaded module and
+# returns the workbook it saved; None means the script builds and saves
+# its workbook as it is imported, with the file name given instead
+GENERATORS = {
+    "MO Infra": (
+        "MO Infra Provisional FY 23-24",
+        "financial_statements_converter copy.py",
+        build_mo_infra,
+    ),
+    "NECC": (
+        "NECC SPV  Balance Sheet at 31.03.2022 FINAL",
+        "create_financials.py",
+        "NANDHRA_FINANCIALS_WITH_ANNEXURES.xlsx",
+    ),
+    "SA Infra": ("SA Infra FS 2023-24", "sa_infrastructure_excel.py", build_sa_infra),
+    "SMO": (
+        "SMO Provisional FY 23-24 (1)_compressed",
+        "create_smo_ferro_excel.py",
+        build_smo,
+    ),
+    "VNHPL": ("VNHPL FY22", "financial_statements_converter.py", build_vnhpl),
+    "Kunstocom": (
+        "Kunstocom Signed BS FY 2020-21",
+        "pdf_to_excel_converter.py",
+        build_kunstocom,
+    ),
+}
+
+
+def styles_stats(path):
+    """Size of the workbook's styles.xml, its cellXfs, fonts and named
+    styles counts, and the named styles no cell format uses"""
+    with zipfile.ZipFile(path) as archive:
+        xml = archive.read("xl/styles.xml").decode("utf-8")
+    counts = {}
+    for tag in ("cellXfs", "fonts"):
+        match = re.search(rf'<{tag} count="(\d+)"', xml)
+        counts[tag] = int(match.group(1)) if match else 0
+
+    cell_xfs = re.search(r"<cellXfs[^>]*>(.*?)</cellXfs>", xml, re.S)
+    used = set(re.findall(r'xfId="(\d+)"', cell_xfs.group(1))) if cell_xfs else set()
+    used.add("0")
+    named = re.findall(r'<cellStyle name="([^"]*)"[^>]*xfId="(\d+)"', xml)
+    unused = [name for name, xf_id in named if xf_id not in used]
+    return len(xml.encode("utf-8")), counts["cellXfs"], counts["fonts"], len(named), unused
+
+
+def run_child(tree, name, workdir):
+    """Build one workbook in this process and print its measurements"""
+    folder, script, build = GENERATORS[name]
+    folder = os.path.join(tree, folder)
+    script = os.path.join(folder, script)
+    sys.path.insert(0, folder)
+    os.chdir(workdir)
+    # Load the heavy dependencies before the clock starts
+    import openpyxl  # noqa: F401
+    import pandas  # noqa: F401
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        if callable(build):
+            module = load_module(script)
+            start = time.perf_counter()
+            output = build(module)
+        else:
+            start = time.perf_counter()
+            runpy.run_path(script, run_name="__main__")
+            output = build
+        seconds = time.perf_counter() - start
+
+    size, xfs, fonts, named, unused = styles_stats(output)
+    print(json.dumps({
+        "seconds": seconds,
+        "path": os.path.abspath(output),
+        "styles_bytes": size,
+        "cell_xfs": xfs,
+        "fonts": fonts,
+        "named_styles": named,
+        "unused_styles": unused,
+    }))
+
+
+def measure(tree, name, repeat, keep=None):
+    """Best of ``repeat`` fresh-process builds of one generator"""
+    best = None
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as workdir:
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", tree, name, workdir],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+            if keep:
+                os.makedirs(keep, exist_ok=True)
+                shutil.copy(result["path"], os.path.join(keep, f"{name}.xlsx"))
+        if best is None or result["seconds"] < best["seconds"]:
+            best = result
+    return best
+
+
+def export_revision(rev, destination):
+    """Write this tree as of git revision ``rev`` into ``destination``"""
+    top, prefix = subprocess.run(
+        ["git", "rev-parse", "--show-toplevel", "--show-prefix"],
+        cwd=PROGRAMS, check=True, capture_output=True, text=True,
+    ).stdout.splitlines()
+    # git archive only takes a subtree from the top of the work tree
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", f"{rev}:{prefix}"],
+        cwd=top, check=True, capture_output=True,
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(destination)
+
+
+def describe(result):
+    return (
+        f"{result['seconds'] * 1000:8.0f} ms  {result['styles_bytes'] / 1024:7.1f} KB"
+        f"  {result['cell_xfs']:5d} xfs  {result['fonts']:4d} fonts"
+        f"  {result['named_styles']:4d} named"
+        + (f" ({', '.join(result['unused_styles'])} unused)" if result["unused_styles"] else "")
+    )
+
+
+def main():
+    if len(sys.argv) == 5 and sys.argv[1] == "--child":
+        run_child(*sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", metavar="REV", help="git revision to compare with")
+    parser.add_argument("--only", nargs="+", choices=list(GENERATORS), metavar="NAME")
+    parser.add_argument("--keep", metavar="DIR", help="copy the workbooks here")
+    args = parser.parse_args()
+    names = args.only or list(GENERATORS)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        trees = [("current", PROGRAMS)]
+        if args.baseline:
+            baseline = os.path.join(scratch, "baseline")
+            export_revision(args.baseline, baseline)
+            trees.insert(0, ("baseline", baseline))
+
+        for name in names:
+            results = {}
+            for label, tree in trees:
+                keep = args.keep
+                if keep and args.baseline:
+                    keep = os.path.join(keep, label)
+                results[label] = measure(tree, name, args.repeat, keep)
+
+            if args.baseline:
+                before, after = results["baseline"], results["current"]
+                print(f"{name}")
+                print(f"  baseline  {describe(before)}")
+                print(f"  current   {describe(after)}")
+                time_change = after["seconds"] / before["seconds"] - 1
+                size_change = after["styles_bytes"] / before["styles_bytes"] - 1
+                print(f"  change    {time_change:+8.0%}  {size_change:+10.0%}")
+            else:
+                print(f"{name:<10} {describe(results['current'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Compare the openpyxl and xlsxwriter workbook writer backends
+
+Usage:
+    python benchmarks/bench_writer_backends.py [--repeat N] [--only NAME ...]
+                                               [--workers N ...] [--keep DIR]
+
+Builds the NECC, SMO and SA Infra workbooks through each backend (see
+workbook_writer in their folders), each run in a fresh process started in
+a scratch directory with WORKBOOK_BACKEND set, and reports the best build
+time over --repeat runs, the process's peak RSS, how much of it the build
+added over the imports, and the size of the saved workbook.
+
+--workers runs each backend again with WORKBOOK_WORKERS set to each N,
+building the NECC and SA Infra sheets in N worker processes (see
+parallel_workbooks); the RSS figures are then the parent process's only.
+The parallel build is experimental until this shows it ahead of the
+serial one on a multi-core machine.
+
+--keep copies the workbooks to DIR/<backend>/ for checking side by side
+(DIR/<backend>-<N>/ for the parallel builds).
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import runpy
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_workbook_styles import GENERATORS, PROGRAMS, load_module
+
+BACKENDS = ("openpyxl", "xlsxwriter")
+NAMES = ("NECC", "SMO", "SA Infra")
+# Generators that build their sheets in parallel with WORKBOOK_WORKERS
+PARALLEL = ("NECC", "SA Infra")
+
+
+def peak_rss_kb():
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_child(name, workdir):
+    """Build one workbook in this process and print its measurements"""
+    folder, script, build = GENERATORS[name]
+    folder = os.path.join(PROGRAMS, folder)
+    script = os.path.join(folder, script)
+    sys.path.insert(0, folder)
+    os.chdir(workdir)
+    # Load the heavy dependencies before the clock starts
+    import openpyxl  # noqa: F401
+    import pandas  # noqa: F401
+    import xlsxwriter  # noqa: F401
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        if callable(build):
+            module = load_module(script)
+            before = peak_rss_kb()
+            start = time.perf_counter()
+            output = build(module)
+        else:
+            before = peak_rss_kb()
+            start = time.perf_counter()
+            runpy.run_path(script, run_name="__main__")
+            output = build
+        seconds = time.perf_counter() - start
+
+    peak = peak_rss_kb()
+    print(json.dumps({
+        "seconds": seconds,
+        "peak_kb": peak,
+        "build_kb": peak - before,
+        "bytes": os.path.getsize(output),
+        "path": os.path.abspath(output),
+    }))
+
+
+def measure(name, backend, repeat, keep=None, workers=1):
+    """Best of ``repeat`` fresh-process builds of one generator"""
+    env = dict(os.environ, WORKBOOK_BACKEND=backend, WORKBOOK_WORKERS=str(workers))
+    label = backend if workers == 1 else f"{backend}-{workers}"
+    best = None
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as workdir:
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", name, workdir],
+                check=True,
+                capture_output=True,
+                text=True,
+                env=env,
+            ).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+            if keep:
+                directory = os.path.join(keep, label)
+                os.makedirs(directory, exist_ok=True)
+                shutil.copy(result["path"], os.path.join(directory, f"{name}.xlsx"))
+        if best is None or result["seconds"] < best["seconds"]:
+            best = result
+    return best
+
+
+def describe(result):
+    return (
+        f"{result['seconds'] * 1000:8.0f} ms  {result['peak_kb'] / 1024:7.1f} MB peak"
+        f"  {result['build_kb'] / 1024:+7.1f} MB build  {result['bytes'] / 1024:7.1f} KB"
+    )
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        run_child(*sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="+", choices=NAMES, metavar="NAME")
+    parser.add_argument("--workers", type=int, nargs="+", default=[], metavar="N",
+                        help="also build with N worker processes")
+    parser.add_argument("--keep", metavar="DIR", help="copy the workbooks here")
+    args = parser.parse_args()
+
+    for name in args.only or NAMES:
+        results = {
+            backend: measure(name, backend, args.repeat, args.keep)
+            for backend in BACKENDS
+        }
+        print(name)
+        for backend in BACKENDS:
+            print(f"  {backend:<12} {describe(results[backend])}")
+        before, after = results["openpyxl"], results["xlsxwriter"]
+        time_change = after["seconds"] / before["seconds"] - 1
+        size_change = after["bytes"] / before["bytes"] - 1
+        print(f"  change       {time_change:+8.0%}  {'':30}{size_change:+9.0%}")
+        if name not in PARALLEL:
+            continue
+        for workers in args.workers:
+            for backend in BACKENDS:
+                result = measure(name, backend, args.repeat, args.keep, workers)
+                label = f"{backend}-{workers}"
+                speedup = results[backend]["seconds"] / result["seconds"]
+                print(f"  {label:<12} {describe(result)}  x{speedup:.2f}")
+
+
+if __name__ == "__main__":
+    main()
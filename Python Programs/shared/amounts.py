@@ -0,0 +1,231 @@
+from collections import namedtuple
+from decimal import Decimal
+
+import numpy as np
+
+
+# Cell contents that mean "nothing" in a statement and parse as zero
+NIL_MARKERS = ("-", "--", "—", "–", "Nil", "NIL", "nil")
+
+# Excel number formats with Indian lakh/crore grouping and negative
+# amounts in brackets: 1,58,73,55,063.16 and (19,09,500.00). Telling
+# sizes apart inside one format takes conditions, which leave it no
+# negative section, so there is one format per size band instead, with
+# the smallest amount it is for (see indian_number_format)
+INDIAN_NUMBER_FORMATS = (
+    (1_000_000_000, r"#\,##\,##\,##\,##0.00;(#\,##\,##\,##\,##0.00)"),
+    (10_000_000, r"##\,##\,##\,##0.00;(##\,##\,##\,##0.00)"),
+    (100_000, r"##\,##\,##0.00;(##\,##\,##0.00)"),
+    (0, "#,##0.00;(#,##0.00)"),
+)
+
+# The format for amounts below a lakh, where Indian and western grouping
+# agree; the default for cells styled before their amount is known
+INDIAN_NUMBER_FORMAT = INDIAN_NUMBER_FORMATS[-1][1]
+
+# Strings are parsed in blocks of this many so the per-character work
+# arrays stay small
+CHUNK_ROWS = 1 << 16
+
+# Amounts with more digits than this cannot be assembled exactly in a
+# float64 mantissa and are converted one by one instead
+MAX_EXACT_DIGITS = 15
+
+ParsedAmounts = namedtuple("ParsedAmounts", "values valid errors")
+
+_POW10 = 10 ** np.arange(19, dtype=np.int64)
+_POW10_FLOAT = 10.0 ** np.arange(MAX_EXACT_DIGITS + 1)
+_ZERO, _NINE = ord("0"), ord("9")
+_COMMA, _DOT, _MINUS, _OPEN, _CLOSE = (ord(c) for c in ",.-()")
+
+
+def _shift(mask, step):
+    """Shift a characters x rows mask by one character, padding with False"""
+    shifted = np.zeros_like(mask)
+    if step > 0:
+        shifted[1:] = mask[:-1]
+    else:
+        shifted[:-1] = mask[1:]
+    return shifted
+
+
+def _seen(mask, reverse=False):
+    """Running "any" down the character axis: True from the first True on"""
+    seen = mask.copy()
+    rows = range(len(seen) - 2, -1, -1) if reverse else range(1, len(seen))
+    step = 1 if reverse else -1
+    for j in rows:
+        seen[j] |= seen[j + step]
+    return seen
+
+
+def _parse_codes(chars):
+    """Parse a block of strings given as a characters x rows byte array
+
+    ``chars[j, i]`` is the j-th character of string i (non-ASCII clipped
+    to 255, padding 0). Every step is a whole-array operation over the
+    block. Returns ``(valid, negative, mantissa, decimals, exact)`` per
+    string; the amount is ``mantissa / 10**decimals`` when ``exact`` is set.
+    """
+    # Strip surrounding whitespace
+    significant = chars > 32
+    inside = _seen(significant) & _seen(significant, reverse=True)
+    present = inside.any(axis=0)
+
+    # Peel off "(...)" and then a leading "-"
+    is_first = inside & ~_shift(inside, 1)
+    is_last = inside & ~_shift(inside, -1)
+    parens = (
+        (is_first & (chars == _OPEN)).any(axis=0)
+        & (is_last & (chars == _CLOSE)).any(axis=0)
+        & (inside.sum(axis=0) > 1)
+    )
+    body = inside & ~((is_first | is_last) & parens)
+    is_first = body & ~_shift(body, 1)
+    minus = (is_first & (chars == _MINUS)).any(axis=0)
+    body &= ~(is_first & minus)
+
+    digit = body & (chars >= _ZERO) & (chars <= _NINE)
+    comma = body & (chars == _COMMA)
+    dot = body & (chars == _DOT)
+    after_dot = _seen(dot)
+    body_edges = body & ~(_shift(body, 1) & _shift(body, -1))
+
+    digit_count = digit.sum(axis=0)
+    valid = (
+        present
+        & ~(body & ~(digit | comma | dot)).any(axis=0)
+        & (digit_count > 0)
+        & (dot.sum(axis=0) <= 1)
+        & ~(body_edges & comma).any(axis=0)
+        & ~(comma[1:] & comma[:-1]).any(axis=0)
+        & ~(comma & after_dot).any(axis=0)
+        & ~(parens & minus)
+    )
+
+    # Assemble the digits left to right, one character position at a time
+    mantissa = np.zeros(chars.shape[1], dtype=np.int64)
+    for is_digit, code in zip(digit, chars):
+        step = mantissa * 10 + (code.astype(np.int64) - _ZERO)
+        np.copyto(mantissa, step, where=is_digit)
+    decimals = (digit & after_dot).sum(axis=0)
+    exact = digit_count <= MAX_EXACT_DIGITS
+    return valid, parens | minus, mantissa, decimals, exact
+
+
+def _clean(text):
+    """Strip sign, parentheses and grouping from a valid amount string"""
+    text = text.strip()
+    if text.startswith("(") and text.endswith(")"):
+        text = text[1:-1]
+    return text.lstrip("-").replace(",", "")
+
+
+def parse_amounts(texts, decimal=False):
+    """Parse a whole column of amount strings in one vectorized pass
+
+    Accepts Indian ("1,58,73,55,063.16") and western grouping, a leading
+    minus sign, parenthesized negatives ("(19,09,500.00)") and the nil
+    markers in ``NIL_MARKERS``, which parse as zero. ``texts`` may be any
+    array-like of strings, e.g. a list of rows; the result has its shape.
+
+    The strings are viewed as a character-position x string byte array and
+    checked and converted with array operations only; no Python code runs
+    per value except for amounts longer than ``MAX_EXACT_DIGITS`` digits
+    (and per valid value when building ``Decimal`` results).
+
+    Returns ``ParsedAmounts(values, valid, errors)``: ``values`` is a
+    float64 array (NaN where invalid), or an object array of ``Decimal``
+    (None where invalid) when ``decimal`` is True; ``valid`` is a boolean
+    mask; ``errors`` holds the flat positions of non-blank cells that are
+    not amounts.
+    """
+    text = np.asarray(texts, dtype=str)
+    shape = text.shape
+    flat = np.ascontiguousarray(text.ravel())
+    size = flat.size
+    width = flat.dtype.itemsize // 4
+
+    valid = np.zeros(size, dtype=bool)
+    blank = np.ones(size, dtype=bool)
+    if decimal:
+        values = np.full(size, None, dtype=object)
+    else:
+        values = np.full(size, np.nan)
+
+    for begin in range(0, size if width else 0, CHUNK_ROWS):
+        block = flat[begin:begin + CHUNK_ROWS]
+        codes = block.view(np.uint32).reshape(-1, width)
+        chars = np.minimum(codes, 255).astype(np.uint8).T.copy()
+        ok, negative, mantissa, decimals, exact = _parse_codes(chars)
+        stripped = np.char.strip(block)
+        nil = np.isin(stripped, NIL_MARKERS)
+        ok &= ~nil
+
+        if decimal:
+            chunk = np.full(len(block), None, dtype=object)
+            for i in np.flatnonzero(ok):
+                if exact[i]:
+                    amount = Decimal(int(mantissa[i])).scaleb(-int(decimals[i]))
+                else:
+                    amount = Decimal(_clean(block[i]))
+                chunk[i] = -amount if negative[i] else amount
+            chunk[nil] = Decimal(0)
+        else:
+            chunk = np.full(len(block), np.nan)
+            fast = ok & exact
+            chunk[fast] = mantissa[fast] / _POW10_FLOAT[decimals[fast]]
+            for i in np.flatnonzero(ok & ~exact):
+                chunk[i] = float(_clean(block[i]))
+            np.negative(chunk, out=chunk, where=ok & negative)
+            chunk[nil] = 0.0
+
+        end = begin + len(block)
+        values[begin:end] = chunk
+        valid[begin:end] = ok | nil
+        blank[begin:end] = stripped == ""
+
+    errors = np.flatnonzero(~valid & ~blank)
+    return ParsedAmounts(values.reshape(shape), valid.reshape(shape), errors)
+
+
+def parse_amount(text):
+    """Parse a single amount cell with the same rules as ``parse_amounts``
+
+    Returns a float, 0.0 for nil markers, or None if the cell is not an
+    amount.
+    """
+    text = text.strip()
+    if text in NIL_MARKERS:
+        return 0.0
+
+    parens = len(text) > 1 and text.startswith("(") and text.endswith(")")
+    body = text[1:-1] if parens else text
+    minus = body.startswith("-")
+    if minus:
+        if parens:
+            return None
+        body = body[1:]
+
+    digits = body.replace(",", "")
+    dot = body.find(".")
+    if (
+        not digits.isascii()
+        or not digits.replace(".", "", 1).isdecimal()
+        or body.startswith(",")
+        or body.endswith(",")
+        or ",," in body
+        or (dot >= 0 and body.rfind(",") > dot)
+    ):
+        return None
+
+    value = float(digits)
+    return -value if parens or minus else value
+
+
+def indian_number_format(value):
+    """The ``INDIAN_NUMBER_FORMATS`` entry for an amount the size of ``value``"""
+    size = abs(round(value, 2))
+    for smallest, number_format in INDIAN_NUMBER_FORMATS:
+        if size >= smallest:
+            return number_format
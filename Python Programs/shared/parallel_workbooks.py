@@ -0,0 +1,437 @@
+"""Build a workbook's sheets in parallel and merge them into one file
+
+A generator whose sheets do not depend on one another can build them in
+worker processes, a few sheets to each, every worker saving its sheets as
+a workbook of their own (a "part"). ``merge_workbooks`` then joins the
+parts into the one .xlsx, at the package level: the sheet XML is copied
+over with its style (and shared string) indexes rewritten against a
+style table (and string table) unified across the parts, and the
+workbook, relationship and content type parts are written afresh for the
+merged set of sheets.
+
+Parts are expected to come from the same generator and writer backend
+(see workbook_writer): plain sheets of values and styles, merged cells,
+column widths and row heights. Anything tied to the workbook beyond
+that - defined names, differential formats (conditional formatting),
+sheet relationships such as hyperlinks or drawings - is refused with a
+ValueError rather than merged wrongly.
+
+Experimental: the serial build stays the default (WORKBOOK_WORKERS=1).
+A parallel build only pays once the per-process start-up, imports and
+merge are outweighed by sheets built side by side on separate cores, and
+that has not been measured yet; on a single core NECC and SA Infra build
+two to three times slower with 2-4 workers than serially.
+"""
+import functools
+import io
+import os
+import re
+import tempfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape, quoteattr
+from zipfile import ZIP_DEFLATED, ZipFile
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+WORKSHEET_TYPE = REL_NS + "/worksheet"
+STYLES_TYPE = REL_NS + "/styles"
+THEME_TYPE = REL_NS + "/theme"
+SHARED_STRINGS_TYPE = REL_NS + "/sharedStrings"
+
+SPREADSHEET_CT = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+CONTENT_TYPES = {
+    "workbook": SPREADSHEET_CT + ".sheet.main+xml",
+    "worksheet": SPREADSHEET_CT + ".worksheet+xml",
+    "styles": SPREADSHEET_CT + ".styles+xml",
+    "sharedStrings": SPREADSHEET_CT + ".sharedStrings+xml",
+    "theme": "application/vnd.openxmlformats-officedocument.theme+xml",
+    "core": "application/vnd.openxmlformats-package.core-properties+xml",
+    "app": "application/vnd.openxmlformats-officedocument.extended-properties+xml",
+}
+
+# styles.xml children, in the order the schema requires
+STYLE_PARTS = (
+    "numFmts", "fonts", "fills", "borders", "cellStyleXfs", "cellXfs",
+    "cellStyles", "dxfs", "tableStyles", "colors", "extLst",
+)
+# Custom number formats are numbered from here; lower ids are built in
+FIRST_CUSTOM_NUMFMT = 164
+
+# Cell, row and column tags with their style index, and a cell's value
+STYLED_TAG = re.compile(rb'<(c|row|col)\b([^>]*?)(/?)>(?:<v>(\d+)</v>)?')
+STYLE_ATTR = re.compile(rb'\b(s|style)="(\d+)"')
+TAB_SELECTED = re.compile(rb' tabSelected="1"')
+
+
+def _q(tag, ns):
+    return f"{{{ns}}}{tag}"
+
+
+def _parse(data):
+    """Parse an XML part, with SpreadsheetML tags unqualified
+
+    The prefixes the part declares for other namespaces are kept for
+    writing it back (see _tostring).
+    """
+    for _, (prefix, uri) in ET.iterparse(io.BytesIO(data), events=("start-ns",)):
+        if prefix and not re.match(r"ns\d+$", prefix):
+            ET.register_namespace(prefix, uri)
+    root = ET.fromstring(data)
+    main = f"{{{MAIN_NS}}}"
+    for element in root.iter():
+        if element.tag.startswith(main):
+            element.tag = element.tag[len(main):]
+    return root
+
+
+def _tostring(root):
+    """Serialize a part parsed by _parse, with SpreadsheetML the default namespace"""
+    root.set("xmlns", MAIN_NS)
+    return ET.tostring(root, encoding="UTF-8")
+
+
+def _relationships(archive, path):
+    """{Id: (Type, part name)} of the relationships of part ``path``"""
+    folder, name = os.path.split(path)
+    rels = _parse(archive.read(f"{folder}/_rels/{name}.rels"))
+    result = {}
+    for rel in rels.iter(_q("Relationship", PKG_REL_NS)):
+        target = rel.get("Target")
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = os.path.normpath(os.path.join(folder, target)).replace(os.sep, "/")
+        result[rel.get("Id")] = (rel.get("Type"), target)
+    return result
+
+
+class _Part:
+    """One part workbook: its sheets and the paths of its shared parts"""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.archive = ZipFile(filename)
+        workbook = self.archive.read("xl/workbook.xml")
+        root = _parse(workbook)
+        if root.find("definedNames/definedName") is not None:
+            raise ValueError(f"{filename}: defined names cannot be merged")
+        self.workbook = workbook
+        rels = _relationships(self.archive, "xl/workbook.xml")
+        self.sheets = []
+        for sheet in root.iter("sheet"):
+            _, path = rels[sheet.get(_q("id", REL_NS))]
+            folder, name = os.path.split(path)
+            if f"{folder}/_rels/{name}.rels" in self.archive.namelist():
+                raise ValueError(
+                    f"{filename}: sheet {sheet.get('name')!r} has relationships"
+                    " (hyperlinks, drawings, ...) which cannot be merged"
+                )
+            self.sheets.append((sheet.get("name"), sheet.get("state"), path))
+        self.shared = {}
+        for rel_type, path in rels.values():
+            if rel_type != WORKSHEET_TYPE:
+                self.shared[rel_type] = path
+
+    def read(self, rel_type):
+        path = self.shared.get(rel_type)
+        return None if path is None else self.archive.read(path)
+
+    def close(self):
+        self.archive.close()
+
+
+class _Table:
+    """Elements deduplicated by their serialized form, in first-seen order"""
+
+    def __init__(self):
+        self.elements = []
+        self.index = {}
+
+    def add(self, element):
+        key = ET.tostring(element)
+        if key not in self.index:
+            self.index[key] = len(self.elements)
+            self.elements.append(element)
+        return self.index[key]
+
+
+class _StyleMerger:
+    """The style table unified across the parts' styles.xml"""
+
+    def __init__(self):
+        self.root = None
+        self.num_fmts = {}  # formatCode: numFmtId
+        self.tables = {tag: _Table() for tag in ("fonts", "fills", "borders",
+                                                 "cellStyleXfs", "cellXfs")}
+        self.cell_styles = {}  # name: cellStyle element
+
+    def add(self, data):
+        """Fold in one part's styles.xml; return its cellXfs index map"""
+        root = _parse(data)
+        if self.root is None:
+            self.root = root
+        dxfs = root.find("dxfs")
+        if dxfs is not None and len(dxfs):
+            raise ValueError("differential formats (dxfs) cannot be merged")
+
+        num_fmt_map = {}
+        for num_fmt in root.iterfind("numFmts/numFmt"):
+            code = num_fmt.get("formatCode")
+            if code not in self.num_fmts:
+                self.num_fmts[code] = FIRST_CUSTOM_NUMFMT + len(self.num_fmts)
+            num_fmt_map[num_fmt.get("numFmtId")] = str(self.num_fmts[code])
+
+        maps = {}
+        for tag in ("fonts", "fills", "borders"):
+            maps[tag] = [
+                str(self.tables[tag].add(element))
+                for element in root.iterfind(f"{tag}/*")
+            ]
+
+        def add_xfs(tag, style_xf_map=None):
+            indexes = []
+            for xf in root.iterfind(f"{tag}/xf"):
+                num_fmt_id = xf.get("numFmtId")
+                if num_fmt_id in num_fmt_map:
+                    xf.set("numFmtId", num_fmt_map[num_fmt_id])
+                for attr, table in (("fontId", "fonts"), ("fillId", "fills"),
+                                    ("borderId", "borders")):
+                    if xf.get(attr) is not None:
+                        xf.set(attr, maps[table][int(xf.get(attr))])
+                if style_xf_map is not None and xf.get("xfId") is not None:
+                    xf.set("xfId", style_xf_map[int(xf.get("xfId"))])
+                indexes.append(self.tables[tag].add(xf))
+            return indexes
+
+        style_xf_map = [str(i) for i in add_xfs("cellStyleXfs")]
+        for style in root.iterfind("cellStyles/cellStyle"):
+            if style.get("name") not in self.cell_styles:
+                style.set("xfId", style_xf_map[int(style.get("xfId"))])
+                self.cell_styles[style.get("name")] = style
+        return add_xfs("cellXfs", style_xf_map)
+
+    def tostring(self):
+        root = ET.Element(self.root.tag, self.root.attrib)
+        for tag in STYLE_PARTS:
+            if tag == "numFmts":
+                if not self.num_fmts:
+                    continue
+                children = [
+                    ET.Element("numFmt", numFmtId=str(num_fmt_id), formatCode=code)
+                    for code, num_fmt_id in self.num_fmts.items()
+                ]
+            elif tag in self.tables:
+                children = self.tables[tag].elements
+            elif tag == "cellStyles":
+                children = list(self.cell_styles.values())
+            else:
+                element = self.root.find(tag)
+                if element is not None:
+                    root.append(element)
+                continue
+            element = ET.SubElement(root, tag, count=str(len(children)))
+            element.extend(children)
+        return _tostring(root)
+
+
+class _StringMerger:
+    """The shared string table unified across the parts' sharedStrings.xml"""
+
+    def __init__(self):
+        self.table = _Table()
+        self.references = 0
+
+    def add(self, data):
+        """Fold in one part's sharedStrings.xml; return its index map"""
+        if data is None:
+            return []
+        root = _parse(data)
+        self.references += int(root.get("count") or 0)
+        return [self.table.add(si) for si in root.iterfind("si")]
+
+    def __len__(self):
+        return len(self.table.elements)
+
+    def tostring(self):
+        root = ET.Element("sst", count=str(self.references),
+                          uniqueCount=str(len(self)))
+        root.extend(self.table.elements)
+        return _tostring(root)
+
+
+def _rewrite_sheet(data, xf_map, string_map, selected):
+    """Renumber a sheet's style and shared string indexes"""
+    if not selected:
+        data = TAB_SELECTED.sub(b"", data)
+    if xf_map == list(range(len(xf_map))) and string_map == list(range(len(string_map))):
+        return data
+
+    xf_map = [str(i).encode() for i in xf_map]
+
+    def restyle(match):
+        return match.group(1) + b'="' + xf_map[int(match.group(2))] + b'"'
+
+    def rewrite(match):
+        tag, attrs, close, value = match.groups()
+        attrs = STYLE_ATTR.sub(restyle, attrs)
+        out = b"<" + tag + attrs + close + b">"
+        if value is not None:
+            if b't="s"' in attrs:
+                value = str(string_map[int(value)]).encode()
+            out += b"<v>" + value + b"</v>"
+        return out
+
+    return STYLED_TAG.sub(rewrite, data)
+
+
+def _workbook_xml(template, sheets):
+    """``template``'s workbook.xml with its sheet list replaced"""
+    entries = []
+    for number, (name, state) in enumerate(sheets, 1):
+        state = "" if state is None else f" state={quoteattr(state)}"
+        entries.append(
+            f'<sheet name={quoteattr(name)} sheetId="{number}"{state} r:id="rId{number}"/>'
+        )
+    listing = ("<sheets>" + "".join(entries) + "</sheets>").encode("utf-8")
+    return re.sub(rb"<sheets>.*</sheets>", lambda _: listing, template, flags=re.S)
+
+
+def _relationships_xml(relationships):
+    entries = "".join(
+        f'<Relationship Id="{rel_id}" Type="{rel_type}" Target="{escape(target)}"/>'
+        for rel_id, rel_type, target in relationships
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Relationships xmlns="{PKG_REL_NS}">{entries}</Relationships>'
+    ).encode("utf-8")
+
+
+def _content_types_xml(overrides):
+    entries = "".join(
+        f'<Override PartName="/{path}" ContentType="{content_type}"/>'
+        for path, content_type in overrides
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        f"{entries}</Types>"
+    ).encode("utf-8")
+
+
+def merge_workbooks(parts, filename):
+    """Join the sheets of the workbooks ``parts``, in order, into ``filename``"""
+    parts = [_Part(part) for part in parts]
+    try:
+        styles = _StyleMerger()
+        strings = _StringMerger()
+        maps = [
+            (styles.add(part.read(STYLES_TYPE)), strings.add(part.read(SHARED_STRINGS_TYPE)))
+            for part in parts
+        ]
+        first = parts[0]
+        theme = first.read(THEME_TYPE)
+        names = first.archive.namelist()
+
+        sheets = []
+        overrides = [("xl/workbook.xml", CONTENT_TYPES["workbook"])]
+        with ZipFile(filename, "w", ZIP_DEFLATED, allowZip64=True) as archive:
+            for part, (xf_map, string_map) in zip(parts, maps):
+                for name, state, path in part.sheets:
+                    sheets.append((name, state))
+                    target = f"worksheets/sheet{len(sheets)}.xml"
+                    data = _rewrite_sheet(
+                        part.archive.read(path), xf_map, string_map, len(sheets) == 1
+                    )
+                    archive.writestr(f"xl/{target}", data)
+                    overrides.append((f"xl/{target}", CONTENT_TYPES["worksheet"]))
+
+            relationships = [
+                (f"rId{number}", WORKSHEET_TYPE, f"worksheets/sheet{number}.xml")
+                for number in range(1, len(sheets) + 1)
+            ]
+            archive.writestr("xl/styles.xml", styles.tostring())
+            relationships.append((f"rId{len(relationships) + 1}", STYLES_TYPE, "styles.xml"))
+            overrides.append(("xl/styles.xml", CONTENT_TYPES["styles"]))
+            if theme is not None:
+                archive.writestr("xl/theme/theme1.xml", theme)
+                relationships.append(
+                    (f"rId{len(relationships) + 1}", THEME_TYPE, "theme/theme1.xml")
+                )
+                overrides.append(("xl/theme/theme1.xml", CONTENT_TYPES["theme"]))
+            if len(strings):
+                archive.writestr("xl/sharedStrings.xml", strings.tostring())
+                relationships.append(
+                    (f"rId{len(relationships) + 1}", SHARED_STRINGS_TYPE, "sharedStrings.xml")
+                )
+                overrides.append(("xl/sharedStrings.xml", CONTENT_TYPES["sharedStrings"]))
+
+            archive.writestr("xl/workbook.xml", _workbook_xml(first.workbook, sheets))
+            archive.writestr("xl/_rels/workbook.xml.rels", _relationships_xml(relationships))
+
+            package_rels = [("rId1", REL_NS + "/officeDocument", "xl/workbook.xml")]
+            if "docProps/core.xml" in names:
+                archive.writestr("docProps/core.xml", first.archive.read("docProps/core.xml"))
+                package_rels.append((
+                    "rId2",
+                    "http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties",
+                    "docProps/core.xml",
+                ))
+                overrides.append(("docProps/core.xml", CONTENT_TYPES["core"]))
+            # The parts' app.xml may list their own sheets; write a bare one
+            archive.writestr("docProps/app.xml", (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">'
+                "<Application>Microsoft Excel</Application></Properties>"
+            ).encode("utf-8"))
+            package_rels.append((
+                f"rId{len(package_rels) + 1}",
+                REL_NS + "/extended-properties",
+                "docProps/app.xml",
+            ))
+            overrides.append(("docProps/app.xml", CONTENT_TYPES["app"]))
+
+            archive.writestr("_rels/.rels", _relationships_xml(package_rels))
+            archive.writestr("[Content_Types].xml", _content_types_xml(overrides))
+    finally:
+        for part in parts:
+            part.close()
+
+
+def resolve_workers(workers=None):
+    """Map None to WORKBOOK_WORKERS (default 1, serial); validate counts"""
+    if workers is None:
+        workers = os.environ.get("WORKBOOK_WORKERS", "1")
+    workers = int(workers)
+    if workers < 1:
+        raise ValueError(f"Need at least one workbook worker, not {workers}")
+    return workers
+
+
+def build_in_parallel(build_part, sheets, filename, workers=None, **options):
+    """Build ``sheets`` in worker processes, merged into ``filename``
+
+    ``build_part(sheets, part_filename, **options)`` must build and save a
+    workbook of just the sheets given (titles, or whatever else the
+    generator names its sheets by), in order; it is called in the workers
+    (so it has to be a module-level function). The sheets are split into
+    consecutive runs, about two to a worker so one slow sheet does not hold
+    up the rest, and the parts merged in order (see merge_workbooks).
+    """
+    workers = workers or os.cpu_count() or 1
+    sheets = list(sheets)
+    count = max(1, min(len(sheets), workers * 2))
+    runs = [
+        sheets[len(sheets) * i // count:len(sheets) * (i + 1) // count]
+        for i in range(count)
+    ]
+    with tempfile.TemporaryDirectory() as scratch:
+        paths = [os.path.join(scratch, f"part{i}.xlsx") for i in range(count)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(functools.partial(build_part, **options), runs, paths))
+        merge_workbooks(paths, filename)
@@ -0,0 +1,99 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from amounts import (
+    INDIAN_NUMBER_FORMATS,
+    indian_number_format,
+    parse_amount,
+    parse_amounts,
+)
+
+SAMPLES = [
+    "1,58,73,55,063.16",
+    "(19,09,500.00)",
+    "-1,000",
+    "1,000.5",
+    "12",
+    " 42 ",
+    "0.5",
+    ".5",
+    "5.",
+    "-",
+    "--",
+    "Nil",
+    "",
+    "  ",
+    "abc",
+    "1,,000",
+    "(-5)",
+    ",100",
+    "100,",
+    "1.2.3",
+    "1,000.00,0",
+    "(5",
+    "()",
+    "1 000",
+    "₹100",
+    "12345678901234567.5",
+]
+
+
+def test_column_parse_matches_single_cell_parse():
+    parsed = parse_amounts(SAMPLES)
+    for text, value, valid in zip(SAMPLES, parsed.values, parsed.valid):
+        expected = parse_amount(text)
+        if expected is None:
+            assert not valid, text
+            assert np.isnan(value), text
+        else:
+            assert valid, text
+            assert value == pytest.approx(expected), text
+
+
+@pytest.mark.parametrize(
+    "text, value",
+    [
+        ("1,58,73,55,063.16", 1587355063.16),
+        ("(19,09,500.00)", -1909500.0),
+        ("-1,000", -1000.0),
+        ("Nil", 0.0),
+        ("-", 0.0),
+    ],
+)
+def test_parse_amount(text, value):
+    assert parse_amount(text) == value
+
+
+def test_errors_list_invalid_cells_but_not_blank_ones():
+    parsed = parse_amounts(["1", "", "x", "  ", "2,,0"])
+    assert parsed.errors.tolist() == [2, 4]
+
+
+def test_result_keeps_the_input_shape():
+    parsed = parse_amounts([["1", "x"], ["(2)", ""]])
+    assert parsed.values.shape == (2, 2)
+    assert parsed.valid.tolist() == [[True, False], [True, False]]
+    assert parsed.values[1, 0] == -2.0
+
+
+def test_decimal_results():
+    parsed = parse_amounts(["1,09,500.10", "x"], decimal=True)
+    assert parsed.values[0] == Decimal("109500.10")
+    assert parsed.values[1] is None
+
+
+@pytest.mark.parametrize(
+    "value, smallest",
+    [(0, 0), (99_999.99, 0), (-1_909_500, 100_000), (15_873_550, 10_000_000),
+     (1_587_355_063.16, 1_000_000_000)],
+)
+def test_indian_number_format_picks_the_size_band(value, smallest):
+    assert indian_number_format(value) == dict(INDIAN_NUMBER_FORMATS)[smallest]
+
+
+def test_indian_number_formats_bracket_negatives():
+    for _, number_format in INDIAN_NUMBER_FORMATS:
+        positive, negative = number_format.split(";")
+        assert negative == f"({positive})"
@@ -0,0 +1,652 @@
+"""Workbook writer backends
+
+The generators build their workbooks through a small part of openpyxl's
+API: ``create_sheet``/``remove``/``wb[title]``, ``ws.cell``/``ws['A1']``
+with ``value``, ``style`` and the style attributes, ``merge_cells``,
+``column_dimensions``/``row_dimensions``, ``append``, named styles (see
+each script's ``register_styles``) and ``save``. ``new_workbook`` returns
+an empty workbook answering to that API from one of two backends:
+
+``openpyxl``
+    An ordinary ``openpyxl.Workbook``. The default, and the one to use
+    when a workbook is to be read back or edited after it is built.
+``xlsxwriter``
+    ``XlsxWriterWorkbook``: keeps each cell as its value and style and
+    writes the sheets with XlsxWriter in ``constant_memory`` mode when
+    saved, which serializes a workbook several times faster. Rows of
+    sheets created with ``create_streaming_sheet`` go to XlsxWriter as
+    they are appended. Nothing can be read back from a saved workbook.
+
+The backend is chosen per job: pass ``backend`` to ``new_workbook`` (the
+generators take it as an argument) or set WORKBOOK_BACKEND.
+
+Both backends hold sheet titles to Excel's 31 characters the same way
+(see ``sheet_title``), so a job names its sheets alike whichever it uses.
+"""
+import os
+import warnings
+
+import openpyxl
+from openpyxl.cell.cell import MergedCell
+from openpyxl.styles import Alignment, Border, PatternFill
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import (
+    column_index_from_string,
+    coordinate_from_string,
+    range_boundaries,
+)
+
+try:
+    import xlsxwriter
+except ImportError:  # optional: only needed for the xlsxwriter backend
+    xlsxwriter = None
+
+WORKBOOK_BACKENDS = ("openpyxl", "xlsxwriter")
+
+# openpyxl style values and their XlsxWriter format property values
+BORDER_STYLES = {
+    "thin": 1, "medium": 2, "dashed": 3, "dotted": 4, "thick": 5,
+    "double": 6, "hair": 7, "mediumDashed": 8, "dashDot": 9,
+    "mediumDashDot": 10, "dashDotDot": 11, "mediumDashDotDot": 12,
+    "slantDashDot": 13,
+}
+FILL_PATTERNS = {
+    "solid": 1, "mediumGray": 2, "darkGray": 3, "lightGray": 4,
+    "darkHorizontal": 5, "darkVertical": 6, "darkDown": 7, "darkUp": 8,
+    "darkGrid": 9, "darkTrellis": 10, "lightHorizontal": 11,
+    "lightVertical": 12, "lightDown": 13, "lightUp": 14, "lightGrid": 15,
+    "lightTrellis": 16, "gray125": 17, "gray0625": 18,
+}
+UNDERLINES = {"single": 1, "double": 2, "singleAccounting": 33, "doubleAccounting": 34}
+HORIZONTAL_ALIGNMENTS = {"centerContinuous": "center_across"}
+VERTICAL_ALIGNMENTS = {
+    "center": "vcenter", "justify": "vjustify", "distributed": "vdistributed",
+}
+
+
+def resolve_backend_name(name=None):
+    """Map None to WORKBOOK_BACKEND (default openpyxl); validate names"""
+    if name is None:
+        name = os.environ.get("WORKBOOK_BACKEND", "openpyxl")
+    if name not in WORKBOOK_BACKENDS:
+        raise ValueError(
+            f"Unknown workbook backend {name!r}; expected one of {list(WORKBOOK_BACKENDS)}"
+        )
+    return name
+
+
+def new_workbook(backend=None):
+    """Return a new workbook, with its default sheet, from ``backend``"""
+    if resolve_backend_name(backend) == "xlsxwriter":
+        return XlsxWriterWorkbook()
+    return OpenpyxlWorkbook()
+
+
+def sheet_title(title):
+    """``title`` cut to the 31 characters Excel allows in a sheet name
+
+    openpyxl only warns about longer titles and saves them as they are,
+    which Excel may refuse to open; XlsxWriter raises. Both backends cut
+    them here instead, with a warning.
+    """
+    if title is None or len(title) <= 31:
+        return title
+    warnings.warn(f"Sheet title {title!r} is cut to 31 characters")
+    return title[:31]
+
+
+class OpenpyxlWorkbook(openpyxl.Workbook):
+    """``openpyxl.Workbook`` with sheet titles cut as by ``sheet_title``"""
+
+    def create_sheet(self, title=None, index=None):
+        return super().create_sheet(sheet_title(title), index)
+
+    def __getitem__(self, key):
+        return super().__getitem__(sheet_title(key))
+
+
+def _color(color):
+    """'#RRGGBB' for an RGB openpyxl colour; None for theme/indexed ones"""
+    if color is None or color.type != "rgb":
+        return None
+    return "#" + color.rgb[-6:]
+
+
+def format_properties(font, border, alignment, fill, number_format):
+    """XlsxWriter format properties for openpyxl style objects"""
+    props = {}
+    if font.name is not None:
+        props["font_name"] = font.name
+    if font.sz is not None:
+        props["font_size"] = font.sz
+    if font.b:
+        props["bold"] = True
+    if font.i:
+        props["italic"] = True
+    if font.u:
+        props["underline"] = UNDERLINES.get(font.u, 1)
+    if font.strike:
+        props["font_strikeout"] = True
+    if font.vertAlign:
+        props["font_script"] = 1 if font.vertAlign == "superscript" else 2
+    if _color(font.color):
+        props["font_color"] = _color(font.color)
+
+    for side in ("left", "right", "top", "bottom"):
+        edge = getattr(border, side)
+        if edge is not None and edge.style:
+            props[side] = BORDER_STYLES.get(edge.style, 1)
+            if _color(edge.color):
+                props[f"{side}_color"] = _color(edge.color)
+
+    if alignment.horizontal and alignment.horizontal != "general":
+        props["align"] = HORIZONTAL_ALIGNMENTS.get(alignment.horizontal, alignment.horizontal)
+    if alignment.vertical and alignment.vertical != "bottom":
+        props["valign"] = VERTICAL_ALIGNMENTS.get(alignment.vertical, alignment.vertical)
+    if alignment.wrap_text:
+        props["text_wrap"] = True
+    if alignment.shrink_to_fit:
+        props["shrink"] = True
+    if alignment.indent:
+        props["indent"] = int(alignment.indent)
+    if alignment.text_rotation:
+        props["rotation"] = alignment.text_rotation
+
+    if isinstance(fill, PatternFill) and fill.fill_type in FILL_PATTERNS:
+        props["pattern"] = FILL_PATTERNS[fill.fill_type]
+        if _color(fill.fgColor):
+            props["fg_color"] = _color(fill.fgColor)
+        if _color(fill.bgColor):
+            props["bg_color"] = _color(fill.bgColor)
+
+    if number_format and number_format != "General":
+        props["num_format"] = number_format
+    return props
+
+
+class _NormalStyle:
+    """The attributes of openpyxl's built-in "Normal" style"""
+
+    font = DEFAULT_FONT
+    border = Border()
+    alignment = Alignment()
+    fill = PatternFill()
+    number_format = "General"
+
+
+class XlsxWriterCell:
+    """A cell of an ``XlsxWriterWorksheet``
+
+    Holds the value, the named style and any style attributes set on top
+    of it, which read back like openpyxl's. Setting ``style`` replaces
+    all of them, as it does in openpyxl.
+    """
+
+    __slots__ = (
+        "parent", "row", "column", "_value", "_style",
+        "_font", "_border", "_alignment", "_fill", "_number_format",
+    )
+
+    def __init__(self, parent, row, column, value=None):
+        self.parent = parent
+        self.row = row
+        self.column = column
+        self._value = value
+        self._style = "Normal"
+        self._font = self._border = self._alignment = self._fill = None
+        self._number_format = None
+
+    @property
+    def coordinate(self):
+        return f"{get_column_letter(self.column)}{self.row}"
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+
+    @property
+    def style(self):
+        return self._style
+
+    @style.setter
+    def style(self, name):
+        if name not in self.parent.parent._named_styles:
+            raise ValueError(f"{name} is not a known style")
+        self._style = name
+        self._font = self._border = self._alignment = self._fill = None
+        self._number_format = None
+
+    def _named(self):
+        return self.parent.parent._named_styles[self._style]
+
+    @property
+    def font(self):
+        return self._font or self._named().font
+
+    @font.setter
+    def font(self, font):
+        self._font = font
+
+    @property
+    def border(self):
+        return self._border or self._named().border
+
+    @border.setter
+    def border(self, border):
+        self._border = border
+
+    @property
+    def alignment(self):
+        return self._alignment or self._named().alignment
+
+    @alignment.setter
+    def alignment(self, alignment):
+        self._alignment = alignment
+
+    @property
+    def fill(self):
+        return self._fill or self._named().fill
+
+    @fill.setter
+    def fill(self, fill):
+        self._fill = fill
+
+    @property
+    def number_format(self):
+        return self._number_format or self._named().number_format or "General"
+
+    @number_format.setter
+    def number_format(self, number_format):
+        self._number_format = number_format
+
+    def _format_key(self):
+        """The cell's style, by identity, for the workbook's format cache"""
+        if (self._font is None and self._border is None and self._alignment is None
+                and self._fill is None and self._number_format is None):
+            return self._style
+        return (self._style, id(self._font), id(self._border), id(self._alignment),
+                id(self._fill), self._number_format)
+
+
+class XlsxWriterMergedCell(XlsxWriterCell):
+    """A cell covered by a merged range other than its top-left one"""
+
+    __slots__ = ()
+
+    @property
+    def value(self):
+        return None
+
+    @value.setter
+    def value(self, value):
+        raise AttributeError("'MergedCell' object attribute 'value' is read-only")
+
+
+# Both backends' cells covered by a merged range
+MERGED_CELL_TYPES = (MergedCell, XlsxWriterMergedCell)
+
+
+class _Dimension:
+    __slots__ = ("width", "height")
+
+    def __init__(self):
+        self.width = None
+        self.height = None
+
+
+class _Dimensions(dict):
+    """``column_dimensions``/``row_dimensions``: entries made on access"""
+
+    def __missing__(self, key):
+        dimension = self[key] = _Dimension()
+        return dimension
+
+
+class XlsxWriterWorksheet:
+    """A sheet of an ``XlsxWriterWorkbook``
+
+    Cells are kept until the workbook is saved, so they can be written in
+    any order and restyled; a streaming sheet (see
+    ``XlsxWriterWorkbook.create_streaming_sheet``) instead passes each
+    appended row straight to XlsxWriter and keeps no cells.
+    """
+
+    def __init__(self, parent, title, streaming=False):
+        self.parent = parent
+        self._title = title
+        self.streaming = streaming
+        self._cells = {}
+        self._merges = {}  # first row: [(first row, first column, last row, last column)]
+        self._last_opened_row = 0  # see _open_row
+        self._max_row = 0
+        self._max_column = 0
+        self._target = None  # the XlsxWriter worksheet, once the book is open
+        self.column_dimensions = _Dimensions()
+        self.row_dimensions = _Dimensions()
+
+    def __repr__(self):
+        return f'<XlsxWriterWorksheet "{self._title}">'
+
+    @property
+    def title(self):
+        return self._title
+
+    @title.setter
+    def title(self, title):
+        if self._target is not None:
+            raise ValueError("Sheets cannot be renamed once rows have been streamed")
+        title = sheet_title(title)
+        self.parent._check_title(title)
+        self._title = title
+
+    @property
+    def max_row(self):
+        return max(self._max_row, 1)
+
+    @property
+    def max_column(self):
+        return max(self._max_column, 1)
+
+    def cell(self, row, column, value=None):
+        if self.streaming:
+            raise TypeError("Cells of a streaming sheet cannot be addressed; use append")
+        cell = self._cells.get((row, column))
+        if cell is None:
+            cell = self._cells[row, column] = XlsxWriterCell(self, row, column)
+            if row > self._max_row:
+                self._max_row = row
+            if column > self._max_column:
+                self._max_column = column
+        if value is not None:
+            cell.value = value
+        return cell
+
+    def __getitem__(self, coordinate):
+        column, row = coordinate_from_string(coordinate)
+        return self.cell(row, column_index_from_string(column))
+
+    def __setitem__(self, coordinate, value):
+        self[coordinate].value = value
+
+    @property
+    def rows(self):
+        return self.iter_rows()
+
+    @property
+    def columns(self):
+        for column in range(1, self.max_column + 1):
+            yield tuple(self.cell(row, column) for row in range(1, self.max_row + 1))
+
+    def iter_rows(self, min_row=1, max_row=None, min_col=1, max_col=None):
+        for row in range(min_row, (max_row or self.max_row) + 1):
+            yield tuple(
+                self.cell(row, column)
+                for column in range(min_col, (max_col or self.max_column) + 1)
+            )
+
+    def append(self, values, styles=None):
+        """Write ``values`` to the next row
+
+        ``styles`` is a named style for the whole row or one per value
+        (None leaves that cell unstyled), as for ``StreamingSheet``.
+        """
+        if isinstance(styles, str) or styles is None:
+            styles = [styles] * len(values)
+        row = self._max_row + 1
+        if self.streaming:
+            self._max_row = row
+            self._max_column = max(self._max_column, len(values))
+            target = self.parent._open_target(self)
+            self._open_row(target, row)
+            written = False
+            for column, (value, style) in enumerate(zip(values, styles)):
+                fmt = self.parent._format(style) if style else None
+                if value is not None or fmt is not None:
+                    target.write(row - 1, column, value, fmt)
+                    written = True
+            if not written:
+                self._keep_row(target, row)
+            return
+        for column, (value, style) in enumerate(zip(values, styles), 1):
+            cell = self.cell(row, column, value)
+            if style:
+                cell.style = style
+        self._max_row = row
+
+    def merge_cells(self, range_string=None, start_row=None, start_column=None,
+                    end_row=None, end_column=None):
+        if range_string is not None:
+            start_column, start_row, end_column, end_row = range_boundaries(range_string)
+        self._merges.setdefault(start_row, []).append(
+            (start_row, start_column, end_row, end_column)
+        )
+        if self.streaming:
+            return
+
+        # As openpyxl does: the other cells become read-only merged cells,
+        # and those on the edges take the top-left cell's border there
+        anchor = self.cell(start_row, start_column)
+        for row in range(start_row, end_row + 1):
+            for column in range(start_column, end_column + 1):
+                if (row, column) != (start_row, start_column):
+                    self._cells[row, column] = XlsxWriterMergedCell(self, row, column)
+        self._max_row = max(self._max_row, end_row)
+        self._max_column = max(self._max_column, end_column)
+        edges = {
+            "top": [(start_row, c) for c in range(start_column, end_column + 1)],
+            "bottom": [(end_row, c) for c in range(start_column, end_column + 1)],
+            "left": [(r, start_column) for r in range(start_row, end_row + 1)],
+            "right": [(r, end_column) for r in range(start_row, end_row + 1)],
+        }
+        for side, coordinates in edges.items():
+            edge = getattr(anchor.border, side)
+            if edge is None or edge.style is None:
+                continue
+            for coordinate in coordinates:
+                cell = self._cells[coordinate]
+                if cell is not anchor:
+                    cell.border = cell.border + Border(**{side: edge})
+
+    def _open_row(self, target, row):
+        """Give ``target`` row ``row``'s height and the merges starting on it
+
+        In constant_memory mode XlsxWriter writes a row out as soon as a
+        later row is written to, and from then on drops its height and any
+        range merged from it, so these go ahead of the row's cells.
+        """
+        dimension = self.row_dimensions.get(row)
+        if dimension is not None and dimension.height is not None:
+            target.set_row(row - 1, dimension.height)
+        for start_row, start_column, end_row, end_column in self._merges.get(row, ()):
+            # Without data or a format merge_range writes no cells
+            target.merge_range(start_row - 1, start_column - 1, end_row - 1, end_column - 1, None)
+        self._last_opened_row = row
+
+    def _keep_row(self, target, row):
+        """Write a blank cell to a row with a height but nothing else
+
+        XlsxWriter writes a row out (with its height) only once a cell has
+        been written to it.
+        """
+        dimension = self.row_dimensions.get(row)
+        if dimension is not None and dimension.height is not None:
+            target.write_blank(row - 1, 0, None, self.parent._plain_format())
+
+    def _write(self, target):
+        """Write the kept cells, dimensions and merges to ``target``"""
+        book = self.parent
+        for letter, dimension in self.column_dimensions.items():
+            if dimension.width is not None:
+                column = column_index_from_string(letter) - 1
+                target.set_column(column, column, dimension.width)
+
+        # constant_memory only takes rows in ascending order
+        cells_by_row = {}
+        for (row, column), cell in sorted(self._cells.items()):
+            cells_by_row.setdefault(row, []).append(cell)
+        self._cells = {}
+        heights = {row for row, dimension in self.row_dimensions.items()
+                   if dimension.height is not None}
+        rows = cells_by_row.keys() | heights | self._merges.keys()
+        for row in sorted(rows):
+            # A streaming sheet's appended rows are open already
+            if row <= self._last_opened_row:
+                continue
+            self._open_row(target, row)
+            written = False
+            for cell in cells_by_row.get(row, ()):
+                key = cell._format_key()
+                fmt = None if key == "Normal" else book._cell_format(cell, key)
+                value = cell.value
+                if value is not None or fmt is not None:
+                    target.write(row - 1, cell.column - 1, value, fmt)
+                    written = True
+            if not written:
+                self._keep_row(target, row)
+
+
+class XlsxWriterWorkbook:
+    """A workbook saved through XlsxWriter in ``constant_memory`` mode
+
+    Stands in for ``openpyxl.Workbook`` where the generators use it (see
+    the module docstring). Named styles become XlsxWriter formats, one per
+    distinct named style and overrides, made when first written.
+    """
+
+    def __init__(self):
+        if xlsxwriter is None:
+            raise ImportError("xlsxwriter is not installed")
+        self._sheets = []
+        self._named_styles = {"Normal": _NormalStyle}
+        self._formats = {}
+        # Style objects whose id() is part of a key in _formats, kept alive
+        # so the ids are not reused once the cells holding them are gone
+        self._format_owners = []
+        self._book = None
+        self.create_sheet("Sheet")
+
+    @property
+    def worksheets(self):
+        return list(self._sheets)
+
+    @property
+    def sheetnames(self):
+        return [ws.title for ws in self._sheets]
+
+    @property
+    def active(self):
+        return self._sheets[0] if self._sheets else None
+
+    @property
+    def named_styles(self):
+        return list(self._named_styles)
+
+    def add_named_style(self, style):
+        if style.name in self._named_styles:
+            raise ValueError(f"Style {style.name} exists already")
+        self._named_styles[style.name] = style
+
+    def __getitem__(self, title):
+        title = sheet_title(title)
+        for ws in self._sheets:
+            if ws.title == title:
+                return ws
+        raise KeyError(f"Worksheet {title} does not exist.")
+
+    def _check_title(self, title):
+        if title in self.sheetnames:
+            raise ValueError(f"A sheet named {title!r} already exists")
+
+    def create_sheet(self, title=None, index=None):
+        return self._add_sheet(title, index, streaming=False)
+
+    def create_streaming_sheet(self, title):
+        """Add a sheet whose appended rows are written out at once"""
+        return self._add_sheet(title, None, streaming=True)
+
+    def _add_sheet(self, title, index, streaming):
+        if title is None:
+            title, number = "Sheet", 0
+            while title in self.sheetnames:
+                number += 1
+                title = f"Sheet{number}"
+        title = sheet_title(title)
+        self._check_title(title)
+        if index is not None and self._book is not None:
+            raise ValueError("Sheets cannot be reordered once rows have been streamed")
+        ws = XlsxWriterWorksheet(self, title, streaming)
+        if index is None:
+            self._sheets.append(ws)
+        else:
+            self._sheets.insert(index, ws)
+        if self._book is not None:
+            ws._target = self._book.add_worksheet(title)
+        return ws
+
+    def remove(self, ws):
+        if ws._target is not None:
+            raise ValueError("Sheets cannot be removed once rows have been streamed")
+        self._sheets.remove(ws)
+
+    def _open_target(self, ws):
+        """Open the XlsxWriter book if need be; return ``ws``'s sheet in it
+
+        XlsxWriter fixes sheet order as sheets are added, so opening adds
+        every sheet made so far, in order.
+        """
+        if self._book is None:
+            # The file name is given to save; XlsxWriter only opens the
+            # file when closed
+            self._book = xlsxwriter.Workbook(
+                None, {
+                    "constant_memory": True,
+                    "strings_to_urls": False,
+                    "default_date_format": "yyyy-mm-dd",
+                }
+            )
+            for sheet in self._sheets:
+                sheet._target = self._book.add_worksheet(sheet.title)
+        return ws._target
+
+    def _format(self, style):
+        """The XlsxWriter format for a named style"""
+        fmt = self._formats.get(style)
+        if fmt is None:
+            if style not in self._named_styles:
+                raise ValueError(f"{style} is not a known style")
+            named = self._named_styles[style]
+            fmt = self._formats[style] = self._book.add_format(format_properties(
+                named.font, named.border, named.alignment, named.fill, named.number_format,
+            ))
+        return fmt
+
+    def _plain_format(self):
+        """A format with no properties (see XlsxWriterWorksheet._keep_row)"""
+        fmt = self._formats.get(None)
+        if fmt is None:
+            fmt = self._formats[None] = self._book.add_format()
+        return fmt
+
+    def _cell_format(self, cell, key):
+        fmt = self._formats.get(key)
+        if fmt is None:
+            fmt = self._formats[key] = self._book.add_format(format_properties(
+                cell.font, cell.border, cell.alignment, cell.fill, cell.number_format,
+            ))
+            if not isinstance(key, str):
+                self._format_owners.append((cell._font, cell._border, cell._alignment, cell._fill))
+        return fmt
+
+    def save(self, filename):
+        if not self._sheets:
+            raise IndexError("At least one sheet must be visible")
+        self._open_target(self._sheets[0])
+        for ws in self._sheets:
+            ws._write(ws._target)
+        self._book.filename = filename
+        self._book.close()